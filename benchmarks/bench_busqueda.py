@@ -0,0 +1,68 @@
+# Búsqueda de pacientes por nombre (modelo/busqueda_pacientes.py) contra el recorrido ingenuo de
+# obtener_pacientes() comparando nombres normalizados. Los nombres combinan nombres de pila comunes
+# con apellidos armados por sílabas (miles de apellidos distintos, unos mucho más comunes que otros).
+# Uso:  python -m benchmarks.bench_busqueda [cantidad_pacientes]
+import random
+import sys
+import time
+from itertools import accumulate
+
+from benchmarks.sintetico import dni_sintetico
+from modelo.busqueda_pacientes import palabras_de_nombre
+from modelo.clinica import Clinica
+from modelo.paciente import Paciente
+
+NOMBRES = ["Ana", "María", "José", "Juan", "Luis", "Carlos", "Lucía", "Sofía", "Martín", "Valentina",
+           "Mateo", "Camila", "Diego", "Julieta", "Pedro", "Florencia", "Tomás", "Agustina", "Nicolás", "Belén"]
+SILABAS = ["gar", "ci", "a", "gon", "za", "lez", "ro", "dri", "guez", "fer", "nan", "dez", "lo", "pez",
+           "mar", "ti", "nez", "pe", "rez", "san", "chez", "gó", "mez", "dí", "az", "al", "va", "ri", "ño"]
+CONSULTAS = [("prefijo común", "g", False), ("prefijo", "gonz", False), ("nombre y apellido", "garci mar", False),
+             ("con error", "gonzales", True), ("dos palabras con error", "lucia fernandes", True)]
+
+
+def generar_nombres(cantidad: int, semilla: int = 1234) -> list[str]:
+    azar = random.Random(semilla)
+    apellidos = list(dict.fromkeys("".join(azar.choices(SILABAS, k=azar.randint(2, 4))).capitalize()
+                                   for _ in range(20000)))
+    apellidos[:4] = ["García", "González", "Fernández", "López"]
+    pesos = list(accumulate(1 / (posicion + 1) for posicion in range(len(apellidos)))) # Pocos apellidos muy comunes.
+    return [f"{azar.choice(NOMBRES)} {' '.join(azar.choices(apellidos, cum_weights=pesos, k=azar.randint(1, 2)))}"
+            for _ in range(cantidad)]
+
+
+def _busqueda_ingenua(clinica: Clinica, texto: str, limite: int) -> list:
+    buscadas = palabras_de_nombre(texto)
+    encontrados = []
+    for paciente in clinica.obtener_pacientes():
+        palabras = palabras_de_nombre(paciente.obtener_nombre())
+        if all(any(p.startswith(b) for p in palabras) for b in buscadas):
+            encontrados.append(paciente)
+    return encontrados[:limite]
+
+
+def _medir_ms(funcion, *argumentos, repeticiones: int = 20) -> float:
+    inicio = time.perf_counter()
+    for _ in range(repeticiones):
+        funcion(*argumentos)
+    return (time.perf_counter() - inicio) / repeticiones * 1000
+
+
+def main():
+    cantidad = int(sys.argv[1]) if len(sys.argv) > 1 else 300000
+    pacientes = [Paciente(nombre, dni_sintetico(numero), "01/01/1990") for numero, nombre in enumerate(generar_nombres(cantidad))]
+    clinica = Clinica()
+    inicio = time.perf_counter()
+    for paciente in pacientes:
+        clinica.agregar_paciente(paciente)
+    alta = (time.perf_counter() - inicio) / cantidad * 1e6
+    print(f"Pacientes: {cantidad} | agregar_paciente: {alta:.1f} us por paciente (con el índice)")
+    for nombre, texto, aproximada in CONSULTAS:
+        indice = _medir_ms(clinica.buscar_pacientes_por_nombre, texto, 20, aproximada)
+        resultados = len(clinica.buscar_pacientes_por_nombre(texto, 20, aproximada))
+        print(f"{nombre:24} {texto!r:20} índice: {indice:7.3f} ms ({resultados} resultados)")
+    ingenua = _medir_ms(_busqueda_ingenua, clinica, "garci mar", 20, repeticiones=1)
+    print(f"{'recorrido ingenuo':24} {'garci mar'!r:20} {ingenua:7.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
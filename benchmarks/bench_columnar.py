@@ -0,0 +1,74 @@
+# Compara la lista de objetos Turno con TurnosColumnares: memoria y tiempo de los conteos
+# por médico y semana / especialidad y mes. Es el almacén de columnas solo: Clinica(columnar=True) guarda
+# además sus objetos Turno. Uso:  python -m benchmarks.bench_columnar [cantidad_turnos]
+import gc
+import sys
+import time
+import tracemalloc
+from collections import Counter
+from datetime import datetime, timedelta
+
+from modelo.columnar import TurnosColumnares
+from modelo.especialidad import Especialidad
+from modelo.medico import Medico
+from modelo.paciente import Paciente
+from modelo.turno import Turno
+
+ESPECIALIDADES = ["Clínica", "Pediatría", "Cardiología", "Dermatología"]
+
+
+def _contar_con_objetos(turnos):
+    por_semana = Counter()
+    por_mes = Counter()
+    for turno in turnos:
+        fecha = turno.obtener_fecha_hora()
+        lunes = fecha.date() - timedelta(days=fecha.weekday())
+        por_semana[(turno.obtener_medico().obtener_matricula(), lunes)] += 1
+        por_mes[(turno.obtener_especialidad_solicitada(), (fecha.year, fecha.month))] += 1
+    return dict(por_semana), dict(por_mes)
+
+
+def _contar_con_columnas(columnas):
+    return columnas.contar_por_medico_y_semana(), columnas.contar_por_especialidad_y_mes()
+
+
+def main():
+    cantidad = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    pacientes = [Paciente(f"Paciente {i}", f"{10000000 + i}", "01/01/1980") for i in range(10000)]
+    medicos = [Medico(f"Médico {i}", f"MP{i:05d}", [Especialidad(ESPECIALIDADES[i % 4], ["lunes"])]) for i in range(500)]
+    inicio = datetime(2030, 1, 7, 8, 0)
+    # Un año de turnos repartidos entre 500 médicos (unos 40 por médico por semana con 1M de turnos).
+    datos = [(pacientes[i % 10000], medicos[i % 500], ESPECIALIDADES[i % 500 % 4], i * 525600 // cantidad)
+             for i in range(cantidad)]
+
+    gc.collect()
+    tracemalloc.start()
+    # Cada Turno tiene su propio datetime, como al agendar o recuperar desde el disco.
+    turnos = [Turno(paciente, medico, inicio + timedelta(minutes=minutos), especialidad)
+              for paciente, medico, especialidad, minutos in datos]
+    memoria_objetos = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    gc.collect()
+    tracemalloc.start()
+    columnas = TurnosColumnares()
+    for paciente, medico, especialidad, minutos in datos:
+        columnas.agregar_valores(paciente, medico, especialidad, inicio + timedelta(minutes=minutos))
+    memoria_columnas = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    inicio_medicion = time.perf_counter()
+    con_objetos = _contar_con_objetos(turnos)
+    tiempo_objetos = time.perf_counter() - inicio_medicion
+    inicio_medicion = time.perf_counter()
+    con_columnas = _contar_con_columnas(columnas)
+    tiempo_columnas = time.perf_counter() - inicio_medicion
+    assert con_objetos == con_columnas
+
+    print(f"Turnos: {cantidad}")
+    print(f"Memoria  objetos Turno: {memoria_objetos / cantidad:6.1f} bytes/turno | columnas: {memoria_columnas / cantidad:6.1f} bytes/turno")
+    print(f"Conteos  objetos Turno: {tiempo_objetos:6.2f} s | columnas: {tiempo_columnas:6.2f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+# Turnos por segundo con varios hilos agendando a la vez, comparando el cerrojo por médico
+# con un cerrojo global. Cada hilo agenda para sus propios médicos (no hay choques).
+# Uso:  python -m benchmarks.bench_concurrencia [turnos_por_hilo]
+import sys
+import threading
+import time
+from datetime import datetime, timedelta
+
+from modelo.clinica import Clinica
+from modelo.paciente import Paciente
+from modelo.medico import Medico
+from modelo.especialidad import Especialidad
+
+MEDICOS_POR_HILO = 5
+DIAS = ["lunes", "martes", "miércoles", "jueves", "viernes", "sábado", "domingo"]
+
+
+def medir(modo, cantidad_hilos, turnos_por_hilo):
+    clinica = Clinica(modo_concurrencia=modo)
+    clinica.agregar_paciente(Paciente("Paciente", "12345678", "01/01/1990"))
+    for m in range(cantidad_hilos * MEDICOS_POR_HILO):
+        clinica.agregar_medico(Medico(f"Médico {m}", f"MP{m}", [Especialidad("Clínica", DIAS, timedelta(minutes=15))]))
+
+    def trabajar(numero_hilo):
+        for i in range(turnos_por_hilo):
+            matricula = f"MP{numero_hilo * MEDICOS_POR_HILO + i % MEDICOS_POR_HILO}"
+            clinica.agendar_turno("12345678", matricula, "Clínica", datetime(2030, 1, 1) + timedelta(minutes=15 * i))
+
+    hilos = [threading.Thread(target=trabajar, args=(n,)) for n in range(cantidad_hilos)]
+    inicio = time.perf_counter()
+    for hilo in hilos:
+        hilo.start()
+    for hilo in hilos:
+        hilo.join()
+    return cantidad_hilos * turnos_por_hilo / (time.perf_counter() - inicio)
+
+
+def main():
+    turnos_por_hilo = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    resultados = [(hilos, medir("medico", hilos, turnos_por_hilo), medir("global", hilos, turnos_por_hilo))
+                  for hilos in (1, 2, 4, 8)]
+    print("hilos  por_medico (turnos/s)  global (turnos/s)")
+    for hilos, por_medico, global_ in resultados:
+        print(f"{hilos:5d}  {por_medico:21.0f}  {global_:17.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+# Compara Clinica.buscar_turnos (índices secundarios) contra recorrer obtener_turnos() y filtrar.
+# Uso:  python -m benchmarks.bench_consultas [cantidad_turnos]
+import shutil
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+from benchmarks.bench_recuperacion import generar_estado
+from modelo.clinica import Clinica
+from modelo.persistencia import AlmacenamientoClinica
+
+
+def _medir(funcion, repeticiones):
+    inicio = time.perf_counter()
+    for _ in range(repeticiones):
+        resultado = funcion()
+    return (time.perf_counter() - inicio) / repeticiones, len(resultado)
+
+
+def main():
+    cantidad_turnos = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    directorio = tempfile.mkdtemp(prefix="bench_clinica_")
+    try:
+        # Cargo los turnos a través de una instantánea: es la forma rápida de tener una clínica grande.
+        almacenamiento = AlmacenamientoClinica(directorio)
+        almacenamiento.guardar_instantanea(generar_estado(cantidad_turnos))
+        almacenamiento.cerrar()
+        clinica = Clinica(AlmacenamientoClinica(directorio))
+        todos = clinica.obtener_turnos()
+
+        semana = datetime(2030, 3, 4)
+        fin_semana = semana + timedelta(days=7)
+        dia = datetime(2030, 3, 6)
+        consultas = {
+            "especialidad en una semana": (
+                lambda: clinica.buscar_turnos(especialidad="Clínica", desde=semana, hasta=fin_semana),
+                lambda: [t for t in todos if t.obtener_especialidad_solicitada() == "Clínica"
+                         and semana <= t.obtener_fecha_hora() < fin_semana]),
+            "médico en un día": (
+                lambda: clinica.buscar_turnos(matricula="MP00002", desde=dia, hasta=dia + timedelta(days=1)),
+                lambda: [t for t in todos if t.obtener_medico().obtener_matricula() == "MP00002"
+                         and dia <= t.obtener_fecha_hora() < dia + timedelta(days=1)]),
+            "paciente (todos sus turnos)": (
+                lambda: clinica.buscar_turnos(dni="10000042"),
+                lambda: [t for t in todos if t.obtener_paciente().obtener_dni() == "10000042"]),
+        }
+
+        print(f"Turnos en la clínica: {len(todos)}")
+        for nombre, (con_indice, filtrando) in consultas.items():
+            tiempo_indice, encontrados = _medir(con_indice, 20)
+            tiempo_filtro, encontrados_filtro = _medir(filtrando, 2)
+            assert encontrados == encontrados_filtro
+            print(f"{nombre:30s} {encontrados:7d} turnos | índice: {tiempo_indice * 1000:9.3f} ms"
+                  f" | filtrando la lista: {tiempo_filtro * 1000:9.1f} ms | x{tiempo_filtro / tiempo_indice:,.0f}")
+    finally:
+        shutil.rmtree(directorio, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+# Compara la importación masiva con el alta de a uno usando los métodos de siempre.
+# Uso:  python -m benchmarks.bench_importacion [cantidad_pacientes]
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+from modelo.clinica import Clinica
+from modelo.eventos import ImpresoraConsola
+from modelo.paciente import Paciente
+from modelo.persistencia import AlmacenamientoClinica
+
+
+def filas_pacientes(cantidad):
+    return [{"nombre": f"Paciente {i}", "dni": f"{10000000 + i}", "fecha_nacimiento": f"{1 + i % 28:02d}/{1 + i % 12:02d}/1980"}
+            for i in range(cantidad)]
+
+
+def medir(cantidad, con_diario):
+    filas = filas_pacientes(cantidad)
+    directorios = [tempfile.mkdtemp(prefix="bench_clinica_") for _ in range(2)]
+    try:
+        clinicas = [Clinica(AlmacenamientoClinica(d)) if con_diario else Clinica() for d in directorios]
+
+        # El alta de a uno se mide como en el menú, con cada evento impreso. La impresión va a un
+        # archivo con buffer por línea, como una terminal, pero sin depender de lo lenta que sea.
+        with open(os.devnull, "w", buffering=1) as salida:
+            clinicas[0].obtener_eventos().suscribir(ImpresoraConsola(salida))
+            inicio = time.perf_counter()
+            for fila in filas:
+                clinicas[0].agregar_paciente(Paciente(fila["nombre"], fila["dni"], fila["fecha_nacimiento"]))
+            de_a_uno = time.perf_counter() - inicio
+
+        inicio = time.perf_counter()
+        clinicas[1].importar_lote("pacientes", filas)
+        por_lote = time.perf_counter() - inicio
+
+        for clinica in clinicas:
+            clinica.cerrar()
+        return de_a_uno, por_lote
+    finally:
+        for d in directorios:
+            shutil.rmtree(d, ignore_errors=True)
+
+
+def main():
+    cantidad = int(sys.argv[1]) if len(sys.argv) > 1 else 50000
+    print(f"Pacientes: {cantidad}")
+    for con_diario in (False, True):
+        de_a_uno, por_lote = medir(cantidad, con_diario)
+        titulo = "con diario en disco" if con_diario else "solo en memoria"
+        print(f"  {titulo}: de a uno {de_a_uno:.3f} s, por lote {por_lote:.3f} s ({de_a_uno / por_lote:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
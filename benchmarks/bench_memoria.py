@@ -0,0 +1,67 @@
+# Mide con tracemalloc cuántos bytes ocupa cada Turno y cada Receta (con su HistoriaClinica y
+# sus textos) en una clínica grande. Uso:  python -m benchmarks.bench_memoria [cantidad]
+import gc
+import sys
+import tracemalloc
+from datetime import datetime, timedelta
+
+from modelo.especialidad import Especialidad
+from modelo.historia_clinica import HistoriaClinica
+from modelo.medico import Medico
+from modelo.paciente import Paciente
+from modelo.receta import Receta
+from modelo.turno import Turno
+
+MEDICAMENTOS = ["Ibuprofeno", "Paracetamol", "Amoxicilina", "Omeprazol", "Loratadina"]
+
+
+def _texto_nuevo(texto: str) -> str:
+    # Como cuando el dato viene de un archivo o de la red: un objeto str nuevo cada vez.
+    return "".join(list(texto))
+
+
+def _medir(crear, cantidad: int) -> float:
+    gc.collect()
+    tracemalloc.start()
+    antes = tracemalloc.get_traced_memory()[0]
+    objetos = crear(cantidad)
+    gc.collect()
+    despues = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del objetos
+    return (despues - antes) / cantidad
+
+
+def main():
+    cantidad = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+    pacientes = [Paciente(f"Paciente {i}", f"{10000000 + i}", "01/01/1980") for i in range(1000)]
+    medico = Medico("Dr. Juan Pérez", "MP11111", [Especialidad("Clínica", ["lunes", "martes", "miércoles", "jueves", "viernes"])])
+    historias = [HistoriaClinica(p) for p in pacientes]
+    inicio = datetime(2030, 1, 7, 8, 0)
+
+    def crear_turnos(n):
+        turnos = [Turno(pacientes[i % 1000], medico, inicio + timedelta(minutes=30 * i), _texto_nuevo("Clínica"))
+                  for i in range(n)]
+        for turno in turnos:
+            historias[0].agregar_turno(turno) # Cuento también el lugar que ocupa en una historia.
+        return turnos
+
+    def crear_recetas(n):
+        return [Receta(pacientes[i % 1000], medico, [_texto_nuevo(MEDICAMENTOS[i % 5]), _texto_nuevo(MEDICAMENTOS[(i + 1) % 5])],
+                       inicio + timedelta(minutes=i)) for i in range(n)]
+
+    def crear_pacientes(n):
+        return [Paciente(f"Paciente {i}", f"{20000000 + i}", "01/01/1980") for i in range(n)]
+
+    def crear_historias(n):
+        return [HistoriaClinica(pacientes[i % 1000]) for i in range(n)]
+
+    print(f"Objetos por medición: {cantidad}")
+    print(f"Bytes por turno:     {_medir(crear_turnos, cantidad):7.1f}")
+    print(f"Bytes por receta:    {_medir(crear_recetas, cantidad):7.1f}")
+    print(f"Bytes por paciente:  {_medir(crear_pacientes, cantidad):7.1f}")
+    print(f"Bytes por historia:  {_medir(crear_historias, cantidad):7.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+# Tiempo del reporte de ocupación (modelo/ocupacion.py) sobre un año de turnos, en modo columnar y
+# con la lista de objetos Turno, contra el camino ingenuo: recorrer obtener_turnos() y preguntarle
+# a cada médico por la especialidad de ese día.
+# Uso:  python -m benchmarks.bench_ocupacion [cantidad_turnos] [cantidad_medicos]
+import sys
+import time
+from collections import Counter
+from datetime import timedelta
+
+from benchmarks.sintetico import crear_clinica, PRIMER_LUNES
+from modelo.dias import dia_de_fecha
+from modelo.ocupacion import calcular_ocupacion
+
+
+def _ocupacion_ingenua(clinica, desde, hasta):
+    por_medico, por_especialidad, por_dia = Counter(), Counter(), Counter()
+    for turno in clinica.obtener_turnos():
+        fecha_hora = turno.obtener_fecha_hora()
+        if not desde <= fecha_hora.date() < hasta:
+            continue
+        medico = turno.obtener_medico()
+        especialidad = medico.obtener_especialidad_para_dia(dia_de_fecha(fecha_hora))
+        por_medico[medico.obtener_matricula()] += 1
+        por_especialidad[especialidad] += 1
+        por_dia[fecha_hora.weekday()] += 1
+    return por_medico, por_especialidad, por_dia
+
+
+def _medir(funcion, *argumentos) -> float:
+    inicio = time.perf_counter()
+    funcion(*argumentos)
+    return time.perf_counter() - inicio
+
+
+def main():
+    cantidad_turnos = int(sys.argv[1]) if len(sys.argv) > 1 else 500000
+    cantidad_medicos = int(sys.argv[2]) if len(sys.argv) > 2 else 2000
+    desde = PRIMER_LUNES.date()
+    hasta = desde + timedelta(days=365)
+    print(f"Turnos: {cantidad_turnos}, médicos: {cantidad_medicos}, rango: {desde} a {hasta}")
+    for columnar in (True, False):
+        clinica = crear_clinica(cantidad_medicos, cantidad_turnos // 20, cantidad_turnos, columnar=columnar)
+        reporte = _medir(calcular_ocupacion, clinica, desde, hasta)
+        ingenuo = _medir(_ocupacion_ingenua, clinica, desde, hasta)
+        print(f"{'columnar' if columnar else 'lista   '}  calcular_ocupacion: {reporte:6.3f} s | recorrido ingenuo: {ingenuo:6.3f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+# Turnos por segundo agendando a través de ClinicaParticionada con 1, 2, 4 y 8 procesos, contra una
+# Clinica sola en este proceso (con el mismo protocolo de pedidos). Los médicos se reparten entre
+# las particiones por matrícula, así que cada proceso agenda para los suyos sin esperar a los demás.
+# La mejora depende de los núcleos libres: con un solo núcleo los procesos se turnan y no escala.
+# Uso:  python -m benchmarks.bench_particiones [turnos]
+import os
+import sys
+import time
+from datetime import datetime, timedelta
+
+from modelo.clinica import Clinica
+from servicio.operaciones import ejecutar_operacion
+from servicio.particiones import ClinicaParticionada
+
+CANTIDAD_MEDICOS = 64
+DIAS = "lunes,martes,miércoles,jueves,viernes,sábado,domingo"
+
+
+def generar_pedidos(cantidad_turnos: int) -> tuple[list[dict], list[dict]]:
+    altas = [{"op": "agregar_paciente", "nombre": "Paciente", "dni": "12345678", "fecha_nacimiento": "01/01/1990"}]
+    altas += [{"op": "agregar_medico", "nombre": f"Médico {m}", "matricula": f"MP{m}", "especialidades": f"Clínica:{DIAS}"}
+              for m in range(CANTIDAD_MEDICOS)]
+    turnos = [{"op": "agendar_turno", "dni": "12345678", "matricula": f"MP{i % CANTIDAD_MEDICOS}", "especialidad": "Clínica",
+               "fecha_hora": (datetime(2030, 1, 1) + timedelta(minutes=15 * (i // CANTIDAD_MEDICOS))).isoformat(),
+               "duracion_minutos": 15}
+              for i in range(cantidad_turnos)]
+    return altas, turnos
+
+
+def medir_sin_particiones(altas, turnos) -> float:
+    clinica = Clinica()
+    for pedido in altas:
+        ejecutar_operacion(clinica, pedido)
+    inicio = time.perf_counter()
+    respuestas = [ejecutar_operacion(clinica, pedido) for pedido in turnos]
+    total = time.perf_counter() - inicio
+    assert all(r["ok"] for r in respuestas)
+    return len(turnos) / total
+
+
+def medir_particiones(cantidad, altas, turnos) -> float:
+    with ClinicaParticionada(cantidad) as clinica:
+        clinica.ejecutar_varios(altas)
+        inicio = time.perf_counter()
+        respuestas = clinica.ejecutar_varios(turnos)
+        total = time.perf_counter() - inicio
+    assert all(r["ok"] for r in respuestas)
+    return len(turnos) / total
+
+
+def main():
+    cantidad_turnos = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+    altas, turnos = generar_pedidos(cantidad_turnos)
+    print(f"Núcleos disponibles: {os.cpu_count()}")
+    print(f"sin particiones (un proceso): {medir_sin_particiones(altas, turnos):10.0f} turnos/s")
+    print("procesos  turnos/s")
+    for cantidad in (1, 2, 4, 8):
+        print(f"{cantidad:8d}  {medir_particiones(cantidad, altas, turnos):8.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+# Mide cuánto tarda Clinica en recuperarse desde disco con una instantánea grande
+# más una cola de diario. Uso:  python -m benchmarks.bench_recuperacion [cantidad_turnos]
+import shutil
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+from modelo.clinica import Clinica
+from modelo.persistencia import AlmacenamientoClinica
+
+DIAS = ["lunes", "martes", "miércoles", "jueves", "viernes"]
+
+
+def generar_estado(cantidad_turnos, cantidad_pacientes=100000, cantidad_medicos=2000):
+    # Armo el estado directamente en el formato de la instantánea: es mucho más rápido
+    # que pasar por agendar_turno y lo que quiero medir es la recuperación.
+    pacientes = [[f"Paciente {i}", f"{10000000 + i}", "01/01/1980"] for i in range(cantidad_pacientes)]
+    medicos = [[f"Médico {i}", f"MP{i:05d}", [["Clínica", [DIAS[i % 5]]]]] for i in range(cantidad_medicos)]
+
+    turnos = []
+    primer_lunes = datetime(2030, 1, 7, 8, 0)
+    for i in range(cantidad_turnos):
+        numero_medico = i % cantidad_medicos
+        semana, franja = divmod(i // cantidad_medicos, 20) # 20 turnos de 30 minutos por jornada
+        fecha = primer_lunes + timedelta(days=7 * semana + numero_medico % 5, minutes=30 * franja)
+        turnos.append([pacientes[i % cantidad_pacientes][1], medicos[numero_medico][1], "Clínica", fecha.isoformat()])
+    return {"pacientes": pacientes, "medicos": medicos, "turnos": turnos, "recetas": []}
+
+
+def main():
+    cantidad_turnos = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    cola_diario = 10000
+    directorio = tempfile.mkdtemp(prefix="bench_clinica_")
+    try:
+        estado = generar_estado(cantidad_turnos + cola_diario)
+        turnos_cola = estado["turnos"][cantidad_turnos:]
+        del estado["turnos"][cantidad_turnos:]
+
+        almacenamiento = AlmacenamientoClinica(directorio)
+        almacenamiento.guardar_instantanea(estado)
+        for turno in turnos_cola:
+            almacenamiento.registrar("T", *turno)
+        almacenamiento.cerrar()
+        del estado, turnos_cola
+
+        inicio = time.perf_counter()
+        clinica = Clinica(AlmacenamientoClinica(directorio))
+        duracion = time.perf_counter() - inicio
+
+        print(f"Turnos en instantánea: {cantidad_turnos}, en el diario: {cola_diario}")
+        print(f"Turnos recuperados: {len(clinica.obtener_turnos())}")
+        print(f"Tiempo de recuperación: {duracion:.2f} s")
+    finally:
+        shutil.rmtree(directorio, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+# Control de superposición de turnos con duración (AgendaMedicos.obtener_superpuestos) a medida que
+# crece la agenda de un médico, contra el recorrido ingenuo de todos sus turnos. Los turnos duran
+# 15, 30, 45 o 60 minutos y van uno detrás de otro, así que casi cualquier horario pisa alguno.
+# Uso:  python -m benchmarks.bench_superposicion [turnos_maximos]
+import io
+import random
+import sys
+import time
+from contextlib import redirect_stdout
+from datetime import datetime, timedelta
+
+from modelo.clinica import Clinica
+from modelo.especialidad import Especialidad
+from modelo.exception import TurnoDuplicadoError
+from modelo.medico import Medico
+from modelo.paciente import Paciente
+
+DIAS = ["lunes", "martes", "miércoles", "jueves", "viernes", "sábado", "domingo"]
+DURACIONES = [timedelta(minutes=m) for m in (15, 30, 45, 60)]
+INICIO = datetime(2030, 1, 7)
+
+
+def armar_clinica(cantidad: int, semilla: int = 1234) -> tuple[Clinica, datetime]:
+    azar = random.Random(semilla)
+    clinica = Clinica()
+    with redirect_stdout(io.StringIO()):
+        clinica.agregar_paciente(Paciente("Paciente", "12345678", "01/01/1990"))
+        clinica.agregar_medico(Medico("Médico", "MP00001", [Especialidad("Clínica", DIAS)]))
+    fecha = INICIO
+    for _ in range(cantidad):
+        duracion = azar.choice(DURACIONES)
+        clinica.agendar_turno("12345678", "MP00001", "Clínica", fecha, duracion)
+        fecha += duracion
+    return clinica, fecha
+
+
+def _superpuestos_ingenuo(turnos: list, inicio: datetime, fin: datetime) -> list:
+    return [t for t in turnos if t.obtener_fecha_hora() < fin and t.obtener_fin() > inicio]
+
+
+def _medir_us(funcion, argumentos: list) -> float:
+    inicio = time.perf_counter()
+    for argumento in argumentos:
+        funcion(*argumento)
+    return (time.perf_counter() - inicio) / len(argumentos) * 1e6
+
+
+def _agendar_rechazado(clinica: Clinica, fecha_hora: datetime, duracion: timedelta):
+    try:
+        clinica.agendar_turno("12345678", "MP00001", "Clínica", fecha_hora, duracion)
+    except TurnoDuplicadoError:
+        pass
+
+
+def main():
+    maximo = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    tamanios = [t for t in (1000, 10000, 100000, 1000000) if t < maximo] + [maximo]
+    azar = random.Random(99)
+    print(f"{'turnos del médico':>18} {'validar (us)':>13} {'agendar rechazado (us)':>23} "
+          f"{'agendar al final (us)':>22} {'ingenuo (us)':>13}")
+    for cantidad in tamanios:
+        clinica, final = armar_clinica(cantidad)
+        minutos_totales = int((final - INICIO).total_seconds() // 60)
+        consultas = [(INICIO + timedelta(minutes=azar.randrange(minutos_totales - 60)), azar.choice(DURACIONES))
+                     for _ in range(5000)]
+        validar = _medir_us(lambda f, d: clinica.validar_turno_no_duplicado("MP00001", f, d), consultas)
+        rechazado = _medir_us(lambda f, d: _agendar_rechazado(clinica, f, d), consultas)
+        nuevos = []
+        fecha = final
+        for _ in range(2000):
+            nuevos.append((fecha, DURACIONES[1]))
+            fecha += DURACIONES[1]
+        al_final = _medir_us(lambda f, d: clinica.agendar_turno("12345678", "MP00001", "Clínica", f, d), nuevos)
+        turnos = clinica.obtener_turnos()
+        ingenuo = _medir_us(lambda f, d: _superpuestos_ingenuo(turnos, f, f + d), consultas[:20])
+        print(f"{cantidad:>18} {validar:>13.2f} {rechazado:>23.2f} {al_final:>22.2f} {ingenuo:>13.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+# Generador de carga para el servidor de la clínica: abre varias conexiones, manda pedidos
+# en pipeline (hasta 'ventana' sin respuesta por conexión) e informa la latencia p50/p99.
+# Si no se indica --puerto, levanta un servidor en el mismo proceso.
+# Uso:  python -m benchmarks.generador_carga [--puerto 8765] [--clientes 8] [--pedidos 2000]
+import argparse
+import asyncio
+import json
+import time
+from datetime import datetime, timedelta
+
+from modelo.clinica import Clinica
+from servicio.servidor import ServidorClinica
+
+DIAS = ["lunes", "martes", "miércoles", "jueves", "viernes", "sábado", "domingo"]
+
+
+def percentil(valores, p):
+    ordenados = sorted(valores)
+    return ordenados[min(len(ordenados) - 1, int(len(ordenados) * p / 100))]
+
+
+async def cliente(host, puerto, numero, pedidos, ventana, latencias):
+    lector, escritor = await asyncio.open_connection(host, puerto, limit=2 ** 24) # Las historias pueden ser largas.
+    dni = f"{20000000 + numero}"
+    dni_consulta = f"{30000000 + numero}" # Paciente aparte cuya historia se consulta (no crece durante la prueba).
+    matricula = f"MPC{numero}"
+    preparacion = [
+        {"op": "agregar_paciente", "nombre": f"Paciente {numero}", "dni": dni, "fecha_nacimiento": "01/01/1990"},
+        {"op": "agregar_paciente", "nombre": f"Consulta {numero}", "dni": dni_consulta, "fecha_nacimiento": "01/01/1990"},
+        {"op": "agregar_medico", "nombre": f"Médico {numero}", "matricula": matricula,
+         "especialidades": [{"tipo": "Clínica", "dias": DIAS}]},
+    ]
+    for pedido in preparacion:
+        escritor.write(json.dumps(pedido).encode() + b"\n")
+        await lector.readline()
+
+    enviados = {}
+    lugares = asyncio.Semaphore(ventana)
+
+    async def leer_respuestas():
+        for _ in range(pedidos):
+            respuesta = json.loads(await lector.readline())
+            latencias.append(time.perf_counter() - enviados.pop(respuesta["id"]))
+            lugares.release()
+
+    lectura = asyncio.create_task(leer_respuestas())
+    for i in range(pedidos):
+        await lugares.acquire()
+        if i % 5 == 4:
+            pedido = {"op": "ver_historia", "id": i, "dni": dni_consulta}
+        else:
+            fecha = datetime(2030, 1, 1) + timedelta(minutes=15 * i)
+            pedido = {"op": "agendar_turno", "id": i, "dni": dni, "matricula": matricula,
+                      "especialidad": "Clínica", "fecha_hora": fecha.isoformat(), "duracion_minutos": 15}
+        enviados[i] = time.perf_counter()
+        escritor.write(json.dumps(pedido).encode() + b"\n")
+        await escritor.drain()
+    await lectura
+    escritor.close()
+    await escritor.wait_closed()
+
+
+async def correr(argumentos):
+    servidor = None
+    host, puerto = argumentos.host, argumentos.puerto
+    if puerto is None:
+        servidor = ServidorClinica(Clinica())
+        await servidor.iniciar_tcp(host, 0)
+        puerto = servidor.obtener_puerto()
+
+    latencias = []
+    inicio = time.perf_counter()
+    await asyncio.gather(*(cliente(host, puerto, n, argumentos.pedidos, argumentos.ventana, latencias)
+                           for n in range(argumentos.clientes)))
+    duracion = time.perf_counter() - inicio
+    if servidor is not None:
+        await servidor.detener()
+
+    return latencias, duracion
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generador de carga para servicio.servidor.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--puerto", type=int)
+    parser.add_argument("--clientes", type=int, default=8)
+    parser.add_argument("--pedidos", type=int, default=2000, help="Pedidos por cliente.")
+    parser.add_argument("--ventana", type=int, default=32, help="Pedidos sin respuesta por conexión.")
+    argumentos = parser.parse_args()
+    latencias, duracion = asyncio.run(correr(argumentos))
+
+    print(f"Pedidos: {len(latencias)} en {duracion:.2f} s ({len(latencias) / duracion:.0f} pedidos/s)")
+    print(f"Latencia p50: {percentil(latencias, 50) * 1000:.2f} ms")
+    print(f"Latencia p99: {percentil(latencias, 99) * 1000:.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+# Generador de clínicas sintéticas para los benchmarks: N médicos, M pacientes y K turnos con
+# distribuciones parecidas a las de una clínica real. Con la misma semilla genera siempre los
+# mismos datos, así dos corridas (o dos versiones del código) miden exactamente lo mismo.
+import random
+from datetime import datetime, timedelta
+
+from modelo.clinica import Clinica
+
+# Especialidad y peso (qué tan común es entre los médicos de la clínica).
+ESPECIALIDADES = [("Clínica", 30), ("Pediatría", 15), ("Ginecología", 10), ("Cardiología", 8),
+                  ("Traumatología", 8), ("Dermatología", 7), ("Oftalmología", 6), ("Psiquiatría", 5),
+                  ("Neurología", 4), ("Endocrinología", 4), ("Urología", 3)]
+# Días hábiles y peso: los sábados hay pocos consultorios y el domingo ninguno.
+DIAS = [("lunes", 10), ("martes", 10), ("miércoles", 10), ("jueves", 10), ("viernes", 9), ("sábado", 3)]
+_NUMERO_DIA = {nombre: numero for numero, (nombre, _) in enumerate(DIAS)}
+MEDICAMENTOS = ["Ibuprofeno", "Paracetamol", "Amoxicilina", "Omeprazol", "Loratadina", "Enalapril",
+                "Metformina", "Atorvastatina", "Salbutamol", "Diclofenac", "Levotiroxina", "Clonazepam"]
+
+PRIMER_LUNES = datetime(2030, 1, 7)
+HORA_INICIO = 8
+TURNOS_POR_JORNADA = 20 # De 8 a 18, cada 30 minutos.
+DURACION_TURNO = timedelta(minutes=30)
+
+
+def _elegir_sin_repetir(azar: random.Random, opciones: list[tuple[str, int]], cantidad: int) -> list[str]:
+    nombres = [nombre for nombre, _ in opciones]
+    pesos = [peso for _, peso in opciones]
+    elegidos = []
+    while len(elegidos) < cantidad:
+        nombre = azar.choices(nombres, pesos)[0]
+        if nombre not in elegidos:
+            elegidos.append(nombre)
+    return elegidos
+
+
+def matricula_sintetica(numero: int) -> str:
+    return f"MP{numero:06d}"
+
+
+def dni_sintetico(numero: int) -> str:
+    return f"{10000000 + numero}"
+
+
+def generar_medicos(cantidad: int, semilla: int = 1234) -> list[dict]:
+    # Cada médico atiende 1 a 3 especialidades, cada una 1 a 3 días (en días distintos entre sí).
+    azar = random.Random(semilla)
+    filas = []
+    for numero in range(cantidad):
+        especialidades = _elegir_sin_repetir(azar, ESPECIALIDADES, azar.choices([1, 2, 3], [60, 30, 10])[0])
+        dias = _elegir_sin_repetir(azar, DIAS, min(len(DIAS), len(especialidades) * azar.randint(1, 2)))
+        agenda = [{"tipo": especialidad, "dias": dias[i::len(especialidades)]} for i, especialidad in enumerate(especialidades)]
+        filas.append({"nombre": f"Médico {numero}", "matricula": matricula_sintetica(numero), "especialidades": agenda})
+    return filas
+
+
+def generar_pacientes(cantidad: int, semilla: int = 1234) -> list[dict]:
+    azar = random.Random(semilla + 1)
+    return [{"nombre": f"Paciente {numero}", "dni": dni_sintetico(numero),
+             "fecha_nacimiento": f"{azar.randint(1, 28):02d}/{azar.randint(1, 12):02d}/{azar.randint(1935, 2024)}"}
+            for numero in range(cantidad)]
+
+
+def generar_turnos(medicos: list[dict], cantidad_pacientes: int, cantidad: int, semilla: int = 1234) -> list[dict]:
+    # Los turnos se reparten desparejos, como en la realidad: pocos médicos y pacientes concentran
+    # muchos turnos (pesos tipo Zipf). Cada turno cae en un día y horario en que el médico atiende
+    # esa especialidad y nunca se repite el horario de un médico.
+    azar = random.Random(semilla + 2)
+    pesos_medicos = [1 / (posicion + 1) ** 0.8 for posicion in range(len(medicos))]
+    pesos_pacientes = [1 / (posicion + 1) ** 0.6 for posicion in range(cantidad_pacientes)]
+    numeros_pacientes = range(cantidad_pacientes)
+    ocupados = set()
+    proxima_semana = {} # Para cada médico, hasta qué semana ya está lleno, para no buscar para siempre.
+    turnos = []
+    numeros_medicos = azar.choices(range(len(medicos)), pesos_medicos, k=cantidad)
+    numeros_de_pacientes = azar.choices(numeros_pacientes, pesos_pacientes, k=cantidad)
+    for numero_medico, numero_paciente in zip(numeros_medicos, numeros_de_pacientes):
+        medico = medicos[numero_medico]
+        especialidad = azar.choice(medico["especialidades"])
+        while True:
+            semana = proxima_semana.get(numero_medico, 0) + azar.randint(0, 3)
+            dia = azar.choice(especialidad["dias"])
+            numero_dia = _NUMERO_DIA[dia]
+            franja = azar.randrange(TURNOS_POR_JORNADA)
+            fecha_hora = PRIMER_LUNES + timedelta(weeks=semana, days=numero_dia, hours=HORA_INICIO) + franja * DURACION_TURNO
+            if (numero_medico, fecha_hora) not in ocupados:
+                break
+            proxima_semana[numero_medico] = proxima_semana.get(numero_medico, 0) + 1 # Se está llenando: avanzo.
+        ocupados.add((numero_medico, fecha_hora))
+        turnos.append({"dni": dni_sintetico(numero_paciente), "matricula": medico["matricula"],
+                       "especialidad": especialidad["tipo"], "fecha_hora": fecha_hora})
+    return turnos
+
+
+def crear_clinica(cantidad_medicos: int, cantidad_pacientes: int, cantidad_turnos: int, semilla: int = 1234, **opciones) -> Clinica:
+    # Clínica en memoria ya cargada. Uso importar_lote: valida todo igual que el alta de a uno,
+    # pero sin imprimir por cada fila. 'opciones' se pasa a Clinica (por ejemplo columnar=True).
+    medicos = generar_medicos(cantidad_medicos, semilla)
+    turnos = generar_turnos(medicos, cantidad_pacientes, cantidad_turnos, semilla)
+    clinica = Clinica(**opciones)
+    for tipo, filas in (("medicos", medicos), ("pacientes", generar_pacientes(cantidad_pacientes, semilla)),
+                        ("turnos", turnos)):
+        resultado = clinica.importar_lote(tipo, filas)
+        if resultado.obtener_errores():
+            raise RuntimeError(f"¡Error! La clínica sintética no se pudo cargar:\n{resultado}")
+    return clinica
@@ -0,0 +1,146 @@
+# Suite de benchmarks de los caminos calientes de Clinica. Para cada tamaño arma una clínica
+# sintética (ver benchmarks/sintetico.py) y mide cada operación llamada por llamada: cantidad,
+# operaciones por segundo y latencias p50/p95/p99/máx. Los resultados salen como tabla y,
+# opcionalmente, en JSON para guardarlos y comparar corridas.
+#
+# Uso:  python -m benchmarks.suite [--tamanios 1000,10000,100000] [--repeticiones 2000]
+#                                  [--salida resultados.json] [--comparar base.json --tolerancia 0.25]
+# Con --comparar, sale con código 1 si alguna operación empeoró su p50 más que la tolerancia.
+import argparse
+import gc
+import json
+import platform
+import random
+import sys
+import time
+from datetime import datetime, timedelta
+
+from benchmarks.sintetico import (crear_clinica, dni_sintetico, matricula_sintetica, generar_medicos,
+                                  DIAS, MEDICAMENTOS, PRIMER_LUNES, HORA_INICIO, TURNOS_POR_JORNADA, DURACION_TURNO)
+from modelo.paciente import Paciente
+
+VERSION_FORMATO = 1
+SEMANA_LIBRE = 20000 # Semana a partir de la cual la clínica sintética no tiene turnos: ahí agendo los nuevos.
+
+
+def _percentil(ordenados: list[int], p: float) -> int:
+    return ordenados[min(len(ordenados) - 1, int(len(ordenados) * p / 100))]
+
+
+def medir(nombre: str, tamanio: int, llamadas) -> dict:
+    # 'llamadas' es una lista de funciones sin argumentos; mido cada una por separado.
+    gc.collect()
+    latencias = []
+    inicio = time.perf_counter()
+    for llamada in llamadas:
+        antes = time.perf_counter_ns()
+        llamada()
+        latencias.append(time.perf_counter_ns() - antes)
+    total = time.perf_counter() - inicio
+    latencias.sort()
+    return {"operacion": nombre, "tamanio": tamanio, "repeticiones": len(latencias), "total_s": round(total, 6),
+            "ops_por_segundo": round(len(latencias) / total, 1),
+            "p50_us": _percentil(latencias, 50) / 1000, "p95_us": _percentil(latencias, 95) / 1000,
+            "p99_us": _percentil(latencias, 99) / 1000, "max_us": latencias[-1] / 1000}
+
+
+def medir_tamanio(tamanio: int, repeticiones: int, semilla: int) -> list[dict]:
+    # 'tamanio' es la cantidad de turnos; médicos y pacientes crecen en proporción.
+    cantidad_medicos = max(10, tamanio // 500)
+    cantidad_pacientes = max(100, tamanio // 10)
+    clinica = crear_clinica(cantidad_medicos, cantidad_pacientes, tamanio, semilla)
+    medicos = generar_medicos(cantidad_medicos, semilla)
+    azar = random.Random(semilla + 10)
+    resultados = []
+
+    # Paciente.__init__: solo la validación de los datos.
+    resultados.append(medir("paciente_init", tamanio, [
+        lambda i=i: Paciente(f"Paciente Nuevo {i}", f"{90000000 + i}", "15/05/1990") for i in range(repeticiones)]))
+
+    resultados.append(medir("agregar_paciente", tamanio, [
+        lambda i=i: clinica.agregar_paciente(Paciente(f"Paciente Nuevo {i}", f"{90000000 + i}", "15/05/1990"))
+        for i in range(repeticiones)]))
+
+    # agendar_turno en horarios libres (semanas que el generador no usa), repartidos entre los médicos.
+    numero_dia = {nombre: numero for numero, (nombre, _) in enumerate(DIAS)}
+    pedidos = []
+    for i in range(repeticiones):
+        medico = medicos[i % cantidad_medicos]
+        especialidad = medico["especialidades"][0]
+        ocupados_del_medico = i // cantidad_medicos
+        semana, franja = divmod(ocupados_del_medico, TURNOS_POR_JORNADA)
+        fecha_hora = (PRIMER_LUNES + timedelta(weeks=SEMANA_LIBRE + semana, days=numero_dia[especialidad["dias"][0]],
+                                               hours=HORA_INICIO) + franja * DURACION_TURNO)
+        pedidos.append((dni_sintetico(azar.randrange(cantidad_pacientes)), medico["matricula"], especialidad["tipo"], fecha_hora))
+    resultados.append(medir("agendar_turno", tamanio, [lambda p=p: clinica.agendar_turno(*p) for p in pedidos]))
+
+    resultados.append(medir("emitir_receta", tamanio, [
+        lambda dni=dni_sintetico(azar.randrange(cantidad_pacientes)),
+               matricula=matricula_sintetica(azar.randrange(cantidad_medicos)),
+               medicamentos=azar.sample(MEDICAMENTOS, azar.randint(1, 3)):
+        clinica.emitir_receta(dni, matricula, medicamentos)
+        for _ in range(repeticiones)]))
+
+    objetos_medicos = [clinica.obtener_medico_por_matricula(m["matricula"]) for m in medicos]
+    resultados.append(medir("obtener_especialidad_para_dia", tamanio, [
+        lambda medico=azar.choice(objetos_medicos), dia=azar.choice(DIAS)[0]: medico.obtener_especialidad_para_dia(dia)
+        for _ in range(repeticiones)]))
+
+    # HistoriaClinica.__str__ de los pacientes con más turnos (los primeros, por la distribución del generador).
+    historias = [clinica.obtener_historia_clinica_por_dni(dni_sintetico(i)) for i in range(min(20, cantidad_pacientes))]
+    resultados.append(medir("historia_clinica_str", tamanio, [
+        lambda historia=historias[i % len(historias)]: str(historia) for i in range(max(20, repeticiones // 50))]))
+    return resultados
+
+
+def comparar(resultados: list[dict], base: dict, tolerancia: float) -> bool:
+    # Compara el p50 de cada operación con el de una corrida anterior. Devuelve True si no hay regresiones.
+    anteriores = {(r["operacion"], r["tamanio"]): r for r in base["resultados"]}
+    sin_regresiones = True
+    print(f"\nComparación con la corrida base (tolerancia {tolerancia:.0%} en p50):")
+    for resultado in resultados:
+        anterior = anteriores.get((resultado["operacion"], resultado["tamanio"]))
+        if anterior is None:
+            continue
+        cambio = resultado["p50_us"] / anterior["p50_us"] - 1 if anterior["p50_us"] else 0.0
+        regresion = cambio > tolerancia
+        sin_regresiones = sin_regresiones and not regresion
+        marca = "  <-- REGRESIÓN" if regresion else ""
+        print(f"  {resultado['operacion']:30s} {resultado['tamanio']:>8d}  {anterior['p50_us']:10.2f} -> "
+              f"{resultado['p50_us']:10.2f} us  ({cambio:+.0%}){marca}")
+    return sin_regresiones
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmarks de los caminos calientes de la clínica.")
+    parser.add_argument("--tamanios", default="1000,10000,100000", help="Cantidades de turnos, separadas por coma.")
+    parser.add_argument("--repeticiones", type=int, default=2000, help="Llamadas medidas por operación.")
+    parser.add_argument("--semilla", type=int, default=1234)
+    parser.add_argument("--salida", help="Archivo JSON donde guardar los resultados.")
+    parser.add_argument("--comparar", help="Archivo JSON de una corrida anterior para comparar.")
+    parser.add_argument("--tolerancia", type=float, default=0.25, help="Empeoramiento de p50 permitido (0.25 = 25%%).")
+    argumentos = parser.parse_args()
+
+    resultados = []
+    for tamanio in (int(t) for t in argumentos.tamanios.split(",")):
+        por_tamanio = medir_tamanio(tamanio, argumentos.repeticiones, argumentos.semilla)
+        for r in por_tamanio:
+            print(f"{r['operacion']:30s} {r['tamanio']:>8d} turnos | {r['ops_por_segundo']:>11,.0f} ops/s | "
+                  f"p50 {r['p50_us']:9.2f} us | p95 {r['p95_us']:9.2f} us | p99 {r['p99_us']:9.2f} us")
+        resultados.extend(por_tamanio)
+
+    documento = {"version": VERSION_FORMATO, "fecha": datetime.now().isoformat(timespec="seconds"),
+                 "python": platform.python_version(), "plataforma": platform.platform(),
+                 "semilla": argumentos.semilla, "repeticiones": argumentos.repeticiones, "resultados": resultados}
+    if argumentos.salida:
+        with open(argumentos.salida, "w", encoding="utf-8") as archivo:
+            json.dump(documento, archivo, ensure_ascii=False, indent=2)
+
+    if argumentos.comparar:
+        with open(argumentos.comparar, "r", encoding="utf-8") as archivo:
+            if not comparar(resultados, json.load(archivo), argumentos.tolerancia):
+                sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
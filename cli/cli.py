@@ -6,18 +6,11 @@ from modelo.especialidad import Especialidad
 from modelo.turno import Turno
 from modelo.receta import Receta
 from modelo.historia_clinica import HistoriaClinica
+from modelo.eventos import ImpresoraConsola
+from modelo.ocupacion import AGRUPACIONES, calcular_ocupacion
+from modelo.importacion import leer_duracion
 from datetime import datetime, timedelta
 import os
-import locale
-
-# Configuración del locale (se recomienda que esté en main.py o un archivo de configuración).
-try:
-    locale.setlocale(locale.LC_TIME, 'es_ES.UTF-8')
-except locale.Error:
-    try:
-        locale.setlocale(locale.LC_TIME, 'Spanish_Spain.1252')
-    except locale.Error:
-        pass # Ignorar si no se puede configurar, los días saldrán en inglés.
 
 
 # Excepciones personalizadas
@@ -28,12 +21,18 @@ from modelo.exception import (
     PacienteExistenteError, PacienteNoExisteError,
     MedicoExistenteError, MedicoNoExisteError,
     TurnoDuplicadoError, MedicoNoAtiendeEspecialidadError,
-    MedicoNoTrabajaEseDiaError, RecetaInvalidaError
+    MedicoNoTrabajaEseDiaError, RecetaInvalidaError, TurnoNoExisteError
 )
 
 class CLI:
-    def __init__(self):
-        self.__clinica = Clinica()
+    TAMANIO_PAGINA = 10 # Cuántos elementos se muestran por pantalla en los listados.
+
+    def __init__(self, clinica=None, archivo_metricas=None):
+        # Si no me pasan una clínica, trabajo con una en memoria (sin persistencia).
+        self.__clinica = clinica if clinica is not None else Clinica()
+        # La clínica no imprime: en el menú muestro cada evento (paciente registrado, turno agendado, ...).
+        self.__clinica.obtener_eventos().suscribir(ImpresoraConsola())
+        self.__archivo_metricas = archivo_metricas # Si se indica, las métricas se exportan ahí en formato texto.
 
     def _limpiar_pantalla(self):
         os.system('cls' if os.name == 'nt' else 'clear')
@@ -53,6 +52,11 @@ class CLI:
         print("7) Ver todos los turnos")
         print("8) Ver todos los pacientes")
         print("9) Ver todos los médicos")
+        print("10) Cancelar turno")
+        print("11) Reprogramar turno")
+        print("12) Ver métricas de operaciones")
+        print("13) Reporte de ocupación")
+        print("14) Buscar paciente por nombre")
         print("0) Salir")
         print("--------------------")
 
@@ -68,6 +72,10 @@ class CLI:
             except ValueError:
                 print("¡Formato de fecha/hora incorrecto! Usa YYYY-MM-DD HH:MM (ej. 2025-12-31 14:30).")
 
+    def _solicitar_duracion(self, mensaje):
+        # Minutos del turno; Enter deja la duración de la especialidad (None).
+        return leer_duracion(input(f"{mensaje} (minutos, Enter = la de la especialidad): "))
+
     # --- Operaciones de Gestión ---
 
     def _agregar_paciente(self):
@@ -107,10 +115,11 @@ class CLI:
                 dias_atencion = [d.strip() for d in dias_atencion_str.split(',') if d.strip()]
                 
                 try:
-                    nueva_especialidad = Especialidad(tipo_especialidad, dias_atencion)
+                    duracion = self._solicitar_duracion("Duración de cada turno")
+                    nueva_especialidad = Especialidad(tipo_especialidad, dias_atencion, duracion)
                     especialidades_lista.append(nueva_especialidad)
                     print(f"✅ Especialidad '{tipo_especialidad}' agregada provisionalmente.")
-                except (TipoEspecialidadInvalidoError, DiasAtencionInvalidosError) as e:
+                except (TipoEspecialidadInvalidoError, DiasAtencionInvalidosError, ValueError, TypeError) as e:
                     print(f"❌ Error en la especialidad: {e}")
             
             if not especialidades_lista:
@@ -133,8 +142,9 @@ class CLI:
             matricula = input("Matrícula del médico: ").strip()
             especialidad = input("Especialidad del turno: ").strip()
             fecha_hora = self._solicitar_fecha_hora("Fecha y hora del turno")
+            duracion = self._solicitar_duracion("Duración del turno")
 
-            self.__clinica.agendar_turno(dni, matricula, especialidad, fecha_hora)
+            self.__clinica.agendar_turno(dni, matricula, especialidad, fecha_hora, duracion)
             print("\n✅ Turno agendado exitosamente.")
         except (PacienteNoExisteError, MedicoNoExisteError, TurnoDuplicadoError, 
                 MedicoNoAtiendeEspecialidadError, MedicoNoTrabajaEseDiaError, ValueError, TypeError) as e:
@@ -143,6 +153,49 @@ class CLI:
             print(f"\n❌ Ocurrió un error inesperado: {e}")
         self._pausar_pantalla()
 
+    def _elegir_turno_de_paciente(self):
+        # Muestra los turnos vigentes del paciente con su id y devuelve el id elegido.
+        dni = input("DNI del paciente: ").strip()
+        turnos = self.__clinica.obtener_historia_clinica_por_dni(dni).obtener_turnos()
+        if not turnos:
+            raise ValueError("El paciente no tiene turnos vigentes.")
+        print()
+        for turno in turnos:
+            print(f"  [{turno.obtener_id()}] {turno.obtener_fecha_hora().strftime('%Y-%m-%d %H:%M')} - "
+                  f"{turno.obtener_medico().obtener_nombre()} ({turno.obtener_especialidad_solicitada()})")
+        identificador = input("\nId del turno: ").strip()
+        if not identificador.isdigit():
+            raise ValueError("El id del turno debe ser un número.")
+        return int(identificador)
+
+    def _cancelar_turno(self):
+        self._limpiar_pantalla()
+        print("--- Cancelar Turno ---")
+        try:
+            identificador = self._elegir_turno_de_paciente()
+            self.__clinica.cancelar_turno(identificador)
+            print("\n✅ Turno cancelado. El horario quedó libre.")
+        except (PacienteNoExisteError, TurnoNoExisteError, ValueError) as e:
+            print(f"\n❌ Error al cancelar turno: {e}")
+        except Exception as e:
+            print(f"\n❌ Ocurrió un error inesperado: {e}")
+        self._pausar_pantalla()
+
+    def _reprogramar_turno(self):
+        self._limpiar_pantalla()
+        print("--- Reprogramar Turno ---")
+        try:
+            identificador = self._elegir_turno_de_paciente()
+            fecha_hora = self._solicitar_fecha_hora("Nueva fecha y hora del turno")
+            self.__clinica.reprogramar_turno(identificador, fecha_hora)
+            print("\n✅ Turno reprogramado exitosamente.")
+        except (PacienteNoExisteError, TurnoNoExisteError, TurnoDuplicadoError,
+                MedicoNoAtiendeEspecialidadError, MedicoNoTrabajaEseDiaError, ValueError) as e:
+            print(f"\n❌ Error al reprogramar turno: {e}")
+        except Exception as e:
+            print(f"\n❌ Ocurrió un error inesperado: {e}")
+        self._pausar_pantalla()
+
     def _agregar_especialidad_a_medico(self):
         self._limpiar_pantalla()
         print("--- Agregar Especialidad a Médico ---")
@@ -153,12 +206,14 @@ class CLI:
             tipo_especialidad = input("Nuevo tipo de especialidad: ").strip()
             dias_atencion_str = input("Días de atención (coma, ej. lunes, miércoles): ").strip().lower()
             dias_atencion = [d.strip() for d in dias_atencion_str.split(',') if d.strip()]
+            duracion = self._solicitar_duracion("Duración de cada turno")
 
-            nueva_especialidad = Especialidad(tipo_especialidad, dias_atencion)
+            nueva_especialidad = Especialidad(tipo_especialidad, dias_atencion, duracion)
             medico.agregar_especialidad(nueva_especialidad)
             
             print("\n✅ Especialidad agregada con éxito al médico.")
-        except (MedicoNoExisteError, TipoEspecialidadInvalidoError, DiasAtencionInvalidosError, EspecialidadDuplicadaError) as e:
+        except (MedicoNoExisteError, TipoEspecialidadInvalidoError, DiasAtencionInvalidosError, EspecialidadDuplicadaError,
+                ValueError, TypeError) as e:
             print(f"\n❌ Error al agregar especialidad: {e}")
         except Exception as e:
             print(f"\n❌ Ocurrió un error inesperado: {e}")
@@ -197,47 +252,102 @@ class CLI:
         try:
             dni = input("DNI del paciente: ").strip()
             historia_clinica = self.__clinica.obtener_historia_clinica_por_dni(dni)
-            print("\n" + str(historia_clinica))
+            print()
+            # La muestro de a bloques: en historias largas lo primero aparece enseguida.
+            for bloque in historia_clinica.iterar_texto():
+                print(bloque, end="", flush=True)
+            print()
         except PacienteNoExisteError as e:
             print(f"\n❌ Error: {e}")
         except Exception as e:
             print(f"\n❌ Ocurrió un error inesperado: {e}")
         self._pausar_pantalla()
 
+    def _mostrar_paginado(self, titulo, obtener_pagina, etiqueta, mensaje_vacio):
+        # Muestro de a TAMANIO_PAGINA elementos y pido los siguientes solo si el usuario quiere seguir.
+        cursor = 0
+        numero = 0
+        while True:
+            self._limpiar_pantalla()
+            print(f"--- {titulo} ---")
+            pagina = obtener_pagina(cursor, self.TAMANIO_PAGINA)
+            if numero == 0 and len(pagina) == 0:
+                print(mensaje_vacio)
+                break
+            for elemento in pagina:
+                numero += 1
+                print(f"\n--- {etiqueta} {numero} ---")
+                print(elemento)
+            if not pagina.hay_mas():
+                break
+            if input("\nEnter para ver más, 'q' para volver al menú: ").strip().lower() == 'q':
+                return
+            cursor = pagina.obtener_siguiente_cursor()
+        self._pausar_pantalla()
+
     def _ver_todos_los_turnos(self):
+        self._mostrar_paginado("Todos los Turnos Agendados", self.__clinica.obtener_turnos_pagina,
+                               "Turno", "No hay turnos registrados en el sistema.")
+
+    def _ver_todos_los_pacientes(self):
+        self._mostrar_paginado("Todos los Pacientes Registrados", self.__clinica.obtener_pacientes_pagina,
+                               "Paciente", "No hay pacientes registrados en el sistema.")
+
+    def _ver_todos_los_medicos(self):
+        self._mostrar_paginado("Todos los Médicos Registrados", self.__clinica.obtener_medicos_pagina,
+                               "Médico", "No hay médicos registrados en el sistema.")
+
+    def _ver_metricas(self):
         self._limpiar_pantalla()
-        print("--- Todos los Turnos Agendados ---")
-        turnos = self.__clinica.obtener_turnos()
-        if not turnos:
-            print("No hay turnos registrados en el sistema.")
+        print("--- Métricas de Operaciones ---")
+        metricas = self.__clinica.obtener_metricas()
+        if metricas is None:
+            print("Las métricas están desactivadas (iniciar con --metricas).")
         else:
-            for i, turno in enumerate(turnos):
-                print(f"\n--- Turno {i+1} ---")
-                print(turno)
+            print(metricas)
+            if self.__archivo_metricas:
+                metricas.escribir_archivo(self.__archivo_metricas)
+                print(f"\nMétricas guardadas en {self.__archivo_metricas}")
         self._pausar_pantalla()
 
-    def _ver_todos_los_pacientes(self):
+    def _reporte_ocupacion(self):
         self._limpiar_pantalla()
-        print("--- Todos los Pacientes Registrados ---")
-        pacientes = self.__clinica.obtener_pacientes()
-        if not pacientes:
-            print("No hay pacientes registrados en el sistema.")
-        else:
-            for i, paciente in enumerate(pacientes):
-                print(f"\n--- Paciente {i+1} ---")
-                print(paciente)
+        print("--- Reporte de Ocupación ---")
+        try:
+            desde = datetime.strptime(input("Desde (YYYY-MM-DD): ").strip(), "%Y-%m-%d").date()
+            hasta = datetime.strptime(input("Hasta, sin incluir (YYYY-MM-DD): ").strip(), "%Y-%m-%d").date()
+            agrupacion = input(f"Agrupar por ({', '.join(AGRUPACIONES)}) [medico]: ").strip().lower() or "medico"
+            reporte = calcular_ocupacion(self.__clinica, desde, hasta)
+            print()
+            print(reporte.tabla(agrupacion))
+            ruta = input("\nArchivo CSV para guardarlo (Enter para no guardar): ").strip()
+            if ruta:
+                with open(ruta, "w", encoding="utf-8", newline="") as archivo:
+                    reporte.escribir_csv(archivo, agrupacion)
+                print(f"✅ Reporte guardado en {ruta}")
+        except ValueError as e:
+            print(f"\n❌ Error: {e}")
+        except OSError as e:
+            print(f"\n❌ No se pudo guardar el archivo: {e}")
         self._pausar_pantalla()
 
-    def _ver_todos_los_medicos(self):
+    def _buscar_paciente(self):
         self._limpiar_pantalla()
-        print("--- Todos los Médicos Registrados ---")
-        medicos = self.__clinica.obtener_medicos()
-        if not medicos:
-            print("No hay médicos registrados en el sistema.")
-        else:
-            for i, medico in enumerate(medicos):
-                print(f"\n--- Médico {i+1} ---")
-                print(medico)
+        print("--- Buscar Paciente por Nombre ---")
+        try:
+            texto = input("Nombre o parte del nombre (p. ej. 'garc an'): ").strip()
+            pacientes = self.__clinica.buscar_pacientes_por_nombre(texto, self.TAMANIO_PAGINA)
+            if not pacientes:
+                # Sin coincidencias exactas pruebo tolerando errores de tipeo.
+                pacientes = self.__clinica.buscar_pacientes_por_nombre(texto, self.TAMANIO_PAGINA, aproximada=True)
+                if pacientes:
+                    print("\nNo hay coincidencias exactas. Quizás quisiste decir:")
+            if not pacientes:
+                print("\nNo se encontraron pacientes con ese nombre.")
+            for paciente in pacientes:
+                print(f"  - {paciente.obtener_nombre()} (DNI: {paciente.obtener_dni()})")
+        except ValueError as e:
+            print(f"\n❌ Error: {e}")
         self._pausar_pantalla()
 
     # --- Flujo Principal ---
@@ -256,8 +366,16 @@ class CLI:
             elif opcion == '7': self._ver_todos_los_turnos()
             elif opcion == '8': self._ver_todos_los_pacientes()
             elif opcion == '9': self._ver_todos_los_medicos()
+            elif opcion == '10': self._cancelar_turno()
+            elif opcion == '11': self._reprogramar_turno()
+            elif opcion == '12': self._ver_metricas()
+            elif opcion == '13': self._reporte_ocupacion()
+            elif opcion == '14': self._buscar_paciente()
             elif opcion == '0':
                 print("\n¡Gracias por usar el sistema de la Clínica! ¡Hasta pronto!")
+                if self.__archivo_metricas and self.__clinica.obtener_metricas() is not None:
+                    self.__clinica.obtener_metricas().escribir_archivo(self.__archivo_metricas)
+                self.__clinica.cerrar()
                 break
             else:
                 print("\nOpción no válida. Por favor, elige un número del menú.")
@@ -1,15 +1,87 @@
-from cli.cli import CLI 
-import locale
+from modelo.clinica import Clinica
+from modelo.persistencia import AlmacenamientoClinica
+from modelo.importacion import TIPOS_IMPORTACION, importar_archivo
+from modelo.ocupacion import AGRUPACIONES, calcular_ocupacion
+from datetime import date
+import argparse
+import os
+import sys
 
-# Configuración del locale para que los días de la semana salgan en español.
-try:
-    locale.setlocale(locale.LC_TIME, 'es_ES.UTF-8')
-except locale.Error:
+# Carpeta donde se guardan el diario y la instantánea de la clínica entre ejecuciones.
+DIRECTORIO_DATOS = os.environ.get("CLINICA_DATOS", "datos_clinica")
+
+
+def crear_parser():
+    parser = argparse.ArgumentParser(description="Sistema de Gestión de Clínica. Sin subcomando abre el menú interactivo.")
+    parser.add_argument("--metricas", nargs="?", const="", metavar="ARCHIVO",
+                        help="Mide las operaciones de la clínica; con ARCHIVO las exporta ahí en formato texto.")
+    subcomandos = parser.add_subparsers(dest="comando")
+
+    importar = subcomandos.add_parser("importar", help="Importa pacientes, médicos o turnos desde un archivo CSV o JSONL.")
+    importar.add_argument("tipo", choices=TIPOS_IMPORTACION, help="Qué se importa.")
+    importar.add_argument("archivo", help="Ruta a un archivo .csv o .jsonl.")
+    importar.add_argument("--tamanio-lote", type=int, default=5000, help="Filas que se validan y guardan juntas.")
+
+    lote = subcomandos.add_parser("lote", help="Ejecuta pedidos JSON por líneas (como el servidor) sin menú interactivo.")
+    lote.add_argument("archivo", nargs="?", default="-", help="Archivo con un pedido por línea ('-' o nada: entrada estándar).")
+    lote.add_argument("--salida", default="-", help="Archivo para las respuestas ('-' o nada: salida estándar).")
+    lote.add_argument("--detener-en-error", action="store_true", help="Corta en el primer pedido que falle.")
+
+    ocupacion = subcomandos.add_parser("ocupacion", help="Reporte de ocupación: turnos contra capacidad de atención.")
+    ocupacion.add_argument("--desde", required=True, type=date.fromisoformat, help="Primer día (YYYY-MM-DD).")
+    ocupacion.add_argument("--hasta", required=True, type=date.fromisoformat, help="Día final, sin incluir (YYYY-MM-DD).")
+    ocupacion.add_argument("--por", choices=AGRUPACIONES, help="Solo esta agrupación (sin esto, las tres).")
+    ocupacion.add_argument("--csv", metavar="ARCHIVO", help="Escribe el reporte en CSV ('-': salida estándar). Requiere --por.")
+    return parser
+
+
+def ejecutar_lote(clinica: Clinica, argumentos) -> int:
+    from servicio.lotes import ejecutar_lineas
+    entrada = sys.stdin if argumentos.archivo == "-" else open(argumentos.archivo, "r", encoding="utf-8")
+    salida = sys.stdout if argumentos.salida == "-" else open(argumentos.salida, "w", encoding="utf-8")
     try:
-        locale.setlocale(locale.LC_TIME, 'Spanish_Spain.1252') 
-    except locale.Error:
-        print("Advertencia: No se pudo configurar el locale para español. Los días de la semana podrían salir en inglés.")
+        resultado = ejecutar_lineas(clinica, entrada, salida, argumentos.detener_en_error)
+    finally:
+        for archivo in (entrada, salida):
+            if archivo not in (sys.stdin, sys.stdout):
+                archivo.close()
+    print(resultado, file=sys.stderr) # El resumen va a stderr para no mezclarse con las respuestas.
+    return 1 if resultado.obtener_errores() else 0
+
+
+def ejecutar_ocupacion(clinica: Clinica, argumentos) -> int:
+    reporte = calcular_ocupacion(clinica, argumentos.desde, argumentos.hasta)
+    if argumentos.csv:
+        if argumentos.csv == "-":
+            reporte.escribir_csv(sys.stdout, argumentos.por)
+        else:
+            with open(argumentos.csv, "w", encoding="utf-8", newline="") as archivo:
+                reporte.escribir_csv(archivo, argumentos.por)
+    else:
+        print(reporte.tabla(argumentos.por) if argumentos.por else reporte)
+    return 0
+
 
 if __name__ == "__main__":
-    mi_interfaz = CLI()
-    mi_interfaz.iniciar()
\ No newline at end of file
+    parser = crear_parser()
+    argumentos = parser.parse_args()
+    if argumentos.comando == "ocupacion" and argumentos.csv and not argumentos.por:
+        parser.error("--csv necesita --por (un CSV tiene una sola agrupación).")
+    mi_clinica = Clinica(AlmacenamientoClinica(DIRECTORIO_DATOS), metricas=argumentos.metricas is not None)
+
+    if argumentos.comando in ("importar", "lote", "ocupacion"):
+        if argumentos.comando == "importar":
+            print(importar_archivo(mi_clinica, argumentos.tipo, argumentos.archivo, argumentos.tamanio_lote))
+            codigo_salida = 0
+        elif argumentos.comando == "lote":
+            codigo_salida = ejecutar_lote(mi_clinica, argumentos)
+        else:
+            codigo_salida = ejecutar_ocupacion(mi_clinica, argumentos)
+        if argumentos.metricas:
+            mi_clinica.obtener_metricas().escribir_archivo(argumentos.metricas)
+        mi_clinica.cerrar()
+        sys.exit(codigo_salida)
+    else:
+        from cli.cli import CLI # Solo el menú interactivo necesita la CLI; 'importar' y 'lote' no la cargan.
+        mi_interfaz = CLI(mi_clinica, archivo_metricas=argumentos.metricas or None)
+        mi_interfaz.iniciar()
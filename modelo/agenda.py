@@ -0,0 +1,142 @@
+from bisect import bisect_left
+from datetime import datetime, timedelta
+
+from modelo.especialidad import DURACION_TURNO
+
+# Lo más corto que distingue datetime: [t, t + _UN_INSTANTE) es solo el momento t.
+_UN_INSTANTE = timedelta(microseconds=1)
+
+
+class AgendaMedicos:
+    # Índice de turnos por matrícula: para cada médico guardo los comienzos de sus turnos ordenados,
+    # en paralelo cuándo termina cada uno y el turno que ocupa cada comienzo. Así no tengo que
+    # recorrer todos los turnos de la clínica para saber si un horario está ocupado.
+    # Un turno ocupa [comienzo, fin). Los que se pueden pisar con un intervalo nuevo [inicio, fin) son
+    # los que empiezan en [inicio - la duración más larga del médico, fin): un bisect en la lista
+    # ordenada y los pocos turnos de ese tramo, tenga el médico cien turnos o cien mil.
+    def __init__(self):
+        self.__fechas_por_medico: dict[str, list[datetime]] = {}
+        self.__fines_por_medico: dict[str, list[datetime]] = {}
+        self.__turnos_por_medico: dict[str, dict[datetime, object]] = {}
+        self.__duracion_maxima: dict[str, timedelta] = {}
+
+    def agregar(self, matricula: str, fecha_hora: datetime, turno, duracion: timedelta = DURACION_TURNO):
+        fechas = self.__fechas_por_medico.get(matricula)
+        if fechas is None:
+            fechas = self.__fechas_por_medico[matricula] = []
+            self.__fines_por_medico[matricula] = []
+            self.__turnos_por_medico[matricula] = {}
+            self.__duracion_maxima[matricula] = duracion
+        fines = self.__fines_por_medico[matricula]
+
+        # La mayoría de los turnos se agendan hacia adelante, así que evito el insert si puedo. El
+        # comienzo va último: quien recorra 'fechas' sin cerrojo ya encuentra su fin, su turno y la
+        # duración máxima al día.
+        if duracion > self.__duracion_maxima[matricula]:
+            self.__duracion_maxima[matricula] = duracion
+        self.__turnos_por_medico[matricula][fecha_hora] = turno
+        if not fechas or fechas[-1] < fecha_hora:
+            fines.append(fecha_hora + duracion)
+            fechas.append(fecha_hora)
+        else:
+            posicion = bisect_left(fechas, fecha_hora)
+            fechas.insert(posicion, fecha_hora)
+            fines.insert(posicion, fecha_hora + duracion)
+
+    def quitar(self, matricula: str, fecha_hora: datetime):
+        # Libera el horario: desde ya esta_ocupado da False. Borro de las listas ordenadas del médico
+        # con bisect (solo los turnos de ese médico, no los de toda la clínica).
+        fechas = self.__fechas_por_medico[matricula]
+        posicion = bisect_left(fechas, fecha_hora)
+        del fechas[posicion]
+        del self.__fines_por_medico[matricula][posicion]
+        del self.__turnos_por_medico[matricula][fecha_hora]
+
+    def __limite_candidatos(self, matricula: str, inicio: datetime) -> datetime:
+        # Un turno que empezó antes de esto ya terminó para 'inicio' (ninguno del médico dura más).
+        try:
+            return inicio - self.__duracion_maxima[matricula]
+        except OverflowError: # 'inicio' está a menos de esa duración de datetime.min.
+            return datetime.min
+
+    def __tramo_candidato(self, matricula: str, inicio: datetime, fin: datetime) -> tuple[int, int]:
+        # Posiciones [desde, hasta) de los turnos del médico que podrían pisarse con [inicio, fin).
+        fechas = self.__fechas_por_medico[matricula]
+        desde = bisect_left(fechas, self.__limite_candidatos(matricula, inicio))
+        return desde, bisect_left(fechas, fin, desde)
+
+    def obtener_superpuestos(self, matricula: str, inicio: datetime, fin: datetime) -> list:
+        # Turnos del médico que se pisan con [inicio, fin), en orden. Uno que termina justo a la hora
+        # 'inicio' no se pisa.
+        fechas = self.__fechas_por_medico.get(matricula)
+        if not fechas:
+            return []
+        limite = self.__limite_candidatos(matricula, inicio)
+        fines = self.__fines_por_medico[matricula]
+        # Un solo bisect (el último que empieza antes de 'fin') y voy hacia atrás hasta 'limite':
+        # casi siempre son uno o dos turnos.
+        posicion = bisect_left(fechas, fin) - 1
+        superpuestos = []
+        while posicion >= 0 and fechas[posicion] >= limite:
+            if fines[posicion] > inicio:
+                superpuestos.append(posicion)
+            posicion -= 1
+        if not superpuestos: # Lo más común: el horario está libre.
+            return superpuestos
+        turnos = self.__turnos_por_medico[matricula]
+        return [turnos[fechas[p]] for p in reversed(superpuestos)]
+
+    def esta_libre(self, matricula: str, inicio: datetime, fin: datetime) -> bool:
+        return not self.obtener_superpuestos(matricula, inicio, fin)
+
+    def esta_ocupado(self, matricula: str, fecha_hora: datetime) -> bool:
+        # ¿Hay un turno del médico en curso en ese momento (empezó antes o justo ahí y no terminó)?
+        return not self.esta_libre(matricula, fecha_hora, fecha_hora + _UN_INSTANTE)
+
+    def obtener_fechas_entre(self, matricula: str, desde: datetime, hasta: datetime) -> list[datetime]:
+        # Devuelve los comienzos de los turnos del médico en el rango [desde, hasta), ya ordenados.
+        fechas = self.__fechas_por_medico.get(matricula)
+        if not fechas:
+            return []
+        inicio = bisect_left(fechas, desde)
+        fin = bisect_left(fechas, hasta, inicio)
+        return fechas[inicio:fin]
+
+    def obtener_turnos_entre(self, matricula: str, desde: datetime, hasta: datetime) -> list:
+        turnos = self.__turnos_por_medico.get(matricula, {})
+        return [turnos[f] for f in self.obtener_fechas_entre(matricula, desde, hasta)]
+
+    def cantidad_turnos(self, matricula: str) -> int:
+        return len(self.__fechas_por_medico.get(matricula, ()))
+
+    def proximo_turno_desde(self, matricula: str, desde: datetime):
+        # Primer horario ocupado del médico a partir de 'desde' (o None si no hay).
+        fechas = self.__fechas_por_medico.get(matricula)
+        if not fechas:
+            return None
+        posicion = bisect_left(fechas, desde)
+        return fechas[posicion] if posicion < len(fechas) else None
+
+    def horarios_libres(self, matricula: str, inicio: datetime, fin: datetime, duracion: timedelta):
+        # Genera, en orden, los comienzos de bloques de 'duracion' entre inicio y fin que no se pisan
+        # con ningún turno del médico (tampoco con uno que empezó antes de 'inicio' y sigue). Busco los
+        # turnos del rango una sola vez (bisect) y después avanzo con un puntero, sin volver a buscar
+        # por cada bloque.
+        if self.__fechas_por_medico.get(matricula):
+            desde, hasta = self.__tramo_candidato(matricula, inicio, fin)
+            comienzos = self.__fechas_por_medico[matricula][desde:hasta]
+            fines = self.__fines_por_medico[matricula][desde:hasta]
+        else:
+            comienzos, fines = [], []
+        posicion = 0
+        comienzo = inicio
+        while comienzo + duracion <= fin:
+            final_bloque = comienzo + duracion
+            # Los turnos que terminan antes de este bloque no pueden pisar ninguno de los siguientes.
+            while posicion < len(comienzos) and fines[posicion] <= comienzo:
+                posicion += 1
+            if posicion < len(comienzos) and comienzos[posicion] < final_bloque:
+                comienzo = final_bloque # Hay un turno dentro de este bloque: paso al siguiente.
+                continue
+            yield comienzo
+            comienzo = final_bloque
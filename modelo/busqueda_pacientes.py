@@ -0,0 +1,240 @@
+import heapq
+import re
+import sys
+import unicodedata
+from array import array
+from bisect import bisect_left, insort
+from collections import Counter
+
+# Índice de pacientes por nombre, para buscar en mostrador sin el DNI:
+# - por prefijo: "garc an" encuentra a "Ana García" (cada palabra buscada es el comienzo de alguna
+#   palabra del nombre);
+# - aproximada: "gonzales" encuentra a "González" (cada palabra buscada está a pocas letras de
+#   distancia de alguna palabra del nombre).
+# Todo sin distinguir mayúsculas ni tildes. El índice no guarda nombres sino palabras distintas
+# ("garcia" una sola vez aunque haya miles de García), cada una con sus pacientes en orden de alta:
+# una lista ordenada de palabras para los prefijos y trigramas de palabras para la búsqueda aproximada.
+
+_PATRON_PALABRA = re.compile(r"\w+")
+
+
+def palabras_de_nombre(nombre: str) -> list[str]:
+    # "María José  Núñez-Pérez" -> ["maria", "jose", "nunez", "perez"]
+    descompuesto = unicodedata.normalize("NFKD", nombre.casefold())
+    return _PATRON_PALABRA.findall("".join(c for c in descompuesto if not unicodedata.combining(c)))
+
+
+def _trigramas(palabra: str) -> set[str]:
+    # Con dos espacios al principio y uno al final, así las palabras cortas también tienen trigramas
+    # y el comienzo de la palabra pesa más (es donde menos se equivoca la gente).
+    relleno = f"  {palabra} "
+    return {relleno[i:i + 3] for i in range(len(relleno) - 2)}
+
+
+def _distancia_maxima(palabra: str) -> int:
+    # Errores tolerados según el largo de la palabra buscada.
+    if len(palabra) <= 2:
+        return 0
+    return 1 if len(palabra) <= 5 else 2
+
+
+def distancia_edicion(a: str, b: str, maximo: int) -> int:
+    # Distancia de Levenshtein entre a y b, o maximo + 1 si se pasa (corto apenas una fila entera se pasa).
+    if abs(len(a) - len(b)) > maximo:
+        return maximo + 1
+    # Lo que tienen igual al principio y al final no cambia la distancia, y suele ser casi toda la palabra.
+    inicio = 0
+    while inicio < len(a) and inicio < len(b) and a[inicio] == b[inicio]:
+        inicio += 1
+    fin_a, fin_b = len(a), len(b)
+    while fin_a > inicio and fin_b > inicio and a[fin_a - 1] == b[fin_b - 1]:
+        fin_a -= 1
+        fin_b -= 1
+    a, b = a[inicio:fin_a], b[inicio:fin_b]
+    if not a or not b:
+        return min(len(a) + len(b), maximo + 1)
+    anterior = list(range(len(b) + 1))
+    for i, letra_a in enumerate(a, 1):
+        actual = [i]
+        izquierda = minimo_fila = i
+        for j, letra_b in enumerate(b):
+            valor = anterior[j] if letra_a == letra_b else anterior[j] + 1
+            if anterior[j + 1] + 1 < valor:
+                valor = anterior[j + 1] + 1
+            if izquierda + 1 < valor:
+                valor = izquierda + 1
+            actual.append(valor)
+            izquierda = valor
+            if valor < minimo_fila:
+                minimo_fila = valor
+        if minimo_fila > maximo:
+            return maximo + 1
+        anterior = actual
+    return min(anterior[-1], maximo + 1)
+
+
+class IndicePacientes:
+    # Lo mantiene Clinica al guardar cada paciente (alta, importación o recuperación desde disco).
+    def __init__(self):
+        self.__pacientes = []                            # Pacientes en orden de alta: la posición es su número en el índice.
+        self.__palabras_de_paciente: list[tuple] = []    # Palabras del nombre de cada paciente (sin repetir).
+        self.__pacientes_por_palabra: dict[str, array] = {} # Números de paciente, en arreglos tipados: 4 bytes cada uno.
+        self.__palabras_ordenadas: list[str] = []        # Palabras distintas, ordenadas: los prefijos son tramos contiguos.
+        self.__numero_de_palabra: dict[str, int] = {}
+        self.__palabras: list[str] = []                  # Palabras distintas en orden de aparición (para los trigramas).
+        self.__palabras_por_trigrama: dict[str, list[int]] = {}
+        # Palabra tal cual viene en el nombre -> sus palabras normalizadas. Los nombres repiten mucho
+        # las mismas palabras, así que casi nunca hace falta normalizar.
+        self.__normalizadas: dict[str, tuple[str, ...]] = {}
+
+    def __len__(self):
+        return len(self.__pacientes)
+
+    def agregar(self, paciente):
+        self.__agregar(paciente, None)
+
+    def agregar_varios(self, pacientes):
+        # Para las importaciones: como agregar de a uno, pero las palabras nuevas se ordenan todas juntas
+        # al final. Con muchas palabras nuevas (un número de historia en el nombre, por ejemplo) el insort
+        # de cada una corre toda la lista y termina siendo lo más caro de la importación.
+        nuevas = []
+        for paciente in pacientes:
+            self.__agregar(paciente, nuevas)
+        if nuevas:
+            self.__palabras_ordenadas.extend(nuevas)
+            self.__palabras_ordenadas.sort() # Ya estaban casi ordenadas: sort solo ordena las nuevas y las intercala.
+
+    def __agregar(self, paciente, nuevas):
+        numero = len(self.__pacientes)
+        palabras = []
+        for cruda in paciente.obtener_nombre().split():
+            normalizadas = self.__normalizadas.get(cruda)
+            if normalizadas is None:
+                normalizadas = self.__normalizadas[cruda] = tuple(self.__registrar_palabra(p, nuevas)
+                                                                  for p in palabras_de_nombre(cruda))
+            palabras.extend(normalizadas)
+        palabras = tuple(dict.fromkeys(palabras))
+        for palabra in palabras:
+            self.__pacientes_por_palabra[palabra].append(numero)
+        self.__palabras_de_paciente.append(palabras)
+        self.__pacientes.append(paciente)
+
+    def __registrar_palabra(self, palabra: str, nuevas) -> str:
+        # Devuelve la palabra guardada en el índice (compartida por todos los nombres que la tienen).
+        # Si viene la lista 'nuevas', la palabra nueva se anota ahí y la ordena quien la pasó.
+        if palabra in self.__pacientes_por_palabra:
+            return self.__palabras[self.__numero_de_palabra[palabra]]
+        palabra = sys.intern(palabra)
+        self.__pacientes_por_palabra[palabra] = array("I")
+        self.__numero_de_palabra[palabra] = len(self.__palabras)
+        for trigrama in _trigramas(palabra):
+            self.__palabras_por_trigrama.setdefault(trigrama, []).append(len(self.__palabras))
+        self.__palabras.append(palabra)
+        if nuevas is not None:
+            nuevas.append(palabra)
+        else:
+            # Las palabras nuevas son cada vez menos (los apellidos se repiten), así que el insort casi no se paga.
+            insort(self.__palabras_ordenadas, palabra)
+        return palabra
+
+    @staticmethod
+    def __palabras_buscadas(texto: str, limite: int) -> list[str]:
+        if not isinstance(texto, str):
+            raise TypeError("¡Error! El nombre a buscar tiene que ser un texto.")
+        if not isinstance(limite, int) or limite <= 0:
+            raise ValueError("¡Error! El límite de resultados debe ser un número entero mayor a cero.")
+        palabras = palabras_de_nombre(texto)
+        if not palabras:
+            raise ValueError("¡Error! El nombre a buscar no puede estar vacío.")
+        return list(dict.fromkeys(palabras))
+
+    def __con_prefijo(self, prefijo: str):
+        # Palabras del índice que empiezan con 'prefijo', en orden alfabético (la palabra exacta primero).
+        ordenadas = self.__palabras_ordenadas
+        posicion = bisect_left(ordenadas, prefijo)
+        while posicion < len(ordenadas) and ordenadas[posicion].startswith(prefijo):
+            yield ordenadas[posicion]
+            posicion += 1
+
+    def buscar_por_prefijo(self, texto: str, limite: int = 20) -> list:
+        # Pacientes cuyo nombre tiene, para cada palabra buscada, alguna palabra que empieza así.
+        # Orden: por la palabra encontrada para la más larga de las buscadas (la coincidencia exacta
+        # primero, después alfabético) y, con la misma palabra, por orden de alta. Se corta apenas hay
+        # 'limite' resultados, así que un prefijo muy común ("a") no recorre a todos los pacientes.
+        buscadas = self.__palabras_buscadas(texto, limite)
+        principal = max(buscadas, key=len)
+        otras = [p for p in buscadas if p != principal]
+        encontrados, vistos = [], set()
+        for palabra in self.__con_prefijo(principal):
+            for numero in self.__pacientes_por_palabra[palabra]:
+                if numero in vistos:
+                    continue
+                vistos.add(numero)
+                palabras = self.__palabras_de_paciente[numero]
+                if all(any(p.startswith(otra) for p in palabras) for otra in otras):
+                    encontrados.append(self.__pacientes[numero])
+                    if len(encontrados) == limite:
+                        return encontrados
+        return encontrados
+
+    def __parecidas(self, buscada: str) -> dict[str, int]:
+        # Palabras del índice a distancia tolerable de 'buscada': {palabra: distancia}.
+        # Primero filtro por trigramas en común (cada error rompe a lo sumo 3) y recién a esas pocas
+        # les calculo la distancia de edición.
+        maximo = _distancia_maxima(buscada)
+        if maximo == 0:
+            return {buscada: 0} if buscada in self.__pacientes_por_palabra else {}
+        trigramas = _trigramas(buscada)
+        minimo_en_comun = len(trigramas) - 3 * maximo
+        en_comun = Counter()
+        for trigrama in trigramas:
+            en_comun.update(self.__palabras_por_trigrama.get(trigrama, ()))
+        parecidas = {}
+        for numero_palabra, cantidad in en_comun.items():
+            if cantidad >= minimo_en_comun:
+                palabra = self.__palabras[numero_palabra]
+                distancia = distancia_edicion(buscada, palabra, maximo)
+                if distancia <= maximo:
+                    parecidas[palabra] = distancia
+        return parecidas
+
+    def buscar_aproximado(self, texto: str, limite: int = 20) -> list:
+        # Pacientes cuyo nombre tiene, para cada palabra buscada, alguna palabra a pocas letras de
+        # distancia (ninguna en palabras de hasta 2 letras, 1 hasta 5 letras, 2 si es más larga).
+        # Orden: menos errores en total primero y, con los mismos errores, por orden de alta.
+        buscadas = self.__palabras_buscadas(texto, limite)
+        parecidas = [self.__parecidas(buscada) for buscada in buscadas]
+        if not all(parecidas):
+            return []
+        # Recorro los pacientes de la palabra buscada con menos candidatos, de a una distancia por vez
+        # (0 errores, 1, 2) y en orden de alta, y controlo las demás palabras con las del paciente.
+        # Como los errores totales nunca son menos que los de esa palabra, en cuanto los 'limite'
+        # mejores ya no pueden mejorar dejo de recorrer: una palabra muy común no cuesta más.
+        principal = min(range(len(buscadas)),
+                        key=lambda i: sum(len(self.__pacientes_por_palabra[p]) for p in parecidas[i]))
+        otras = [parecidas_i for i, parecidas_i in enumerate(parecidas) if i != principal]
+        mejores = [] # Montículo de (-errores, -numero): arriba queda el peor de los elegidos.
+        vistos = set()
+        for distancia in sorted(set(parecidas[principal].values())):
+            if len(mejores) == limite and distancia > -mejores[0][0]:
+                break
+            listas = [self.__pacientes_por_palabra[p] for p, d in parecidas[principal].items() if d == distancia]
+            for numero in heapq.merge(*listas):
+                if len(mejores) == limite and (distancia, numero) > (-mejores[0][0], -mejores[0][1]):
+                    break # Los que siguen en esta distancia tienen número más alto: tampoco entran.
+                if numero in vistos:
+                    continue
+                vistos.add(numero)
+                errores = distancia
+                palabras = self.__palabras_de_paciente[numero]
+                for parecidas_i in otras:
+                    distancias = [parecidas_i[p] for p in palabras if p in parecidas_i]
+                    if not distancias:
+                        break
+                    errores += min(distancias)
+                else:
+                    if len(mejores) < limite:
+                        heapq.heappush(mejores, (-errores, -numero))
+                    elif (errores, numero) < (-mejores[0][0], -mejores[0][1]):
+                        heapq.heapreplace(mejores, (-errores, -numero))
+        return [self.__pacientes[-numero] for _, numero in sorted(mejores, reverse=True)]
@@ -4,24 +4,121 @@ from modelo.medico import Medico
 from modelo.turno import Turno
 from modelo.receta import Receta
 from modelo.historia_clinica import HistoriaClinica
-from datetime import datetime
-import locale 
-try:
-    locale.setlocale(locale.LC_TIME, 'es_ES.UTF-8')
-except locale.Error:
+from modelo.agenda import AgendaMedicos
+from modelo.indice_turnos import IndiceTurnos
+from modelo.columnar import TurnosColumnares
+from modelo.especialidad import Especialidad, validar_duracion_turno
+from modelo.persistencia import AlmacenamientoClinica
+from modelo.importacion import (ResultadoImportacion, TIPOS_IMPORTACION, ERRORES_DE_VALIDACION,
+                                 leer_especialidades, leer_fecha_hora, leer_duracion)
+from modelo.dias import dia_de_fecha
+from modelo.paginacion import Pagina, paginar, iterar_lista, paginar_vigentes, iterar_vigentes
+from modelo.metricas import MetricasClinica
+from modelo.eventos import (BusEventos, PacienteRegistrado, MedicoRegistrado, EspecialidadAgregada,
+                            TurnoAgendado, TurnoCancelado, TurnoReprogramado, SerieAgendada, RecetaEmitida, LoteImportado)
+from modelo.recurrencia import ReglaRecurrencia
+from modelo.vista import VistaClinica
+from modelo.medicamentos import IndiceMedicamentos, CatalogoMedicamentos
+from modelo.busqueda_pacientes import IndicePacientes
+from datetime import date, datetime, time, timedelta
+from heapq import merge
+from collections import Counter
+from contextlib import ExitStack
+import threading
+import weakref
+
+from modelo.exception import (PacienteExistenteError, PacienteNoExisteError,MedicoExistenteError, MedicoNoExisteError,TurnoDuplicadoError, MedicoNoAtiendeEspecialidadError,MedicoNoTrabajaEseDiaError,EspecialidadVaciaError,SerieTurnosConflictoError,TurnoNoExisteError)
+
+# Las duraciones se anotan en el diario como minutos enteros.
+_UN_MINUTO = timedelta(minutes=1)
+
+
+def _fin_de_turno(fecha_hora: datetime, duracion: timedelta) -> datetime:
+    # Cuándo termina un turno; un turno que terminaría después del 31/12/9999 no se puede guardar.
     try:
-        locale.setlocale(locale.LC_TIME, 'Spanish_Spain.1252')
-    except locale.Error:
-        print("Advertencia: No se pudo configurar el locale para español. Los días de la semana podrían salir en inglés.")
+        return fecha_hora + duracion
+    except OverflowError:
+        raise ValueError("¡Error! El turno terminaría después de la última fecha posible (año 9999).") from None
+
 
-from modelo.exception import (PacienteExistenteError, PacienteNoExisteError,MedicoExistenteError, MedicoNoExisteError,TurnoDuplicadoError, MedicoNoAtiendeEspecialidadError,MedicoNoTrabajaEseDiaError,EspecialidadVaciaError)
 class Clinica:
-    def __init__(self):
+    MODOS_CONCURRENCIA = ("medico", "global")
+    # Operaciones públicas que se miden cuando la clínica se crea con metricas=True.
+    OPERACIONES_MEDIDAS = ("agregar_paciente", "agregar_medico", "agendar_turno", "agendar_serie", "cancelar_turno",
+                           "reprogramar_turno", "emitir_receta", "importar_lote", "buscar_turnos", "buscar_turnos_libres",
+                           "buscar_pacientes_por_nombre", "obtener_historia_clinica_por_dni")
+    # Cuántos turnos cancelados se juntan, como mínimo, antes de compactar las listas (ver cancelar_turno).
+    MINIMO_BAJAS_PARA_COMPACTAR = 1024
+
+    def __init__(self, almacenamiento: AlmacenamientoClinica = None, modo_concurrencia: str = "medico",
+                 columnar: bool = False, metricas: bool = False):
 
         self.__pacientes: dict[str, Paciente] = {}      
         self.__medicos: dict[str, Medico] = {}          
         self.__historias_clinicas: dict[str, HistoriaClinica] = {} 
-        self.__turnos: list[Turno] = [] 
+        # Con columnar=True la lista de turnos de la clínica se guarda por columnas en arreglos tipados
+        # (ver TurnosColumnares), que permiten los conteos y estadísticas sin recorrer objetos. Se usa
+        # igual que la lista (len, [i], [a:b]), pero lo que devuelve son Turno armados en el momento.
+        # Ojo: no ahorra memoria. Cada Turno sigue guardado por id, en la agenda del médico, en los
+        # índices y en la historia del paciente; las columnas son una copia más para contar rápido.
+        self.__turnos: list[Turno] | TurnosColumnares = TurnosColumnares() if columnar else []
+        # Cada turno guardado recibe un id (0, 1, 2, ... en orden de alta) para poder cancelarlo o
+        # reprogramarlo. Cancelar lo saca de este diccionario y lo marca como baja en las listas.
+        self.__turnos_por_id: dict[int, Turno] = {}
+        self.__proximo_id_turno = 0
+        self.__bajas_pendientes = 0 # Turnos cancelados que siguen marcados en las listas.
+        self.__bajas_totales = 0 # Cancelaciones desde el principio: el número de baja de cada turno.
+        self.__proximo_id_receta = 0
+        # Catálogo de medicamentos e índice medicamento -> recetas (ver modelo/medicamentos.py).
+        self.__medicamentos = IndiceMedicamentos()
+        # Índice de pacientes por nombre, para buscarlos sin el DNI (ver modelo/busqueda_pacientes.py).
+        self.__indice_pacientes = IndicePacientes()
+        # Vistas de solo lectura abiertas (ver obtener_vista): mientras haya alguna no se compacta.
+        self.__vistas: weakref.WeakSet[VistaClinica] = weakref.WeakSet()
+        self.__historias_con_bajas: set[str] = set()
+        # Pacientes y médicos en orden de alta: listas de solo-agregar para recorrer y paginar
+        # con un orden estable sin copiar los diccionarios.
+        self.__orden_pacientes: list[Paciente] = []
+        self.__orden_medicos: list[Medico] = []
+        self.__agenda = AgendaMedicos() # Índice matrícula -> horarios ocupados, para no recorrer todos los turnos.
+        self.__indice_turnos = IndiceTurnos() # Índices por DNI, especialidad y fecha para buscar_turnos.
+        # Índice especialidad (en minúsculas) -> 7 listas (una por día de la semana) con las matrículas que la atienden.
+        self.__medicos_por_especialidad: dict[str, list[list[str]]] = {}
+
+        # Concurrencia: varios hilos pueden agendar a la vez.
+        # - modo "medico": cada médico tiene su propio cerrojo, así los turnos de médicos distintos
+        #   se validan en paralelo. Al guardar se vuelve a chequear el horario bajo el cerrojo de
+        #   escritura (compare-and-set), así que nunca entran dos turnos en el mismo horario.
+        # - modo "global": un único cerrojo para todo agendar_turno (sirve para comparar).
+        if modo_concurrencia not in self.MODOS_CONCURRENCIA:
+            raise ValueError(f"¡Error! Modo de concurrencia desconocido: '{modo_concurrencia}'. Usar 'medico' o 'global'.")
+        self.__modo_concurrencia = modo_concurrencia
+        self.__cerrojo_global = threading.Lock()
+        self.__cerrojos_medicos: dict[str, threading.Lock] = {}
+        # Protege el guardado en las estructuras compartidas y el diario. Es reentrante porque
+        # guardar una operación puede disparar una instantánea o el aviso de una especialidad nueva.
+        self.__cerrojo_escritura = threading.RLock()
+
+        # Persistencia opcional: si me pasan un almacenamiento, recupero el estado guardado
+        # y a partir de ahí cada operación se anota en el diario.
+        if almacenamiento is not None and not isinstance(almacenamiento, AlmacenamientoClinica):
+            raise TypeError("¡Error! El almacenamiento debe ser un objeto AlmacenamientoClinica.")
+        # Avisos de lo que pasa en la clínica (ver modelo/eventos.py). Clinica no imprime: el menú
+        # interactivo suscribe una ImpresoraConsola. Se suscribe después de crear la clínica, así
+        # que la recuperación desde disco no genera eventos.
+        self.__eventos = BusEventos()
+
+        self.__almacenamiento = None
+        if almacenamiento is not None:
+            self.__recuperar(almacenamiento)
+            self.__almacenamiento = almacenamiento
+
+        # Métricas opcionales: reemplazo cada operación medida, solo en esta instancia, por una versión
+        # que cuenta llamadas, errores por tipo y latencias. Sin métricas no se envuelve nada.
+        self.__metricas = MetricasClinica() if metricas else None
+        if self.__metricas is not None:
+            for operacion in self.OPERACIONES_MEDIDAS:
+                setattr(self, operacion, self.__metricas.envolver(operacion, getattr(self, operacion)))
 
     # --- Métodos para AGREGAR o REGISTRAR cosas ---
 
@@ -30,60 +127,179 @@ class Clinica:
         if not isinstance(paciente, Paciente):
             raise TypeError("¡Error! Solo puedo agregar objetos de tipo Paciente.")
         
-        if self.validar_existencia_paciente(paciente.obtener_dni()):
-            raise PacienteExistenteError(f"¡Atención! El paciente con DNI {paciente.obtener_dni()} ya está registrado.")
-        
-        self.__pacientes[paciente.obtener_dni()] = paciente
-        nueva_historia = HistoriaClinica(paciente)
-        self.__historias_clinicas[paciente.obtener_dni()] = nueva_historia
-        print(f"Paciente {paciente.obtener_nombre()} (DNI: {paciente.obtener_dni()}) registrado y su historia clínica creada.")
+        with self.__cerrojo_escritura:
+            if self.validar_existencia_paciente(paciente.obtener_dni()):
+                raise PacienteExistenteError(f"¡Atención! El paciente con DNI {paciente.obtener_dni()} ya está registrado.")
+            
+            self.__guardar_paciente(paciente)
+            self.__registrar("P", paciente.obtener_nombre(), paciente.obtener_dni(), paciente.obtener_fecha_nacimiento())
+        if self.__eventos.hay_suscriptores():
+            self.__eventos.publicar(PacienteRegistrado(paciente))
 
     def agregar_medico(self, medico: Medico):
 
         if not isinstance(medico, Medico):
             raise TypeError("¡Error! Solo puedo agregar objetos de tipo Medico.")
-        if self.validar_existencia_medico(medico.obtener_matricula()):
-            raise MedicoExistenteError(f"¡Atención! El médico con matrícula {medico.obtener_matricula()} ya está registrado.")
-        
-        # Si pasa las validaciones, lo agrego a mi lista de médicos.
-        self.__medicos[medico.obtener_matricula()] = medico
-        print(f"Médico {medico.obtener_nombre()} (Matrícula: {medico.obtener_matricula()}) registrado.")
-
-    def agendar_turno(self, dni: str, matricula: str, especialidad_solicitada: str, fecha_hora: datetime):
+        with self.__cerrojo_escritura:
+            if self.validar_existencia_medico(medico.obtener_matricula()):
+                raise MedicoExistenteError(f"¡Atención! El médico con matrícula {medico.obtener_matricula()} ya está registrado.")
+            
+            # Si pasa las validaciones, lo agrego a mi lista de médicos.
+            self.__guardar_medico(medico)
+            self.__registrar("M", medico.obtener_nombre(), medico.obtener_matricula(),
+                             [self.__datos_de_especialidad(e) for e in medico.obtener_especialidad()])
+        if self.__eventos.hay_suscriptores():
+            self.__eventos.publicar(MedicoRegistrado(medico))
+
+    def agendar_turno(self, dni: str, matricula: str, especialidad_solicitada: str, fecha_hora: datetime,
+                      duracion: timedelta = None):
+        # El turno ocupa [fecha_hora, fecha_hora + duracion); sin 'duracion', lo que dura un turno de
+        # esa especialidad con ese médico. No puede pisarse con ningún otro turno del médico.
+        with self.__cerrojo_para(matricula):
+            paciente, medico, duracion = self.__validar_turno(dni, matricula, especialidad_solicitada, fecha_hora, duracion)
+            nuevo_turno = Turno(paciente, medico, fecha_hora, especialidad_solicitada.strip(), duracion)
+            with self.__cerrojo_escritura:
+                # Compare-and-set: una importación en lote pudo haber tomado el horario mientras validaba.
+                superpuestos = self.__superpuestos(matricula, fecha_hora, duracion)
+                if superpuestos:
+                    raise self.__error_superposicion("agendar", medico, fecha_hora, superpuestos[0])
+                self.__guardar_turno(nuevo_turno)
+                self.__registrar("T", dni, matricula, nuevo_turno.obtener_especialidad_solicitada(), fecha_hora.isoformat(),
+                                 duracion // _UN_MINUTO)
+        if self.__eventos.hay_suscriptores():
+            self.__eventos.publicar(TurnoAgendado(nuevo_turno))
+        return nuevo_turno # Devuelvo el turno creado, por si lo necesitan.
 
+    def cancelar_turno(self, identificador: int) -> Turno:
+        # Libera el horario enseguida (la agenda del médico y los índices lo sacan en el momento).
+        # En la lista de turnos de la clínica y en la historia del paciente solo queda marcado como
+        # cancelado, en tiempo constante; esas listas se compactan cuando se juntan suficientes bajas.
+        turno = self.obtener_turno_por_id(identificador)
+        with self.__cerrojo_para(turno.obtener_medico().obtener_matricula()):
+            with self.__cerrojo_escritura:
+                if identificador not in self.__turnos_por_id: # Otro hilo lo canceló mientras esperaba.
+                    raise TurnoNoExisteError(f"¡No puedo cancelar! No hay ningún turno vigente con id {identificador}.")
+                self.__quitar_turno(turno)
+                self.__registrar("C", identificador)
+                self.__compactar_si_hace_falta()
+        if self.__eventos.hay_suscriptores():
+            self.__eventos.publicar(TurnoCancelado(turno))
+        return turno
+
+    def reprogramar_turno(self, identificador: int, nueva_fecha_hora: datetime) -> Turno:
+        # Mueve el turno a otro horario del mismo médico, paciente, especialidad y duración. Es atómico:
+        # el horario viejo se libera solo si el nuevo se pudo tomar. Devuelve el turno nuevo, con su propio id.
+        # El turno nuevo puede pisarse con el viejo (correrlo 15 minutos, por ejemplo).
+        anterior = self.obtener_turno_por_id(identificador)
+        dni = anterior.obtener_paciente().obtener_dni()
+        matricula = anterior.obtener_medico().obtener_matricula()
+        especialidad = anterior.obtener_especialidad_solicitada()
+        if nueva_fecha_hora == anterior.obtener_fecha_hora():
+            raise ValueError("¡Error! El turno ya está en ese horario.")
+
+        with self.__cerrojo_para(matricula):
+            paciente, medico, duracion = self.__validar_turno(dni, matricula, especialidad, nueva_fecha_hora,
+                                                              anterior.obtener_duracion(), reemplaza=anterior)
+            nuevo_turno = Turno(paciente, medico, nueva_fecha_hora, especialidad, duracion)
+            with self.__cerrojo_escritura:
+                if identificador not in self.__turnos_por_id:
+                    raise TurnoNoExisteError(f"¡No puedo reprogramar! No hay ningún turno vigente con id {identificador}.")
+                superpuestos = self.__superpuestos(matricula, nueva_fecha_hora, duracion, reemplaza=anterior)
+                if superpuestos: # Compare-and-set, como en agendar_turno.
+                    raise self.__error_superposicion("reprogramar", medico, nueva_fecha_hora, superpuestos[0])
+                self.__quitar_turno(anterior)
+                self.__guardar_turno(nuevo_turno)
+                self.__registrar("V", identificador, nueva_fecha_hora.isoformat())
+                self.__compactar_si_hace_falta()
+        if self.__eventos.hay_suscriptores():
+            self.__eventos.publicar(TurnoReprogramado(anterior, nuevo_turno))
+        return nuevo_turno
+
+    def compactar_turnos(self):
+        # Saca de las listas los turnos cancelados. Se llama sola cada tantas bajas; las listas nuevas
+        # reemplazan a las viejas, así quien las esté recorriendo termina sin problemas.
+        with self.__cerrojo_escritura:
+            if self.__vistas:
+                raise ValueError("¡Error! No se puede compactar mientras haya vistas de la clínica abiertas.")
+            if isinstance(self.__turnos, TurnosColumnares):
+                self.__turnos = self.__turnos.compactada()
+            else:
+                self.__turnos = [turno for turno in self.__turnos if not turno.esta_cancelado()]
+            for dni in self.__historias_con_bajas:
+                self.__historias_clinicas[dni].compactar_turnos()
+            self.__historias_con_bajas = set()
+            self.__bajas_pendientes = 0
+
+    def agendar_serie(self, dni: str, matricula: str, especialidad_solicitada: str, regla: ReglaRecurrencia,
+                      duracion: timedelta = None) -> list[Turno]:
+        # Agenda todos los turnos de una serie (por ejemplo, uno por semana durante meses) o ninguno.
+        # Paciente, médico y especialidad se validan una sola vez; cada fecha se controla contra los
+        # días del médico y su agenda. Si alguna falla, el error trae todas las fechas con conflicto.
+        if not isinstance(regla, ReglaRecurrencia):
+            raise TypeError("¡Error! La serie de turnos necesita una ReglaRecurrencia.")
         if not isinstance(especialidad_solicitada, str) or not especialidad_solicitada.strip():
             raise ValueError("¡Error! La especialidad solicitada para el turno no puede estar vacía.")
-        
         if not self.validar_existencia_paciente(dni):
             raise PacienteNoExisteError(f"¡No puedo agendar! El paciente con DNI {dni} no está registrado.")
-        
         if not self.validar_existencia_medico(matricula):
             raise MedicoNoExisteError(f"¡No puedo agendar! El médico con matrícula {matricula} no está registrado.")
-    
         paciente = self.__pacientes[dni]
         medico = self.__medicos[matricula]
-
-        if not isinstance(fecha_hora, datetime):
-            raise TypeError("¡Error! La 'fecha_hora' debe ser un objeto datetime válido para agendar el turno.")
-        
-        if self.validar_turno_no_duplicado(matricula, fecha_hora):
-            raise TurnoDuplicadoError(f"¡Imposible agendar! El médico {medico.obtener_nombre()} ya tiene un turno agendado para el {fecha_hora.strftime('%Y-%m-%d %H:%M')}.")
-
+        especialidad = especialidad_solicitada.strip()
+        fechas = regla.obtener_fechas()
+        # Todos los turnos de la serie duran lo mismo (sin 'duracion', la de la especialidad con ese médico).
+        duracion = medico.obtener_duracion_turno(especialidad) if duracion is None else validar_duracion_turno(duracion)
+
+        with self.__cerrojo_para(matricula):
+            conflictos = []
+            motivo_por_dia = {} # El día de la semana se resuelve una vez por día distinto, no por fecha.
+            fin_anterior = None
+            for fecha_hora in fechas:
+                numero_dia = fecha_hora.weekday()
+                if numero_dia not in motivo_por_dia:
+                    motivo_por_dia[numero_dia] = self.__motivo_dia_no_disponible(medico, especialidad, fecha_hora)
+                motivo = motivo_por_dia[numero_dia]
+                # Las fechas van en orden y duran lo mismo: un turno de la serie solo puede pisar al anterior
+                # (pasa si el intervalo es más corto que la duración).
+                if motivo is None and fin_anterior is not None and fecha_hora < fin_anterior:
+                    motivo = "Se superpone con el turno anterior de la misma serie."
+                if motivo is None and self.validar_turno_no_duplicado(matricula, fecha_hora, duracion):
+                    motivo = "El médico ya tiene un turno que se superpone con ese horario."
+                if motivo is not None:
+                    conflictos.append((fecha_hora, motivo))
+                fin_anterior = _fin_de_turno(fecha_hora, duracion)
+            if conflictos:
+                raise self.__error_de_serie(conflictos, len(fechas))
+            nuevos_turnos = [Turno(paciente, medico, fecha_hora, especialidad, duracion) for fecha_hora in fechas]
+
+            with self.__cerrojo_escritura:
+                # Compare-and-set, como en agendar_turno: una importación pudo tomar alguno de los horarios.
+                ocupados = [(f, "El médico ya tiene un turno que se superpone con ese horario.") for f in fechas
+                            if self.validar_turno_no_duplicado(matricula, f, duracion)]
+                if ocupados:
+                    raise self.__error_de_serie(ocupados, len(fechas))
+                for turno in nuevos_turnos:
+                    self.__guardar_turno(turno)
+                # Un solo registro en el diario: la serie entera entra o no entra.
+                self.__registrar_lote("T", [[dni, matricula, turno.obtener_especialidad_solicitada(), turno.obtener_fecha_hora().isoformat(),
+                                             duracion // _UN_MINUTO] for turno in nuevos_turnos])
+        if self.__eventos.hay_suscriptores():
+            self.__eventos.publicar(SerieAgendada(nuevos_turnos))
+        return nuevos_turnos
+
+    @staticmethod
+    def __error_de_serie(conflictos: list, cantidad_fechas: int) -> SerieTurnosConflictoError:
+        return SerieTurnosConflictoError(f"¡Imposible agendar la serie! {len(conflictos)} de {cantidad_fechas} fechas "
+                                         f"tienen conflictos; no se agendó ningún turno.", conflictos)
+
+    def __motivo_dia_no_disponible(self, medico: Medico, especialidad: str, fecha_hora: datetime) -> str | None:
+        # None si el médico atiende esa especialidad el día de 'fecha_hora'; si no, el motivo.
         dia_semana_espanol = self.obtener_dia_semana_en_espanol(fecha_hora)
-        especialidad_que_atiende_ese_dia = medico.obtener_especialidad_para_dia(dia_semana_espanol)
-
-        if especialidad_que_atiende_ese_dia is None:
-            raise MedicoNoTrabajaEseDiaError(f"¡No se puede agendar! El médico {medico.obtener_nombre()} no atiende los días {dia_semana_espanol}.")
-        
-        if not self.validar_especialidad_en_dia(medico, especialidad_solicitada, dia_semana_espanol):
-             raise MedicoNoAtiendeEspecialidadError(f"¡No se puede agendar! El médico {medico.obtener_nombre()} no atiende {especialidad_solicitada} los días {dia_semana_espanol}.")
-
-        nuevo_turno = Turno(paciente, medico, fecha_hora, especialidad_solicitada.strip())
-        self.__turnos.append(nuevo_turno)
-        historia_paciente = self.__historias_clinicas[dni]
-        historia_paciente.agregar_turno(nuevo_turno)
-        print(f"Turno agendado con éxito: Paciente {paciente.obtener_nombre()} con Dr./Dra. {medico.obtener_nombre()} ({especialidad_solicitada}) el {fecha_hora.strftime('%Y-%m-%d %H:%M')}.")
-        return nuevo_turno # Devuelvo el turno creado, por si lo necesitan.
+        if not medico.obtener_especialidades_para_dia(dia_semana_espanol):
+            return f"El médico no atiende los días {dia_semana_espanol}."
+        if not self.validar_especialidad_en_dia(medico, especialidad, dia_semana_espanol):
+            return f"El médico no atiende {especialidad} los días {dia_semana_espanol}."
+        return None
 
     def emitir_receta(self, dni: str, matricula: str, medicamentos: list[str]):
       
@@ -101,28 +317,179 @@ class Clinica:
         if not medicamentos:
             raise ValueError("¡Error! La lista de medicamentos no puede estar vacía para una receta.")
 
-        nueva_receta = Receta(paciente, medico, medicamentos)
-        historia_paciente = self.__historias_clinicas[dni]
-        historia_paciente.agregar_receta(nueva_receta)
-        print(f"Receta emitida para Paciente: {paciente.obtener_nombre()} por Dr./Dra. {medico.obtener_nombre()}.")
+        # Cada medicamento se guarda con el nombre del catálogo: "ibuprofeno " queda como "Ibuprofeno"
+        # si ya se había recetado así.
+        catalogo = self.__medicamentos.obtener_catalogo()
+        nueva_receta = Receta(paciente, medico, [catalogo.nombre_canonico(m) for m in medicamentos])
+        with self.__cerrojo_escritura:
+            self.__guardar_receta(nueva_receta)
+            self.__registrar("R", dni, matricula, nueva_receta.obtener_medicamentos(), nueva_receta.obtener_fecha().isoformat())
+        if self.__eventos.hay_suscriptores():
+            self.__eventos.publicar(RecetaEmitida(nueva_receta))
         return nueva_receta # Devuelvo la receta creada.
 
 
     # --- Métodos para OBTENER información  ---
 
+    def obtener_metricas(self) -> MetricasClinica | None:
+        # None si la clínica se creó sin métricas.
+        return self.__metricas
+
+    def obtener_eventos(self) -> BusEventos:
+        # Para suscribirse a los eventos de la clínica: clinica.obtener_eventos().suscribir(funcion).
+        return self.__eventos
+
     def obtener_pacientes(self) -> list[Paciente]:
         return list(self.__pacientes.values()) 
 
     def obtener_medicos(self) -> list[Medico]:
         return list(self.__medicos.values()) 
 
+    def iterar_pacientes(self):
+        return iterar_lista(self.__orden_pacientes)
+
+    def iterar_medicos(self):
+        return iterar_lista(self.__orden_medicos)
+
+    def iterar_turnos(self):
+        return iterar_vigentes(self.__turnos)
+
+    # Páginas en orden de alta. El cursor de la primera página es 0 y cada página trae el de la siguiente.
+
+    def obtener_pacientes_pagina(self, cursor: int = 0, limite: int = 50) -> Pagina:
+        return paginar(self.__orden_pacientes, cursor, limite)
+
+    def buscar_pacientes_por_nombre(self, texto: str, limite: int = 20, aproximada: bool = False) -> list[Paciente]:
+        # Hasta 'limite' pacientes por nombre, sin distinguir mayúsculas ni tildes. Por prefijo, "garc an"
+        # encuentra a "Ana García"; con aproximada=True tolera errores de tipeo ("gonzales" -> "González").
+        if aproximada:
+            return self.__indice_pacientes.buscar_aproximado(texto, limite)
+        return self.__indice_pacientes.buscar_por_prefijo(texto, limite)
+
+    def obtener_medicos_pagina(self, cursor: int = 0, limite: int = 50) -> Pagina:
+        return paginar(self.__orden_medicos, cursor, limite)
+
+    def obtener_turnos_pagina(self, cursor: int = 0, limite: int = 50) -> Pagina:
+        # El cursor de los turnos es un id (ver paginar_vigentes): sigue valiendo aunque se compacte.
+        return paginar_vigentes(self.__turnos, cursor, limite)
+
+    # --- Consultas por medicamento (índice invertido, sin recorrer las historias) ---
+
+    def obtener_catalogo_medicamentos(self) -> CatalogoMedicamentos:
+        return self.__medicamentos.obtener_catalogo()
+
+    def buscar_recetas_por_medicamento(self, medicamento: str, desde: datetime = None,
+                                       hasta: datetime = None) -> list[Receta]:
+        # Recetas que incluyen el medicamento, por fecha; con desde/hasta, solo las de [desde, hasta).
+        return self.__medicamentos.recetas_con(medicamento, desde, hasta)
+
+    def obtener_pacientes_con_medicamento(self, medicamento: str, desde: datetime = None,
+                                          hasta: datetime = None) -> list[Paciente]:
+        return self.__medicamentos.pacientes_con(medicamento, desde, hasta)
+
+    def obtener_medicamentos_mas_recetados(self, cantidad: int = 10, desde: datetime = None,
+                                           hasta: datetime = None) -> list[tuple[str, int]]:
+        return self.__medicamentos.mas_recetados(cantidad, desde, hasta)
+
+    def obtener_vista(self) -> VistaClinica:
+        # Foto de solo lectura del estado actual para reportes y exportaciones (ver modelo/vista.py).
+        # Tomarla solo anota contadores y referencias bajo el cerrojo de escritura: no copia datos,
+        # así que no demora a agendar_turno ni a emitir_receta aunque el reporte tarde mucho.
+        with self.__cerrojo_escritura:
+            vista = VistaClinica(self.__turnos, len(self.__turnos), len(self.__turnos_por_id), self.__bajas_totales,
+                                 self.__proximo_id_turno, self.__proximo_id_receta,
+                                 self.__orden_pacientes, len(self.__orden_pacientes),
+                                 self.__orden_medicos, len(self.__orden_medicos),
+                                 self.__historias_clinicas, self.__vistas.discard)
+            self.__vistas.add(vista)
+        return vista
+
+    def cantidad_turnos(self) -> int:
+        return len(self.__turnos_por_id)
+
+    def obtener_turno_por_id(self, identificador: int) -> Turno:
+        turno = self.__turnos_por_id.get(identificador)
+        if turno is None:
+            raise TurnoNoExisteError(f"No hay ningún turno vigente con id {identificador}.")
+        return turno
+
     def obtener_medico_por_matricula(self, matricula: str) -> Medico:
         if not self.validar_existencia_medico(matricula):
             raise MedicoNoExisteError(f"Médico con matrícula {matricula} no encontrado.")
         return self.__medicos[matricula]
 
     def obtener_turnos(self) -> list[Turno]:
-        return self.__turnos[:]
+        return [turno for turno in self.__turnos if not turno.esta_cancelado()]
+
+    def obtener_turnos_de_medico_entre(self, matricula: str, desde: datetime, hasta: datetime) -> list[Turno]:
+        # Turnos del médico con fecha en [desde, hasta), ordenados por fecha.
+        if not self.validar_existencia_medico(matricula):
+            raise MedicoNoExisteError(f"Médico con matrícula {matricula} no encontrado.")
+        return self.__agenda.obtener_turnos_entre(matricula, desde, hasta)
+
+    def buscar_turnos(self, dni: str = None, matricula: str = None, especialidad: str = None,
+                      desde: datetime = None, hasta: datetime = None) -> list[Turno]:
+        # Turnos que cumplen todos los filtros indicados, ordenados por fecha. El rango es [desde, hasta).
+        # Recorro solo el índice más chico de los pedidos (médico, paciente, especialidad o el de
+        # fechas de toda la clínica) y con los demás filtros descarto sobre esos pocos turnos.
+        if (desde is not None and not isinstance(desde, datetime)) or (hasta is not None and not isinstance(hasta, datetime)):
+            raise TypeError("¡Error! 'desde' y 'hasta' deben ser objetos datetime.")
+
+        candidatos = [(len(self.__indice_turnos.por_fecha()), "fecha", self.__indice_turnos.por_fecha())]
+        if dni is not None:
+            por_dni = self.__indice_turnos.por_dni(dni)
+            candidatos.append((len(por_dni or ()), "dni", por_dni))
+        if especialidad is not None:
+            por_especialidad = self.__indice_turnos.por_especialidad(especialidad)
+            candidatos.append((len(por_especialidad or ()), "especialidad", por_especialidad))
+        if matricula is not None:
+            candidatos.append((self.__agenda.cantidad_turnos(matricula), "matricula", None))
+        cantidad, elegido, indice = min(candidatos, key=lambda candidato: candidato[0])
+        if cantidad == 0:
+            return []
+
+        if elegido == "matricula":
+            turnos = self.__agenda.obtener_turnos_entre(matricula, desde or datetime.min, hasta or datetime.max)
+        else:
+            turnos = indice.iterar_entre(desde, hasta)
+
+        # El filtro del índice elegido ya se cumple: solo aplico los otros.
+        if dni is not None and elegido != "dni":
+            turnos = [t for t in turnos if t.obtener_paciente().obtener_dni() == dni]
+        if matricula is not None and elegido != "matricula":
+            turnos = [t for t in turnos if t.obtener_medico().obtener_matricula() == matricula]
+        if especialidad is not None and elegido != "especialidad":
+            clave = IndiceTurnos.clave_especialidad(especialidad)
+            turnos = [t for t in turnos if IndiceTurnos.clave_especialidad(t.obtener_especialidad_solicitada()) == clave]
+        return list(turnos)
+
+    # --- Estadísticas (solo con columnar=True) ---
+
+    def contar_turnos_por_medico_y_semana(self) -> dict[tuple[str, date], int]:
+        return self.__obtener_columnas().contar_por_medico_y_semana()
+
+    def contar_turnos_por_especialidad_y_mes(self) -> dict[tuple[str, tuple[int, int]], int]:
+        return self.__obtener_columnas().contar_por_especialidad_y_mes()
+
+    def contar_turnos_por_medico_especialidad_y_dia(self, desde: datetime = None,
+                                                    hasta: datetime = None) -> dict[tuple[str, str, int], int]:
+        # {(matrícula, especialidad pedida, día de la semana 0-6): turnos} con fecha en [desde, hasta).
+        # Lo usa el reporte de ocupación (modelo/ocupacion.py). Anda en los dos modos.
+        if isinstance(self.__turnos, TurnosColumnares):
+            return self.__turnos.contar_por_medico_especialidad_y_dia(desde, hasta)
+        # Sin columnas: recorro con el índice por fecha solo los turnos del rango.
+        return dict(Counter((turno.obtener_medico().obtener_matricula(), turno.obtener_especialidad_solicitada(),
+                             turno.obtener_fecha_hora().weekday())
+                            for turno in self.__indice_turnos.por_fecha().iterar_entre(desde, hasta)))
+
+    def contar_turnos(self, matricula: str = None, dni: str = None, especialidad: str = None,
+                      desde: datetime = None, hasta: datetime = None) -> int:
+        return self.__obtener_columnas().contar(matricula, dni, especialidad, desde, hasta)
+
+    def __obtener_columnas(self) -> TurnosColumnares:
+        if not isinstance(self.__turnos, TurnosColumnares):
+            raise ValueError("¡Error! Las estadísticas de turnos necesitan una clínica creada con columnar=True.")
+        return self.__turnos
 
     def obtener_historia_clinica_por_dni(self, dni: str) -> HistoriaClinica:
         if not self.validar_existencia_paciente(dni):
@@ -130,6 +497,51 @@ class Clinica:
         return self.__historias_clinicas[dni]
 
 
+    def buscar_turnos_libres(self, especialidad: str, desde: datetime, hasta: datetime,
+                             duracion: timedelta = None, cantidad: int = 5,
+                             hora_inicio: time = time(8, 0), hora_fin: time = time(18, 0)) -> list[tuple[datetime, Medico]]:
+        # Los 'cantidad' horarios libres más tempranos entre 'desde' y 'hasta' para esa especialidad,
+        # mirando a todos los médicos que la atienden cada día. Devuelve pares (fecha_hora, medico).
+        # Los bloques se arman dentro de la jornada [hora_inicio, hora_fin) de cada día y duran 'duracion'
+        # (sin ella, lo que dura un turno de esa especialidad con cada médico).
+        if not isinstance(especialidad, str) or not especialidad.strip():
+            raise ValueError("¡Error! La especialidad a buscar no puede estar vacía.")
+        if not isinstance(desde, datetime) or not isinstance(hasta, datetime):
+            raise TypeError("¡Error! 'desde' y 'hasta' deben ser objetos datetime.")
+        if duracion is not None and (not isinstance(duracion, timedelta) or duracion <= timedelta(0)):
+            raise ValueError("¡Error! La duración del turno debe ser un timedelta positivo.")
+        if cantidad <= 0:
+            raise ValueError("¡Error! La cantidad de turnos a buscar debe ser mayor a cero.")
+
+        medicos_por_dia = self.__medicos_por_especialidad.get(especialidad.strip().lower())
+        libres = []
+        if medicos_por_dia is None:
+            return libres
+
+        dia = desde.date()
+        while dia <= hasta.date() and len(libres) < cantidad:
+            matriculas = medicos_por_dia[dia.weekday()]
+            if matriculas:
+                inicio = max(datetime.combine(dia, hora_inicio), desde)
+                fin = min(datetime.combine(dia, hora_fin), hasta)
+                # Cada médico genera sus bloques libres del día ya ordenados; los mezclo con un heap
+                # y me quedo con los primeros. El número de orden desempata entre médicos.
+                por_medico = [self.__bloques_libres(orden, matricula, inicio, fin,
+                                                    duracion or self.__medicos[matricula].obtener_duracion_turno(especialidad))
+                              for orden, matricula in enumerate(matriculas)]
+                for comienzo, _, matricula in merge(*por_medico):
+                    libres.append((comienzo, self.__medicos[matricula]))
+                    if len(libres) == cantidad:
+                        break
+            if dia == hasta.date() or len(libres) == cantidad:
+                break # No paso al día siguiente si no hace falta: después del 31/12/9999 no hay fecha.
+            dia += timedelta(days=1)
+        return libres
+
+    def __bloques_libres(self, orden: int, matricula: str, inicio: datetime, fin: datetime, duracion: timedelta):
+        for comienzo in self.__agenda.horarios_libres(matricula, inicio, fin, duracion):
+            yield comienzo, orden, matricula
+
     # --- Métodos de VALIDACIÓN y UTILIDADES ---
 
     def validar_existencia_paciente(self, dni: str) -> bool:
@@ -138,26 +550,389 @@ class Clinica:
     def validar_existencia_medico(self, matricula: str) -> bool:
         return matricula in self.__medicos
 
-    def validar_turno_no_duplicado(self, matricula: str, fecha_hora: datetime) -> bool:
-
-        for turno_existente in self.__turnos:
-
-            if (turno_existente.obtener_medico().obtener_matricula() == matricula and
-                turno_existente.obtener_fecha_hora() == fecha_hora):
-                return True 
-        return False 
+    def validar_turno_no_duplicado(self, matricula: str, fecha_hora: datetime, duracion: timedelta = None) -> bool:
+        # True si un turno de 'duracion' que empiece en fecha_hora se pisaría con otro del médico; sin
+        # 'duracion', si a esa hora el médico ya está atendiendo un turno. Consulto la agenda del médico
+        # (bisect) en lugar de recorrer la lista completa de turnos.
+        if duracion is None:
+            return self.__agenda.esta_ocupado(matricula, fecha_hora)
+        return not self.__agenda.esta_libre(matricula, fecha_hora, _fin_de_turno(fecha_hora, duracion))
+
+    def __superpuestos(self, matricula: str, fecha_hora: datetime, duracion: timedelta,
+                       agenda_lote: AgendaMedicos = None, reemplaza: Turno = None) -> list[Turno]:
+        # Turnos del médico que se pisan con [fecha_hora, fecha_hora + duracion), sin contar 'reemplaza'
+        # (el turno que se está reprogramando) y contando los que ya tomó una importación en curso.
+        fin = _fin_de_turno(fecha_hora, duracion)
+        superpuestos = self.__agenda.obtener_superpuestos(matricula, fecha_hora, fin)
+        if reemplaza is not None:
+            superpuestos = [t for t in superpuestos if t is not reemplaza]
+        if agenda_lote is not None:
+            superpuestos += agenda_lote.obtener_superpuestos(matricula, fecha_hora, fin)
+        return superpuestos
+
+    @staticmethod
+    def __error_superposicion(accion: str, medico: Medico, fecha_hora: datetime, ocupado: Turno) -> TurnoDuplicadoError:
+        return TurnoDuplicadoError(f"¡Imposible {accion}! El médico {medico.obtener_nombre()} ya tiene un turno de "
+                                   f"{ocupado.obtener_fecha_hora().strftime('%Y-%m-%d %H:%M')} a {ocupado.obtener_fin().strftime('%H:%M')} "
+                                   f"que se superpone con el del {fecha_hora.strftime('%Y-%m-%d %H:%M')}.")
 
     def obtener_dia_semana_en_espanol(self, fecha_hora: datetime) -> str:
-        return fecha_hora.strftime("%A").capitalize() # %A me da el nombre completo del día.
+        return dia_de_fecha(fecha_hora).capitalize() # Tabla propia en español: no depende del locale.
 
     def validar_especialidad_en_dia(self, medico: Medico, especialidad_solicitada: str, dia_semana: str) -> bool:
-        especialidad_que_atiende = medico.obtener_especialidad_para_dia(dia_semana.lower()) 
+        # Consulta directa a la máscara de días de esa especialidad (tiene en cuenta todas
+        # las especialidades del médico ese día, no solo la primera).
+        return medico.atiende_especialidad(especialidad_solicitada, dia_semana)
+
+
+    def __validar_turno(self, dni: str, matricula: str, especialidad_solicitada: str, fecha_hora: datetime,
+                        duracion: timedelta = None, agenda_lote: AgendaMedicos = None, reemplaza: Turno = None):
+        # Todas las validaciones para agendar un turno. Devuelve (paciente, medico, duracion) si está todo
+        # bien; sin 'duracion', la de la especialidad con ese médico.
+        # 'agenda_lote' tiene los turnos que ya tomó una importación en curso (ver __superpuestos).
+
+        if not isinstance(especialidad_solicitada, str) or not especialidad_solicitada.strip():
+            raise ValueError("¡Error! La especialidad solicitada para el turno no puede estar vacía.")
+        
+        if not self.validar_existencia_paciente(dni):
+            raise PacienteNoExisteError(f"¡No puedo agendar! El paciente con DNI {dni} no está registrado.")
+        
+        if not self.validar_existencia_medico(matricula):
+            raise MedicoNoExisteError(f"¡No puedo agendar! El médico con matrícula {matricula} no está registrado.")
+    
+        paciente = self.__pacientes[dni]
+        medico = self.__medicos[matricula]
+
+        if not isinstance(fecha_hora, datetime):
+            raise TypeError("¡Error! La 'fecha_hora' debe ser un objeto datetime válido para agendar el turno.")
+
+        if duracion is None:
+            duracion = medico.obtener_duracion_turno(especialidad_solicitada) # Ya validada por la Especialidad.
+        else:
+            validar_duracion_turno(duracion)
+        superpuestos = self.__superpuestos(matricula, fecha_hora, duracion, agenda_lote, reemplaza)
+        if superpuestos:
+            raise self.__error_superposicion("agendar", medico, fecha_hora, superpuestos[0])
 
-        if especialidad_que_atiende is None:
-            return False
+        dia_semana_espanol = self.obtener_dia_semana_en_espanol(fecha_hora)
+
+        if not medico.obtener_especialidades_para_dia(dia_semana_espanol):
+            raise MedicoNoTrabajaEseDiaError(f"¡No se puede agendar! El médico {medico.obtener_nombre()} no atiende los días {dia_semana_espanol}.")
         
-        return especialidad_que_atiende.lower() == especialidad_solicitada.lower()
+        if not self.validar_especialidad_en_dia(medico, especialidad_solicitada, dia_semana_espanol):
+             raise MedicoNoAtiendeEspecialidadError(f"¡No se puede agendar! El médico {medico.obtener_nombre()} no atiende {especialidad_solicitada} los días {dia_semana_espanol}.")
 
+        return paciente, medico, duracion
+
+    # --- Importación masiva ---
+
+    def importar_lote(self, tipo: str, filas, tamanio_lote: int = 5000) -> ResultadoImportacion:
+        # Importa muchas filas (diccionarios) de pacientes, médicos o turnos de una vez.
+        # Valida por lotes, anota los errores de cada fila sin cortar la importación y guarda
+        # las filas válidas de cada lote juntas, sin imprimir nada y con una sola escritura al diario.
+        if tipo not in TIPOS_IMPORTACION:
+            raise ValueError(f"¡Error! Tipo de importación desconocido: '{tipo}'. Usar uno de: {', '.join(TIPOS_IMPORTACION)}.")
+        if tamanio_lote <= 0:
+            raise ValueError("¡Error! El tamaño de lote debe ser mayor a cero.")
+
+        resultado = ResultadoImportacion()
+        lote = []
+        for numero_fila, fila in enumerate(filas, start=1):
+            lote.append((numero_fila, fila))
+            if len(lote) >= tamanio_lote:
+                self.__importar_con_cerrojos(tipo, lote, resultado)
+                lote = []
+        if lote:
+            self.__importar_con_cerrojos(tipo, lote, resultado)
+        return resultado
+
+    def __importar_con_cerrojos(self, tipo: str, lote: list, resultado: ResultadoImportacion):
+        # Los turnos importados entran en la agenda de sus médicos, y agendar_turno la lee (al validar)
+        # con solo el cerrojo de ese médico. Así que antes del cerrojo de escritura tomo los de los médicos
+        # del lote, siempre en el mismo orden, como hace cualquier alta de turno con el suyo.
+        while True:
+            cerrojos = self.__cerrojos_de_lote(tipo, lote)
+            with ExitStack() as tomados:
+                for cerrojo in cerrojos:
+                    tomados.enter_context(cerrojo)
+                with self.__cerrojo_escritura:
+                    if self.__cerrojos_de_lote(tipo, lote) == cerrojos:
+                        self.__importar_un_lote(tipo, lote, resultado)
+                        return
+            # Mientras esperaba se registró algún médico del lote: vuelvo a empezar tomando también el suyo.
+
+    def __cerrojos_de_lote(self, tipo: str, lote: list) -> list:
+        if tipo != "turnos":
+            return []
+        if self.__modo_concurrencia == "global":
+            return [self.__cerrojo_global]
+        # Los médicos que todavía no existen no hacen falta: esas filas se rechazan sin tocar la agenda.
+        matriculas = {fila.get("matricula") for _, fila in lote if isinstance(fila, dict)}
+        return [self.__cerrojos_medicos[m] for m in sorted(m for m in matriculas
+                                                           if isinstance(m, str) and m in self.__cerrojos_medicos)]
+
+    def __importar_un_lote(self, tipo: str, lote: list, resultado: ResultadoImportacion):
+        validos = []
+        registros = []
+        vistos = set() # Claves ya tomadas dentro de este mismo lote.
+        agenda_lote = AgendaMedicos() # Turnos ya tomados dentro de este mismo lote, para ver superposiciones.
+
+        # Primera pasada: solo valido, no toco el estado de la clínica.
+        for numero_fila, fila in lote:
+            try:
+                if not isinstance(fila, dict):
+                    raise ValueError("¡Error! La fila no es un registro válido.")
+                if tipo == "pacientes":
+                    paciente = Paciente(fila["nombre"], fila["dni"], fila["fecha_nacimiento"])
+                    dni = paciente.obtener_dni()
+                    if dni in self.__pacientes or dni in vistos:
+                        raise PacienteExistenteError(f"¡Atención! El paciente con DNI {dni} ya está registrado.")
+                    vistos.add(dni)
+                    validos.append(paciente)
+                    registros.append([paciente.obtener_nombre(), dni, paciente.obtener_fecha_nacimiento()])
+
+                elif tipo == "medicos":
+                    especialidades = [Especialidad(t, d, m) for t, d, m in leer_especialidades(fila["especialidades"])]
+                    medico = Medico(fila["nombre"], fila["matricula"], especialidades)
+                    matricula = medico.obtener_matricula()
+                    if matricula in self.__medicos or matricula in vistos:
+                        raise MedicoExistenteError(f"¡Atención! El médico con matrícula {matricula} ya está registrado.")
+                    vistos.add(matricula)
+                    validos.append(medico)
+                    registros.append([medico.obtener_nombre(), matricula, [self.__datos_de_especialidad(e) for e in especialidades]])
+
+                else:
+                    dni, matricula = fila["dni"], fila["matricula"]
+                    fecha_hora = leer_fecha_hora(fila["fecha_hora"])
+                    paciente, medico, duracion = self.__validar_turno(dni, matricula, fila["especialidad"], fecha_hora,
+                                                                      leer_duracion(fila.get("duracion_minutos")), agenda_lote)
+                    turno = Turno(paciente, medico, fecha_hora, fila["especialidad"].strip(), duracion)
+                    agenda_lote.agregar(matricula, fecha_hora, turno, duracion)
+                    validos.append(turno)
+                    registros.append([dni, matricula, turno.obtener_especialidad_solicitada(), fecha_hora.isoformat(),
+                                      duracion // _UN_MINUTO])
+
+            except KeyError as e:
+                resultado.agregar_error(numero_fila, f"Falta la columna {e}.")
+            except (ValueError, TypeError, AttributeError) + ERRORES_DE_VALIDACION as e:
+                resultado.agregar_error(numero_fila, str(e))
+
+        # Segunda pasada: guardo todo lo válido de una vez y lo anoto como un único registro.
+        if tipo == "pacientes":
+            self.__guardar_pacientes(validos)
+        else:
+            guardar = self.__guardar_medico if tipo == "medicos" else self.__guardar_turno
+            for objeto in validos:
+                guardar(objeto)
+        self.__registrar_lote({"pacientes": "P", "medicos": "M", "turnos": "T"}[tipo], registros)
+        resultado.sumar_importados(len(validos))
+        if validos and self.__eventos.hay_suscriptores():
+            self.__eventos.publicar(LoteImportado(tipo, len(validos)))
+
+    # --- Persistencia ---
+
+    def guardar_instantanea(self):
+        # Vuelca el estado completo al disco y vacía el diario, para que la próxima
+        # recuperación no tenga que reproducir todas las operaciones.
+        if self.__almacenamiento is None:
+            raise ValueError("¡Error! Esta clínica no tiene almacenamiento configurado.")
+        with self.__cerrojo_escritura:
+            self.__almacenamiento.guardar_instantanea(self.__exportar_estado())
+
+    def cerrar(self):
+        if self.__almacenamiento is not None:
+            with self.__cerrojo_escritura:
+                self.__almacenamiento.cerrar()
+
+    def __cerrojo_para(self, matricula: str):
+        if self.__modo_concurrencia == "global":
+            return self.__cerrojo_global
+        # Si el médico no existe, la validación lo va a rechazar; uso el cerrojo global para no crear uno.
+        return self.__cerrojos_medicos.get(matricula, self.__cerrojo_global)
+
+    def __registrar(self, *operacion):
+        if self.__almacenamiento is None:
+            return
+        self.__almacenamiento.registrar(*operacion)
+        if self.__almacenamiento.necesita_instantanea():
+            self.guardar_instantanea()
+
+    def __registrar_lote(self, codigo_operacion: str, filas: list):
+        if self.__almacenamiento is None or not filas:
+            return
+        self.__almacenamiento.registrar_lote(codigo_operacion, filas)
+        if self.__almacenamiento.necesita_instantanea():
+            self.guardar_instantanea()
+
+    def __al_agregar_especialidad(self, medico: Medico, especialidad: Especialidad):
+        with self.__cerrojo_escritura:
+            self.__indexar_especialidad(medico.obtener_matricula(), especialidad)
+            self.__registrar("E", medico.obtener_matricula(), *self.__datos_de_especialidad(especialidad))
+        if self.__eventos.hay_suscriptores():
+            self.__eventos.publicar(EspecialidadAgregada(medico, especialidad))
+
+    # Estos métodos guardan en memoria sin validar ni imprimir. Los usan las operaciones
+    # públicas (después de validar) y la recuperación desde disco (datos ya validados).
+
+    def __guardar_paciente(self, paciente: Paciente):
+        self.__pacientes[paciente.obtener_dni()] = paciente
+        self.__orden_pacientes.append(paciente)
+        self.__historias_clinicas[paciente.obtener_dni()] = HistoriaClinica(paciente)
+        self.__indice_pacientes.agregar(paciente)
+
+    def __guardar_pacientes(self, pacientes: list):
+        # Lo mismo para muchos juntos (importación y recuperación): el índice por nombre los agrega de una vez.
+        for paciente in pacientes:
+            self.__pacientes[paciente.obtener_dni()] = paciente
+            self.__historias_clinicas[paciente.obtener_dni()] = HistoriaClinica(paciente)
+        self.__orden_pacientes.extend(pacientes)
+        self.__indice_pacientes.agregar_varios(pacientes)
+
+    def __guardar_medico(self, medico: Medico):
+        self.__medicos[medico.obtener_matricula()] = medico
+        self.__orden_medicos.append(medico)
+        self.__cerrojos_medicos[medico.obtener_matricula()] = threading.Lock()
+        for especialidad in medico.obtener_especialidad():
+            self.__indexar_especialidad(medico.obtener_matricula(), especialidad)
+        medico.suscribir_cambios(self.__al_agregar_especialidad)
+
+    def __indexar_especialidad(self, matricula: str, especialidad: Especialidad):
+        medicos_por_dia = self.__medicos_por_especialidad.setdefault(especialidad.obtener_tipo().lower(), [[] for _ in range(7)])
+        mascara = especialidad.obtener_mascara_dias()
+        for numero_dia in range(7):
+            if mascara >> numero_dia & 1:
+                medicos_por_dia[numero_dia].append(matricula)
+
+    def __guardar_turno(self, turno: Turno, identificador: int = None):
+        # Sin 'identificador' le toca el próximo id; con él (al recuperar una instantánea) respeto el guardado.
+        if identificador is None:
+            identificador = self.__proximo_id_turno
+        turno.asignar_id(identificador)
+        self.__proximo_id_turno = max(self.__proximo_id_turno, identificador + 1)
+        self.__turnos_por_id[identificador] = turno
+        if isinstance(self.__turnos, TurnosColumnares):
+            self.__turnos.agregar(turno)
+        else:
+            self.__turnos.append(turno)
+        self.__agenda.agregar(turno.obtener_medico().obtener_matricula(), turno.obtener_fecha_hora(), turno, turno.obtener_duracion())
+        self.__indice_turnos.agregar(turno)
+        self.__historias_clinicas[turno.obtener_paciente().obtener_dni()].agregar_turno(turno)
+
+    def __guardar_receta(self, receta: Receta):
+        receta.asignar_id(self.__proximo_id_receta)
+        self.__proximo_id_receta += 1
+        self.__historias_clinicas[receta.obtener_paciente().obtener_dni()].agregar_receta(receta)
+        self.__medicamentos.agregar(receta)
+
+    def __quitar_turno(self, turno: Turno):
+        # Baja de un turno: fuera del diccionario de ids, de la agenda y de los índices ya mismo;
+        # en la lista de la clínica y en la historia queda marcado hasta la próxima compactación.
+        identificador = turno.obtener_id()
+        del self.__turnos_por_id[identificador]
+        turno.cancelar(self.__bajas_totales)
+        if isinstance(self.__turnos, TurnosColumnares):
+            # Las columnas no guardan el objeto: anoto el id como baja.
+            self.__turnos.quitar(identificador, self.__bajas_totales)
+        self.__bajas_totales += 1
+        self.__agenda.quitar(turno.obtener_medico().obtener_matricula(), turno.obtener_fecha_hora())
+        self.__indice_turnos.quitar(turno)
+        self.__historias_con_bajas.add(turno.obtener_paciente().obtener_dni())
+        self.__bajas_pendientes += 1
+
+    def __compactar_si_hace_falta(self):
+        # Compacto cuando las bajas son una cuarta parte de la lista (y al menos MINIMO_BAJAS_PARA_COMPACTAR):
+        # cada compactación recorre la lista entera, pero pasa cada muchas bajas, así que por baja cuesta poco.
+        # Con vistas abiertas espero: la próxima baja después de cerrarlas vuelve a probar.
+        if not self.__vistas and self.__bajas_pendientes >= max(self.MINIMO_BAJAS_PARA_COMPACTAR, len(self.__turnos) // 4):
+            self.compactar_turnos()
+
+    def __exportar_estado(self) -> dict:
+        return {
+            "pacientes": [[p.obtener_nombre(), p.obtener_dni(), p.obtener_fecha_nacimiento()] for p in self.__pacientes.values()],
+            "medicos": [[m.obtener_nombre(), m.obtener_matricula(), [self.__datos_de_especialidad(e) for e in m.obtener_especialidad()]]
+                        for m in self.__medicos.values()],
+            "turnos": [[dni, matricula, especialidad, fecha_hora.isoformat(), identificador, duracion // _UN_MINUTO]
+                       for dni, matricula, especialidad, fecha_hora, identificador, duracion in self.__filas_de_turnos()],
+            "proximo_id_turno": self.__proximo_id_turno,
+            "recetas": [[dni, r.obtener_medico().obtener_matricula(), r.obtener_medicamentos(), r.obtener_fecha().isoformat()]
+                        for dni, historia in self.__historias_clinicas.items() for r in historia.obtener_recetas()],
+        }
+
+    def __filas_de_turnos(self):
+        if isinstance(self.__turnos, TurnosColumnares):
+            return self.__turnos.iterar_filas() # No hace falta armar los Turno para guardarlos.
+        return ((t.obtener_paciente().obtener_dni(), t.obtener_medico().obtener_matricula(),
+                 t.obtener_especialidad_solicitada(), t.obtener_fecha_hora(), t.obtener_id(), t.obtener_duracion())
+                for t in self.__turnos if not t.esta_cancelado())
+
+    @staticmethod
+    def __datos_de_especialidad(especialidad: Especialidad) -> list:
+        # [tipo, días, minutos por turno], como se anota en el diario y en la instantánea.
+        return [especialidad.obtener_tipo(), especialidad.obtener_dias_atencion(), especialidad.obtener_duracion_turno() // _UN_MINUTO]
+
+    @staticmethod
+    def __especialidad_de_datos(tipo: str, dias: list, *minutos) -> Especialidad:
+        # Los diarios anteriores a las duraciones no traen los minutos: queda la duración general.
+        return Especialidad(tipo, dias, timedelta(minutes=minutos[0])) if minutos else Especialidad(tipo, dias)
+
+    def __recuperar(self, almacenamiento: AlmacenamientoClinica):
+        estado, registros = almacenamiento.cargar()
+        if estado is not None:
+            self.__guardar_pacientes([Paciente(nombre, dni, fecha_nacimiento) for nombre, dni, fecha_nacimiento in estado["pacientes"]])
+            for nombre, matricula, especialidades in estado["medicos"]:
+                self.__guardar_medico(Medico(nombre, matricula, [self.__especialidad_de_datos(*e) for e in especialidades]))
+            for dni, matricula, especialidad, fecha_hora, *resto in estado["turnos"]:
+                # Las instantáneas anteriores a los ids no lo traen (los turnos se numeran en orden), y
+                # las anteriores a las duraciones tampoco la duración (la de la especialidad).
+                identificador = resto[0] if resto else None
+                duracion = timedelta(minutes=resto[1]) if len(resto) > 1 else None
+                self.__guardar_turno(Turno(self.__pacientes[dni], self.__medicos[matricula],
+                                           datetime.fromisoformat(fecha_hora), especialidad, duracion), identificador)
+            self.__proximo_id_turno = max(self.__proximo_id_turno, estado.get("proximo_id_turno", 0))
+            for dni, matricula, medicamentos, fecha in estado["recetas"]:
+                self.__guardar_receta(Receta(self.__pacientes[dni], self.__medicos[matricula], medicamentos,
+                                             datetime.fromisoformat(fecha)))
+
+        # Reproduzco la cola del diario. Todavía no tengo asignado el almacenamiento,
+        # así que nada de esto se vuelve a anotar.
+        for registro in registros:
+            if registro[1] == "L" and registro[2] == "P":
+                self.__guardar_pacientes([Paciente(*datos) for datos in registro[3]])
+            elif registro[1] == "L":
+                for datos in registro[3]:
+                    self.__aplicar_registro(registro[2], datos)
+            else:
+                self.__aplicar_registro(registro[1], registro[2:])
+
+    def __aplicar_registro(self, operacion: str, datos: list):
+        if operacion == "P":
+            self.__guardar_paciente(Paciente(*datos))
+        elif operacion == "M":
+            nombre, matricula, especialidades = datos
+            self.__guardar_medico(Medico(nombre, matricula, [self.__especialidad_de_datos(*e) for e in especialidades]))
+        elif operacion == "E":
+            matricula, *especialidad = datos
+            self.__medicos[matricula].agregar_especialidad(self.__especialidad_de_datos(*especialidad))
+        elif operacion == "T":
+            dni, matricula, especialidad, fecha_hora, *minutos = datos # Los diarios viejos no traen la duración.
+            self.__guardar_turno(Turno(self.__pacientes[dni], self.__medicos[matricula], datetime.fromisoformat(fecha_hora),
+                                       especialidad, timedelta(minutes=minutos[0]) if minutos else None))
+        elif operacion == "C":
+            self.__quitar_turno(self.__turnos_por_id[datos[0]])
+            self.__compactar_si_hace_falta()
+        elif operacion == "V":
+            identificador, fecha_hora = datos
+            anterior = self.__turnos_por_id[identificador]
+            self.__quitar_turno(anterior)
+            self.__guardar_turno(Turno(anterior.obtener_paciente(), anterior.obtener_medico(), datetime.fromisoformat(fecha_hora),
+                                       anterior.obtener_especialidad_solicitada(), anterior.obtener_duracion()))
+            self.__compactar_si_hace_falta()
+        elif operacion == "R":
+            dni, matricula, medicamentos, fecha = datos
+            self.__guardar_receta(Receta(self.__pacientes[dni], self.__medicos[matricula], medicamentos,
+                                         datetime.fromisoformat(fecha)))
+        else:
+            raise ValueError(f"¡Error! Operación desconocida en el diario: {operacion}")
 
     # --- Método de Representación ---
 
@@ -172,7 +947,7 @@ class Clinica:
 
         # Resumen de turnos.
 
-        total_turnos = len(self.__turnos)
+        total_turnos = self.cantidad_turnos()
         turnos_str = f"  Total de Turnos Agendados: {total_turnos}"
 
         # Resumen de historias clínicas (solo cuántas hay).
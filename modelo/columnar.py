@@ -0,0 +1,290 @@
+from array import array
+from collections import Counter
+from itertools import compress, repeat
+from operator import add, and_, eq, floordiv, le, lt, mod, mul, not_
+from datetime import date, datetime, timedelta
+import sys
+
+from modelo.paciente import Paciente
+from modelo.medico import Medico
+from modelo.turno import Turno
+
+# Los horarios se guardan como segundos desde esta fecha (sin zona horaria, igual que los turnos).
+# Uso el primer día que admite datetime (un lunes): así los segundos y los días nunca son negativos.
+EPOCA = datetime.min
+_SEGUNDOS_POR_DIA = 86400
+_DIA_EPOCA = EPOCA.toordinal()
+_SEGUNDOS_POR_SEMANA = 7 * _SEGUNDOS_POR_DIA
+_PERIODOS_CLAVE = 1 << 22 # Más que la cantidad de días desde EPOCA de cualquier datetime (hasta el año 9999).
+
+
+def a_segundos(fecha_hora: datetime) -> int:
+    return (fecha_hora - EPOCA) // timedelta(seconds=1)
+
+
+def desde_segundos(segundos: int) -> datetime:
+    return EPOCA + timedelta(seconds=segundos)
+
+
+class TurnosColumnares:
+    # Los turnos guardados por columnas en arreglos tipados en lugar de un objeto Turno por fila:
+    # médico, paciente y especialidad como números (códigos) y la fecha como segundos desde EPOCA.
+    # Cada turno ocupa 4 + 4 + 4 + 8 + 8 + 2 bytes (con el id y los minutos que dura), y los conteos recorren las columnas sin crear objetos.
+    # Los Turno se arman recién cuando alguien pide uno (obtener_turno / iterar_turnos). Esto vale para
+    # el almacén en sí: Clinica(columnar=True) igual guarda sus objetos Turno en otras estructuras.
+    # Los turnos cancelados siguen en las columnas (su id queda en 'cancelados') hasta que la
+    # clínica pide una copia compactada; los conteos y filtros ya no los tienen en cuenta.
+    def __init__(self):
+        self.__medicos = array("i")
+        self.__pacientes = array("i")
+        self.__especialidades = array("i")
+        self.__segundos = array("q")
+        self.__ids = array("q") # Id del turno en la clínica (-1 si no tiene).
+        self.__minutos = array("H") # Duración del turno (a lo sumo un día: 1440 minutos).
+        self.__cancelados: dict[int, int] = {} # Id -> número de baja (ver Turno.cancelar).
+
+        # Tablas de códigos: objeto -> código y código -> objeto.
+        self.__codigo_medico: dict[str, int] = {}
+        self.__lista_medicos: list[Medico] = []
+        self.__codigo_paciente: dict[str, int] = {}
+        self.__lista_pacientes: list[Paciente] = []
+        self.__codigo_especialidad: dict[str, int] = {}
+        self.__lista_especialidades: list[str] = []
+        self.__duraciones: dict[int, timedelta] = {} # Minutos -> timedelta: hay muy pocas duraciones distintas.
+
+    def __len__(self):
+        # Filas guardadas, contando las de turnos cancelados que todavía no se compactaron.
+        return len(self.__segundos)
+
+    # --- Carga ---
+
+    def agregar(self, turno: Turno):
+        identificador = turno.obtener_id()
+        self.agregar_valores(turno.obtener_paciente(), turno.obtener_medico(), turno.obtener_especialidad_solicitada(),
+                             turno.obtener_fecha_hora(), -1 if identificador is None else identificador, turno.obtener_duracion())
+
+    def agregar_valores(self, paciente: Paciente, medico: Medico, especialidad: str, fecha_hora: datetime,
+                        identificador: int = -1, duracion: timedelta = None):
+        if duracion is None: # La de la especialidad, como en Turno.
+            duracion = medico.obtener_duracion_turno(especialidad)
+        codigo_medico = self.__codigo_medico.get(medico.obtener_matricula())
+        if codigo_medico is None:
+            codigo_medico = self.__codigo_medico[medico.obtener_matricula()] = len(self.__lista_medicos)
+            self.__lista_medicos.append(medico)
+        codigo_paciente = self.__codigo_paciente.get(paciente.obtener_dni())
+        if codigo_paciente is None:
+            codigo_paciente = self.__codigo_paciente[paciente.obtener_dni()] = len(self.__lista_pacientes)
+            self.__lista_pacientes.append(paciente)
+        codigo_especialidad = self.__codigo_especialidad.get(especialidad)
+        if codigo_especialidad is None:
+            codigo_especialidad = self.__codigo_especialidad[especialidad] = len(self.__lista_especialidades)
+            self.__lista_especialidades.append(sys.intern(especialidad))
+
+        # Escribo la fecha al final: mientras no esté, len() no cuenta esta fila a medio cargar.
+        self.__medicos.append(codigo_medico)
+        self.__pacientes.append(codigo_paciente)
+        self.__especialidades.append(codigo_especialidad)
+        self.__ids.append(identificador)
+        self.__minutos.append(duracion // timedelta(minutes=1))
+        self.__segundos.append(a_segundos(fecha_hora))
+
+    # --- Bajas ---
+
+    def quitar(self, identificador: int, numero_baja: int = 0):
+        # Marca el turno como cancelado: tiempo constante, no mueve ninguna columna.
+        self.__cancelados[identificador] = numero_baja
+
+    def compactada(self) -> "TurnosColumnares":
+        # Copia sin las filas de turnos cancelados. Es una copia y no un cambio en el lugar para que
+        # quien esté recorriendo esta (por posición) no se saltee filas. Las tablas de códigos se comparten.
+        nueva = TurnosColumnares()
+        vigentes = self.__mascara_vigentes(len(self))
+        nueva.__medicos = array("i", compress(self.__medicos, vigentes))
+        nueva.__pacientes = array("i", compress(self.__pacientes, vigentes))
+        nueva.__especialidades = array("i", compress(self.__especialidades, vigentes))
+        nueva.__ids = array("q", compress(self.__ids, vigentes))
+        nueva.__minutos = array("H", compress(self.__minutos, vigentes))
+        nueva.__segundos = array("q", compress(self.__segundos, vigentes))
+        nueva.__codigo_medico, nueva.__lista_medicos = self.__codigo_medico, self.__lista_medicos
+        nueva.__codigo_paciente, nueva.__lista_pacientes = self.__codigo_paciente, self.__lista_pacientes
+        nueva.__codigo_especialidad, nueva.__lista_especialidades = self.__codigo_especialidad, self.__lista_especialidades
+        nueva.__duraciones = self.__duraciones
+        return nueva
+
+    def __mascara_vigentes(self, cantidad: int) -> list[bool]:
+        # True en las filas de turnos no cancelados, armada en C (map sobre la columna de ids).
+        return list(map(not_, map(self.__cancelados.__contains__, self.__ids[:cantidad])))
+
+    # --- Acceso fila por fila (materializa Turno) ---
+
+    def obtener_turno(self, posicion: int) -> Turno:
+        turno = Turno(self.__lista_pacientes[self.__pacientes[posicion]], self.__lista_medicos[self.__medicos[posicion]],
+                      desde_segundos(self.__segundos[posicion]), self.__lista_especialidades[self.__especialidades[posicion]],
+                      self.obtener_duracion(posicion))
+        identificador = self.__ids[posicion]
+        if identificador >= 0:
+            turno.asignar_id(identificador)
+            numero_baja = self.__cancelados.get(identificador)
+            if numero_baja is not None:
+                turno.cancelar(numero_baja)
+        return turno
+
+    def obtener_fila(self, posicion: int) -> tuple[str, str, str, datetime]:
+        # (dni, matrícula, especialidad, fecha_hora) sin crear el Turno: lo usa la instantánea.
+        return (self.__lista_pacientes[self.__pacientes[posicion]].obtener_dni(),
+                self.__lista_medicos[self.__medicos[posicion]].obtener_matricula(),
+                self.__lista_especialidades[self.__especialidades[posicion]],
+                desde_segundos(self.__segundos[posicion]))
+
+    def obtener_duracion(self, posicion: int) -> timedelta:
+        minutos = self.__minutos[posicion]
+        duracion = self.__duraciones.get(minutos)
+        if duracion is None:
+            duracion = self.__duraciones[minutos] = timedelta(minutes=minutos)
+        return duracion
+
+    def __getitem__(self, posicion):
+        # Se puede usar como la lista de turnos de antes: turnos[i], turnos[a:b] (con paginar, por ejemplo).
+        if isinstance(posicion, slice):
+            return [self.obtener_turno(p) for p in range(*posicion.indices(len(self)))]
+        if posicion < 0:
+            posicion += len(self)
+        if not 0 <= posicion < len(self):
+            raise IndexError("¡Error! No hay un turno en esa posición.")
+        return self.obtener_turno(posicion)
+
+    def __iter__(self):
+        return self.iterar_turnos()
+
+    def iterar_filas(self):
+        # (dni, matrícula, especialidad, fecha_hora, id, duración) de los turnos no cancelados.
+        for posicion in range(len(self)):
+            identificador = self.__ids[posicion]
+            if identificador not in self.__cancelados:
+                yield self.obtener_fila(posicion) + (identificador, self.obtener_duracion(posicion))
+
+    def iterar_turnos(self, desde: int = 0):
+        # Como iterar_lista: recorre por posición, así ve también lo que se agrega mientras tanto.
+        posicion = desde
+        while posicion < len(self):
+            yield self.obtener_turno(posicion)
+            posicion += 1
+
+    # --- Filtros y conteos sobre las columnas ---
+
+    def filtrar(self, matricula: str = None, dni: str = None, especialidad: str = None,
+                desde: datetime = None, hasta: datetime = None) -> list[int]:
+        # Posiciones de los turnos que cumplen todos los filtros (fecha en [desde, hasta)).
+        posiciones, mascara = self.__filtrar(matricula, dni, especialidad, desde, hasta)
+        return list(posiciones if mascara is None else compress(posiciones, mascara))
+
+    def contar(self, matricula: str = None, dni: str = None, especialidad: str = None,
+               desde: datetime = None, hasta: datetime = None) -> int:
+        if matricula is None and dni is None and especialidad is None and desde is None and hasta is None:
+            return len(self) - len(self.__cancelados)
+        posiciones, mascara = self.__filtrar(matricula, dni, especialidad, desde, hasta)
+        return len(posiciones) if mascara is None else sum(mascara)
+
+    def __filtrar(self, matricula, dni, especialidad, desde, hasta):
+        # Devuelve (posiciones, máscara): las filas que pasan son las posiciones donde la máscara es True
+        # (o todas si es None). Los filtros por código suelen dejar pocas filas, así que achican las
+        # posiciones de una vez con compress; la fecha y las bajas se juntan en una sola máscara perezosa.
+        # Todo con map, compress y operator sobre las columnas: ningún bucle de Python por turno.
+        posiciones = range(len(self))
+        for columna, codigos, valor in ((self.__medicos, self.__codigo_medico, matricula),
+                                        (self.__pacientes, self.__codigo_paciente, dni),
+                                        (self.__especialidades, self.__codigo_especialidad, especialidad)):
+            if valor is None:
+                continue
+            codigo = codigos.get(valor)
+            if codigo is None:
+                return [], None
+            posiciones = list(compress(posiciones, map(eq, self.__valores(columna, posiciones), repeat(codigo))))
+        mascaras = []
+        if desde is not None or hasta is not None:
+            segundos = self.__valores(self.__segundos, posiciones)
+            if desde is not None and hasta is not None:
+                segundos = list(segundos) # Lo recorren las dos comparaciones.
+            if desde is not None:
+                mascaras.append(map(le, repeat(a_segundos(desde)), segundos))
+            if hasta is not None:
+                mascaras.append(map(lt, segundos, repeat(a_segundos(hasta))))
+        if self.__cancelados:
+            mascaras.append(map(not_, map(self.__cancelados.__contains__, self.__valores(self.__ids, posiciones))))
+        if not mascaras:
+            return posiciones, None
+        mascara = mascaras[0]
+        for otra in mascaras[1:]:
+            mascara = map(and_, mascara, otra)
+        return posiciones, mascara
+
+    @staticmethod
+    def __valores(columna: array, posiciones):
+        # Los valores de la columna en esas posiciones. Si todavía son todas, la recorro directo (más rápido).
+        if isinstance(posiciones, range):
+            return columna[:len(posiciones)]
+        return map(columna.__getitem__, posiciones)
+
+    def __contar_por_codigo_y_periodo(self, columna: array, segundos_por_periodo: int) -> Counter:
+        # Cuenta pares (código, número de período desde EPOCA) juntando los dos en un solo entero:
+        # codigo * _PERIODOS_CLAVE + período. map, Counter y las operaciones de operator recorren las
+        # columnas en C, sin un bucle de Python por turno.
+        cantidad = len(self)
+        segundos, codigos = self.__segundos[:cantidad], columna[:cantidad]
+        if self.__cancelados:
+            vigentes = self.__mascara_vigentes(cantidad)
+            segundos, codigos = compress(segundos, vigentes), compress(codigos, vigentes)
+        periodos = map(floordiv, segundos, repeat(segundos_por_periodo))
+        claves = map(add, map(mul, codigos, repeat(_PERIODOS_CLAVE)), periodos)
+        return Counter(claves)
+
+    def contar_por_medico_y_semana(self) -> dict[tuple[str, date], int]:
+        # {(matrícula, lunes de la semana): cantidad de turnos}. EPOCA es lunes, así que la semana
+        # de un turno es directamente segundos // segundos de una semana.
+        resultado = {}
+        for clave, total in self.__contar_por_codigo_y_periodo(self.__medicos, _SEGUNDOS_POR_SEMANA).items():
+            codigo, semana = divmod(clave, _PERIODOS_CLAVE)
+            resultado[(self.__lista_medicos[codigo].obtener_matricula(), date.fromordinal(_DIA_EPOCA + 7 * semana))] = total
+        return resultado
+
+    def contar_por_medico_especialidad_y_dia(self, desde: datetime = None,
+                                             hasta: datetime = None) -> dict[tuple[str, str, int], int]:
+        # {(matrícula, especialidad, día de la semana 0-6): cantidad} de los turnos con fecha en [desde, hasta).
+        # Igual que arriba: una clave entera por turno, ((médico * especialidades) + especialidad) * 7 + día,
+        # y el filtro por rango y por bajas como máscaras armadas con map. EPOCA es lunes: el día de la
+        # semana es (segundos // segundos de un día) % 7.
+        cantidad = len(self)
+        segundos = self.__segundos[:cantidad]
+        medicos, especialidades = self.__medicos[:cantidad], self.__especialidades[:cantidad]
+        cantidad_especialidades = len(self.__lista_especialidades) # Después de copiar: ningún código la supera.
+        mascara = None
+        if desde is not None or hasta is not None:
+            minimo = a_segundos(desde) if desde is not None else -2 ** 63
+            maximo = a_segundos(hasta) if hasta is not None else 2 ** 63 - 1
+            mascara = list(map(and_, map(le, repeat(minimo), segundos), map(lt, segundos, repeat(maximo))))
+        if self.__cancelados:
+            vigentes = self.__mascara_vigentes(cantidad)
+            mascara = vigentes if mascara is None else list(map(and_, mascara, vigentes))
+        if mascara is not None:
+            segundos = compress(segundos, mascara)
+            medicos, especialidades = compress(medicos, mascara), compress(especialidades, mascara)
+
+        dias = map(mod, map(floordiv, segundos, repeat(_SEGUNDOS_POR_DIA)), repeat(7))
+        combinados = map(add, map(mul, medicos, repeat(cantidad_especialidades)), especialidades)
+        resultado = {}
+        for clave, total in Counter(map(add, map(mul, combinados, repeat(7)), dias)).items():
+            combinado, dia = divmod(clave, 7)
+            codigo_medico, codigo_especialidad = divmod(combinado, cantidad_especialidades)
+            resultado[(self.__lista_medicos[codigo_medico].obtener_matricula(),
+                       self.__lista_especialidades[codigo_especialidad], dia)] = total
+        return resultado
+
+    def contar_por_especialidad_y_mes(self) -> dict[tuple[str, tuple[int, int]], int]:
+        # {(especialidad, (año, mes)): cantidad de turnos}. Los meses no tienen largo fijo: cuento por
+        # día y paso de día a mes una vez por par (especialidad, día) distinto, no por turno.
+        resultado = Counter()
+        for clave, total in self.__contar_por_codigo_y_periodo(self.__especialidades, _SEGUNDOS_POR_DIA).items():
+            codigo, dia = divmod(clave, _PERIODOS_CLAVE)
+            fecha = date.fromordinal(_DIA_EPOCA + dia)
+            resultado[(self.__lista_especialidades[codigo], (fecha.year, fecha.month))] += total
+        return dict(resultado)
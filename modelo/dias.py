@@ -0,0 +1,47 @@
+import unicodedata
+from datetime import datetime
+
+# Nombres de los días en español, en el orden de datetime.weekday() (0 = lunes).
+# Con esta tabla no dependo de strftime("%A") ni del locale que haya configurado el proceso.
+DIAS_SEMANA = ("lunes", "martes", "miércoles", "jueves", "viernes", "sábado", "domingo")
+
+# Clave canónica de cada día: en minúsculas y sin tildes. Es la que comparan
+# Especialidad, Medico y Clinica, así "miércoles", "Miercoles" y "MIÉRCOLES" son lo mismo.
+CLAVES_DIAS = ("lunes", "martes", "miercoles", "jueves", "viernes", "sabado", "domingo")
+
+# También acepto los nombres en inglés: es lo que devuelve strftime("%A") con el locale "C",
+# y hay código (y datos viejos) que todavía arma los días de esa forma.
+_NOMBRES_EN_INGLES = ("monday", "tuesday", "wednesday", "thursday", "friday", "saturday", "sunday")
+
+_INDICE_POR_NOMBRE = {}
+for _indice, (_clave, _nombre, _ingles) in enumerate(zip(CLAVES_DIAS, DIAS_SEMANA, _NOMBRES_EN_INGLES)):
+    _INDICE_POR_NOMBRE[_clave] = _indice
+    _INDICE_POR_NOMBRE[_nombre] = _indice
+    _INDICE_POR_NOMBRE[_ingles] = _indice
+
+
+def _sin_tildes(texto: str) -> str:
+    descompuesto = unicodedata.normalize("NFKD", texto)
+    return "".join(c for c in descompuesto if not unicodedata.combining(c))
+
+
+def indice_dia(dia) -> int | None:
+    # Número de día (0 = lunes ... 6 = domingo) para un nombre de día, o None si no es un día.
+    if not isinstance(dia, str):
+        return None
+    texto = dia.strip().lower()
+    indice = _INDICE_POR_NOMBRE.get(texto)
+    if indice is None and texto:
+        indice = _INDICE_POR_NOMBRE.get(_sin_tildes(texto)) # Caso raro: tildes en otra letra o en otra forma Unicode.
+    return indice
+
+
+def normalizar_dia(dia) -> str | None:
+    # Clave canónica ("lunes", ..., "miercoles", ..., "sabado", "domingo") o None si no es un día.
+    indice = indice_dia(dia)
+    return None if indice is None else CLAVES_DIAS[indice]
+
+
+def dia_de_fecha(fecha: datetime) -> str:
+    # Nombre del día en español (en minúsculas y con tilde) para una fecha.
+    return DIAS_SEMANA[fecha.weekday()]
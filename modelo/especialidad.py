@@ -1,33 +1,64 @@
 
 from modelo.exception import (TipoEspecialidadInvalidoError,DiasAtencionInvalidosError)
+from modelo.dias import normalizar_dia, indice_dia
+from datetime import timedelta
+import sys
+
+# Duración de un turno si la especialidad no dice otra (la grilla de 8 a 18 cada 30 minutos).
+DURACION_TURNO = timedelta(minutes=30)
+_CERO = timedelta(0)
+_UN_DIA = timedelta(days=1)
+
+
+def validar_duracion_turno(duracion) -> timedelta:
+    # Minutos enteros (así se guarda en el diario), más de cero y hasta un día.
+    if not isinstance(duracion, timedelta):
+        raise TypeError("¡Error! La duración del turno debe ser un timedelta.")
+    if not _CERO < duracion <= _UN_DIA or duracion.seconds % 60 or duracion.microseconds:
+        raise ValueError("¡Error! La duración del turno debe ser de minutos enteros, mayor a cero y de hasta un día.")
+    return duracion
+
 
 class Especialidad:
     # Una lista con los días de la semana válidos para chequear
     DIAS_VALIDOS_PARA_ATENCION = ["lunes", "martes", "miércoles", "miercoles", "jueves", "viernes", "sábado", "sabado", "domingo"]
 
-    def __init__(self, tipo, dias_atencion):
+    def __init__(self, tipo, dias_atencion, duracion_turno=None):
         self.__tipo = ""
         self.__dias = []
+        self.__claves_dias = frozenset() # Los mismos días como clave canónica (sin tildes), para comparar rápido.
+        self.__mascara_dias = 0 # Un bit por día de la semana (bit 0 = lunes ... bit 6 = domingo).
 
         # Primero, valido el nombre (tipo) de la especialidad
         if not tipo or tipo.strip() == "":
             raise TipoEspecialidadInvalidoError("El nombre de la especialidad no puede estar vacío.")
-        self.__tipo = tipo.strip().capitalize() # Lo guardo limpio y con la primera letra en mayúscula
+        self.__tipo = sys.intern(tipo.strip().capitalize()) # Lo guardo limpio y con la primera letra en mayúscula
 
         # Ahora los días de atención
         if not dias_atencion or len(dias_atencion) == 0:
             raise DiasAtencionInvalidosError("Una especialidad tiene que tener días de atención.")
         
         dias_limpios_y_validos = []
+        claves = set()
         for d in dias_atencion:
             dia_temp = d.strip().lower() # Lo limpio y lo pongo en minúscula
             if dia_temp not in self.DIAS_VALIDOS_PARA_ATENCION:
                 raise DiasAtencionInvalidosError(f"El día '{d}' no es un día válido de la semana.")
-            # Si el día ya lo tengo, no lo agrego de nuevo (evito duplicados en la lista)
-            if dia_temp not in dias_limpios_y_validos:
+            # Si el día ya lo tengo, no lo agrego de nuevo (evito duplicados en la lista).
+            # Comparo por la clave, así "miércoles" y "miercoles" cuentan como el mismo día.
+            clave = normalizar_dia(dia_temp)
+            if clave not in claves:
+                claves.add(clave)
                 dias_limpios_y_validos.append(dia_temp)
         
         self.__dias = sorted(dias_limpios_y_validos) # Guardo los días ordenados por si acaso
+        self.__claves_dias = frozenset(claves)
+        for clave in claves:
+            self.__mascara_dias |= 1 << indice_dia(clave)
+
+        # Cuánto dura cada turno de esta especialidad cuando al agendar no se indica otra duración
+        # (sin 'duracion_turno', la general).
+        self.__duracion_turno = DURACION_TURNO if duracion_turno is None else validar_duracion_turno(duracion_turno)
 
     # Método para obtener el nombre de la especialidad
     def obtener_tipo(self): # Me pidieron obtener_especialidad() pero el tipo es el nombre
@@ -35,12 +66,8 @@ class Especialidad:
 
     # Método para saber si atiende en un día específico
     def verificar_dia(self, dia_a_chequear):
-        dia_normalizado = dia_a_chequear.strip().lower() # Limpio y pongo en minúscula para comparar
-        
-        if dia_normalizado in self.__dias: # Me fijo si el día está en mi lista de días
-            return True
-        else:
-            return False
+        # Paso el día a su clave canónica (sin espacios, minúsculas, sin tildes) para comparar
+        return normalizar_dia(dia_a_chequear) in self.__claves_dias
 
     # Para que se vea bonito cuando lo imprimo
     def __str__(self):
@@ -64,4 +91,13 @@ class Especialidad:
         return hash(self.__tipo.lower())
     
     def obtener_dias_atencion(self):
-        return self.__dias
\ No newline at end of file
+        return self.__dias
+
+    def obtener_claves_dias(self):
+        return self.__claves_dias
+
+    def obtener_mascara_dias(self):
+        return self.__mascara_dias
+
+    def obtener_duracion_turno(self):
+        return self.__duracion_turno
@@ -0,0 +1,270 @@
+import queue
+import sys
+import threading
+from datetime import datetime
+
+# Eventos de dominio que publica Clinica cada vez que cambia algo (un paciente nuevo, un turno, ...).
+# Clinica no imprime nada: quien quiera enterarse se suscribe al BusEventos. Sin suscriptores
+# (el caso de usar Clinica como biblioteca) el evento ni siquiera se crea.
+
+
+class Evento:
+    # Base de todos los eventos. 'describir' arma el mensaje para una persona; solo se llama
+    # si algún suscriptor lo necesita (la consola o el registro), nunca al publicar.
+    __slots__ = ("__momento",)
+
+    def __init__(self):
+        self.__momento = datetime.now()
+
+    def obtener_momento(self) -> datetime:
+        return self.__momento
+
+    def obtener_nombre(self) -> str:
+        return type(self).__name__
+
+    def describir(self) -> str:
+        return self.obtener_nombre()
+
+
+class PacienteRegistrado(Evento):
+    __slots__ = ("__paciente",)
+
+    def __init__(self, paciente):
+        super().__init__()
+        self.__paciente = paciente
+
+    def obtener_paciente(self):
+        return self.__paciente
+
+    def describir(self) -> str:
+        return f"Paciente {self.__paciente.obtener_nombre()} (DNI: {self.__paciente.obtener_dni()}) registrado y su historia clínica creada."
+
+
+class MedicoRegistrado(Evento):
+    __slots__ = ("__medico",)
+
+    def __init__(self, medico):
+        super().__init__()
+        self.__medico = medico
+
+    def obtener_medico(self):
+        return self.__medico
+
+    def describir(self) -> str:
+        return f"Médico {self.__medico.obtener_nombre()} (Matrícula: {self.__medico.obtener_matricula()}) registrado."
+
+
+class EspecialidadAgregada(Evento):
+    __slots__ = ("__medico", "__especialidad")
+
+    def __init__(self, medico, especialidad):
+        super().__init__()
+        self.__medico = medico
+        self.__especialidad = especialidad
+
+    def obtener_medico(self):
+        return self.__medico
+
+    def obtener_especialidad(self):
+        return self.__especialidad
+
+    def describir(self) -> str:
+        return (f"Especialidad {self.__especialidad.obtener_tipo()} agregada a Dr./Dra. {self.__medico.obtener_nombre()} "
+                f"(Matrícula: {self.__medico.obtener_matricula()}).")
+
+
+class TurnoAgendado(Evento):
+    __slots__ = ("__turno",)
+
+    def __init__(self, turno):
+        super().__init__()
+        self.__turno = turno
+
+    def obtener_turno(self):
+        return self.__turno
+
+    def describir(self) -> str:
+        turno = self.__turno
+        return (f"Turno agendado con éxito: Paciente {turno.obtener_paciente().obtener_nombre()} con "
+                f"Dr./Dra. {turno.obtener_medico().obtener_nombre()} ({turno.obtener_especialidad_solicitada()}) "
+                f"el {turno.obtener_fecha_hora().strftime('%Y-%m-%d %H:%M')}.")
+
+
+class TurnoCancelado(Evento):
+    __slots__ = ("__turno",)
+
+    def __init__(self, turno):
+        super().__init__()
+        self.__turno = turno
+
+    def obtener_turno(self):
+        return self.__turno
+
+    def describir(self) -> str:
+        turno = self.__turno
+        return (f"Turno {turno.obtener_id()} cancelado: Paciente {turno.obtener_paciente().obtener_nombre()} con "
+                f"Dr./Dra. {turno.obtener_medico().obtener_nombre()} el {turno.obtener_fecha_hora().strftime('%Y-%m-%d %H:%M')}.")
+
+
+class TurnoReprogramado(Evento):
+    __slots__ = ("__anterior", "__nuevo")
+
+    def __init__(self, anterior, nuevo):
+        super().__init__()
+        self.__anterior = anterior
+        self.__nuevo = nuevo
+
+    def obtener_anterior(self):
+        return self.__anterior
+
+    def obtener_nuevo(self):
+        return self.__nuevo
+
+    def describir(self) -> str:
+        return (f"Turno reprogramado: Paciente {self.__nuevo.obtener_paciente().obtener_nombre()} con "
+                f"Dr./Dra. {self.__nuevo.obtener_medico().obtener_nombre()}, del "
+                f"{self.__anterior.obtener_fecha_hora().strftime('%Y-%m-%d %H:%M')} al "
+                f"{self.__nuevo.obtener_fecha_hora().strftime('%Y-%m-%d %H:%M')} (nuevo id {self.__nuevo.obtener_id()}).")
+
+
+class SerieAgendada(Evento):
+    # Una serie de turnos publica un solo evento con todos sus turnos.
+    __slots__ = ("__turnos",)
+
+    def __init__(self, turnos: list):
+        super().__init__()
+        self.__turnos = turnos
+
+    def obtener_turnos(self) -> list:
+        return self.__turnos[:]
+
+    def describir(self) -> str:
+        primero, ultimo = self.__turnos[0], self.__turnos[-1]
+        return (f"Serie de {len(self.__turnos)} turnos agendada con éxito: Paciente {primero.obtener_paciente().obtener_nombre()} "
+                f"con Dr./Dra. {primero.obtener_medico().obtener_nombre()} ({primero.obtener_especialidad_solicitada()}) "
+                f"del {primero.obtener_fecha_hora().strftime('%Y-%m-%d %H:%M')} al {ultimo.obtener_fecha_hora().strftime('%Y-%m-%d %H:%M')}.")
+
+
+class RecetaEmitida(Evento):
+    __slots__ = ("__receta",)
+
+    def __init__(self, receta):
+        super().__init__()
+        self.__receta = receta
+
+    def obtener_receta(self):
+        return self.__receta
+
+    def describir(self) -> str:
+        return (f"Receta emitida para Paciente: {self.__receta.obtener_paciente().obtener_nombre()} "
+                f"por Dr./Dra. {self.__receta.obtener_medico().obtener_nombre()}.")
+
+
+class LoteImportado(Evento):
+    # Una importación masiva publica un solo evento por lote, no uno por fila.
+    __slots__ = ("__tipo", "__cantidad")
+
+    def __init__(self, tipo: str, cantidad: int):
+        super().__init__()
+        self.__tipo = tipo
+        self.__cantidad = cantidad
+
+    def obtener_tipo(self) -> str:
+        return self.__tipo
+
+    def obtener_cantidad(self) -> int:
+        return self.__cantidad
+
+    def describir(self) -> str:
+        return f"Lote importado: {self.__cantidad} {self.__tipo}."
+
+
+class BusEventos:
+    # Lista de suscriptores (cualquier función que reciba un Evento). La lista se reemplaza entera
+    # al suscribir o desuscribir, así publicar la recorre sin cerrojo aunque otro hilo la cambie.
+    def __init__(self):
+        self.__suscriptores = ()
+        self.__cerrojo = threading.Lock()
+
+    def suscribir(self, suscriptor):
+        if not callable(suscriptor):
+            raise TypeError("¡Error! El suscriptor debe ser una función (o un objeto que se pueda llamar) que reciba el evento.")
+        with self.__cerrojo:
+            self.__suscriptores = self.__suscriptores + (suscriptor,)
+
+    def desuscribir(self, suscriptor):
+        with self.__cerrojo:
+            # Comparo con == y no con 'is': lista.append crea un método ligado nuevo cada vez que se escribe.
+            self.__suscriptores = tuple(s for s in self.__suscriptores if s != suscriptor)
+
+    def hay_suscriptores(self) -> bool:
+        # Clinica pregunta esto antes de crear el evento: sin nadie escuchando, publicar no cuesta nada.
+        return bool(self.__suscriptores)
+
+    def publicar(self, evento: Evento):
+        for suscriptor in self.__suscriptores:
+            suscriptor(evento)
+
+
+# --- Suscriptores ---
+
+def sumidero_nulo(evento: Evento):
+    # Descarta el evento. Es lo mismo que no tener suscriptores; sirve para reemplazar a otro sin cambiar código.
+    pass
+
+
+class ImpresoraConsola:
+    # Imprime cada evento como lo hacía Clinica antes. Es la que usa el menú interactivo.
+    def __init__(self, salida=None):
+        self.__salida = salida
+
+    def __call__(self, evento: Evento):
+        print(evento.describir(), file=self.__salida if self.__salida is not None else sys.stdout)
+
+
+class RegistradorAsincrono:
+    # Escribe los eventos en un archivo desde un hilo aparte. Publicar solo pone el evento en una
+    # cola; el hilo arma las líneas y las escribe de a muchas juntas, así quien agenda no espera al disco.
+    FIN = object() # Marca en la cola para que el hilo termine.
+
+    def __init__(self, archivo, eventos_por_escritura: int = 512):
+        # 'archivo' puede ser una ruta o un archivo ya abierto (que queda a cargo de quien lo abrió).
+        if eventos_por_escritura <= 0:
+            raise ValueError("¡Error! La cantidad de eventos por escritura debe ser mayor a cero.")
+        self.__propio = isinstance(archivo, str)
+        self.__archivo = open(archivo, "a", encoding="utf-8") if self.__propio else archivo
+        self.__eventos_por_escritura = eventos_por_escritura
+        self.__cola = queue.SimpleQueue()
+        self.__hilo = threading.Thread(target=self.__escribir, name="registrador-eventos", daemon=True)
+        self.__hilo.start()
+
+    def __call__(self, evento: Evento):
+        self.__cola.put(evento)
+
+    def __escribir(self):
+        terminar = False
+        while not terminar:
+            pendientes = [self.__cola.get()] # Espero el primero y después junto los que ya estén en la cola.
+            while len(pendientes) < self.__eventos_por_escritura:
+                try:
+                    pendientes.append(self.__cola.get_nowait())
+                except queue.Empty:
+                    break
+            lineas = []
+            for evento in pendientes:
+                if evento is self.FIN:
+                    terminar = True
+                    continue
+                lineas.append(f"{evento.obtener_momento().isoformat(timespec='milliseconds')} "
+                              f"{evento.obtener_nombre()} {evento.describir()}\n")
+            if lineas:
+                self.__archivo.write("".join(lineas))
+                self.__archivo.flush()
+
+    def cerrar(self):
+        # Escribe lo que quede en la cola y espera al hilo. Hay que desuscribirlo antes de cerrarlo.
+        if self.__hilo.is_alive():
+            self.__cola.put(self.FIN)
+            self.__hilo.join()
+            if self.__propio:
+                self.__archivo.close()
@@ -84,7 +84,21 @@ class MedicoNoTrabajaEseDiaError(Exception):
     def __init__(self, mensaje="El médico no trabaja el día de la semana para el turno solicitado."):
         super().__init__(mensaje)
 
+class TurnoNoExisteError(Exception):
+    "Error cuando se busca (para cancelarlo o reprogramarlo) un turno que no existe o ya se canceló."
+    def __init__(self, mensaje="No hay ningún turno vigente con ese id."):
+        super().__init__(mensaje)
+
 class RecetaInvalidaError(Exception): # Aunque la clase Receta ya valida, Clinica podría tener un control extra.
     "Error cuando los datos de una receta no son válidos (ej. lista de medicamentos vacía)."
     def __init__(self, mensaje="No se puede emitir la receta: los datos son inválidos."):
-        super().__init__(mensaje)
\ No newline at end of file
+        super().__init__(mensaje)
+
+class SerieTurnosConflictoError(Exception):
+    "Error cuando una o más fechas de una serie de turnos no se pueden agendar. No se agenda ninguna."
+    def __init__(self, mensaje="No se pudo agendar la serie: hay fechas con conflictos.", conflictos=None):
+        super().__init__(mensaje)
+        self.__conflictos = list(conflictos or []) # Pares (fecha_hora, motivo).
+
+    def obtener_conflictos(self) -> list:
+        return self.__conflictos[:]
@@ -2,12 +2,35 @@
 from modelo.paciente import Paciente 
 from modelo.turno import Turno       
 from modelo.receta import Receta     
+from modelo.paginacion import Pagina, paginar, iterar_lista, paginar_vigentes, iterar_vigentes
+from bisect import bisect_left
+import threading
+
+# El texto de cada turno/receta se arma una sola vez y queda guardado (ver __fragmento). Este cerrojo
+# evita que dos hilos que muestran la misma historia a la vez agreguen el mismo fragmento dos veces.
+_CERROJO_FRAGMENTOS = threading.Lock()
+
+
+def _id_de_entrada(entrada) -> int:
+    return entrada.obtener_id()
+
+
+def _indentar(texto: str) -> str:
+    # Cada línea con sangría y separada con ",\n", como se muestran las entradas en la historia.
+    return ",\n".join([f"    {linea}" for linea in texto.splitlines()])
 
 class HistoriaClinica:
+    __slots__ = ("__paciente", "__turnos", "__recetas", "__fragmentos_turnos", "__fragmentos_recetas") # Hay una por paciente: sin __dict__ por historia.
+
     def __init__(self, el_paciente):
         self.__paciente = None
         self.__turnos = []   
         self.__recetas = [] 
+        # Texto ya armado de cada turno/receta, en el mismo orden. Se completa recién cuando alguien
+        # muestra la historia, así no ocupa memoria en las que nunca se miran. Como turnos y recetas
+        # no cambian una vez creados, agregar una entrada no invalida los fragmentos anteriores.
+        self.__fragmentos_turnos = []
+        self.__fragmentos_recetas = []
 
         if not isinstance(el_paciente, Paciente):
             raise TypeError("¡Ojo! La historia clínica necesita un objeto 'Paciente' real. No me pases otra cosa.")
@@ -22,6 +45,13 @@ class HistoriaClinica:
             raise TypeError("¡Error al agregar turno! Solo puedo guardar objetos de tipo 'Turno'.")
         self.__turnos.append(nuevo_turno)
 
+    def compactar_turnos(self):
+        # Saca los turnos cancelados (que hasta ahora solo se salteaban) junto con su texto ya armado.
+        with _CERROJO_FRAGMENTOS:
+            vigentes = [p for p, turno in enumerate(self.__turnos) if not turno.esta_cancelado()]
+            self.__fragmentos_turnos = [self.__fragmentos_turnos[p] for p in vigentes if p < len(self.__fragmentos_turnos)]
+            self.__turnos = [self.__turnos[p] for p in vigentes]
+
     def agregar_receta(self, nueva_receta):
         # El paciente recibe una receta y quiero anotarla en su historial.
 
@@ -35,39 +65,82 @@ class HistoriaClinica:
         return self.__paciente
 
     def obtener_turnos(self):
-        return self.__turnos[:]
+        # Sin los cancelados.
+        return [turno for turno in self.__turnos if not turno.esta_cancelado()]
 
     def obtener_recetas(self):
         return self.__recetas[:]
 
+    # Para historias largas: recorrer sin copiar, o de a una página (en orden de carga).
+
+    def iterar_turnos(self):
+        return iterar_vigentes(self.__turnos)
+
+    def iterar_recetas(self):
+        return iterar_lista(self.__recetas)
+
+    def obtener_turnos_pagina(self, cursor: int = 0, limite: int = 50) -> Pagina:
+        return paginar_vigentes(self.__turnos, cursor, limite)
+
+    def obtener_recetas_pagina(self, cursor: int = 0, limite: int = 50) -> Pagina:
+        return paginar(self.__recetas, cursor, limite)
+
+    # Como estaban en un momento anterior, para las vistas de la clínica (modelo/vista.py). Turnos y
+    # recetas se agregan en orden de id, así que con bisect corto en el primero que es posterior.
+
+    def obtener_turnos_en(self, proximo_id_turno: int, bajas: int) -> list:
+        turnos = self.__turnos
+        fin = bisect_left(turnos, proximo_id_turno, key=_id_de_entrada)
+        return [turno for turno in turnos[:fin] if turno.vigente_en(bajas)]
+
+    def obtener_recetas_en(self, proximo_id_receta: int) -> list:
+        recetas = self.__recetas
+        return recetas[:bisect_left(recetas, proximo_id_receta, key=_id_de_entrada)]
+
     # --- Método de Representación ---
 
+    def __fragmento(self, entradas: list, fragmentos: list, posicion: int) -> str:
+        # Devuelve el texto de la entrada 'posicion', armando (y guardando) los que falten hasta ella.
+        with _CERROJO_FRAGMENTOS:
+            while len(fragmentos) <= posicion:
+                fragmentos.append(_indentar(str(entradas[len(fragmentos)])))
+            return fragmentos[posicion]
+
+    def __iterar_seccion(self, titulo: str, entradas: list, fragmentos: list, texto_vacio: str, entradas_por_bloque: int,
+                         posiciones: list):
+        # 'posiciones' son las entradas a mostrar: todas, o en los turnos las que no están canceladas.
+        if not posiciones:
+            yield f"  {titulo}: [] ({texto_vacio})\n"
+            return
+        partes = [f"  {titulo}:\n[\n"]
+        for numero, posicion in enumerate(posiciones):
+            if numero > 0:
+                partes.append(",\n")
+            partes.append(self.__fragmento(entradas, fragmentos, posicion))
+            if len(partes) >= 2 * entradas_por_bloque:
+                yield "".join(partes)
+                partes = []
+        partes.append("\n  ]\n")
+        yield "".join(partes)
+
+    def iterar_texto(self, entradas_por_bloque: int = 20):
+        # Genera el mismo texto que str(historia) pero de a bloques de 'entradas_por_bloque' turnos
+        # o recetas, así se puede empezar a mostrar una historia larga sin esperar a tenerla entera.
+        if entradas_por_bloque <= 0:
+            raise ValueError("¡Error! La cantidad de entradas por bloque debe ser mayor a cero.")
+        yield (f"--- Historia Clínica ---\n"
+               f"Paciente: {self.__paciente.obtener_nombre()} (DNI: {self.__paciente.obtener_dni()})\n")
+        # Muestro lo que había al empezar, aunque se agreguen entradas mientras tanto.
+        turnos, recetas = self.__turnos, self.__recetas
+        yield from self.__iterar_seccion("Turnos", turnos, self.__fragmentos_turnos,
+                                         "Este paciente no tiene turnos registrados aún", entradas_por_bloque,
+                                         [p for p, turno in enumerate(turnos) if not turno.esta_cancelado()])
+        yield from self.__iterar_seccion("Recetas", recetas, self.__fragmentos_recetas,
+                                         "Este paciente no tiene recetas registradas aún", entradas_por_bloque,
+                                         range(len(recetas)))
+        yield "-------------------------"
+
     def __str__(self):
-        # Esto es para que la historia clínica se vea entendible 
-
-        info_paciente = f"Paciente: {self.__paciente.obtener_nombre()} (DNI: {self.__paciente.obtener_dni()})"
-        lista_turnos_texto = []
-        if self.__turnos:
-            for un_turno in self.__turnos:
-                lista_turnos_texto.append(str(un_turno))
-            # Uno todos los textos de los turnos, con indentación para que quede prolijo.
-            turnos_formateados = ",\n".join([f"    {linea}" for t_str in lista_turnos_texto for linea in t_str.splitlines()])
-            seccion_turnos = f"  Turnos:\n[\n{turnos_formateados}\n  ]"
-        else:
-            seccion_turnos = "  Turnos: [] (Este paciente no tiene turnos registrados aún)"
-
-        # Y hago lo mismo para la lista de recetas.
-        lista_recetas_texto = []
-        if self.__recetas:
-            for una_receta in self.__recetas:
-                lista_recetas_texto.append(str(una_receta))
-            # Uno los textos de las recetas, también con indentación.
-            recetas_formateadas = ",\n".join([f"    {linea}" for r_str in lista_recetas_texto for linea in r_str.splitlines()])
-            seccion_recetas = f"  Recetas:\n[\n{recetas_formateadas}\n  ]"
-        else:
-            seccion_recetas = "  Recetas: [] (Este paciente no tiene recetas registradas aún)"
-        return (f"--- Historia Clínica ---\n"
-                f"{info_paciente}\n"
-                f"{seccion_turnos}\n"
-                f"{seccion_recetas}\n"
-                f"-------------------------")
\ No newline at end of file
+        # Esto es para que la historia clínica se vea entendible.
+        # Los turnos y recetas que ya se mostraron alguna vez no se vuelven a formatear.
+        return "".join(self.iterar_texto())
@@ -0,0 +1,115 @@
+import csv
+import json
+from datetime import datetime, timedelta
+
+from modelo.exception import (DNIInvalidoError, NombreInvalidoError, FechaNacimientoInvalidaError,
+                              MatriculaInvalidaError, EspecialidadVaciaError, EspecialidadDuplicadaError,
+                              EspecialidadError, PacienteExistenteError, PacienteNoExisteError,
+                              MedicoExistenteError, MedicoNoExisteError, TurnoDuplicadoError,
+                              MedicoNoAtiendeEspecialidadError, MedicoNoTrabajaEseDiaError)
+
+TIPOS_IMPORTACION = ("pacientes", "medicos", "turnos")
+
+# Errores que se anotan en la fila correspondiente en lugar de cortar la importación.
+ERRORES_DE_VALIDACION = (DNIInvalidoError, NombreInvalidoError, FechaNacimientoInvalidaError,
+                         MatriculaInvalidaError, EspecialidadVaciaError, EspecialidadDuplicadaError,
+                         EspecialidadError, PacienteExistenteError, PacienteNoExisteError,
+                         MedicoExistenteError, MedicoNoExisteError, TurnoDuplicadoError,
+                         MedicoNoAtiendeEspecialidadError, MedicoNoTrabajaEseDiaError)
+
+
+class ResultadoImportacion:
+    # Resumen de una importación: cuántas filas entraron y qué pasó con las que no.
+    def __init__(self):
+        self.__importados = 0
+        self.__errores: list[tuple[int, str]] = []
+
+    def sumar_importados(self, cantidad: int):
+        self.__importados += cantidad
+
+    def agregar_error(self, numero_fila: int, mensaje: str):
+        self.__errores.append((numero_fila, mensaje))
+
+    def obtener_importados(self) -> int:
+        return self.__importados
+
+    def obtener_errores(self) -> list[tuple[int, str]]:
+        return self.__errores[:]
+
+    def __str__(self):
+        lineas = [f"Filas importadas: {self.__importados}", f"Filas con errores: {len(self.__errores)}"]
+        for numero_fila, mensaje in self.__errores:
+            lineas.append(f"  Fila {numero_fila}: {mensaje}")
+        return "\n".join(lineas)
+
+
+# --- Conversión de columnas ---
+
+def leer_fecha_hora(valor) -> datetime:
+    # Acepta un datetime o un texto ISO ("2025-06-16 10:00" o "2025-06-16T10:00").
+    if isinstance(valor, datetime):
+        return valor
+    if not isinstance(valor, str):
+        raise TypeError("¡Error! La 'fecha_hora' debe ser un texto con formato AAAA-MM-DD HH:MM.")
+    try:
+        return datetime.fromisoformat(valor.strip())
+    except ValueError:
+        raise ValueError(f"¡Formato de fecha/hora incorrecto! '{valor}' no es AAAA-MM-DD HH:MM.")
+
+
+def leer_duracion(valor) -> timedelta | None:
+    # Minutos del turno ("45" o 45). Vacío o ausente: None, o sea la duración de la especialidad.
+    if valor is None or (isinstance(valor, str) and not valor.strip()):
+        return None
+    if isinstance(valor, bool) or not isinstance(valor, (int, str)):
+        raise TypeError("¡Error! La 'duracion_minutos' debe ser un número entero de minutos.")
+    try:
+        return timedelta(minutes=int(valor))
+    except ValueError:
+        raise ValueError(f"¡Error! La duración '{valor}' no es un número entero de minutos.")
+
+
+def leer_especialidades(valor) -> list[tuple[str, list[str], timedelta | None]]:
+    # En CSV las especialidades vienen en una sola columna: "Pediatría:lunes,miércoles;Cardiología:martes:45".
+    # En JSONL también se acepta una lista de {"tipo": ..., "dias": [...], "duracion_minutos": ...} (como
+    # las devuelve listar_medicos). Los minutos de cada turno son opcionales: sin ellos, None (la duración general).
+    if isinstance(valor, list):
+        return [(esp["tipo"], esp["dias"], leer_duracion(esp.get("duracion_minutos"))) for esp in valor]
+    if not isinstance(valor, str):
+        raise TypeError("¡Error! Las especialidades deben ser un texto o una lista.")
+
+    especialidades = []
+    for parte in valor.split(";"):
+        if not parte.strip():
+            continue
+        tipo, separador, resto = parte.partition(":")
+        if not separador:
+            raise ValueError(f"¡Error! La especialidad '{parte.strip()}' no tiene días (usar Tipo:dia,dia o Tipo:dia,dia:minutos).")
+        dias, _, minutos = resto.partition(":")
+        especialidades.append((tipo, [d.strip() for d in dias.split(",") if d.strip()], leer_duracion(minutos)))
+    return especialidades
+
+
+# --- Lectura de archivos ---
+
+def leer_filas(ruta: str):
+    # Recorre el archivo fila por fila (sin cargarlo entero) y devuelve diccionarios.
+    # El formato se deduce de la extensión: .csv o .jsonl.
+    if ruta.endswith(".csv"):
+        with open(ruta, "r", encoding="utf-8", newline="") as archivo:
+            yield from csv.DictReader(archivo)
+    elif ruta.endswith(".jsonl"):
+        with open(ruta, "r", encoding="utf-8") as archivo:
+            for linea in archivo:
+                if not linea.strip():
+                    continue
+                try:
+                    yield json.loads(linea)
+                except ValueError:
+                    yield None # La fila rota se informa como error al importar, no corta la lectura.
+    else:
+        raise ValueError(f"¡Error! Formato de archivo no soportado: '{ruta}'. Usar .csv o .jsonl.")
+
+
+def importar_archivo(clinica, tipo: str, ruta: str, tamanio_lote: int = 5000) -> ResultadoImportacion:
+    return clinica.importar_lote(tipo, leer_filas(ruta), tamanio_lote)
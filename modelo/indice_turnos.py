@@ -0,0 +1,109 @@
+from bisect import bisect_left, insort
+from datetime import date, datetime
+
+
+def _fecha_de_turno(turno) -> datetime:
+    return turno.obtener_fecha_hora()
+
+
+class TurnosPorFecha:
+    # Turnos ordenados por fecha y hora, repartidos en un "cajón" por día.
+    # Agregar solo reordena la lista de ese día (no un millón de turnos), y una búsqueda por
+    # rango salta con bisect al primer día y al primer horario que interesan.
+    def __init__(self):
+        self.__dias: list[date] = []                  # Días con turnos, ordenados.
+        self.__turnos_por_dia: dict[date, list] = {}   # Día -> turnos de ese día ordenados por hora.
+        self.__cantidad = 0
+
+    def agregar(self, fecha_hora: datetime, turno):
+        dia = fecha_hora.date()
+        turnos_del_dia = self.__turnos_por_dia.get(dia)
+        if turnos_del_dia is None:
+            turnos_del_dia = self.__turnos_por_dia[dia] = []
+            if not self.__dias or self.__dias[-1] < dia:
+                self.__dias.append(dia)
+            else:
+                insort(self.__dias, dia)
+
+        # Igual que en la agenda: casi siempre se agrega al final y me ahorro el insort.
+        if not turnos_del_dia or _fecha_de_turno(turnos_del_dia[-1]) <= fecha_hora:
+            turnos_del_dia.append(turno)
+        else:
+            insort(turnos_del_dia, turno, key=_fecha_de_turno)
+        self.__cantidad += 1
+
+    def quitar(self, fecha_hora: datetime, turno):
+        # Lo saco del cajón de su día: bisect hasta su horario y busco ese turno entre los de la misma hora.
+        dia = fecha_hora.date()
+        turnos_del_dia = self.__turnos_por_dia[dia]
+        posicion = bisect_left(turnos_del_dia, fecha_hora, key=_fecha_de_turno)
+        while turnos_del_dia[posicion] is not turno:
+            posicion += 1
+        del turnos_del_dia[posicion]
+        if not turnos_del_dia:
+            del self.__turnos_por_dia[dia]
+            del self.__dias[bisect_left(self.__dias, dia)]
+        self.__cantidad -= 1
+
+    def __len__(self):
+        return self.__cantidad
+
+    def iterar_entre(self, desde: datetime = None, hasta: datetime = None):
+        # Genera los turnos con fecha en [desde, hasta), en orden. Sin límites recorre todo.
+        dias = self.__dias
+        primero = 0 if desde is None else bisect_left(dias, desde.date())
+        for posicion in range(primero, len(dias)):
+            dia = dias[posicion]
+            if hasta is not None and dia > hasta.date():
+                break
+            turnos_del_dia = self.__turnos_por_dia[dia]
+            inicio = 0
+            if desde is not None and dia == desde.date():
+                inicio = bisect_left(turnos_del_dia, desde, key=_fecha_de_turno)
+            fin = len(turnos_del_dia)
+            if hasta is not None and dia == hasta.date():
+                fin = bisect_left(turnos_del_dia, hasta, key=_fecha_de_turno)
+            yield from turnos_del_dia[inicio:fin]
+
+
+class IndiceTurnos:
+    # Índices secundarios de los turnos de la clínica: por DNI del paciente, por especialidad
+    # (en minúsculas) y por fecha para toda la clínica. El índice por matrícula ya lo lleva
+    # AgendaMedicos. Cada índice es un TurnosPorFecha, así todos pueden filtrar por rango.
+    def __init__(self):
+        self.__por_dni: dict[str, TurnosPorFecha] = {}
+        self.__por_especialidad: dict[str, TurnosPorFecha] = {}
+        self.__por_fecha = TurnosPorFecha()
+
+    @staticmethod
+    def clave_especialidad(especialidad: str) -> str:
+        return especialidad.strip().lower()
+
+    def agregar(self, turno):
+        fecha_hora = turno.obtener_fecha_hora()
+        dni = turno.obtener_paciente().obtener_dni()
+        por_dni = self.__por_dni.get(dni)
+        if por_dni is None:
+            por_dni = self.__por_dni[dni] = TurnosPorFecha()
+        especialidad = self.clave_especialidad(turno.obtener_especialidad_solicitada())
+        por_especialidad = self.__por_especialidad.get(especialidad)
+        if por_especialidad is None:
+            por_especialidad = self.__por_especialidad[especialidad] = TurnosPorFecha()
+        por_dni.agregar(fecha_hora, turno)
+        por_especialidad.agregar(fecha_hora, turno)
+        self.__por_fecha.agregar(fecha_hora, turno)
+
+    def quitar(self, turno):
+        fecha_hora = turno.obtener_fecha_hora()
+        self.__por_dni[turno.obtener_paciente().obtener_dni()].quitar(fecha_hora, turno)
+        self.__por_especialidad[self.clave_especialidad(turno.obtener_especialidad_solicitada())].quitar(fecha_hora, turno)
+        self.__por_fecha.quitar(fecha_hora, turno)
+
+    def por_dni(self, dni: str) -> TurnosPorFecha | None:
+        return self.__por_dni.get(dni)
+
+    def por_especialidad(self, especialidad: str) -> TurnosPorFecha | None:
+        return self.__por_especialidad.get(self.clave_especialidad(especialidad))
+
+    def por_fecha(self) -> TurnosPorFecha:
+        return self.__por_fecha
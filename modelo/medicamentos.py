@@ -0,0 +1,132 @@
+import heapq
+import sys
+import unicodedata
+from bisect import bisect_left, insort
+from datetime import datetime
+
+
+def clave_medicamento(nombre: str) -> str:
+    # Minúsculas, sin tildes y con un solo espacio entre palabras: "Ácido  Fólico" y "acido fólico"
+    # son el mismo medicamento.
+    descompuesto = unicodedata.normalize("NFKD", " ".join(nombre.split()).casefold())
+    return "".join(c for c in descompuesto if not unicodedata.combining(c))
+
+
+class CatalogoMedicamentos:
+    # Medicamentos conocidos por la clínica, cada uno con un código (0, 1, 2, ... en orden de alta)
+    # y un nombre para mostrar: el primero con que se recetó, internado para que todas las recetas
+    # compartan el mismo str.
+    def __init__(self):
+        self.__codigo_por_clave: dict[str, int] = {}
+        self.__codigo_por_texto: dict[str, int] = {} # Textos tal cual vinieron: me ahorro normalizar cada vez.
+        self.__nombres: list[str] = []
+
+    def obtener_codigo(self, nombre: str) -> int | None:
+        codigo = self.__codigo_por_texto.get(nombre)
+        if codigo is None:
+            codigo = self.__codigo_por_clave.get(clave_medicamento(nombre))
+        return codigo
+
+    def registrar(self, nombre: str) -> int:
+        # Código del medicamento; si es nuevo, lo agrega al catálogo.
+        codigo = self.__codigo_por_texto.get(nombre)
+        if codigo is not None:
+            return codigo
+        clave = clave_medicamento(nombre)
+        codigo = self.__codigo_por_clave.get(clave)
+        if codigo is None:
+            codigo = self.__codigo_por_clave[clave] = len(self.__nombres)
+            self.__nombres.append(sys.intern(" ".join(nombre.split())))
+        self.__codigo_por_texto[nombre] = codigo
+        return codigo
+
+    def nombre_canonico(self, nombre: str) -> str:
+        # El nombre del catálogo para 'nombre', o el mismo texto prolijo si todavía no está.
+        codigo = self.obtener_codigo(nombre)
+        return self.__nombres[codigo] if codigo is not None else " ".join(nombre.split())
+
+    def obtener_nombre(self, codigo: int) -> str:
+        return self.__nombres[codigo]
+
+    def __contains__(self, nombre) -> bool:
+        return isinstance(nombre, str) and self.obtener_codigo(nombre) is not None
+
+    def __len__(self):
+        return len(self.__nombres)
+
+    def __iter__(self):
+        return iter(self.__nombres[:])
+
+
+def _fecha_de_receta(receta) -> datetime:
+    return receta.obtener_fecha()
+
+
+class IndiceMedicamentos:
+    # Índice invertido: para cada medicamento del catálogo, las recetas que lo incluyen ordenadas por
+    # fecha. Buscar "quién tomó X" no recorre las historias clínicas, y un rango de fechas se resuelve
+    # con dos bisect. Lo mantiene Clinica al emitir (o recuperar) cada receta.
+    def __init__(self):
+        self.__catalogo = CatalogoMedicamentos()
+        self.__recetas_por_codigo: list[list] = []
+
+    def obtener_catalogo(self) -> CatalogoMedicamentos:
+        return self.__catalogo
+
+    def agregar(self, receta):
+        fecha = receta.obtener_fecha()
+        # Una receta con el mismo medicamento dos veces cuenta una sola vez.
+        for codigo in {self.__catalogo.registrar(m) for m in receta.obtener_medicamentos()}:
+            while len(self.__recetas_por_codigo) <= codigo: # Medicamento nuevo (el set no respeta el orden).
+                self.__recetas_por_codigo.append([])
+            recetas = self.__recetas_por_codigo[codigo]
+            # Las recetas llegan en orden de emisión, así que casi siempre se agregan al final.
+            if not recetas or recetas[-1].obtener_fecha() <= fecha:
+                recetas.append(receta)
+            else:
+                insort(recetas, receta, key=_fecha_de_receta)
+
+    def __rango(self, recetas: list, desde: datetime, hasta: datetime) -> tuple[int, int]:
+        # Posiciones [inicio, fin) de las recetas con fecha en [desde, hasta).
+        inicio = 0 if desde is None else bisect_left(recetas, desde, key=_fecha_de_receta)
+        fin = len(recetas) if hasta is None else bisect_left(recetas, hasta, inicio, key=_fecha_de_receta)
+        return inicio, fin
+
+    def recetas_con(self, medicamento: str, desde: datetime = None, hasta: datetime = None) -> list:
+        # Recetas que incluyen el medicamento, ordenadas por fecha (con fecha en [desde, hasta) si se indica).
+        codigo = self.__catalogo.obtener_codigo(medicamento)
+        if codigo is None:
+            return []
+        recetas = self.__recetas_por_codigo[codigo]
+        inicio, fin = self.__rango(recetas, desde, hasta)
+        return recetas[inicio:fin]
+
+    def pacientes_con(self, medicamento: str, desde: datetime = None, hasta: datetime = None) -> list:
+        # Pacientes a los que se les recetó el medicamento, sin repetir, en orden de la primera receta.
+        pacientes = {}
+        for receta in self.recetas_con(medicamento, desde, hasta):
+            paciente = receta.obtener_paciente()
+            pacientes.setdefault(paciente.obtener_dni(), paciente)
+        return list(pacientes.values())
+
+    def contar(self, medicamento: str, desde: datetime = None, hasta: datetime = None) -> int:
+        codigo = self.__catalogo.obtener_codigo(medicamento)
+        if codigo is None:
+            return 0
+        inicio, fin = self.__rango(self.__recetas_por_codigo[codigo], desde, hasta)
+        return fin - inicio
+
+    def mas_recetados(self, cantidad: int = 10, desde: datetime = None,
+                      hasta: datetime = None) -> list[tuple[str, int]]:
+        # Los 'cantidad' medicamentos en más recetas: [(nombre, recetas), ...] de mayor a menor.
+        # Por medicamento cuesta dos bisect, no un recorrido de sus recetas.
+        if not isinstance(cantidad, int) or cantidad <= 0:
+            raise ValueError("¡Error! La cantidad de medicamentos debe ser un número entero mayor a cero.")
+        conteos = []
+        for codigo, recetas in enumerate(self.__recetas_por_codigo):
+            inicio, fin = self.__rango(recetas, desde, hasta)
+            if fin > inicio:
+                conteos.append((fin - inicio, codigo))
+        # Con empate, primero el que entró antes al catálogo.
+        mejores = heapq.nlargest(cantidad, conteos, key=lambda par: (par[0], -par[1]))
+        return [(self.__catalogo.obtener_nombre(codigo), total) for total, codigo in mejores]
@@ -1,4 +1,5 @@
-from modelo.especialidad import Especialidad
+from modelo.especialidad import Especialidad, DURACION_TURNO
+from modelo.dias import indice_dia
 from modelo.exception import (NombreInvalidoError,MatriculaInvalidaError,EspecialidadVaciaError,EspecialidadDuplicadaError)
 
 class Medico:
@@ -6,6 +7,14 @@ class Medico:
         self.__nombre = "" 
         self.__matricula = ""
         self.__especialidades = []
+        self.__observadores = [] # Funciones a avisar cuando se agrega una especialidad (ej. la persistencia de Clinica).
+
+        # Estructuras precalculadas para no recorrer las especialidades en cada consulta:
+        # - para cada especialidad (en minúsculas), una máscara de 7 bits con sus días;
+        # - para cada día (0 = lunes ... 6 = domingo), los nombres de las especialidades que atiende.
+        self.__mascaras: dict[str, int] = {}
+        self.__duraciones: dict[str, object] = {} # Especialidad (en minúsculas) -> duración de sus turnos.
+        self.__especialidades_por_dia: list[list[str]] = [[] for _ in range(7)]
 
         # Empiezo con las validaciones del nombre y la matrícula
         if not nombre or nombre.strip() == "": # Chequeo si está vacío o solo espacios
@@ -28,6 +37,7 @@ class Medico:
             if esp in self.__especialidades:
                 raise EspecialidadDuplicadaError(f"Especialidad '{esp.obtener_tipo()}' duplicada en la lista inicial.")
             self.__especialidades.append(esp)
+            self.__indexar_especialidad(esp)
 
 
     # Métodos para ver la informacion
@@ -39,14 +49,11 @@ class Medico:
 
 
     def atiende_especialidad(self, especialidad_nombre, dia):
-        dia = dia.lower()
-        especialidad_nombre = especialidad_nombre.lower()
-
-        for esp in self.__especialidades:
-            if (esp.obtener_tipo().lower() == especialidad_nombre and
-                dia in [d.lower() for d in esp.obtener_dias_atencion()]):
-                return True
-        return False
+        # Me fijo si el bit del día está prendido en la máscara de esa especialidad: O(1).
+        numero_dia = indice_dia(dia)
+        if numero_dia is None or not isinstance(especialidad_nombre, str):
+            return False
+        return bool(self.__mascaras.get(especialidad_nombre.strip().lower(), 0) >> numero_dia & 1)
 
     def agregar_especialidad(self, nueva_especialidad):
         # Valido que sea una Especialidad
@@ -58,20 +65,45 @@ class Medico:
             raise EspecialidadDuplicadaError(f"El médico ya tiene la especialidad '{nueva_especialidad.obtener_tipo()}'.")
         
         self.__especialidades.append(nueva_especialidad) # La agrego si no está
+        self.__indexar_especialidad(nueva_especialidad)
+        for observador in self.__observadores:
+            observador(self, nueva_especialidad)
+
+    def suscribir_cambios(self, observador):
+        # El observador se llama como observador(medico, especialidad) después de cada agregar_especialidad.
+        if not callable(observador):
+            raise TypeError("El observador debe ser una función.")
+        self.__observadores.append(observador)
     
     def obtener_especialidad(self):
         return self.__especialidades
 
 
-    def obtener_especialidad_para_dia(self, dia):
-        # Busco si el médico atiende alguna especialidad un día específico
-        dia_buscado = dia.strip().lower() # Pongo el día en minúsculas para buscar mejor
+    def obtener_duracion_turno(self, especialidad_nombre):
+        # Duración de los turnos de esa especialidad con este médico (la general si no la atiende).
+        if not isinstance(especialidad_nombre, str):
+            return DURACION_TURNO
+        return self.__duraciones.get(especialidad_nombre.strip().lower(), DURACION_TURNO)
 
-        for esp in self.__especialidades:
-            # Uso el método de Especialidad para ver sus días, que es lo correcto
-            if dia_buscado in esp.obtener_dias_atencion():
-                return esp.obtener_tipo() # Devuelvo el nombre de la especialidad
-        return None # Si no encontré nada, devuelvo None
+    def obtener_especialidad_para_dia(self, dia):
+        # Devuelvo la primera especialidad que atiende ese día (o None si no atiende ninguna).
+        # Si atiende varias el mismo día, obtener_especialidades_para_dia las devuelve todas.
+        especialidades = self.obtener_especialidades_para_dia(dia)
+        return especialidades[0] if especialidades else None
+
+    def obtener_especialidades_para_dia(self, dia):
+        numero_dia = indice_dia(dia) # Acepta mayúsculas, espacios y con o sin tilde
+        if numero_dia is None:
+            return []
+        return self.__especialidades_por_dia[numero_dia][:]
+
+    def __indexar_especialidad(self, esp):
+        mascara = esp.obtener_mascara_dias()
+        self.__mascaras[esp.obtener_tipo().lower()] = mascara
+        self.__duraciones[esp.obtener_tipo().lower()] = esp.obtener_duracion_turno()
+        for numero_dia in range(7):
+            if mascara >> numero_dia & 1:
+                self.__especialidades_por_dia[numero_dia].append(esp.obtener_tipo())
 
     # Cómo se ve mi objeto cuando lo imprimo
     def __str__(self):
@@ -0,0 +1,154 @@
+import functools
+import os
+import threading
+import time
+from bisect import bisect_left
+from collections import Counter
+
+# Límites superiores (en segundos) de los cubos del histograma de latencias: 1-2-5 por década,
+# de 1 microsegundo a 10 segundos. Lo que tarde más cae en el último cubo (+Inf).
+LIMITES_LATENCIA = tuple(base * 10.0 ** exponente for exponente in range(-6, 1) for base in (1, 2, 5)) + (10.0,)
+
+
+class HistogramaLatencias:
+    # Cuenta cuántas mediciones caen en cada cubo. Ocupa lo mismo con 10 o con 10 millones de
+    # mediciones, y los percentiles se estiman con el límite del cubo (error de un cubo como mucho).
+    # No tiene cerrojo propio: lo usa MetricasClinica, que ya lo protege.
+    def __init__(self):
+        self.__cubos = [0] * (len(LIMITES_LATENCIA) + 1)
+        self.__cantidad = 0
+        self.__suma = 0.0
+        self.__maximo = 0.0
+
+    def agregar(self, segundos: float):
+        self.__cubos[bisect_left(LIMITES_LATENCIA, segundos)] += 1
+        self.__cantidad += 1
+        self.__suma += segundos
+        if segundos > self.__maximo:
+            self.__maximo = segundos
+
+    def obtener_cantidad(self) -> int:
+        return self.__cantidad
+
+    def obtener_suma(self) -> float:
+        return self.__suma
+
+    def obtener_maximo(self) -> float:
+        return self.__maximo
+
+    def obtener_cubos(self) -> list[tuple[float, int]]:
+        # Pares (límite, cantidad acumulada hasta ese límite), como en el formato de texto de Prometheus.
+        acumulado = 0
+        pares = []
+        for limite, cantidad in zip(LIMITES_LATENCIA + (float("inf"),), self.__cubos):
+            acumulado += cantidad
+            pares.append((limite, acumulado))
+        return pares
+
+    def percentil(self, p: float) -> float:
+        # Límite superior del cubo donde está el percentil p (0 a 100). Para el último cubo uso el máximo visto.
+        if self.__cantidad == 0:
+            return 0.0
+        objetivo = self.__cantidad * p / 100
+        acumulado = 0
+        for posicion, cantidad in enumerate(self.__cubos):
+            acumulado += cantidad
+            if acumulado >= objetivo and cantidad:
+                return LIMITES_LATENCIA[posicion] if posicion < len(LIMITES_LATENCIA) else self.__maximo
+        return self.__maximo
+
+
+class _EstadisticaOperacion:
+    # Lo que se junta de cada operación: llamadas, éxitos, fallos por tipo de excepción y latencias.
+    def __init__(self):
+        self.llamadas = 0
+        self.exitos = 0
+        self.fallos: Counter = Counter()
+        self.latencias = HistogramaLatencias()
+
+
+class MetricasClinica:
+    # Métricas de las operaciones de una Clinica. Se activan con Clinica(metricas=True): en ese caso
+    # la clínica envuelve sus operaciones públicas con 'envolver'. Desactivadas no hay envoltorio,
+    # así que no cuestan nada. Un cerrojo protege los contadores: varios hilos pueden registrar a la vez.
+    def __init__(self):
+        self.__operaciones: dict[str, _EstadisticaOperacion] = {}
+        self.__cerrojo = threading.Lock()
+
+    def registrar(self, operacion: str, segundos: float, error: BaseException = None):
+        with self.__cerrojo:
+            estadistica = self.__operaciones.get(operacion)
+            if estadistica is None:
+                estadistica = self.__operaciones[operacion] = _EstadisticaOperacion()
+            estadistica.llamadas += 1
+            if error is None:
+                estadistica.exitos += 1
+            else:
+                estadistica.fallos[type(error).__name__] += 1
+            estadistica.latencias.agregar(segundos)
+
+    def envolver(self, operacion: str, funcion):
+        # Devuelve una función que hace lo mismo que 'funcion' pero registra su duración y su resultado.
+        @functools.wraps(funcion)
+        def medida(*args, **kwargs):
+            inicio = time.perf_counter()
+            try:
+                resultado = funcion(*args, **kwargs)
+            except Exception as error:
+                self.registrar(operacion, time.perf_counter() - inicio, error)
+                raise
+            self.registrar(operacion, time.perf_counter() - inicio)
+            return resultado
+        return medida
+
+    def obtener_resumen(self) -> dict:
+        # Copia de los números en un diccionario: {operacion: {"llamadas", "exitos", "fallos", "p50_s", ...}}.
+        with self.__cerrojo:
+            return {operacion: {"llamadas": e.llamadas, "exitos": e.exitos, "fallos": dict(e.fallos),
+                                "p50_s": e.latencias.percentil(50), "p95_s": e.latencias.percentil(95),
+                                "p99_s": e.latencias.percentil(99), "maximo_s": e.latencias.obtener_maximo(),
+                                "suma_s": e.latencias.obtener_suma(), "cubos": e.latencias.obtener_cubos()}
+                    for operacion, e in sorted(self.__operaciones.items())}
+
+    def exportar_texto(self) -> str:
+        # Formato de exposición de texto de Prometheus, para que lo lea un recolector.
+        lineas = ["# HELP clinica_operaciones_total Llamadas a operaciones de la clínica por resultado.",
+                  "# TYPE clinica_operaciones_total counter"]
+        resumen = self.obtener_resumen()
+        for operacion, datos in resumen.items():
+            lineas.append(f'clinica_operaciones_total{{operacion="{operacion}",resultado="ok"}} {datos["exitos"]}')
+            lineas.append(f'clinica_operaciones_total{{operacion="{operacion}",resultado="error"}} '
+                          f'{datos["llamadas"] - datos["exitos"]}')
+        lineas += ["# HELP clinica_errores_total Operaciones fallidas por tipo de excepción.",
+                   "# TYPE clinica_errores_total counter"]
+        for operacion, datos in resumen.items():
+            for error, cantidad in sorted(datos["fallos"].items()):
+                lineas.append(f'clinica_errores_total{{operacion="{operacion}",error="{error}"}} {cantidad}')
+        lineas += ["# HELP clinica_latencia_segundos Duración de las operaciones de la clínica.",
+                   "# TYPE clinica_latencia_segundos histogram"]
+        for operacion, datos in resumen.items():
+            for limite, acumulado in datos["cubos"]:
+                texto_limite = "+Inf" if limite == float("inf") else f"{limite:g}"
+                lineas.append(f'clinica_latencia_segundos_bucket{{operacion="{operacion}",le="{texto_limite}"}} {acumulado}')
+            lineas.append(f'clinica_latencia_segundos_sum{{operacion="{operacion}"}} {datos["suma_s"]:.9f}')
+            lineas.append(f'clinica_latencia_segundos_count{{operacion="{operacion}"}} {datos["llamadas"]}')
+        return "\n".join(lineas) + "\n"
+
+    def escribir_archivo(self, ruta: str):
+        # Escribo en un temporal y lo renombro: quien lea el archivo nunca ve uno a medio escribir.
+        temporal = ruta + ".tmp"
+        with open(temporal, "w", encoding="utf-8") as archivo:
+            archivo.write(self.exportar_texto())
+        os.replace(temporal, ruta)
+
+    def __str__(self):
+        resumen = self.obtener_resumen()
+        if not resumen:
+            return "Todavía no se registró ninguna operación."
+        lineas = [f"{'Operación':32s} {'Llamadas':>9s} {'Éxitos':>9s} {'p50 ms':>9s} {'p95 ms':>9s} {'p99 ms':>9s}"]
+        for operacion, datos in resumen.items():
+            lineas.append(f"{operacion:32s} {datos['llamadas']:9d} {datos['exitos']:9d} {datos['p50_s'] * 1000:9.3f} "
+                          f"{datos['p95_s'] * 1000:9.3f} {datos['p99_s'] * 1000:9.3f}")
+            for error, cantidad in sorted(datos["fallos"].items()):
+                lineas.append(f"    {error}: {cantidad}")
+        return "\n".join(lineas)
@@ -0,0 +1,164 @@
+import csv
+from datetime import date, datetime, time, timedelta
+
+from modelo.dias import CLAVES_DIAS, DIAS_SEMANA
+from modelo.indice_turnos import IndiceTurnos
+
+# Reporte de ocupación: turnos agendados contra la capacidad que dan los días de atención de cada
+# Especialidad, por médico, por especialidad y por día de la semana, en un rango de fechas.
+# La capacidad de un día de atención son los turnos de esa especialidad que entran en la JORNADA
+# (de 8 a 18, la misma que usa buscar_turnos_libres): 20 de 30 minutos, 10 de 60, etc. Un médico que
+# un día atiende dos especialidades aporta esa jornada a cada una (es la oferta posible de cada
+# especialidad), pero a él y al día solo una vez: la de la especialidad con turnos más cortos, que es
+# lo máximo que puede atender ese día. Con 'turnos_por_dia' se fija un mismo número para todas.
+#
+# Los turnos se cuentan agrupados en la clínica (Clinica.contar_turnos_por_medico_especialidad_y_dia:
+# sobre las columnas en modo columnar) y acá solo se suman esos grupos, sin recorrer turno por turno.
+
+JORNADA = timedelta(hours=10)
+AGRUPACIONES = ("medico", "especialidad", "dia")
+
+
+class FilaOcupacion:
+    def __init__(self, clave: str, nombre: str, turnos: int, capacidad: int):
+        self.__clave = clave
+        self.__nombre = nombre
+        self.__turnos = turnos
+        self.__capacidad = capacidad
+
+    def obtener_clave(self) -> str:
+        return self.__clave
+
+    def obtener_nombre(self) -> str:
+        return self.__nombre
+
+    def obtener_turnos(self) -> int:
+        return self.__turnos
+
+    def obtener_capacidad(self) -> int:
+        return self.__capacidad
+
+    def obtener_ocupacion(self) -> float:
+        # Turnos / capacidad (0 a 1; puede pasar de 1 si hay turnos fuera de los días de atención).
+        return self.__turnos / self.__capacidad if self.__capacidad else 0.0
+
+
+class ReporteOcupacion:
+    def __init__(self, desde: date, hasta: date, turnos_por_dia: int | None, filas: dict[str, list[FilaOcupacion]]):
+        self.__desde = desde
+        self.__hasta = hasta
+        self.__turnos_por_dia = turnos_por_dia
+        self.__filas = filas
+
+    def obtener_desde(self) -> date:
+        return self.__desde
+
+    def obtener_hasta(self) -> date:
+        return self.__hasta
+
+    def obtener_turnos_por_dia(self) -> int | None:
+        # None si la capacidad salió de la duración de los turnos de cada especialidad.
+        return self.__turnos_por_dia
+
+    def obtener_filas(self, agrupacion: str) -> list[FilaOcupacion]:
+        if agrupacion not in AGRUPACIONES:
+            raise ValueError(f"¡Error! Agrupación desconocida: '{agrupacion}'. Usar una de: {', '.join(AGRUPACIONES)}.")
+        return self.__filas[agrupacion]
+
+    def tabla(self, agrupacion: str) -> str:
+        # Texto con columnas alineadas para mostrar en la consola.
+        filas = self.obtener_filas(agrupacion)
+        encabezado = ("Clave", "Nombre", "Turnos", "Capacidad", "Ocupación")
+        datos = [(f.obtener_clave(), f.obtener_nombre(), str(f.obtener_turnos()), str(f.obtener_capacidad()),
+                  f"{f.obtener_ocupacion():.1%}") for f in filas]
+        anchos = [max([len(encabezado[c])] + [len(d[c]) for d in datos]) for c in range(len(encabezado))]
+        lineas = [f"Ocupación por {agrupacion} del {self.__desde} al {self.__hasta} (sin incluir)"]
+        for numero, fila in enumerate([encabezado] + datos):
+            # Texto a la izquierda, números a la derecha.
+            lineas.append("  ".join(valor.ljust(ancho) if c < 2 else valor.rjust(ancho)
+                                    for c, (valor, ancho) in enumerate(zip(fila, anchos))).rstrip())
+            if numero == 0:
+                lineas.append("  ".join("-" * ancho for ancho in anchos))
+        if not datos:
+            lineas.append("(Sin datos en ese rango)")
+        return "\n".join(lineas)
+
+    def escribir_csv(self, salida, agrupacion: str):
+        # 'salida' es cualquier archivo de texto abierto (con newline="" si es un archivo en disco).
+        escritor = csv.writer(salida)
+        escritor.writerow(["clave", "nombre", "turnos", "capacidad", "ocupacion"])
+        for fila in self.obtener_filas(agrupacion):
+            escritor.writerow([fila.obtener_clave(), fila.obtener_nombre(), fila.obtener_turnos(),
+                               fila.obtener_capacidad(), round(fila.obtener_ocupacion(), 4)])
+
+    def __str__(self):
+        return "\n\n".join(self.tabla(agrupacion) for agrupacion in AGRUPACIONES)
+
+
+def _cantidad_de_cada_dia(desde: date, hasta: date) -> list[int]:
+    # Cuántos lunes, martes, ..., domingos hay en [desde, hasta), sin recorrer las fechas.
+    semanas, resto = divmod(max(0, (hasta - desde).days), 7)
+    cantidades = [semanas] * 7
+    for numero in range(resto):
+        cantidades[(desde.weekday() + numero) % 7] += 1
+    return cantidades
+
+
+def calcular_ocupacion(clinica, desde: date, hasta: date, turnos_por_dia: int = None) -> ReporteOcupacion:
+    # Ocupación de los turnos con fecha en [desde, hasta).
+    if not isinstance(desde, date) or not isinstance(hasta, date):
+        raise TypeError("¡Error! 'desde' y 'hasta' tienen que ser fechas.")
+    if isinstance(desde, datetime):
+        desde = desde.date()
+    if isinstance(hasta, datetime):
+        hasta = hasta.date()
+    if hasta <= desde:
+        raise ValueError("¡Error! La fecha 'hasta' tiene que ser posterior a 'desde'.")
+    if turnos_por_dia is not None and (not isinstance(turnos_por_dia, int) or turnos_por_dia <= 0):
+        raise ValueError("¡Error! Los turnos por día tienen que ser un número entero mayor a cero.")
+
+    dias_en_rango = _cantidad_de_cada_dia(desde, hasta)
+    clave_especialidad = IndiceTurnos.clave_especialidad
+
+    # Capacidad: turnos que entran en las jornadas de cada médico, de cada especialidad y de cada día de la semana.
+    capacidad_medico, capacidad_especialidad, capacidad_dia = {}, {}, [0] * 7
+    nombres_medicos, nombres_especialidades = {}, {}
+    for medico in clinica.iterar_medicos():
+        matricula = medico.obtener_matricula()
+        nombres_medicos[matricula] = medico.obtener_nombre()
+        turnos_del_medico = [0] * 7 # Lo más que puede atender cada día de la semana.
+        for especialidad in medico.obtener_especialidad():
+            mascara = especialidad.obtener_mascara_dias()
+            por_dia = turnos_por_dia or JORNADA // especialidad.obtener_duracion_turno()
+            clave = clave_especialidad(especialidad.obtener_tipo())
+            nombres_especialidades.setdefault(clave, especialidad.obtener_tipo())
+            jornadas = sum(dias_en_rango[dia] for dia in range(7) if mascara >> dia & 1)
+            capacidad_especialidad[clave] = capacidad_especialidad.get(clave, 0) + jornadas * por_dia
+            for dia in range(7):
+                if mascara >> dia & 1:
+                    turnos_del_medico[dia] = max(turnos_del_medico[dia], por_dia)
+        capacidad_medico[matricula] = 0
+        for dia in range(7):
+            capacidad_medico[matricula] += dias_en_rango[dia] * turnos_del_medico[dia]
+            capacidad_dia[dia] += dias_en_rango[dia] * turnos_del_medico[dia]
+
+    # Turnos agendados, ya agrupados por (médico, especialidad, día de la semana).
+    turnos_medico, turnos_especialidad, turnos_dia = {}, {}, [0] * 7
+    grupos = clinica.contar_turnos_por_medico_especialidad_y_dia(datetime.combine(desde, time()),
+                                                                 datetime.combine(hasta, time()))
+    for (matricula, especialidad, dia), total in grupos.items():
+        turnos_medico[matricula] = turnos_medico.get(matricula, 0) + total
+        clave = clave_especialidad(especialidad)
+        nombres_especialidades.setdefault(clave, especialidad)
+        turnos_especialidad[clave] = turnos_especialidad.get(clave, 0) + total
+        turnos_dia[dia] += total
+
+    filas = {
+        "medico": [FilaOcupacion(matricula, nombre, turnos_medico.get(matricula, 0), capacidad_medico[matricula])
+                   for matricula, nombre in nombres_medicos.items()],
+        "especialidad": [FilaOcupacion(clave, nombres_especialidades[clave], turnos_especialidad.get(clave, 0),
+                                       capacidad_especialidad.get(clave, 0))
+                         for clave in sorted(nombres_especialidades)],
+        "dia": [FilaOcupacion(CLAVES_DIAS[dia], DIAS_SEMANA[dia], turnos_dia[dia], capacidad_dia[dia]) for dia in range(7)],
+    }
+    return ReporteOcupacion(desde, hasta, turnos_por_dia, filas)
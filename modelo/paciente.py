@@ -3,23 +3,35 @@ import re
 
 from modelo.exception import DNIInvalidoError, NombreInvalidoError, FechaNacimientoInvalidaError
 
+# Compilo los patrones una sola vez: en las importaciones masivas se crean miles de pacientes.
+_PATRON_DNI = re.compile(r"\d{8}")
+_PATRON_FECHA = re.compile(r"(\d{1,2})/(\d{1,2})/(\d{4})")
+
 class Paciente:
+    # Con __slots__ cada paciente no lleva su propio __dict__: en clínicas grandes se nota en la memoria.
+    __slots__ = ("__nombre", "__dni", "__fecha_nacimiento")
+
     def __init__(self, nombre, dni, fecha_nacimiento):
         # Validación del nombre
         if nombre.strip() == "":
             raise NombreInvalidoError("El nombre no puede estar vacío")
 
         # Validación del DNI (8 números)
-        if not re.match(r"^\d{8}$", dni): # O usar re.fullmatch(r"\d{8}", dni)
+        if not _PATRON_DNI.fullmatch(dni):
             raise DNIInvalidoError("DNI inválido. Debe tener 8 números")
 
-        # Validación de la fecha
+        # Validación de la fecha: separo día/mes/año con el patrón y dejo que datetime
+        # controle que la fecha exista (es bastante más rápido que strptime).
+        partes = _PATRON_FECHA.fullmatch(fecha_nacimiento)
+        if partes is None:
+            raise FechaNacimientoInvalidaError("Formato incorrecto. Usar dd/mm/aaaa")
+        dia, mes, anio = partes.groups()
         try:
-            fecha_obj = datetime.strptime(fecha_nacimiento, "%d/%m/%Y")
-            if fecha_obj > datetime.now():
-                raise FechaNacimientoInvalidaError("La fecha no puede ser futura")
+            fecha_obj = datetime(int(anio), int(mes), int(dia))
         except ValueError:
             raise FechaNacimientoInvalidaError("Formato incorrecto. Usar dd/mm/aaaa")
+        if fecha_obj > datetime.now():
+            raise FechaNacimientoInvalidaError("La fecha no puede ser futura")
 
         # Asignar atributos como privados
         self.__nombre = nombre
@@ -32,6 +44,9 @@ class Paciente:
     def obtener_nombre(self):
         return self.__nombre
 
+    def obtener_fecha_nacimiento(self):
+        return self.__fecha_nacimiento
+
     def __str__(self):
         # Acceder a los atributos privados
         return f"{self.__nombre}, {self.__dni}, {self.__fecha_nacimiento}"
\ No newline at end of file
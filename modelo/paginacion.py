@@ -0,0 +1,82 @@
+from bisect import bisect_left
+
+
+class Pagina:
+    # Una página de resultados. 'siguiente_cursor' es lo que hay que pasar para pedir la página
+    # siguiente, o None si ya no hay más. Los cursores son posiciones en listas a las que solo se
+    # les agrega al final (o ids, en las de turnos), así que una página ya vista no cambia aunque
+    # se sigan cargando datos.
+    def __init__(self, elementos: list, siguiente_cursor):
+        self.__elementos = elementos
+        self.__siguiente_cursor = siguiente_cursor
+
+    def obtener_elementos(self) -> list:
+        return self.__elementos
+
+    def obtener_siguiente_cursor(self):
+        return self.__siguiente_cursor
+
+    def hay_mas(self) -> bool:
+        return self.__siguiente_cursor is not None
+
+    def __len__(self):
+        return len(self.__elementos)
+
+    def __iter__(self):
+        return iter(self.__elementos)
+
+
+def validar_pagina(cursor: int, limite: int):
+    if not isinstance(cursor, int) or cursor < 0:
+        raise ValueError("¡Error! El cursor debe ser un número entero mayor o igual a cero.")
+    if not isinstance(limite, int) or limite <= 0:
+        raise ValueError("¡Error! El límite de la página debe ser un número entero mayor a cero.")
+
+
+def paginar(lista: list, cursor: int = 0, limite: int = 50) -> Pagina:
+    # Copia solo los elementos de la página, no la lista entera.
+    validar_pagina(cursor, limite)
+    fin = cursor + limite
+    elementos = lista[cursor:fin]
+    return Pagina(elementos, fin if fin < len(lista) else None)
+
+
+def iterar_lista(lista: list, desde: int = 0):
+    # Recorre la lista por posición, sin copiarla. Si se agregan elementos mientras tanto,
+    # también se recorren (y nunca falla por "la lista cambió durante la iteración").
+    posicion = desde
+    while posicion < len(lista):
+        yield lista[posicion]
+        posicion += 1
+
+
+# --- Listas de turnos ---
+# Los turnos cancelados quedan en la lista, marcados, hasta que se compacta (ver Clinica.cancelar_turno).
+# Por eso estas funciones los saltean y el cursor es el id del primer turno de la página y no una
+# posición: los ids no cambian al compactar. La lista tiene que estar ordenada por id (se agregan así).
+# Mientras no se cancele nada, id y posición coinciden. Turnos sueltos, que nunca se guardaron en
+# una Clinica, no tienen id: para esos el cursor sigue siendo la posición.
+
+def _id_de_turno(turno) -> int:
+    return turno.obtener_id()
+
+
+def paginar_vigentes(turnos, cursor: int = 0, limite: int = 50) -> Pagina:
+    validar_pagina(cursor, limite)
+    con_ids = len(turnos) > 0 and turnos[0].obtener_id() is not None
+    posicion = bisect_left(turnos, cursor, key=_id_de_turno) if con_ids else cursor
+    elementos = []
+    while posicion < len(turnos):
+        turno = turnos[posicion]
+        if not turno.esta_cancelado():
+            if len(elementos) == limite:
+                return Pagina(elementos, turno.obtener_id() if con_ids else posicion)
+            elementos.append(turno)
+        posicion += 1
+    return Pagina(elementos, None)
+
+
+def iterar_vigentes(turnos, desde: int = 0):
+    for turno in iterar_lista(turnos, desde):
+        if not turno.esta_cancelado():
+            yield turno
@@ -0,0 +1,118 @@
+import json
+import os
+
+
+class AlmacenamientoClinica:
+    # Persistencia local de la clínica: un diario (journal) de solo-agregar con una
+    # operación por línea, más una instantánea (snapshot) periódica del estado completo.
+    # Al arrancar se carga la última instantánea y solo se reproduce la cola del diario.
+
+    NOMBRE_DIARIO = "diario.jsonl"
+    NOMBRE_INSTANTANEA = "instantanea.json"
+
+    def __init__(self, directorio: str, registros_por_instantanea: int = 50000, sincronizar: bool = False):
+        if not isinstance(directorio, str) or not directorio.strip():
+            raise ValueError("¡Error! El directorio de almacenamiento no puede estar vacío.")
+        if registros_por_instantanea <= 0:
+            raise ValueError("¡Error! La cantidad de registros por instantánea debe ser mayor a cero.")
+
+        self.__directorio = directorio
+        self.__ruta_diario = os.path.join(directorio, self.NOMBRE_DIARIO)
+        self.__ruta_instantanea = os.path.join(directorio, self.NOMBRE_INSTANTANEA)
+        self.__registros_por_instantanea = registros_por_instantanea
+        self.__sincronizar = sincronizar # Si es True hago fsync en cada registro (más lento, más seguro).
+        self.__secuencia = 0 # Número del último registro escrito.
+        self.__registros_desde_instantanea = 0
+        self.__diario = None
+
+        os.makedirs(directorio, exist_ok=True)
+
+    # --- Recuperación ---
+
+    def cargar(self):
+        # Devuelve (estado de la instantánea o None, lista de registros posteriores a ella).
+        estado = None
+        secuencia_instantanea = 0
+        if os.path.exists(self.__ruta_instantanea):
+            with open(self.__ruta_instantanea, "r", encoding="utf-8") as archivo:
+                estado = json.load(archivo)
+            secuencia_instantanea = estado["secuencia"]
+
+        registros = []
+        self.__secuencia = secuencia_instantanea
+        if os.path.exists(self.__ruta_diario):
+            posicion_valida = 0
+            with open(self.__ruta_diario, "rb") as archivo:
+                for linea in archivo:
+                    # Una línea cortada al final es una escritura que no llegó a completarse: la recorto
+                    # para que los próximos registros no queden pegados a ella. Sin el salto de línea
+                    # también está cortada, aunque el JSON se pueda leer entero.
+                    if not linea.endswith(b"\n"):
+                        break
+                    try:
+                        registro = json.loads(linea)
+                    except ValueError:
+                        break
+                    posicion_valida += len(linea)
+                    # Si el proceso se cortó justo después de la instantánea, el diario puede
+                    # tener registros ya incluidos en ella: los salteo.
+                    if registro[0] > secuencia_instantanea:
+                        registros.append(registro)
+                        self.__secuencia = registro[0]
+            if posicion_valida < os.path.getsize(self.__ruta_diario):
+                with open(self.__ruta_diario, "r+b") as archivo:
+                    archivo.truncate(posicion_valida)
+        self.__registros_desde_instantanea = len(registros)
+        return estado, registros
+
+    # --- Escritura ---
+
+    def registrar(self, *operacion):
+        # Agrega un registro compacto al diario: [secuencia, codigo_operacion, datos...].
+        self.__secuencia += 1
+        linea = json.dumps([self.__secuencia, *operacion], ensure_ascii=False, separators=(",", ":"))
+        self.__escribir(linea + "\n")
+        self.__registros_desde_instantanea += 1
+
+    def registrar_lote(self, codigo_operacion: str, filas: list):
+        # Un lote de operaciones del mismo tipo en un solo registro: [secuencia, "L", codigo, [filas...]].
+        # Es una sola línea (y una sola escritura), así que el lote entero entra o no entra al diario.
+        if not filas:
+            return
+        self.registrar("L", codigo_operacion, filas)
+        self.__registros_desde_instantanea += len(filas) - 1
+
+    def necesita_instantanea(self) -> bool:
+        return self.__registros_desde_instantanea >= self.__registros_por_instantanea
+
+    def guardar_instantanea(self, estado: dict):
+        # Escribo en un archivo temporal y lo reemplazo de forma atómica, así nunca queda
+        # una instantánea a medio escribir. Recién después vacío el diario.
+        estado["secuencia"] = self.__secuencia
+        ruta_temporal = self.__ruta_instantanea + ".tmp"
+        with open(ruta_temporal, "w", encoding="utf-8") as archivo:
+            json.dump(estado, archivo, ensure_ascii=False, separators=(",", ":"))
+            archivo.flush()
+            os.fsync(archivo.fileno())
+        os.replace(ruta_temporal, self.__ruta_instantanea)
+
+        self.cerrar()
+        with open(self.__ruta_diario, "w", encoding="utf-8"):
+            pass
+        self.__registros_desde_instantanea = 0
+
+    def cerrar(self):
+        if self.__diario is not None:
+            self.__diario.close()
+            self.__diario = None
+
+    def __escribir(self, texto: str):
+        if self.__diario is None:
+            self.__diario = open(self.__ruta_diario, "a", encoding="utf-8")
+        self.__diario.write(texto)
+        self.__diario.flush()
+        if self.__sincronizar:
+            os.fsync(self.__diario.fileno())
+
+    def obtener_directorio(self) -> str:
+        return self.__directorio
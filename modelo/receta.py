@@ -1,14 +1,20 @@
 
 from datetime import datetime 
+import sys
 from modelo.paciente import Paciente
 from modelo.medico import Medico   
 
 class Receta:
-    def __init__(self, el_paciente, el_medico, lista_de_medicamentos):
+    # Igual que Turno: sin __dict__ por receta y con los nombres de medicamentos internados.
+    # El id lo asigna la Clinica al guardarla (en orden de emisión).
+    __slots__ = ("__paciente", "__medico", "__medicamentos", "__fecha", "__id")
+
+    def __init__(self, el_paciente, el_medico, lista_de_medicamentos, fecha=None):
         self.__paciente = None
         self.__medico = None
         self.__medicamentos = []
         self.__fecha = None 
+        self.__id = None
 
         # Tengo que asegurarme de que lo que me pasaron sea realmente un objeto Paciente.
         if not isinstance(el_paciente, Paciente):
@@ -31,14 +37,35 @@ class Receta:
         for med in lista_de_medicamentos:
             if not isinstance(med, str) or not med.strip():
                 raise ValueError(f"¡Un medicamento no es válido! '{med}' no es un texto o está vacío. Cada medicamento en la lista debe ser un nombre.")
-            medicamentos_limpios.append(med.strip()) # Lo agrego limpio
+            medicamentos_limpios.append(sys.intern(med.strip())) # Lo agrego limpio (y compartido entre recetas)
         
         self.__medicamentos = medicamentos_limpios 
-        self.__fecha = datetime.now()
+
+        # La fecha solo se pasa al restaurar una receta ya emitida (por ejemplo, desde el disco).
+        if fecha is not None and not isinstance(fecha, datetime):
+            raise TypeError("¡Error! La 'fecha' de la receta debe ser un objeto datetime.")
+        self.__fecha = fecha if fecha is not None else datetime.now()
     
     def obtener_medicamentos(self):
         return self.__medicamentos
 
+    def obtener_paciente(self):
+        return self.__paciente
+
+    def obtener_medico(self):
+        return self.__medico
+
+    def obtener_fecha(self):
+        return self.__fecha
+
+    def obtener_id(self):
+        return self.__id
+
+    def asignar_id(self, identificador: int):
+        if self.__id is not None:
+            raise ValueError("¡Error! Esta receta ya tiene un id asignado.")
+        self.__id = identificador
+
     def __str__(self):
         # Esto es para que la receta se vea clara cuando la imprimo.
         fecha_formateada = self.__fecha.strftime("%Y-%m-%d %H:%M:%S")
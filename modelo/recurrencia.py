@@ -0,0 +1,53 @@
+from datetime import datetime, timedelta
+
+
+class ReglaRecurrencia:
+    # Describe una serie de turnos: empieza en 'primera' y se repite cada 'intervalo' (por defecto
+    # una semana), hasta juntar 'cantidad' turnos o hasta la fecha 'hasta', lo que llegue primero.
+    MAXIMO_OCURRENCIAS = 520 # Diez años de turnos semanales: más que eso seguro es un error.
+
+    def __init__(self, primera: datetime, intervalo: timedelta = timedelta(weeks=1), cantidad: int = None,
+                 hasta: datetime = None):
+        if not isinstance(primera, datetime):
+            raise TypeError("¡Error! La primera fecha de la serie debe ser un objeto datetime.")
+        if not isinstance(intervalo, timedelta) or intervalo <= timedelta(0):
+            raise ValueError("¡Error! El intervalo de la serie debe ser un tiempo mayor a cero.")
+        if cantidad is None and hasta is None:
+            raise ValueError("¡Error! La serie necesita una cantidad de turnos o una fecha final.")
+        if cantidad is not None and (not isinstance(cantidad, int) or cantidad <= 0):
+            raise ValueError("¡Error! La cantidad de turnos de la serie debe ser un número mayor a cero.")
+        if hasta is not None and (not isinstance(hasta, datetime) or hasta < primera):
+            raise ValueError("¡Error! La fecha final de la serie debe ser un datetime igual o posterior a la primera.")
+        self.__primera = primera
+        self.__intervalo = intervalo
+        self.__cantidad = cantidad
+        self.__hasta = hasta
+        if len(self) > self.MAXIMO_OCURRENCIAS:
+            raise ValueError(f"¡Error! Una serie no puede tener más de {self.MAXIMO_OCURRENCIAS} turnos.")
+        # La última fecha tiene que existir (no pasarse del año 9999): si no, la serie se rompería recién al agendarla.
+        try:
+            self.__primera + self.__intervalo * (len(self) - 1)
+        except OverflowError:
+            raise ValueError("¡Error! La serie se pasa de la última fecha posible (año 9999).")
+
+    def obtener_primera(self) -> datetime:
+        return self.__primera
+
+    def obtener_intervalo(self) -> timedelta:
+        return self.__intervalo
+
+    def obtener_fechas(self) -> list[datetime]:
+        return [self.__primera + self.__intervalo * numero for numero in range(len(self))]
+
+    def __len__(self):
+        # Cuántas fechas entran hasta 'hasta' lo saco con una división, sin generarlas.
+        if self.__hasta is None:
+            return self.__cantidad
+        hasta_la_fecha = (self.__hasta - self.__primera) // self.__intervalo + 1
+        return hasta_la_fecha if self.__cantidad is None else min(self.__cantidad, hasta_la_fecha)
+
+    def __str__(self):
+        limite = f"{self.__cantidad} turnos" if self.__cantidad is not None else ""
+        if self.__hasta is not None:
+            limite += (" o " if limite else "") + f"hasta el {self.__hasta.strftime('%Y-%m-%d')}"
+        return f"Desde el {self.__primera.strftime('%Y-%m-%d %H:%M')}, cada {self.__intervalo}, {limite}"
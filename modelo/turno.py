@@ -1,16 +1,26 @@
 
 from datetime import datetime
+import sys
 from modelo.paciente import Paciente 
 from modelo.medico import Medico 
-import locale
-locale.setlocale(locale.LC_TIME, 'C')    
+from modelo.especialidad import validar_duracion_turno
+from modelo.dias import dia_de_fecha
 
 class Turno:
-    def __init__(self, el_paciente, el_medico, fecha_y_hora, la_especialidad):
+    # Sin __dict__ por turno (puede haber millones). La especialidad se guarda "internada": todos los
+    # turnos de Pediatría comparten el mismo objeto str en lugar de tener cada uno su copia.
+    # El id lo asigna la Clinica al guardarlo; 'baja' marca el turno como cancelado (ver Clinica.cancelar_turno).
+    # El turno ocupa [fecha_hora, fecha_hora + duración): sin duración, la de la especialidad con ese médico.
+    __slots__ = ("__paciente", "__medico", "__fecha_hora", "__especialidad", "__duracion", "__id", "__baja")
+
+    def __init__(self, el_paciente, el_medico, fecha_y_hora, la_especialidad, duracion=None):
         self.__paciente = None
         self.__medico = None
         self.__fecha_hora = None
         self.__especialidad = ""
+        self.__duracion = None
+        self.__id = None
+        self.__baja = None # Número de baja en la clínica; None mientras el turno siga vigente.
 
         if not isinstance(el_paciente, Paciente):
             raise TypeError("¡Error! El 'paciente' debe ser un objeto de la clase Paciente.")
@@ -26,7 +36,13 @@ class Turno:
 
         if not isinstance(la_especialidad, str) or not la_especialidad.strip():
             raise ValueError("¡La especialidad del turno no puede estar vacía o no ser texto!")
-        self.__especialidad = la_especialidad.strip() # Guardo la especialidad, limpio los espacios.
+        self.__especialidad = sys.intern(la_especialidad.strip()) # Guardo la especialidad, limpio los espacios.
+
+        if duracion is None:
+            # Es el mismo objeto timedelta de la Especialidad (ya validado): no ocupa memoria por turno.
+            self.__duracion = el_medico.obtener_duracion_turno(self.__especialidad)
+        else:
+            self.__duracion = validar_duracion_turno(duracion)
 
 
     # --- Métodos para obtener información (los "getters") ---
@@ -43,9 +59,42 @@ class Turno:
         # Devuelve el objeto datetime con la fecha y hora del turno.
         return self.__fecha_hora
     
+    def obtener_especialidad_solicitada(self):
+        # Devuelve la especialidad tal como se pidió al agendar, sin volver a validar el día.
+        return self.__especialidad
+
+    def obtener_duracion(self):
+        return self.__duracion
+
+    def obtener_fin(self):
+        # Momento en que termina el turno (el próximo puede empezar justo ahí).
+        return self.__fecha_hora + self.__duracion
+
+    def obtener_id(self):
+        # Número del turno en la clínica (None si todavía no se guardó en ninguna).
+        return self.__id
+
+    def asignar_id(self, identificador: int):
+        if self.__id is not None:
+            raise ValueError("¡Error! Este turno ya tiene un id asignado.")
+        self.__id = identificador
+
+    def esta_cancelado(self) -> bool:
+        return self.__baja is not None
+
+    def cancelar(self, numero_baja: int = 0):
+        # Solo lo marca: las listas que lo tienen lo saltean hasta la próxima compactación.
+        # 'numero_baja' es el orden de esta cancelación en la clínica (ver vigente_en).
+        self.__baja = numero_baja
+
+    def vigente_en(self, bajas: int) -> bool:
+        # ¿Seguía vigente cuando la clínica llevaba 'bajas' cancelaciones? Lo usan las vistas
+        # (modelo/vista.py): un turno cancelado después de tomar la vista se sigue viendo.
+        return self.__baja is None or self.__baja >= bajas
+
     def obtener_especialidad(self):
-        # Día del turno (en inglés, lo convertimos a español)
-        dia = self.__fecha_hora.strftime("%A").capitalize()
+        # Día del turno en español, sacado de weekday() (no depende del locale)
+        dia = dia_de_fecha(self.__fecha_hora)
 
         # Verificamos si el médico atiende esa especialidad ese día
         if self.__medico.atiende_especialidad(self.__especialidad, dia):
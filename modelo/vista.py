@@ -0,0 +1,97 @@
+from datetime import datetime
+
+from modelo.exception import PacienteNoExisteError
+
+
+class VistaClinica:
+    # Foto de solo lectura de una Clinica en un momento dado, para reportes y exportaciones largas
+    # que no tienen que frenar a quien agenda turnos o emite recetas. Se pide con Clinica.obtener_vista().
+    #
+    # No copia nada: todas las listas de la clínica son de solo-agregar, así que alcanza con anotar
+    # hasta dónde llegaban (cantidad de turnos, pacientes y médicos, próximo id de turno y de receta)
+    # y cuántas bajas había. Lo que se agregue después queda fuera de la vista, y un turno cancelado
+    # después se sigue viendo (Turno.vigente_en). Lo único que reescribe las listas es la compactación
+    # de turnos cancelados: la clínica la posterga mientras haya vistas abiertas, por eso conviene
+    # cerrarlas (cerrar() o un bloque with) al terminar el reporte.
+    def __init__(self, turnos, cantidad_filas: int, cantidad_turnos: int, bajas: int, proximo_id_turno: int,
+                 proximo_id_receta: int, pacientes: list, cantidad_pacientes: int, medicos: list,
+                 cantidad_medicos: int, historias: dict, al_cerrar):
+        self.__momento = datetime.now()
+        self.__turnos = turnos # La lista (o TurnosColumnares) de la clínica al tomar la vista.
+        self.__cantidad_filas = cantidad_filas
+        self.__cantidad_turnos = cantidad_turnos
+        self.__bajas = bajas
+        self.__proximo_id_turno = proximo_id_turno
+        self.__proximo_id_receta = proximo_id_receta
+        self.__pacientes = pacientes
+        self.__cantidad_pacientes = cantidad_pacientes
+        self.__medicos = medicos
+        self.__cantidad_medicos = cantidad_medicos
+        self.__historias = historias
+        self.__al_cerrar = al_cerrar
+
+    def obtener_momento(self) -> datetime:
+        return self.__momento
+
+    def cantidad_turnos(self) -> int:
+        return self.__cantidad_turnos
+
+    def cantidad_pacientes(self) -> int:
+        return self.__cantidad_pacientes
+
+    def cantidad_medicos(self) -> int:
+        return self.__cantidad_medicos
+
+    def iterar_turnos(self, desde: datetime = None, hasta: datetime = None):
+        # Turnos vigentes al tomar la vista, en orden de alta; con desde/hasta, solo los de [desde, hasta).
+        turnos, bajas = self.__turnos, self.__bajas
+        for posicion in range(self.__cantidad_filas):
+            turno = turnos[posicion]
+            if not turno.vigente_en(bajas):
+                continue
+            fecha_hora = turno.obtener_fecha_hora()
+            if (desde is None or fecha_hora >= desde) and (hasta is None or fecha_hora < hasta):
+                yield turno
+
+    def iterar_pacientes(self):
+        pacientes = self.__pacientes
+        for posicion in range(self.__cantidad_pacientes):
+            yield pacientes[posicion]
+
+    def iterar_medicos(self):
+        medicos = self.__medicos
+        for posicion in range(self.__cantidad_medicos):
+            yield medicos[posicion]
+
+    def obtener_turnos_de(self, dni: str) -> list:
+        return self.__historia(dni).obtener_turnos_en(self.__proximo_id_turno, self.__bajas)
+
+    def obtener_recetas_de(self, dni: str) -> list:
+        return self.__historia(dni).obtener_recetas_en(self.__proximo_id_receta)
+
+    def iterar_recetas(self):
+        # Las recetas de cada paciente, paciente por paciente en orden de alta.
+        for paciente in self.iterar_pacientes():
+            yield from self.obtener_recetas_de(paciente.obtener_dni())
+
+    def __historia(self, dni: str):
+        historia = self.__historias.get(dni)
+        if historia is None:
+            raise PacienteNoExisteError(f"No se encontró historia clínica para el DNI {dni}.")
+        return historia
+
+    def cerrar(self):
+        # Avisa a la clínica que ya no se usa (puede volver a compactar). Se puede llamar más de una vez.
+        if self.__al_cerrar is not None:
+            self.__al_cerrar(self)
+            self.__al_cerrar = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *excepcion):
+        self.cerrar()
+
+    def __str__(self):
+        return (f"Vista de la clínica del {self.__momento.strftime('%Y-%m-%d %H:%M:%S')}: "
+                f"{self.__cantidad_pacientes} pacientes, {self.__cantidad_medicos} médicos, {self.__cantidad_turnos} turnos")
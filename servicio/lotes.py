@@ -0,0 +1,50 @@
+# Modo por lotes: ejecuta pedidos contra una Clinica sin menú, sin limpiar la pantalla y sin pausas.
+# Usa el mismo protocolo que el servidor: cada línea de entrada es un pedido JSON {"op": ..., "id": ..., ...datos}
+# y por cada pedido se escribe una línea JSON de respuesta, en el mismo orden.
+# Las líneas vacías y las que empiezan con '#' se ignoran, para poder comentar los guiones.
+#
+# Uso:  python main.py lote comandos.jsonl > respuestas.jsonl
+#       python main.py lote < comandos.jsonl
+import json
+
+from servicio.operaciones import ejecutar_operacion
+
+
+class ResultadoLote:
+    # Cuántos pedidos salieron bien y cuántos fallaron.
+    def __init__(self, exitos: int, errores: int):
+        self.__exitos = exitos
+        self.__errores = errores
+
+    def obtener_exitos(self) -> int:
+        return self.__exitos
+
+    def obtener_errores(self) -> int:
+        return self.__errores
+
+    def __str__(self):
+        return f"Pedidos ejecutados: {self.__exitos + self.__errores} ({self.__exitos} correctos, {self.__errores} con error)."
+
+
+def ejecutar_lineas(clinica, lineas, salida, detener_en_error: bool = False) -> ResultadoLote:
+    # 'lineas' es cualquier iterable de texto (un archivo abierto, sys.stdin, una lista) y 'salida'
+    # cualquier cosa con write. Con detener_en_error se corta en el primer pedido que falle.
+    exitos = errores = 0
+    for linea in lineas:
+        linea = linea.strip()
+        if not linea or linea.startswith("#"):
+            continue
+        try:
+            pedido = json.loads(linea)
+        except ValueError:
+            respuesta = {"id": None, "ok": False, "error": "JSONInvalido", "mensaje": "La línea no es JSON válido."}
+        else:
+            respuesta = ejecutar_operacion(clinica, pedido)
+        salida.write(json.dumps(respuesta, ensure_ascii=False) + "\n")
+        if respuesta["ok"]:
+            exitos += 1
+        else:
+            errores += 1
+            if detener_en_error:
+                break
+    return ResultadoLote(exitos, errores)
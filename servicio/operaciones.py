@@ -0,0 +1,177 @@
+from modelo.clinica import Clinica
+from modelo.paciente import Paciente
+from modelo.medico import Medico
+from modelo.especialidad import Especialidad
+from modelo.importacion import ERRORES_DE_VALIDACION, leer_especialidades, leer_fecha_hora, leer_duracion
+from modelo.recurrencia import ReglaRecurrencia
+from modelo.exception import RecetaInvalidaError, SerieTurnosConflictoError, TurnoNoExisteError
+from datetime import timedelta
+
+# Traducción de pedidos (diccionarios, por ejemplo leídos de JSON) a llamadas sobre una Clinica.
+# Cubre lo mismo que ofrece el menú de la CLI. Lo usan el servidor y el modo por lotes.
+
+
+# --- Conversión de objetos del modelo a datos simples ---
+
+def paciente_a_dict(paciente: Paciente) -> dict:
+    return {"nombre": paciente.obtener_nombre(), "dni": paciente.obtener_dni(),
+            "fecha_nacimiento": paciente.obtener_fecha_nacimiento()}
+
+
+def medico_a_dict(medico: Medico) -> dict:
+    return {"nombre": medico.obtener_nombre(), "matricula": medico.obtener_matricula(),
+            "especialidades": [{"tipo": e.obtener_tipo(), "dias": e.obtener_dias_atencion(),
+                                "duracion_minutos": e.obtener_duracion_turno() // timedelta(minutes=1)}
+                               for e in medico.obtener_especialidad()]}
+
+
+def turno_a_dict(turno) -> dict:
+    return {"id": turno.obtener_id(), "dni": turno.obtener_paciente().obtener_dni(), "matricula": turno.obtener_medico().obtener_matricula(),
+            "especialidad": turno.obtener_especialidad_solicitada(), "fecha_hora": turno.obtener_fecha_hora().isoformat(),
+            "duracion_minutos": turno.obtener_duracion() // timedelta(minutes=1)}
+
+
+def receta_a_dict(receta) -> dict:
+    return {"dni": receta.obtener_paciente().obtener_dni(), "matricula": receta.obtener_medico().obtener_matricula(),
+            "medicamentos": receta.obtener_medicamentos(), "fecha": receta.obtener_fecha().isoformat()}
+
+
+# --- Operaciones ---
+
+def _agregar_paciente(clinica: Clinica, datos: dict):
+    clinica.agregar_paciente(Paciente(datos["nombre"], datos["dni"], datos["fecha_nacimiento"]))
+    return {"dni": datos["dni"]}
+
+
+def _agregar_medico(clinica: Clinica, datos: dict):
+    especialidades = [Especialidad(tipo, dias, duracion) for tipo, dias, duracion in leer_especialidades(datos["especialidades"])]
+    clinica.agregar_medico(Medico(datos["nombre"], datos["matricula"], especialidades))
+    return {"matricula": datos["matricula"]}
+
+
+def _agregar_especialidad(clinica: Clinica, datos: dict):
+    medico = clinica.obtener_medico_por_matricula(datos["matricula"])
+    # "duracion_minutos" es opcional: sin ella, los turnos de la especialidad duran lo general (30 minutos).
+    medico.agregar_especialidad(Especialidad(datos["tipo"], datos["dias"], leer_duracion(datos.get("duracion_minutos"))))
+    return medico_a_dict(medico)
+
+
+def _agendar_turno(clinica: Clinica, datos: dict):
+    turno = clinica.agendar_turno(datos["dni"], datos["matricula"], datos["especialidad"], leer_fecha_hora(datos["fecha_hora"]),
+                                  leer_duracion(datos.get("duracion_minutos")))
+    return turno_a_dict(turno)
+
+
+def _cancelar_turno(clinica: Clinica, datos: dict):
+    return turno_a_dict(clinica.cancelar_turno(datos["id_turno"]))
+
+
+def _reprogramar_turno(clinica: Clinica, datos: dict):
+    return turno_a_dict(clinica.reprogramar_turno(datos["id_turno"], leer_fecha_hora(datos["fecha_hora"])))
+
+
+def _agendar_serie(clinica: Clinica, datos: dict):
+    # {"primera": fecha_hora, "intervalo_dias": 7, "cantidad": n y/o "hasta": fecha_hora, "duracion_minutos": opcional}
+    hasta = leer_fecha_hora(datos["hasta"]) if datos.get("hasta") is not None else None
+    try:
+        intervalo = timedelta(days=datos.get("intervalo_dias", 7))
+    except OverflowError:
+        raise ValueError("¡Error! El intervalo de la serie es demasiado grande.")
+    regla = ReglaRecurrencia(leer_fecha_hora(datos["primera"]), intervalo, datos.get("cantidad"), hasta)
+    turnos = clinica.agendar_serie(datos["dni"], datos["matricula"], datos["especialidad"], regla,
+                                   leer_duracion(datos.get("duracion_minutos")))
+    return [turno_a_dict(turno) for turno in turnos]
+
+
+def _emitir_receta(clinica: Clinica, datos: dict):
+    return receta_a_dict(clinica.emitir_receta(datos["dni"], datos["matricula"], datos["medicamentos"]))
+
+
+def _leer_rango(datos: dict) -> tuple:
+    return tuple(leer_fecha_hora(datos[clave]) if datos.get(clave) is not None else None for clave in ("desde", "hasta"))
+
+
+def _recetas_por_medicamento(clinica: Clinica, datos: dict):
+    # {"medicamento": ..., "desde": fecha_hora, "hasta": fecha_hora} (el rango es opcional).
+    return [receta_a_dict(r) for r in clinica.buscar_recetas_por_medicamento(datos["medicamento"], *_leer_rango(datos))]
+
+
+def _medicamentos_mas_recetados(clinica: Clinica, datos: dict):
+    mas_recetados = clinica.obtener_medicamentos_mas_recetados(datos.get("cantidad", 10), *_leer_rango(datos))
+    return [{"medicamento": nombre, "recetas": total} for nombre, total in mas_recetados]
+
+
+def _buscar_pacientes(clinica: Clinica, datos: dict):
+    # {"nombre": "garc an", "limite": 20, "aproximada": false}
+    pacientes = clinica.buscar_pacientes_por_nombre(datos["nombre"], datos.get("limite", 20), bool(datos.get("aproximada", False)))
+    return [paciente_a_dict(p) for p in pacientes]
+
+
+def _ver_historia(clinica: Clinica, datos: dict):
+    historia = clinica.obtener_historia_clinica_por_dni(datos["dni"])
+    return {"paciente": paciente_a_dict(historia.obtener_paciente()),
+            "turnos": [turno_a_dict(t) for t in historia.obtener_turnos()],
+            "recetas": [receta_a_dict(r) for r in historia.obtener_recetas()]}
+
+
+def _pagina(obtener_pagina, convertir, datos: dict):
+    # Los listados van siempre por páginas: {"elementos": [...], "siguiente_cursor": n o None}.
+    pagina = obtener_pagina(datos.get("cursor", 0), datos.get("limite", 100))
+    return {"elementos": [convertir(e) for e in pagina], "siguiente_cursor": pagina.obtener_siguiente_cursor()}
+
+
+def _listar_turnos(clinica: Clinica, datos: dict):
+    return _pagina(clinica.obtener_turnos_pagina, turno_a_dict, datos)
+
+
+def _listar_pacientes(clinica: Clinica, datos: dict):
+    return _pagina(clinica.obtener_pacientes_pagina, paciente_a_dict, datos)
+
+
+def _listar_medicos(clinica: Clinica, datos: dict):
+    return _pagina(clinica.obtener_medicos_pagina, medico_a_dict, datos)
+
+
+OPERACIONES = {
+    "agregar_paciente": _agregar_paciente,
+    "agregar_medico": _agregar_medico,
+    "agregar_especialidad": _agregar_especialidad,
+    "agendar_turno": _agendar_turno,
+    "agendar_serie": _agendar_serie,
+    "cancelar_turno": _cancelar_turno,
+    "reprogramar_turno": _reprogramar_turno,
+    "emitir_receta": _emitir_receta,
+    "ver_historia": _ver_historia,
+    "buscar_pacientes": _buscar_pacientes,
+    "recetas_por_medicamento": _recetas_por_medicamento,
+    "medicamentos_mas_recetados": _medicamentos_mas_recetados,
+    "listar_turnos": _listar_turnos,
+    "listar_pacientes": _listar_pacientes,
+    "listar_medicos": _listar_medicos,
+}
+
+
+def ejecutar_operacion(clinica: Clinica, pedido: dict) -> dict:
+    # Ejecuta un pedido {"op": ..., "id": ..., ...datos} y devuelve la respuesta:
+    # {"id": ..., "ok": True, "resultado": ...} o {"id": ..., "ok": False, "error": <excepción>, "mensaje": ...}.
+    # Los errores nunca se propagan: siempre vuelven como respuesta, también los que no esperaba
+    # (así un pedido raro no corta la conexión del servidor ni un guion del modo por lotes).
+    if not isinstance(pedido, dict):
+        return {"id": None, "ok": False, "error": "PedidoInvalido", "mensaje": "El pedido debe ser un objeto JSON."}
+
+    identificador = pedido.get("id")
+    operacion = OPERACIONES.get(pedido.get("op"))
+    if operacion is None:
+        return {"id": identificador, "ok": False, "error": "OperacionDesconocida",
+                "mensaje": f"Operación desconocida: {pedido.get('op')!r}. Usar una de: {', '.join(OPERACIONES)}."}
+    try:
+        return {"id": identificador, "ok": True, "resultado": operacion(clinica, pedido)}
+    except KeyError as e:
+        return {"id": identificador, "ok": False, "error": "DatoFaltante", "mensaje": f"Falta el dato {e}."}
+    except SerieTurnosConflictoError as e:
+        return {"id": identificador, "ok": False, "error": type(e).__name__, "mensaje": str(e),
+                "conflictos": [{"fecha_hora": fecha_hora.isoformat(), "motivo": motivo} for fecha_hora, motivo in e.obtener_conflictos()]}
+    except (ValueError, TypeError, AttributeError, RecetaInvalidaError, TurnoNoExisteError) + ERRORES_DE_VALIDACION as e:
+        return {"id": identificador, "ok": False, "error": type(e).__name__, "mensaje": str(e)}
+    except Exception as e:
+        return {"id": identificador, "ok": False, "error": type(e).__name__, "mensaje": f"Error inesperado: {e}"}
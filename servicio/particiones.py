@@ -0,0 +1,304 @@
+# Clínica repartida en varios procesos (particiones) para usar más de un núcleo: una sola Clinica
+# queda atada al GIL. Cada proceso tiene su propia Clinica y es dueño de una parte de los médicos
+# (por matrícula): sus turnos y sus recetas viven solo ahí. ClinicaParticionada hace de enrutador:
+# recibe pedidos con el mismo protocolo que el servidor ({"op": ..., "id": ..., ...datos}) y los
+# manda por colas de multiprocessing a la partición que corresponde.
+#
+# - agendar_turno, agendar_serie y emitir_receta van a la partición de la matrícula.
+# - Pacientes y médicos se agregan en todas las particiones, en el mismo orden: así cualquier
+#   partición puede validar un turno y listar o buscar pacientes o médicos como una clínica sola
+#   (esos pedidos van a la partición 0).
+# - Los ids de turno que ve el cliente son globales: id_local * cantidad_particiones + partición.
+#   Con eso cancelar_turno y reprogramar_turno saben a qué partición ir.
+# - ver_historia, listar_turnos y las consultas por medicamento preguntan a todas las particiones
+#   y juntan las respuestas: la historia de un paciente tiene los turnos y recetas de todos sus médicos.
+#
+# Uso:  with ClinicaParticionada(4) as clinica:
+#           respuestas = clinica.ejecutar_varios(pedidos)
+import multiprocessing
+import os
+import queue
+import sys
+import threading
+import zlib
+
+from modelo.clinica import Clinica
+from modelo.medicamentos import clave_medicamento
+from modelo.persistencia import AlmacenamientoClinica
+from modelo.paginacion import validar_pagina
+from servicio.operaciones import ejecutar_operacion
+
+# Pedidos que se mandan juntos en un solo mensaje a una partición: menos viajes por las colas.
+TAMANIO_TANDA = 256
+
+_EN_TODAS = {"agregar_paciente", "agregar_medico", "agregar_especialidad"}
+_POR_MATRICULA = {"agendar_turno", "agendar_serie", "emitir_receta"}
+_POR_ID_TURNO = {"cancelar_turno", "reprogramar_turno"}
+_REUNIR = {"ver_historia", "listar_turnos", "recetas_por_medicamento", "medicamentos_mas_recetados"}
+_EN_TODAS_LAS_PARTICIONES = -1
+
+
+def particion_de_matricula(matricula: str, cantidad_particiones: int) -> int:
+    # crc32 y no hash(): tiene que dar lo mismo en todos los procesos y entre ejecuciones.
+    return zlib.crc32(matricula.encode("utf-8")) % cantidad_particiones
+
+
+def _atender_particion(indice: int, pedidos, respuestas, directorio: str, columnar: bool):
+    # Bucle de cada proceso: recibe tandas de pedidos y devuelve sus respuestas, en orden.
+    almacenamiento = None
+    if directorio:
+        almacenamiento = AlmacenamientoClinica(os.path.join(directorio, f"particion_{indice}"))
+    clinica = Clinica(almacenamiento, columnar=columnar)
+    try:
+        while True:
+            mensaje = pedidos.get()
+            if mensaje is None:
+                break
+            numero, tanda = mensaje
+            respuestas.put((numero, [_ejecutar_en_particion(clinica, pedido) for pedido in tanda]))
+    finally:
+        clinica.cerrar()
+
+
+def _ejecutar_en_particion(clinica: Clinica, pedido) -> dict:
+    # Un pedido que falla de una forma inesperada vuelve como respuesta de error, igual que en el
+    # servidor: no puede terminar el proceso y dejar a la partición sin atender para siempre.
+    try:
+        return ejecutar_operacion(clinica, pedido)
+    except Exception as e:
+        identificador = pedido.get("id") if isinstance(pedido, dict) else None
+        return {"id": identificador, "ok": False, "error": type(e).__name__, "mensaje": f"Error inesperado: {e}"}
+
+
+class ClinicaParticionada:
+    def __init__(self, cantidad_particiones: int = 2, directorio: str = None, columnar: bool = False):
+        if not isinstance(cantidad_particiones, int) or cantidad_particiones <= 0:
+            raise ValueError("¡Error! La cantidad de particiones debe ser un número entero mayor a cero.")
+        self.__cantidad = cantidad_particiones
+        # spawn y no fork: el proceso que crea las particiones puede tener hilos (el servidor, la CLI).
+        contexto = multiprocessing.get_context("spawn")
+        self.__respuestas = contexto.Queue()
+        self.__colas = []
+        self.__procesos = []
+        for indice in range(cantidad_particiones):
+            cola = contexto.Queue()
+            proceso = contexto.Process(target=_atender_particion, name=f"particion-{indice}", daemon=True,
+                                       args=(indice, cola, self.__respuestas, directorio, columnar))
+            proceso.start()
+            self.__colas.append(cola)
+            self.__procesos.append(proceso)
+        self.__cerrojo = threading.Lock() # Un pedido a la vez: las particiones ven todo en el mismo orden.
+        self.__proximo_numero = 0
+
+    def obtener_cantidad_particiones(self) -> int:
+        return self.__cantidad
+
+    def ejecutar_operacion(self, pedido: dict) -> dict:
+        return self.ejecutar_varios([pedido])[0]
+
+    def ejecutar_varios(self, pedidos: list) -> list[dict]:
+        # Respuestas en el mismo orden que los pedidos. Los pedidos de distintas particiones se
+        # ejecutan en paralelo; dentro de una partición, en el orden en que llegaron.
+        respuestas = [None] * len(pedidos)
+        with self.__cerrojo:
+            tramo = []
+            for posicion, pedido in enumerate(pedidos):
+                if isinstance(pedido, dict) and pedido.get("op") in _REUNIR:
+                    # Lo que se junta de todas las particiones tiene que ver lo anterior ya hecho.
+                    self.__despachar(tramo, respuestas)
+                    tramo = []
+                    respuestas[posicion] = self.__reunir(pedido)
+                else:
+                    tramo.append((posicion, pedido))
+            self.__despachar(tramo, respuestas)
+        return respuestas
+
+    def cerrar(self):
+        for cola in self.__colas:
+            cola.put(None)
+        for proceso in self.__procesos:
+            proceso.join()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *excepcion):
+        self.cerrar()
+
+    # --- Enrutamiento ---
+
+    def __destino(self, pedido) -> tuple[int, object]:
+        # (partición, pedido a mandarle). Lo que no se puede enrutar (pedido inválido, datos
+        # faltantes) va a la partición 0, que contesta el error igual que una clínica sola.
+        if not isinstance(pedido, dict):
+            return 0, pedido
+        operacion = pedido.get("op")
+        if operacion in _EN_TODAS:
+            return _EN_TODAS_LAS_PARTICIONES, pedido
+        if operacion in _POR_MATRICULA and isinstance(pedido.get("matricula"), str):
+            return particion_de_matricula(pedido["matricula"], self.__cantidad), pedido
+        if operacion in _POR_ID_TURNO and isinstance(pedido.get("id_turno"), int) and pedido["id_turno"] >= 0:
+            particion, id_local = self.__a_local(pedido["id_turno"])
+            return particion, dict(pedido, id_turno=id_local)
+        return 0, pedido
+
+    def __a_local(self, id_turno: int) -> tuple[int, int]:
+        id_local, particion = divmod(id_turno, self.__cantidad)
+        return particion, id_local
+
+    def __a_global(self, turno: dict, particion: int) -> dict:
+        if turno.get("id") is not None:
+            turno["id"] = turno["id"] * self.__cantidad + particion
+        return turno
+
+    def __globalizar_respuesta(self, respuesta: dict, pedido, particion: int) -> dict:
+        # Pasa a ids globales los turnos que vienen en el resultado.
+        if not respuesta["ok"] or pedido.get("op") not in _POR_MATRICULA | _POR_ID_TURNO:
+            return respuesta
+        resultado = respuesta["resultado"]
+        if pedido.get("op") == "agendar_serie":
+            for turno in resultado:
+                self.__a_global(turno, particion)
+        elif pedido["op"] != "emitir_receta":
+            self.__a_global(resultado, particion)
+        return respuesta
+
+    # --- Envío y recepción ---
+
+    def __enviar(self, particion: int, tanda: list) -> int:
+        numero = self.__proximo_numero
+        self.__proximo_numero += 1
+        self.__colas[particion].put((numero, tanda))
+        return numero
+
+    def __recibir(self, cantidad: int) -> dict[int, list]:
+        # Espera 'cantidad' tandas de respuestas (vienen en cualquier orden entre particiones).
+        recibidas = {}
+        while len(recibidas) < cantidad:
+            try:
+                numero, respuestas = self.__respuestas.get(timeout=1)
+            except queue.Empty:
+                for indice, proceso in enumerate(self.__procesos):
+                    if not proceso.is_alive():
+                        raise RuntimeError(f"¡Error! La partición {indice} terminó inesperadamente.")
+                continue
+            recibidas[numero] = respuestas
+        return recibidas
+
+    def __despachar(self, tramo: list, respuestas: list):
+        if not tramo:
+            return
+        por_particion = [[] for _ in range(self.__cantidad)] # (posición, pedido) de cada partición.
+        de_una_particion = [] # (posición, pedido, partición) de los que no van a todas.
+        for posicion, pedido in tramo:
+            particion, pedido_local = self.__destino(pedido)
+            if particion != _EN_TODAS_LAS_PARTICIONES:
+                de_una_particion.append((posicion, pedido, particion))
+            destinos = range(self.__cantidad) if particion == _EN_TODAS_LAS_PARTICIONES else (particion,)
+            for destino in destinos:
+                por_particion[destino].append((posicion, pedido_local))
+
+        enviadas = {} # número de tanda -> (partición, posiciones)
+        for particion, asignados in enumerate(por_particion):
+            for inicio in range(0, len(asignados), TAMANIO_TANDA):
+                tanda = asignados[inicio:inicio + TAMANIO_TANDA]
+                numero = self.__enviar(particion, [pedido for _, pedido in tanda])
+                enviadas[numero] = (particion, [posicion for posicion, _ in tanda])
+
+        for numero, respuestas_tanda in self.__recibir(len(enviadas)).items():
+            particion, posiciones = enviadas[numero]
+            for posicion, respuesta in zip(posiciones, respuestas_tanda):
+                anterior = respuestas[posicion]
+                # Lo que se hizo en todas las particiones: si alguna falló, devuelvo ese error.
+                if anterior is None or (anterior["ok"] and not respuesta["ok"]):
+                    respuestas[posicion] = respuesta
+        for posicion, pedido, particion in de_una_particion:
+            self.__globalizar_respuesta(respuestas[posicion], pedido, particion)
+
+    def __en_todas(self, pedidos_por_particion: list) -> list[dict]:
+        # Manda un pedido a cada partición y devuelve las respuestas ordenadas por partición.
+        numeros = [self.__enviar(particion, [pedido]) for particion, pedido in enumerate(pedidos_por_particion)]
+        recibidas = self.__recibir(len(numeros))
+        return [recibidas[numero][0] for numero in numeros]
+
+    # --- Consultas que juntan todas las particiones ---
+
+    def __reunir(self, pedido: dict) -> dict:
+        if pedido["op"] == "ver_historia":
+            return self.__reunir_historia(pedido)
+        if pedido["op"] == "recetas_por_medicamento":
+            return self.__reunir_recetas(pedido)
+        if pedido["op"] == "medicamentos_mas_recetados":
+            return self.__reunir_mas_recetados(pedido)
+        return self.__reunir_turnos(pedido)
+
+    def __reunir_recetas(self, pedido: dict) -> dict:
+        respuestas = self.__en_todas([pedido] * self.__cantidad)
+        for respuesta in respuestas:
+            if not respuesta["ok"]:
+                return respuesta
+        recetas = [receta for respuesta in respuestas for receta in respuesta["resultado"]]
+        recetas.sort(key=lambda receta: receta["fecha"])
+        return {"id": pedido.get("id"), "ok": True, "resultado": recetas}
+
+    def __reunir_mas_recetados(self, pedido: dict) -> dict:
+        # El top de cada partición no alcanza para el total: pido todos los conteos y los sumo.
+        cantidad = pedido.get("cantidad", 10)
+        if not isinstance(cantidad, int) or cantidad <= 0:
+            return self.__en_todas([pedido])[0] # Que la partición 0 conteste el error.
+        respuestas = self.__en_todas([dict(pedido, cantidad=sys.maxsize)] * self.__cantidad)
+        for respuesta in respuestas:
+            if not respuesta["ok"]:
+                return respuesta
+        # Cada partición tiene su catálogo: sumo por clave normalizada y muestro el primer nombre visto.
+        totales, nombres = {}, {}
+        for respuesta in respuestas:
+            for fila in respuesta["resultado"]:
+                clave = clave_medicamento(fila["medicamento"])
+                nombres.setdefault(clave, fila["medicamento"])
+                totales[clave] = totales.get(clave, 0) + fila["recetas"]
+        mejores = sorted(totales.items(), key=lambda par: -par[1])[:cantidad]
+        resultado = [{"medicamento": nombres[clave], "recetas": total} for clave, total in mejores]
+        return {"id": pedido.get("id"), "ok": True, "resultado": resultado}
+
+    def __reunir_historia(self, pedido: dict) -> dict:
+        respuestas = self.__en_todas([pedido] * self.__cantidad)
+        for respuesta in respuestas:
+            if not respuesta["ok"]:
+                return respuesta
+        turnos, recetas = [], []
+        for particion, respuesta in enumerate(respuestas):
+            turnos.extend(self.__a_global(turno, particion) for turno in respuesta["resultado"]["turnos"])
+            recetas.extend(respuesta["resultado"]["recetas"])
+        turnos.sort(key=lambda turno: turno["id"])
+        recetas.sort(key=lambda receta: receta["fecha"])
+        resultado = {"paciente": respuestas[0]["resultado"]["paciente"], "turnos": turnos, "recetas": recetas}
+        return {"id": pedido.get("id"), "ok": True, "resultado": resultado}
+
+    def __reunir_turnos(self, pedido: dict) -> dict:
+        # El cursor es un id global. Cada partición devuelve su página desde el primer id local que
+        # le corresponde; junto todo por id y me quedo con los 'limite' primeros. El próximo cursor
+        # es el menor id que quedó afuera: ninguno anterior se pierde entre páginas.
+        cursor, limite = pedido.get("cursor", 0), pedido.get("limite", 100)
+        try:
+            validar_pagina(cursor, limite)
+        except ValueError:
+            return self.__en_todas([pedido])[0] # Que la partición 0 conteste el error.
+        cantidad = self.__cantidad
+        pedidos = [dict(pedido, cursor=max(0, -(-(cursor - particion) // cantidad))) for particion in range(cantidad)]
+        respuestas = self.__en_todas(pedidos)
+        for respuesta in respuestas:
+            if not respuesta["ok"]:
+                return respuesta
+
+        turnos, siguientes = [], []
+        for particion, respuesta in enumerate(respuestas):
+            turnos.extend(self.__a_global(turno, particion) for turno in respuesta["resultado"]["elementos"])
+            siguiente = respuesta["resultado"]["siguiente_cursor"]
+            if siguiente is not None:
+                siguientes.append(siguiente * cantidad + particion)
+        turnos.sort(key=lambda turno: turno["id"])
+        if len(turnos) > limite:
+            siguientes.append(turnos[limite]["id"])
+        resultado = {"elementos": turnos[:limite], "siguiente_cursor": min(siguientes) if siguientes else None}
+        return {"id": pedido.get("id"), "ok": True, "resultado": resultado}
@@ -0,0 +1,167 @@
+# Servidor asyncio que expone una Clinica por un socket local (TCP o Unix).
+# Protocolo: JSON delimitado por líneas. Cada línea es un pedido {"op": ..., "id": ..., ...datos}
+# y por cada pedido se devuelve una línea de respuesta, en el mismo orden en que llegaron.
+#
+# Uso:  python -m servicio.servidor --puerto 8765
+#       python -m servicio.servidor --unix /tmp/clinica.sock
+import argparse
+import asyncio
+import json
+import os
+
+from modelo.clinica import Clinica
+from modelo.eventos import RegistradorAsincrono
+from modelo.persistencia import AlmacenamientoClinica
+from servicio.operaciones import ejecutar_operacion
+
+# Lo encola __atender en lugar de un pedido que pasó de LARGO_MAXIMO_LINEA; se responde con un error.
+_LINEA_DEMASIADO_LARGA = object()
+
+
+class ServidorClinica:
+    # Cada conexión puede mandar muchos pedidos seguidos sin esperar respuesta (pipelining).
+    # Los pedidos leídos se encolan en una cola acotada: si el cliente manda más rápido de lo que
+    # proceso, la cola se llena, dejo de leer del socket y el cliente queda frenado (backpressure).
+
+    LARGO_MAXIMO_LINEA = 2 ** 20 # Un pedido no puede ocupar más de 1 MB.
+
+    def __init__(self, clinica: Clinica, max_pendientes: int = 64):
+        if not isinstance(clinica, Clinica):
+            raise TypeError("¡Error! El servidor necesita un objeto Clinica.")
+        if max_pendientes <= 0:
+            raise ValueError("¡Error! La cantidad máxima de pedidos pendientes debe ser mayor a cero.")
+        self.__clinica = clinica
+        self.__max_pendientes = max_pendientes
+        self.__servidor = None
+
+    async def iniciar_tcp(self, host: str = "127.0.0.1", puerto: int = 8765):
+        self.__servidor = await asyncio.start_server(self.__atender, host, puerto, limit=self.LARGO_MAXIMO_LINEA)
+        return self.__servidor
+
+    async def iniciar_unix(self, ruta: str):
+        self.__servidor = await asyncio.start_unix_server(self.__atender, ruta, limit=self.LARGO_MAXIMO_LINEA)
+        return self.__servidor
+
+    def obtener_puerto(self) -> int:
+        return self.__servidor.sockets[0].getsockname()[1]
+
+    async def detener(self):
+        if self.__servidor is not None:
+            self.__servidor.close()
+            await self.__servidor.wait_closed()
+            self.__servidor = None
+
+    async def __atender(self, lector: asyncio.StreamReader, escritor: asyncio.StreamWriter):
+        pendientes = asyncio.Queue(maxsize=self.__max_pendientes)
+        respondedor = asyncio.create_task(self.__responder(pendientes, escritor))
+        try:
+            while True:
+                linea = await lector.readline()
+                if not linea:
+                    break # El cliente cerró la conexión.
+                if linea.strip():
+                    await pendientes.put(linea) # Si la cola está llena, espero: no leo más del socket.
+        except (asyncio.LimitOverrunError, ValueError):
+            # La línea pasó del máximo: no sé dónde termina, así que aviso al cliente y cierro.
+            await pendientes.put(_LINEA_DEMASIADO_LARGA)
+        except ConnectionError:
+            pass
+        finally:
+            await pendientes.put(None) # Aviso al respondedor que no vienen más pedidos.
+            await respondedor
+
+    async def __responder(self, pendientes: asyncio.Queue, escritor: asyncio.StreamWriter):
+        # Saca pedidos de la cola hasta el None de __atender, pase lo que pase: si dejara de sacarlos,
+        # __atender quedaría esperando lugar en la cola para siempre.
+        conectado = True
+        try:
+            while True:
+                linea = await pendientes.get()
+                if linea is None:
+                    break
+                if not conectado:
+                    continue # El cliente ya no recibe respuestas: descarto lo que quedó encolado.
+                try:
+                    escritor.write(self.__responder_linea(linea))
+                    # Si el cliente no lee sus respuestas, drain espera y dejo de sacar pedidos de la cola.
+                    await escritor.drain()
+                except ConnectionError:
+                    conectado = False
+        finally:
+            escritor.close()
+
+    def __responder_linea(self, linea: bytes) -> bytes:
+        try:
+            if linea is _LINEA_DEMASIADO_LARGA:
+                respuesta = {"id": None, "ok": False, "error": "LineaDemasiadoLarga",
+                             "mensaje": f"¡Error! El pedido pasa de {self.LARGO_MAXIMO_LINEA} bytes; se cierra la conexión."}
+                return json.dumps(respuesta, ensure_ascii=False).encode("utf-8") + b"\n"
+            try:
+                pedido = json.loads(linea)
+            except ValueError:
+                respuesta = {"id": None, "ok": False, "error": "JSONInvalido", "mensaje": "La línea no es JSON válido."}
+            else:
+                respuesta = ejecutar_operacion(self.__clinica, pedido)
+            return json.dumps(respuesta, ensure_ascii=False).encode("utf-8") + b"\n"
+        except Exception as e: # Por ejemplo, un resultado que no se puede pasar a JSON.
+            respuesta = {"id": None, "ok": False, "error": type(e).__name__, "mensaje": f"Error inesperado: {e}"}
+            return json.dumps(respuesta, ensure_ascii=False).encode("utf-8") + b"\n"
+
+
+async def _exportar_metricas(metricas, ruta: str, intervalo: float):
+    # Reescribe el archivo de métricas cada 'intervalo' segundos para que lo lea un recolector.
+    while True:
+        await asyncio.sleep(intervalo)
+        metricas.escribir_archivo(ruta)
+
+
+async def _servir(argumentos):
+    opciones = {"metricas": bool(argumentos.metricas)}
+    clinica = Clinica(AlmacenamientoClinica(argumentos.datos), **opciones) if argumentos.datos else Clinica(**opciones)
+    registrador = None
+    if argumentos.registro:
+        # Los eventos se escriben desde otro hilo: el bucle de asyncio no espera al disco.
+        registrador = RegistradorAsincrono(argumentos.registro)
+        clinica.obtener_eventos().suscribir(registrador)
+    servidor = ServidorClinica(clinica, argumentos.max_pendientes)
+    if argumentos.unix:
+        servicio = await servidor.iniciar_unix(argumentos.unix)
+        print(f"Servidor de la clínica escuchando en {argumentos.unix}")
+    else:
+        servicio = await servidor.iniciar_tcp(argumentos.host, argumentos.puerto)
+        print(f"Servidor de la clínica escuchando en {argumentos.host}:{servidor.obtener_puerto()}")
+    exportador = None
+    if argumentos.metricas:
+        exportador = asyncio.create_task(_exportar_metricas(clinica.obtener_metricas(), argumentos.metricas,
+                                                            argumentos.intervalo_metricas))
+    try:
+        async with servicio:
+            await servicio.serve_forever()
+    finally:
+        if exportador is not None:
+            exportador.cancel()
+            clinica.obtener_metricas().escribir_archivo(argumentos.metricas)
+        clinica.cerrar()
+        if registrador is not None:
+            clinica.obtener_eventos().desuscribir(registrador)
+            registrador.cerrar()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Servidor JSON por líneas para la clínica.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--puerto", type=int, default=8765)
+    parser.add_argument("--unix", help="Ruta de un socket Unix (en lugar de TCP).")
+    parser.add_argument("--datos", default=os.environ.get("CLINICA_DATOS"), help="Carpeta de persistencia (opcional).")
+    parser.add_argument("--registro", help="Archivo donde anotar los eventos de la clínica (opcional).")
+    parser.add_argument("--metricas", help="Archivo donde exportar las métricas de las operaciones (opcional).")
+    parser.add_argument("--intervalo-metricas", type=float, default=10.0, help="Segundos entre exportaciones de métricas.")
+    parser.add_argument("--max-pendientes", type=int, default=64, help="Pedidos encolados por conexión antes de frenar al cliente.")
+    try:
+        asyncio.run(_servir(parser.parse_args()))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
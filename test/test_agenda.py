@@ -0,0 +1,65 @@
+import unittest
+from datetime import datetime, timedelta
+from modelo.agenda import AgendaMedicos
+
+
+class TestAgendaMedicos(unittest.TestCase):
+
+    def setUp(self):
+        self.agenda = AgendaMedicos()
+        self.lunes_10 = datetime(2025, 6, 16, 10, 0)
+        self.lunes_11 = datetime(2025, 6, 16, 11, 0)
+        self.martes_9 = datetime(2025, 6, 17, 9, 0)
+
+    def test_horario_agregado_queda_ocupado_solo_para_ese_medico(self):
+        self.agenda.agregar("MP1", self.lunes_10, "turno a")
+        self.assertTrue(self.agenda.esta_ocupado("MP1", self.lunes_10))
+        self.assertFalse(self.agenda.esta_ocupado("MP1", self.lunes_11))
+        self.assertFalse(self.agenda.esta_ocupado("MP2", self.lunes_10)) # Otro médico no se ve afectado
+
+    def test_rango_devuelve_turnos_ordenados_aunque_se_agreguen_desordenados(self):
+        self.agenda.agregar("MP1", self.martes_9, "turno c")
+        self.agenda.agregar("MP1", self.lunes_11, "turno b")
+        self.agenda.agregar("MP1", self.lunes_10, "turno a")
+
+        self.assertEqual(self.agenda.obtener_turnos_entre("MP1", self.lunes_10, self.martes_9), ["turno a", "turno b"])
+        self.assertEqual(self.agenda.obtener_fechas_entre("MP1", datetime(2025, 6, 17), datetime(2025, 6, 18)), [self.martes_9])
+        self.assertEqual(self.agenda.cantidad_turnos("MP1"), 3)
+
+    def test_medico_sin_turnos(self):
+        self.assertEqual(self.agenda.obtener_turnos_entre("MP9", self.lunes_10, self.martes_9), [])
+        self.assertIsNone(self.agenda.proximo_turno_desde("MP9", self.lunes_10))
+
+    def test_proximo_turno_desde(self):
+        self.agenda.agregar("MP1", self.lunes_11, "turno b")
+        self.assertEqual(self.agenda.proximo_turno_desde("MP1", self.lunes_10), self.lunes_11)
+        self.assertIsNone(self.agenda.proximo_turno_desde("MP1", self.martes_9))
+
+
+    def test_quitar_libera_el_horario(self):
+        self.agenda.agregar("MP1", self.lunes_10, "turno a")
+        self.agenda.agregar("MP1", self.lunes_11, "turno b")
+        self.agenda.quitar("MP1", self.lunes_10)
+        self.assertFalse(self.agenda.esta_ocupado("MP1", self.lunes_10))
+        self.assertEqual(self.agenda.obtener_turnos_entre("MP1", self.lunes_10, self.martes_9), ["turno b"])
+        self.assertEqual(self.agenda.proximo_turno_desde("MP1", self.lunes_10), self.lunes_11)
+
+    def test_turnos_con_duracion_se_pisan_por_intervalo(self):
+        self.agenda.agregar("MP1", self.lunes_10, "turno largo", timedelta(hours=1))
+        self.agenda.agregar("MP1", datetime(2025, 6, 16, 9, 45), "turno corto", timedelta(minutes=15))
+        self.assertTrue(self.agenda.esta_ocupado("MP1", datetime(2025, 6, 16, 10, 30))) # Empezó antes y sigue
+        self.assertFalse(self.agenda.esta_ocupado("MP1", self.lunes_11))                  # Termina justo a las 11
+        self.assertEqual(self.agenda.obtener_superpuestos("MP1", datetime(2025, 6, 16, 9, 50), datetime(2025, 6, 16, 10, 5)),
+                         ["turno corto", "turno largo"])
+        self.assertEqual(self.agenda.obtener_superpuestos("MP1", datetime(2025, 6, 16, 10, 45), datetime(2025, 6, 16, 11, 15)),
+                         ["turno largo"])
+        self.assertTrue(self.agenda.esta_libre("MP1", self.lunes_11, datetime(2025, 6, 16, 11, 30)))
+        self.assertTrue(self.agenda.esta_libre("MP1", datetime(2025, 6, 16, 9, 0), datetime(2025, 6, 16, 9, 45)))
+
+    def test_horarios_libres_saltea_turnos_que_empezaron_antes(self):
+        self.agenda.agregar("MP1", datetime(2025, 6, 16, 9, 30), "turno largo", timedelta(hours=1))
+        libres = list(self.agenda.horarios_libres("MP1", self.lunes_10, datetime(2025, 6, 16, 12, 0), timedelta(minutes=30)))
+        self.assertEqual(libres, [datetime(2025, 6, 16, 10, 30), self.lunes_11, datetime(2025, 6, 16, 11, 30)])
+
+if __name__ == '__main__':
+    unittest.main(argv=[''], exit=False)
@@ -0,0 +1,59 @@
+import unittest
+from modelo.busqueda_pacientes import IndicePacientes, palabras_de_nombre, distancia_edicion
+from modelo.paciente import Paciente
+
+
+class TestBusquedaPacientes(unittest.TestCase):
+
+    def setUp(self):
+        self.indice = IndicePacientes()
+        self.pacientes = [Paciente(nombre, f"{10000000 + numero}", "01/01/1990") for numero, nombre in enumerate(
+            ["Ana García", "Luis González", "María José Núñez-Pérez", "Ana Garcete", "Pedro Gonzalez Ana"])]
+        for paciente in self.pacientes:
+            self.indice.agregar(paciente)
+        self.ana, self.luis, self.maria, self.ana_garcete, self.pedro = self.pacientes
+
+    def test_palabras_normalizadas(self):
+        self.assertEqual(palabras_de_nombre("María José  Núñez-Pérez"), ["maria", "jose", "nunez", "perez"])
+        self.assertEqual(distancia_edicion("gonzales", "gonzalez", 2), 1)
+        self.assertEqual(distancia_edicion("garcia", "lopez", 2), 3) # Se pasa: devuelve maximo + 1.
+
+    def test_por_prefijo(self):
+        # Ordenados por la palabra encontrada: "garcete" antes que "garcia".
+        self.assertEqual(self.indice.buscar_por_prefijo("GARC"), [self.ana_garcete, self.ana])
+        self.assertEqual(self.indice.buscar_por_prefijo("nunez"), [self.maria])
+        self.assertEqual(self.indice.buscar_por_prefijo("garc an"), [self.ana_garcete, self.ana])
+        self.assertEqual(self.indice.buscar_por_prefijo("ana"), [self.ana, self.ana_garcete, self.pedro])
+        self.assertEqual(self.indice.buscar_por_prefijo("ana", limite=2), [self.ana, self.ana_garcete])
+        self.assertEqual(self.indice.buscar_por_prefijo("gonzalez luis"), [self.luis])
+        self.assertEqual(self.indice.buscar_por_prefijo("lopez"), [])
+
+    def test_aproximada(self):
+        # Menos errores primero: "Gonzalez" está a 1, "González" también (las tildes no cuentan).
+        self.assertEqual(self.indice.buscar_aproximado("gonzales"), [self.luis, self.pedro])
+        self.assertEqual(self.indice.buscar_aproximado("garsia ana"), [self.ana])
+        self.assertEqual(self.indice.buscar_aproximado("nunes perz"), [self.maria])
+        self.assertEqual(self.indice.buscar_aproximado("rodriguez"), [])
+
+    def test_agregar_varios(self):
+        # Agregados de una vez (importación) se buscan igual que de a uno, también mezclando las dos formas.
+        indice = IndicePacientes()
+        indice.agregar(self.ana)
+        indice.agregar_varios(self.pacientes[1:4])
+        indice.agregar(self.pedro)
+        self.assertEqual(len(indice), 5)
+        self.assertEqual(indice.buscar_por_prefijo("GARC"), [self.ana_garcete, self.ana])
+        self.assertEqual(indice.buscar_por_prefijo("ana"), [self.ana, self.ana_garcete, self.pedro])
+        self.assertEqual(indice.buscar_aproximado("gonzales"), [self.luis, self.pedro])
+
+    def test_datos_invalidos(self):
+        with self.assertRaises(ValueError):
+            self.indice.buscar_por_prefijo(" - ")
+        with self.assertRaises(ValueError):
+            self.indice.buscar_aproximado("ana", limite=0)
+        with self.assertRaises(TypeError):
+            self.indice.buscar_por_prefijo(None)
+
+
+if __name__ == '__main__':
+    unittest.main()
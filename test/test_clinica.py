@@ -1,5 +1,5 @@
 import unittest
-from datetime import datetime
+from datetime import datetime, timedelta
 from modelo.clinica import Clinica
 from modelo.paciente import Paciente
 from modelo.medico import Medico
@@ -8,8 +8,9 @@ from modelo.exception import (
     PacienteExistenteError, PacienteNoExisteError,
     MedicoExistenteError, MedicoNoExisteError,
     TurnoDuplicadoError, MedicoNoAtiendeEspecialidadError,
-    MedicoNoTrabajaEseDiaError
+    MedicoNoTrabajaEseDiaError, SerieTurnosConflictoError, TurnoNoExisteError
 )
+from modelo.recurrencia import ReglaRecurrencia
 
 class TestClinica(unittest.TestCase):
     def setUp(self):
@@ -75,6 +76,269 @@ class TestClinica(unittest.TestCase):
         with self.assertRaises(MedicoNoTrabajaEseDiaError):
             self.clinica.agendar_turno("12345678", "MP22222", "Cardiología", fecha)
 
+    def test_agendar_turno_segunda_especialidad_del_mismo_dia(self):
+        # Antes solo se miraba la primera especialidad del día y este turno se rechazaba.
+        self.medico.agregar_especialidad(Especialidad("Clínica", ["lunes"]))
+        turno = self.clinica.agendar_turno("12345678", "MP11111", "Clínica", datetime(2025, 6, 16, 11, 0))
+        self.assertEqual(turno.obtener_especialidad(), "Clínica")
+
+    def test_agendar_turno_no_depende_del_locale(self):
+        import locale
+        anterior = locale.setlocale(locale.LC_TIME)
+        try:
+            locale.setlocale(locale.LC_TIME, "C") # strftime("%A") daría "Wednesday"
+            turno = self.clinica.agendar_turno("12345678", "MP11111", "Pediatría", datetime(2025, 6, 18, 9, 0))
+            self.assertEqual(turno.obtener_especialidad(), "Pediatría")
+        finally:
+            locale.setlocale(locale.LC_TIME, anterior)
+
+    def test_obtener_turnos_de_medico_entre_fechas(self):
+        lunes = datetime(2025, 6, 16, 10, 0)
+        miercoles = datetime(2025, 6, 18, 9, 0)
+        lunes_siguiente = datetime(2025, 6, 23, 11, 0)
+        for fecha in (lunes_siguiente, lunes, miercoles):
+            self.clinica.agendar_turno("12345678", "MP11111", "Pediatría", fecha)
+
+        turnos = self.clinica.obtener_turnos_de_medico_entre("MP11111", datetime(2025, 6, 16), datetime(2025, 6, 23))
+        self.assertEqual([t.obtener_fecha_hora() for t in turnos], [lunes, miercoles])
+        self.assertEqual(self.clinica.obtener_turnos_de_medico_entre("MP22222", datetime(2025, 6, 16), datetime(2025, 6, 23)), [])
+        with self.assertRaises(MedicoNoExisteError):
+            self.clinica.obtener_turnos_de_medico_entre("MP99999", datetime(2025, 6, 16), datetime(2025, 6, 23))
+
+    def test_buscar_turnos_libres_saltea_ocupados_y_dias_sin_atencion(self):
+        otro_pediatra = Medico("Dr. José Ruiz", "MP33333", [Especialidad("Pediatría", ["lunes"])])
+        self.clinica.agregar_medico(otro_pediatra)
+        self.clinica.agendar_turno("12345678", "MP11111", "Pediatría", datetime(2025, 6, 16, 8, 0))
+        self.clinica.agendar_turno("12345678", "MP33333", "Pediatría", datetime(2025, 6, 16, 8, 0))
+
+        # Desde el domingo: nadie atiende ese día, y el lunes a las 8 ya están los dos ocupados.
+        libres = self.clinica.buscar_turnos_libres("pediatría", datetime(2025, 6, 15), datetime(2025, 6, 30), cantidad=3)
+        self.assertEqual([(f, m.obtener_matricula()) for f, m in libres], [
+            (datetime(2025, 6, 16, 8, 30), "MP11111"),
+            (datetime(2025, 6, 16, 8, 30), "MP33333"),
+            (datetime(2025, 6, 16, 9, 0), "MP11111"),
+        ])
+
+    def test_buscar_turnos_libres_respeta_jornada_y_rango(self):
+        from datetime import time, timedelta
+        libres = self.clinica.buscar_turnos_libres("Cardiología", datetime(2025, 6, 17, 17, 0), datetime(2025, 6, 20),
+                                                   duracion=timedelta(minutes=45), cantidad=3, hora_fin=time(18, 0))
+        # Martes 17:00 entra; 17:45 ya no (terminaría 18:30). Después sigue el jueves a las 8.
+        self.assertEqual([f for f, _ in libres], [datetime(2025, 6, 17, 17, 0), datetime(2025, 6, 19, 8, 0), datetime(2025, 6, 19, 8, 45)])
+        self.assertEqual(self.clinica.buscar_turnos_libres("Neurología", datetime(2025, 6, 16), datetime(2025, 6, 30)), [])
+        with self.assertRaises(ValueError):
+            self.clinica.buscar_turnos_libres("", datetime(2025, 6, 16), datetime(2025, 6, 30))
+
+    def test_buscar_turnos_libres_incluye_especialidad_agregada_despues(self):
+        self.medico2.agregar_especialidad(Especialidad("Clínica", ["viernes"]))
+        libres = self.clinica.buscar_turnos_libres("Clínica", datetime(2025, 6, 16), datetime(2025, 6, 30), cantidad=1)
+        self.assertEqual(libres, [(datetime(2025, 6, 20, 8, 0), self.medico2)])
+
+    def test_paginas_de_pacientes_y_turnos_en_orden_de_alta(self):
+        for i in range(4):
+            self.clinica.agregar_paciente(Paciente(f"Paciente {i}", f"{20000000 + i}", "01/01/1990"))
+        primera = self.clinica.obtener_pacientes_pagina(0, 3)
+        segunda = self.clinica.obtener_pacientes_pagina(primera.obtener_siguiente_cursor(), 3)
+        self.assertEqual([p.obtener_dni() for p in primera], ["12345678", "20000000", "20000001"])
+        self.assertEqual([p.obtener_dni() for p in segunda], ["20000002", "20000003"])
+        self.assertFalse(segunda.hay_mas())
+        self.assertEqual(list(self.clinica.iterar_medicos()), [self.medico, self.medico2])
+
+        self.clinica.agendar_turno("12345678", "MP11111", "Pediatría", datetime(2025, 6, 16, 10, 0))
+        self.assertEqual(len(self.clinica.obtener_turnos_pagina(0, 10)), 1)
+        self.assertEqual(len(list(self.clinica.iterar_turnos())), self.clinica.cantidad_turnos())
+
+    def test_agendar_serie_semanal(self):
+        turnos = self.clinica.agendar_serie("12345678", "MP11111", "Pediatría", ReglaRecurrencia(datetime(2025, 6, 16, 10, 0), cantidad=8))
+        self.assertEqual(len(turnos), 8)
+        self.assertEqual(turnos[-1].obtener_fecha_hora(), datetime(2025, 8, 4, 10, 0))
+        self.assertEqual(self.clinica.cantidad_turnos(), 8)
+        self.assertEqual(len(self.clinica.obtener_historia_clinica_por_dni("12345678").obtener_turnos()), 8)
+        with self.assertRaises(TurnoDuplicadoError): # La agenda del médico quedó al día
+            self.clinica.agendar_turno("12345678", "MP11111", "Pediatría", datetime(2025, 7, 7, 10, 0))
+
+    def test_agendar_serie_con_conflictos_no_agenda_nada(self):
+        self.clinica.agendar_turno("12345678", "MP11111", "Pediatría", datetime(2025, 6, 30, 10, 0))
+        # Cada 5 días: miércoles 25 (libre), lunes 30 (ocupado), sábado 5 y jueves 10 (no atiende).
+        regla = ReglaRecurrencia(datetime(2025, 6, 25, 10, 0), timedelta(days=5), cantidad=4)
+        with self.assertRaises(SerieTurnosConflictoError) as contexto:
+            self.clinica.agendar_serie("12345678", "MP11111", "Pediatría", regla)
+        conflictos = contexto.exception.obtener_conflictos()
+        self.assertEqual([fecha for fecha, _ in conflictos], [datetime(2025, 6, 30, 10, 0), datetime(2025, 7, 5, 10, 0),
+                                                              datetime(2025, 7, 10, 10, 0)])
+        self.assertIn("ya tiene un turno", conflictos[0][1])
+        self.assertIn("no atiende los días Sábado", conflictos[1][1])
+        self.assertEqual(self.clinica.cantidad_turnos(), 1) # Ni siquiera el primero (miércoles 25, libre)
+
+        self.clinica.agregar_medico(Medico("Dr. Luis Gómez", "MP33333", [self.especialidad_pediatria, self.especialidad_cardiologia]))
+        with self.assertRaises(SerieTurnosConflictoError) as contexto: # Martes: el médico trabaja, pero no Pediatría
+            self.clinica.agendar_serie("12345678", "MP33333", "Pediatría", ReglaRecurrencia(datetime(2025, 6, 17, 10, 0), cantidad=2))
+        self.assertIn("no atiende Pediatría", contexto.exception.obtener_conflictos()[0][1])
+
+    def test_agendar_serie_valida_paciente_y_medico(self):
+        regla = ReglaRecurrencia(datetime(2025, 6, 16, 10, 0), cantidad=2)
+        with self.assertRaises(PacienteNoExisteError):
+            self.clinica.agendar_serie("99999999", "MP11111", "Pediatría", regla)
+        with self.assertRaises(MedicoNoExisteError):
+            self.clinica.agendar_serie("12345678", "MP99999", "Pediatría", regla)
+        with self.assertRaises(TypeError):
+            self.clinica.agendar_serie("12345678", "MP11111", "Pediatría", [datetime(2025, 6, 16, 10, 0)])
+
+    def test_cancelar_turno_libera_el_horario_enseguida(self):
+        lunes = datetime(2025, 6, 16, 10, 0)
+        turno = self.clinica.agendar_turno("12345678", "MP11111", "Pediatría", lunes)
+        otro = self.clinica.agendar_turno("12345678", "MP11111", "Pediatría", datetime(2025, 6, 18, 10, 0))
+        self.assertEqual((turno.obtener_id(), otro.obtener_id()), (0, 1))
+
+        self.assertIs(self.clinica.cancelar_turno(turno.obtener_id()), turno)
+        self.assertTrue(turno.esta_cancelado())
+        self.assertFalse(self.clinica.validar_turno_no_duplicado("MP11111", lunes))
+        self.assertEqual(self.clinica.obtener_turnos(), [otro])
+        self.assertEqual(self.clinica.cantidad_turnos(), 1)
+        self.assertEqual(self.clinica.obtener_historia_clinica_por_dni("12345678").obtener_turnos(), [otro])
+        self.assertEqual(self.clinica.buscar_turnos(dni="12345678"), [otro])
+        self.assertEqual(self.clinica.obtener_turnos_pagina(0, 10).obtener_elementos(), [otro])
+        with self.assertRaises(TurnoNoExisteError):
+            self.clinica.cancelar_turno(turno.obtener_id())
+
+        nuevo = self.clinica.agendar_turno("12345678", "MP11111", "Pediatría", lunes) # El horario se puede volver a tomar
+        self.assertEqual(nuevo.obtener_id(), 2)
+
+    def test_reprogramar_turno_es_atomico(self):
+        lunes = datetime(2025, 6, 16, 10, 0)
+        miercoles = datetime(2025, 6, 18, 10, 0)
+        turno = self.clinica.agendar_turno("12345678", "MP11111", "Pediatría", lunes)
+        self.clinica.agendar_turno("12345678", "MP11111", "Pediatría", miercoles)
+
+        for fecha, error in ((miercoles, TurnoDuplicadoError), (datetime(2025, 6, 17, 10, 0), MedicoNoTrabajaEseDiaError)):
+            with self.assertRaises(error):
+                self.clinica.reprogramar_turno(turno.obtener_id(), fecha)
+            self.assertTrue(self.clinica.validar_turno_no_duplicado("MP11111", lunes)) # El viejo sigue tomado
+            self.assertFalse(turno.esta_cancelado())
+
+        nuevo = self.clinica.reprogramar_turno(turno.obtener_id(), datetime(2025, 6, 23, 10, 0))
+        self.assertTrue(turno.esta_cancelado())
+        self.assertFalse(self.clinica.validar_turno_no_duplicado("MP11111", lunes))
+        self.assertIs(self.clinica.obtener_turno_por_id(nuevo.obtener_id()), nuevo)
+        self.assertEqual(nuevo.obtener_especialidad_solicitada(), "Pediatría")
+        self.assertEqual(self.clinica.cantidad_turnos(), 2)
+
+    def test_turnos_con_duracion_no_se_pisan(self):
+        self.clinica.agendar_turno("12345678", "MP11111", "Pediatría", datetime(2025, 6, 16, 10, 0)) # 30 minutos
+        with self.assertRaises(TurnoDuplicadoError) as contexto:
+            self.clinica.agendar_turno("12345678", "MP11111", "Pediatría", datetime(2025, 6, 16, 10, 5))
+        self.assertIn("10:00", str(contexto.exception))
+        self.clinica.agendar_turno("12345678", "MP11111", "Pediatría", datetime(2025, 6, 16, 10, 30)) # Empieza cuando termina el otro
+        self.clinica.agendar_turno("12345678", "MP11111", "Pediatría", datetime(2025, 6, 16, 9, 30))
+        with self.assertRaises(TurnoDuplicadoError): # Una hora desde las 8:45 pisa al de las 9:30
+            self.clinica.agendar_turno("12345678", "MP11111", "Pediatría", datetime(2025, 6, 16, 8, 45), timedelta(hours=1))
+        self.assertFalse(self.clinica.validar_turno_no_duplicado("MP11111", datetime(2025, 6, 16, 8, 30), timedelta(hours=1)))
+        self.assertTrue(self.clinica.validar_turno_no_duplicado("MP11111", datetime(2025, 6, 16, 10, 55)))
+        with self.assertRaises(ValueError):
+            self.clinica.agendar_turno("12345678", "MP11111", "Pediatría", datetime(2025, 6, 18, 10, 0), timedelta(seconds=90))
+        self.assertEqual(self.clinica.cantidad_turnos(), 3)
+
+    def test_duracion_por_especialidad(self):
+        self.medico2.agregar_especialidad(Especialidad("Kinesiología", ["viernes"], timedelta(minutes=45)))
+        viernes = datetime(2025, 6, 20, 10, 0)
+        turno = self.clinica.agendar_turno("12345678", "MP22222", "Kinesiología", viernes)
+        self.assertEqual(turno.obtener_duracion(), timedelta(minutes=45))
+        with self.assertRaises(TurnoDuplicadoError):
+            self.clinica.agendar_turno("12345678", "MP22222", "Kinesiología", datetime(2025, 6, 20, 10, 40))
+        # Bloques de 45 minutos desde las 9: el de 9:45 y el de 10:30 se pisan con el turno de las 10.
+        libres = self.clinica.buscar_turnos_libres("Kinesiología", datetime(2025, 6, 20, 9, 0), datetime(2025, 6, 20, 12, 0))
+        self.assertEqual([fecha for fecha, _ in libres], [datetime(2025, 6, 20, 9, 0), datetime(2025, 6, 20, 11, 15)])
+
+    def test_reprogramar_turno_largo_puede_pisar_su_propio_horario(self):
+        turno = self.clinica.agendar_turno("12345678", "MP11111", "Pediatría", datetime(2025, 6, 16, 10, 0), timedelta(hours=1))
+        self.clinica.agendar_turno("12345678", "MP11111", "Pediatría", datetime(2025, 6, 16, 11, 30))
+        nuevo = self.clinica.reprogramar_turno(turno.obtener_id(), datetime(2025, 6, 16, 10, 15)) # Se pisa solo con el viejo
+        self.assertEqual(nuevo.obtener_duracion(), timedelta(hours=1))
+        with self.assertRaises(TurnoDuplicadoError): # Hasta las 11:45 pisaría al de las 11:30
+            self.clinica.reprogramar_turno(nuevo.obtener_id(), datetime(2025, 6, 16, 10, 45))
+        self.assertFalse(self.clinica.validar_turno_no_duplicado("MP11111", datetime(2025, 6, 16, 10, 0))) # A las 10 no atiende a nadie
+        self.assertTrue(self.clinica.validar_turno_no_duplicado("MP11111", datetime(2025, 6, 16, 10, 0), timedelta(minutes=30)))
+
+    def test_agendar_serie_con_duracion(self):
+        regla = ReglaRecurrencia(datetime(2025, 6, 16, 10, 0), cantidad=3)
+        turnos = self.clinica.agendar_serie("12345678", "MP11111", "Pediatría", regla, timedelta(hours=1))
+        self.assertEqual({t.obtener_duracion() for t in turnos}, {timedelta(hours=1)})
+        with self.assertRaises(TurnoDuplicadoError):
+            self.clinica.agendar_turno("12345678", "MP11111", "Pediatría", datetime(2025, 6, 23, 10, 30))
+        with self.assertRaises(SerieTurnosConflictoError) as contexto: # 9:30 + 1 hora pisa a los de las 10:00
+            self.clinica.agendar_serie("12345678", "MP11111", "Pediatría", ReglaRecurrencia(datetime(2025, 6, 16, 9, 30), cantidad=2),
+                                       timedelta(hours=1))
+        self.assertIn("se superpone", contexto.exception.obtener_conflictos()[0][1])
+
+    def test_agendar_serie_que_se_pisa_a_si_misma(self):
+        # Cada 10 minutos, con turnos de 30: cada uno pisa al anterior de la serie.
+        regla = ReglaRecurrencia(datetime(2025, 6, 16, 10, 0), timedelta(minutes=10), cantidad=3)
+        with self.assertRaises(SerieTurnosConflictoError) as contexto:
+            self.clinica.agendar_serie("12345678", "MP11111", "Pediatría", regla)
+        self.assertEqual([fecha for fecha, _ in contexto.exception.obtener_conflictos()],
+                         [datetime(2025, 6, 16, 10, 10), datetime(2025, 6, 16, 10, 20)])
+        self.assertEqual(self.clinica.obtener_turnos(), [])
+        # Con turnos de 10 minutos la misma serie entra: uno termina justo cuando empieza el otro.
+        self.assertEqual(len(self.clinica.agendar_serie("12345678", "MP11111", "Pediatría", regla, timedelta(minutes=10))), 3)
+
+    def test_turno_que_termina_despues_del_anio_9999(self):
+        # El 31/12/9999 es viernes: un turno de 30 minutos a las 23:50 no tiene fin representable.
+        self.clinica.agregar_medico(Medico("Dr. Viernes", "MP99999", [Especialidad("Clínica", ["viernes"])]))
+        with self.assertRaises(ValueError):
+            self.clinica.agendar_turno("12345678", "MP99999", "Clínica", datetime(9999, 12, 31, 23, 50))
+        with self.assertRaises(ValueError):
+            self.clinica.agendar_serie("12345678", "MP99999", "Clínica",
+                                       ReglaRecurrencia(datetime(9999, 12, 24, 23, 50), timedelta(weeks=1), cantidad=2))
+        turno = self.clinica.agendar_turno("12345678", "MP99999", "Clínica", datetime(9999, 12, 31, 23, 0))
+        with self.assertRaises(ValueError):
+            self.clinica.reprogramar_turno(turno.obtener_id(), datetime(9999, 12, 31, 23, 45))
+        resultado = self.clinica.importar_lote("turnos", [{"dni": "12345678", "matricula": "MP99999", "especialidad": "Clínica",
+                                                           "fecha_hora": "9999-12-31T23:40"}])
+        self.assertEqual((resultado.obtener_importados(), len(resultado.obtener_errores())), (0, 1))
+        self.assertEqual(self.clinica.obtener_turnos(), [turno])
+
+    def test_buscar_turnos_libres_hasta_el_anio_9999(self):
+        # La búsqueda termina en el último día sin pasar al siguiente, que no existe.
+        self.clinica.agregar_medico(Medico("Dr. Viernes", "MP99999", [Especialidad("Clínica", ["viernes"])]))
+        libres = self.clinica.buscar_turnos_libres("Clínica", datetime(9999, 12, 31), datetime(9999, 12, 31, 23, 0), cantidad=1)
+        self.assertEqual([(f, m.obtener_matricula()) for f, m in libres], [(datetime(9999, 12, 31, 8, 0), "MP99999")])
+        libres = self.clinica.buscar_turnos_libres("Clínica", datetime(9999, 12, 31), datetime(9999, 12, 31, 23, 0), cantidad=50)
+        self.assertEqual(len(libres), 20)
+
+    def test_compactacion_y_paginas_por_id(self):
+        self.clinica.MINIMO_BAJAS_PARA_COMPACTAR = 3
+        turnos = self.clinica.agendar_serie("12345678", "MP11111", "Pediatría", ReglaRecurrencia(datetime(2025, 6, 16, 10, 0), cantidad=8))
+        primera = self.clinica.obtener_turnos_pagina(0, 4)
+        self.assertEqual(primera.obtener_siguiente_cursor(), 4)
+        for turno in turnos[:2] + turnos[4:5]: # La tercera baja compacta las listas
+            self.clinica.cancelar_turno(turno.obtener_id())
+
+        segunda = self.clinica.obtener_turnos_pagina(primera.obtener_siguiente_cursor(), 4)
+        self.assertEqual([t.obtener_id() for t in segunda], [5, 6, 7])
+        self.assertEqual([t.obtener_id() for t in self.clinica.iterar_turnos()], [2, 3, 5, 6, 7])
+        self.assertEqual(len(self.clinica.obtener_historia_clinica_por_dni("12345678").obtener_turnos()), 5)
+
+    def test_buscar_turnos_por_indices_combinados(self):
+        otro = Paciente("Luis Díaz", "55555555", "03/03/1985")
+        self.clinica.agregar_paciente(otro)
+        self.clinica.agendar_turno("12345678", "MP22222", "Cardiología", datetime(2025, 6, 17, 9, 0))
+        self.clinica.agendar_turno("55555555", "MP11111", "Pediatría", datetime(2025, 6, 18, 10, 0))
+        self.clinica.agendar_turno("12345678", "MP11111", "Pediatría", datetime(2025, 6, 16, 10, 0))
+
+        fechas = lambda turnos: [t.obtener_fecha_hora() for t in turnos]
+        self.assertEqual(fechas(self.clinica.buscar_turnos(matricula="MP11111")),
+                         [datetime(2025, 6, 16, 10, 0), datetime(2025, 6, 18, 10, 0)])
+        self.assertEqual(fechas(self.clinica.buscar_turnos(dni="12345678")),
+                         [datetime(2025, 6, 16, 10, 0), datetime(2025, 6, 17, 9, 0)])
+        self.assertEqual(fechas(self.clinica.buscar_turnos(especialidad="pediatría", desde=datetime(2025, 6, 17))),
+                         [datetime(2025, 6, 18, 10, 0)])
+        self.assertEqual(fechas(self.clinica.buscar_turnos(dni="12345678", matricula="MP22222")), [datetime(2025, 6, 17, 9, 0)])
+        self.assertEqual(len(self.clinica.buscar_turnos(desde=datetime(2025, 6, 16), hasta=datetime(2025, 6, 17))), 1)
+        self.assertEqual(len(self.clinica.buscar_turnos()), 3)
+        self.assertEqual(self.clinica.buscar_turnos(especialidad="Dermatología"), [])
+        with self.assertRaises(TypeError):
+            self.clinica.buscar_turnos(desde="2025-06-16")
+
     def test_emitir_receta_exitoso(self):
         receta = self.clinica.emitir_receta("12345678", "MP11111", ["Ibuprofeno"])
         self.assertIn("Ibuprofeno", receta.obtener_medicamentos())
@@ -95,5 +359,23 @@ class TestClinica(unittest.TestCase):
         with self.assertRaises(PacienteNoExisteError):
             self.clinica.obtener_historia_clinica_por_dni("99999999")
 
+    def test_consultas_por_medicamento(self):
+        otro = Paciente("Carlos Pérez", "87654321", "02/02/1980")
+        self.clinica.agregar_paciente(otro)
+        primera = self.clinica.emitir_receta("12345678", "MP11111", ["Ibuprofeno", "Omeprazol"])
+        segunda = self.clinica.emitir_receta("87654321", "MP22222", [" ibuprofeno "])
+        # El nombre se guarda como está en el catálogo.
+        self.assertEqual(segunda.obtener_medicamentos(), ["Ibuprofeno"])
+        self.assertEqual(self.clinica.buscar_recetas_por_medicamento("IBUPROFENO"), [primera, segunda])
+        self.assertEqual(self.clinica.obtener_pacientes_con_medicamento("Omeprazol"), [self.paciente])
+        self.assertEqual(self.clinica.obtener_medicamentos_mas_recetados(1), [("Ibuprofeno", 2)])
+        self.assertEqual(len(self.clinica.obtener_catalogo_medicamentos()), 2)
+
+    def test_buscar_pacientes_por_nombre(self):
+        self.clinica.importar_lote("pacientes", [{"nombre": "Carlos Pérez", "dni": "87654321", "fecha_nacimiento": "02/02/1980"}])
+        self.assertEqual(self.clinica.buscar_pacientes_por_nombre("garcía"), [self.paciente])
+        self.assertEqual([p.obtener_dni() for p in self.clinica.buscar_pacientes_por_nombre("per")], ["87654321"])
+        self.assertEqual(self.clinica.buscar_pacientes_por_nombre("gracia", aproximada=True), [self.paciente])
+
 if __name__ == '__main__':
     unittest.main(argv=['first-arg-is-ignored'], exit=False)
@@ -0,0 +1,134 @@
+import shutil
+import tempfile
+import unittest
+from datetime import date, datetime, timedelta
+from modelo.clinica import Clinica
+from modelo.paciente import Paciente
+from modelo.medico import Medico
+from modelo.especialidad import Especialidad
+from modelo.turno import Turno
+from modelo.persistencia import AlmacenamientoClinica
+from modelo.columnar import TurnosColumnares, a_segundos, desde_segundos
+
+
+class TestTurnosColumnares(unittest.TestCase):
+
+    def setUp(self):
+        self.ana = Paciente("Ana García", "12345678", "01/01/1990")
+        self.luis = Paciente("Luis Díaz", "55555555", "03/03/1985")
+        self.perez = Medico("Dr. Juan Pérez", "MP11111", [Especialidad("Pediatría", ["lunes", "miércoles"])])
+        self.lopez = Medico("Dra. María López", "MP22222", [Especialidad("Cardiología", ["martes", "jueves"])])
+        self.columnas = TurnosColumnares()
+        self.columnas.agregar(Turno(self.ana, self.perez, datetime(2025, 6, 16, 10, 0), "Pediatría"))  # lunes
+        self.columnas.agregar(Turno(self.luis, self.perez, datetime(2025, 6, 18, 10, 0), "Pediatría")) # miércoles
+        self.columnas.agregar(Turno(self.ana, self.lopez, datetime(2025, 6, 24, 9, 0), "Cardiología")) # martes siguiente
+        self.columnas.agregar(Turno(self.luis, self.lopez, datetime(2025, 7, 1, 9, 0), "Cardiología"))
+
+    def test_segundos_ida_y_vuelta(self):
+        fecha = datetime(1965, 3, 2, 7, 45, 30)
+        self.assertEqual(desde_segundos(a_segundos(fecha)), fecha)
+
+    def test_turnos_se_arman_al_pedirlos(self):
+        self.assertEqual(len(self.columnas), 4)
+        turno = self.columnas[1]
+        self.assertIs(turno.obtener_paciente(), self.luis)
+        self.assertIs(turno.obtener_medico(), self.perez)
+        self.assertEqual(turno.obtener_fecha_hora(), datetime(2025, 6, 18, 10, 0))
+        self.assertEqual([t.obtener_especialidad_solicitada() for t in self.columnas[-2:]], ["Cardiología", "Cardiología"])
+        self.assertEqual(self.columnas.obtener_fila(0), ("12345678", "MP11111", "Pediatría", datetime(2025, 6, 16, 10, 0)))
+        with self.assertRaises(IndexError):
+            self.columnas[4]
+
+    def test_filtrar_y_contar(self):
+        self.assertEqual(self.columnas.filtrar(dni="12345678"), [0, 2])
+        self.assertEqual(self.columnas.contar(matricula="MP22222", desde=datetime(2025, 6, 25)), 1)
+        self.assertEqual(self.columnas.contar(especialidad="Pediatría", dni="55555555"), 1)
+        self.assertEqual(self.columnas.contar(matricula="MP99999"), 0)
+        self.assertEqual(self.columnas.contar(), 4)
+        self.assertEqual(self.columnas.filtrar(desde=datetime(2025, 6, 18, 10, 0), hasta=datetime(2025, 7, 1, 9, 0)), [1, 2])
+        self.assertEqual(self.columnas.filtrar(hasta=datetime(2025, 6, 18)), [0])
+        self.assertEqual(self.columnas.contar(dni="55555555", especialidad="Cardiología", desde=datetime(2025, 7, 1)), 1)
+
+    def test_conteos_por_semana_y_por_mes(self):
+        self.assertEqual(self.columnas.contar_por_medico_y_semana(),
+                         {("MP11111", date(2025, 6, 16)): 2, ("MP22222", date(2025, 6, 23)): 1,
+                          ("MP22222", date(2025, 6, 30)): 1})
+        self.assertEqual(self.columnas.contar_por_especialidad_y_mes(),
+                         {("Pediatría", (2025, 6)): 2, ("Cardiología", (2025, 6)): 1, ("Cardiología", (2025, 7)): 1})
+
+
+    def test_bajas_y_compactacion(self):
+        columnas = TurnosColumnares()
+        for identificador, fecha in enumerate([datetime(2025, 6, 16, 10, 0), datetime(2025, 6, 18, 10, 0), datetime(2025, 6, 23, 10, 0)]):
+            turno = Turno(self.ana, self.perez, fecha, "Pediatría", timedelta(minutes=20 * (identificador + 1)))
+            turno.asignar_id(identificador)
+            columnas.agregar(turno)
+        columnas.quitar(1)
+
+        self.assertEqual(len(columnas), 3) # La fila sigue, marcada
+        self.assertTrue(columnas[1].esta_cancelado())
+        self.assertEqual(columnas.contar(), 2)
+        self.assertEqual(columnas.filtrar(matricula="MP11111"), [0, 2])
+        self.assertEqual(columnas.filtrar(desde=datetime(2025, 6, 17)), [2])
+        self.assertEqual(columnas.contar(dni="12345678", hasta=datetime(2025, 6, 20)), 1)
+        self.assertEqual(columnas.contar_por_medico_y_semana(), {("MP11111", date(2025, 6, 16)): 1, ("MP11111", date(2025, 6, 23)): 1})
+        self.assertEqual([fila[4:] for fila in columnas.iterar_filas()], [(0, timedelta(minutes=20)), (2, timedelta(hours=1))])
+
+        compactada = columnas.compactada()
+        self.assertEqual(len(compactada), 2)
+        self.assertEqual([t.obtener_id() for t in compactada], [0, 2])
+        self.assertEqual([t.obtener_duracion() for t in compactada], [timedelta(minutes=20), timedelta(hours=1)])
+        self.assertFalse(any(t.esta_cancelado() for t in compactada))
+        self.assertEqual(len(columnas), 3) # La original no cambia
+
+class TestClinicaColumnar(unittest.TestCase):
+
+    def setUp(self):
+        self.directorio = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.directorio, ignore_errors=True)
+
+    def _abrir(self):
+        return Clinica(AlmacenamientoClinica(self.directorio), columnar=True)
+
+    def test_misma_api_de_turnos_y_estadisticas(self):
+        clinica = self._abrir()
+        clinica.agregar_paciente(Paciente("Ana García", "12345678", "01/01/1990"))
+        clinica.agregar_medico(Medico("Dr. Juan Pérez", "MP11111", [Especialidad("Pediatría", ["lunes"])]))
+        clinica.agendar_turno("12345678", "MP11111", "Pediatría", datetime(2025, 6, 16, 10, 0))
+        clinica.agendar_turno("12345678", "MP11111", "Pediatría", datetime(2025, 6, 23, 10, 0))
+
+        self.assertEqual(clinica.cantidad_turnos(), 2)
+        self.assertEqual([t.obtener_fecha_hora() for t in clinica.obtener_turnos()],
+                         [datetime(2025, 6, 16, 10, 0), datetime(2025, 6, 23, 10, 0)])
+        self.assertEqual(len(clinica.obtener_turnos_pagina(1, 10)), 1)
+        self.assertEqual(clinica.contar_turnos(matricula="MP11111"), 2)
+        self.assertEqual(clinica.contar_turnos_por_especialidad_y_mes(), {("Pediatría", (2025, 6)): 2})
+
+        clinica.guardar_instantanea()
+        clinica.cerrar()
+        self.assertEqual(self._abrir().contar_turnos(dni="12345678"), 2)
+
+    def test_estadisticas_sin_columnar_fallan(self):
+        with self.assertRaises(ValueError):
+            Clinica().contar_turnos_por_medico_y_semana()
+
+
+    def test_cancelar_y_reprogramar_en_modo_columnar(self):
+        clinica = Clinica(columnar=True)
+        clinica.agregar_paciente(Paciente("Ana García", "12345678", "01/01/1990"))
+        clinica.agregar_medico(Medico("Dr. Juan Pérez", "MP11111", [Especialidad("Pediatría", ["lunes"])]))
+        primero = clinica.agendar_turno("12345678", "MP11111", "Pediatría", datetime(2025, 6, 16, 10, 0))
+        segundo = clinica.agendar_turno("12345678", "MP11111", "Pediatría", datetime(2025, 6, 23, 10, 0))
+
+        clinica.cancelar_turno(primero.obtener_id())
+        nuevo = clinica.reprogramar_turno(segundo.obtener_id(), datetime(2025, 7, 7, 10, 0))
+        self.assertEqual(clinica.contar_turnos(), 1)
+        self.assertEqual(clinica.contar_turnos_por_especialidad_y_mes(), {("Pediatría", (2025, 7)): 1})
+        self.assertEqual([t.obtener_id() for t in clinica.obtener_turnos()], [nuevo.obtener_id()])
+        clinica.compactar_turnos()
+        self.assertEqual([t.obtener_id() for t in clinica.obtener_turnos_pagina(0, 10)], [nuevo.obtener_id()])
+
+if __name__ == '__main__':
+    unittest.main(argv=[''], exit=False)
@@ -0,0 +1,131 @@
+import sys
+import threading
+import unittest
+from datetime import datetime, timedelta
+from modelo.clinica import Clinica
+from modelo.paciente import Paciente
+from modelo.medico import Medico
+from modelo.especialidad import Especialidad
+from modelo.exception import TurnoDuplicadoError
+
+
+class TestAgendaConcurrente(unittest.TestCase):
+    # Muchos hilos intentando agendar los mismos horarios: tiene que entrar exactamente uno por horario.
+
+    HILOS = 8
+    MEDICOS = 4
+    HORARIOS = 25
+
+    def _estresar(self, modo):
+        clinica = Clinica(modo_concurrencia=modo)
+        for i in range(self.HILOS):
+            clinica.agregar_paciente(Paciente(f"Paciente {i}", f"{10000000 + i}", "01/01/1990"))
+        for m in range(self.MEDICOS):
+            clinica.agregar_medico(Medico(f"Médico {m}", f"MP{m}", [Especialidad("Clínica", ["lunes"], timedelta(minutes=15))]))
+
+        horarios = [datetime(2025, 6, 16, 8, 0) + timedelta(minutes=15 * h) for h in range(self.HORARIOS)]
+        exitos = []
+        rechazos = []
+        inicio = threading.Barrier(self.HILOS)
+
+        def trabajar(numero_hilo):
+            inicio.wait() # Todos arrancan juntos para forzar choques.
+            for fecha in horarios:
+                for m in range(self.MEDICOS):
+                    try:
+                        clinica.agendar_turno(f"{10000000 + numero_hilo}", f"MP{m}", "Clínica", fecha)
+                        exitos.append((m, fecha))
+                    except TurnoDuplicadoError:
+                        rechazos.append((m, fecha))
+
+        hilos = [threading.Thread(target=trabajar, args=(i,)) for i in range(self.HILOS)]
+        for hilo in hilos:
+            hilo.start()
+        for hilo in hilos:
+            hilo.join()
+
+        total = self.MEDICOS * self.HORARIOS
+        ocupados = {(t.obtener_medico().obtener_matricula(), t.obtener_fecha_hora()) for t in clinica.obtener_turnos()}
+        self.assertEqual(len(exitos), total)
+        self.assertEqual(len(rechazos), total * (self.HILOS - 1))
+        self.assertEqual(len(clinica.obtener_turnos()), total)
+        self.assertEqual(len(ocupados), total) # Ningún horario quedó con dos turnos
+        self.assertEqual(sum(len(clinica.obtener_historia_clinica_por_dni(f"{10000000 + i}").obtener_turnos())
+                             for i in range(self.HILOS)), total)
+
+    def test_cerrojo_por_medico_no_permite_turnos_dobles(self):
+        self._estresar("medico")
+
+    def test_cerrojo_global_no_permite_turnos_dobles(self):
+        self._estresar("global")
+
+    def _importar_y_agendar(self, modo):
+        # Una importación de turnos mientras otros hilos agendan. La importación trae la primera mitad de
+        # los horarios de atrás para adelante (cada uno se inserta al principio de la agenda del médico)
+        # y los demás hilos agendan todos los horarios, también los del final de la agenda.
+        clinica = Clinica(modo_concurrencia=modo)
+        for i in range(self.HILOS):
+            clinica.agregar_paciente(Paciente(f"Paciente {i}", f"{10000000 + i}", "01/01/1990"))
+        for m in range(self.MEDICOS):
+            clinica.agregar_medico(Medico(f"Médico {m}", f"MP{m}", [Especialidad("Clínica", ["lunes"], timedelta(minutes=15))]))
+
+        horarios = [datetime(2025, 6, 16, 8, 0) + timedelta(minutes=15 * h) for h in range(self.HORARIOS * 2)]
+        filas = [{"dni": "10000000", "matricula": f"MP{m}", "especialidad": "Clínica", "fecha_hora": fecha.isoformat()}
+                 for fecha in reversed(horarios[:self.HORARIOS]) for m in range(self.MEDICOS)]
+        exitos = []
+        inesperados = [] # Cualquier error que no sea un rechazo por horario ocupado.
+        resultados = []
+        inicio = threading.Barrier(self.HILOS)
+
+        def importar():
+            inicio.wait()
+            try:
+                resultados.append(clinica.importar_lote("turnos", filas, tamanio_lote=7))
+            except Exception as e:
+                inesperados.append(e)
+
+        def agendar(numero_hilo):
+            inicio.wait()
+            for fecha in horarios:
+                for m in range(self.MEDICOS):
+                    try:
+                        clinica.agendar_turno(f"{10000000 + numero_hilo}", f"MP{m}", "Clínica", fecha)
+                        exitos.append((m, fecha))
+                    except TurnoDuplicadoError:
+                        pass
+                    except Exception as e:
+                        inesperados.append(e)
+
+        hilos = [threading.Thread(target=importar)] + [threading.Thread(target=agendar, args=(i,)) for i in range(1, self.HILOS)]
+        intervalo = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6) # Cambiar de hilo lo más seguido posible, para forzar choques.
+        try:
+            for hilo in hilos:
+                hilo.start()
+            for hilo in hilos:
+                hilo.join()
+        finally:
+            sys.setswitchinterval(intervalo)
+
+        total = self.MEDICOS * len(horarios)
+        importados = resultados[0].obtener_importados()
+        ocupados = {(t.obtener_medico().obtener_matricula(), t.obtener_fecha_hora()) for t in clinica.obtener_turnos()}
+        self.assertEqual(inesperados, [])
+        self.assertEqual(len(exitos) + importados, total)
+        self.assertEqual(len(resultados[0].obtener_errores()), len(filas) - importados) # Solo los horarios ya tomados.
+        self.assertEqual(len(clinica.obtener_turnos()), total)
+        self.assertEqual(len(ocupados), total) # Ningún horario quedó con dos turnos
+
+    def test_importacion_y_altas_por_medico(self):
+        self._importar_y_agendar("medico")
+
+    def test_importacion_y_altas_global(self):
+        self._importar_y_agendar("global")
+
+    def test_modo_desconocido(self):
+        with self.assertRaises(ValueError):
+            Clinica(modo_concurrencia="ninguno")
+
+
+if __name__ == '__main__':
+    unittest.main(argv=[''], exit=False)
@@ -0,0 +1,45 @@
+import locale
+import unittest
+from datetime import datetime
+from modelo.dias import DIAS_SEMANA, dia_de_fecha, indice_dia, normalizar_dia
+
+
+class TestDias(unittest.TestCase):
+
+    def test_dia_de_fecha_en_espanol(self):
+        self.assertEqual(dia_de_fecha(datetime(2025, 6, 16)), "lunes")
+        self.assertEqual(dia_de_fecha(datetime(2025, 6, 18)), "miércoles")
+        self.assertEqual(dia_de_fecha(datetime(2025, 6, 21)), "sábado")
+        self.assertEqual(dia_de_fecha(datetime(2025, 6, 22)), "domingo")
+
+    def test_dia_de_fecha_no_depende_del_locale(self):
+        anterior = locale.setlocale(locale.LC_TIME)
+        try:
+            locale.setlocale(locale.LC_TIME, "C")
+            self.assertEqual(dia_de_fecha(datetime(2025, 6, 16)), "lunes")
+        finally:
+            locale.setlocale(locale.LC_TIME, anterior)
+
+    def test_normalizar_dia_ignora_mayusculas_espacios_y_tildes(self):
+        self.assertEqual(normalizar_dia("  Miércoles "), "miercoles")
+        self.assertEqual(normalizar_dia("MIERCOLES"), "miercoles")
+        self.assertEqual(normalizar_dia("Sábado"), "sabado")
+        self.assertEqual(normalizar_dia("lunes"), "lunes")
+
+    def test_normalizar_dia_acepta_nombres_de_strftime_en_ingles(self):
+        self.assertEqual(normalizar_dia("Monday"), "lunes")
+        self.assertEqual(normalizar_dia("sunday"), "domingo")
+
+    def test_valores_que_no_son_dias(self):
+        self.assertIsNone(normalizar_dia(""))
+        self.assertIsNone(normalizar_dia("otro día"))
+        self.assertIsNone(normalizar_dia(None))
+        self.assertIsNone(indice_dia("23/12/2024"))
+
+    def test_indice_coincide_con_weekday(self):
+        for numero, nombre in enumerate(DIAS_SEMANA):
+            self.assertEqual(indice_dia(nombre), numero)
+
+
+if __name__ == '__main__':
+    unittest.main(argv=[''], exit=False)
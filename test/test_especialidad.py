@@ -1,4 +1,5 @@
 
+from datetime import timedelta
 import unittest
 from modelo.especialidad import Especialidad
 from modelo.exception import ( TipoEspecialidadInvalidoError,DiasAtencionInvalidosError)
@@ -90,6 +91,12 @@ class TestEspecialidad(unittest.TestCase):
         self.assertFalse(esp.verificar_dia("   ")) # Un día vacío tampoco
         self.assertFalse(esp.verificar_dia("otro día"))
 
+    def test_mascara_de_dias(self):
+        # Un bit por día: lunes es el bit 0 y domingo el bit 6. "miercoles" sin tilde es el mismo día.
+        esp = Especialidad("Pediatría", ["lunes", "miércoles", "miercoles", "domingo"])
+        self.assertEqual(esp.obtener_mascara_dias(), 0b1000101)
+        self.assertEqual(len(esp.obtener_dias_atencion()), 3)
+
     # --- Test para el método '__str__()' (cómo se ve la especialidad) ---
 
     def test_str_especialidad_devuelve_formato_correcto(self):
@@ -114,6 +121,15 @@ class TestEspecialidad(unittest.TestCase):
         self.assertEqual(esp1, esp3)
         self.assertNotEqual(esp1, esp_diferente)
 
+    def test_duracion_de_los_turnos(self):
+        self.assertEqual(Especialidad("Clínica", ["lunes"]).obtener_duracion_turno(), timedelta(minutes=30))
+        self.assertEqual(Especialidad("Kinesiología", ["lunes"], timedelta(minutes=45)).obtener_duracion_turno(), timedelta(minutes=45))
+        for duracion in (timedelta(0), timedelta(seconds=90), timedelta(days=2)): # Cero, minutos no enteros, más de un día
+            with self.assertRaises(ValueError):
+                Especialidad("Kinesiología", ["lunes"], duracion)
+        with self.assertRaises(TypeError):
+            Especialidad("Kinesiología", ["lunes"], 45)
+
     def test_especialidades_con_mismo_tipo_tienen_mismo_hash(self):
         # Para que funcionen bien en sets o diccionarios.
         esp1 = Especialidad("Radiología", ["lunes"])
@@ -0,0 +1,74 @@
+import io
+import unittest
+from datetime import datetime
+from modelo.clinica import Clinica
+from modelo.paciente import Paciente
+from modelo.medico import Medico
+from modelo.especialidad import Especialidad
+from modelo.eventos import (BusEventos, ImpresoraConsola, RegistradorAsincrono, PacienteRegistrado,
+                            MedicoRegistrado, EspecialidadAgregada, TurnoAgendado, RecetaEmitida, LoteImportado)
+
+
+class TestEventos(unittest.TestCase):
+
+    def setUp(self):
+        self.clinica = Clinica()
+        self.eventos = []
+        self.clinica.obtener_eventos().suscribir(self.eventos.append)
+
+    def _cargar(self):
+        self.clinica.agregar_paciente(Paciente("Ana García", "12345678", "01/01/1990"))
+        medico = Medico("Dr. Juan Pérez", "MP11111", [Especialidad("Pediatría", ["lunes"])])
+        self.clinica.agregar_medico(medico)
+        medico.agregar_especialidad(Especialidad("Clínica", ["viernes"]))
+        self.clinica.agendar_turno("12345678", "MP11111", "Pediatría", datetime(2025, 6, 16, 10, 0))
+        self.clinica.emitir_receta("12345678", "MP11111", ["Ibuprofeno"])
+
+    def test_clinica_publica_un_evento_por_operacion(self):
+        self._cargar()
+        self.assertEqual([type(e) for e in self.eventos],
+                         [PacienteRegistrado, MedicoRegistrado, EspecialidadAgregada, TurnoAgendado, RecetaEmitida])
+        self.assertEqual(self.eventos[3].obtener_turno().obtener_fecha_hora(), datetime(2025, 6, 16, 10, 0))
+
+    def test_importacion_publica_un_evento_por_lote(self):
+        filas = [{"nombre": f"Paciente {i}", "dni": f"{20000000 + i}", "fecha_nacimiento": "01/01/1990"} for i in range(5)]
+        self.clinica.importar_lote("pacientes", filas, tamanio_lote=3)
+        self.assertEqual([(e.obtener_tipo(), e.obtener_cantidad()) for e in self.eventos], [("pacientes", 3), ("pacientes", 2)])
+        self.assertIsInstance(self.eventos[0], LoteImportado)
+
+    def test_impresora_consola_muestra_los_mensajes_de_siempre(self):
+        salida = io.StringIO()
+        self.clinica.obtener_eventos().suscribir(ImpresoraConsola(salida))
+        self._cargar()
+        lineas = salida.getvalue().splitlines()
+        self.assertEqual(lineas[0], "Paciente Ana García (DNI: 12345678) registrado y su historia clínica creada.")
+        self.assertEqual(lineas[3], "Turno agendado con éxito: Paciente Ana García con Dr./Dra. Dr. Juan Pérez (Pediatría) el 2025-06-16 10:00.")
+        self.assertEqual(lineas[4], "Receta emitida para Paciente: Ana García por Dr./Dra. Dr. Juan Pérez.")
+
+    def test_desuscribir_y_bus_sin_suscriptores(self):
+        bus = BusEventos()
+        self.assertFalse(bus.hay_suscriptores())
+        recibidos = []
+        bus.suscribir(recibidos.append)
+        bus.publicar(LoteImportado("turnos", 1))
+        bus.desuscribir(recibidos.append)
+        bus.publicar(LoteImportado("turnos", 1))
+        self.assertEqual(len(recibidos), 1)
+        self.assertFalse(bus.hay_suscriptores())
+        with self.assertRaises(TypeError):
+            bus.suscribir("no es una función")
+
+    def test_registrador_asincrono_escribe_todo_al_cerrar(self):
+        archivo = io.StringIO()
+        registrador = RegistradorAsincrono(archivo, eventos_por_escritura=2)
+        self.clinica.obtener_eventos().suscribir(registrador)
+        self._cargar()
+        self.clinica.obtener_eventos().desuscribir(registrador)
+        registrador.cerrar()
+        lineas = archivo.getvalue().splitlines()
+        self.assertEqual(len(lineas), 5)
+        self.assertIn("TurnoAgendado Turno agendado con éxito", lineas[3])
+
+
+if __name__ == '__main__':
+    unittest.main(argv=[''], exit=False)
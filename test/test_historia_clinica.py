@@ -1,5 +1,6 @@
 
 import unittest
+from unittest.mock import patch
 from datetime import datetime, timedelta 
 from modelo.historia_clinica import HistoriaClinica
 from modelo.paciente import Paciente 
@@ -96,6 +97,54 @@ class TestHistoriaClinica(unittest.TestCase):
         self.assertNotIn(self.turno_cardiologia, hc.obtener_turnos())
         self.assertNotIn(self.receta_dos, hc.obtener_recetas())
 
+    def test_paginas_e_iteradores_de_la_historia(self):
+        hc = HistoriaClinica(self.paciente_titular)
+        hc.agregar_turno(self.turno_pediatria)
+        hc.agregar_turno(self.turno_cardiologia)
+        hc.agregar_receta(self.receta_uno)
+
+        pagina = hc.obtener_turnos_pagina(0, 1)
+        self.assertEqual(pagina.obtener_elementos(), [self.turno_pediatria])
+        self.assertEqual(hc.obtener_turnos_pagina(pagina.obtener_siguiente_cursor(), 1).obtener_elementos(), [self.turno_cardiologia])
+        self.assertEqual(list(hc.iterar_recetas()), [self.receta_uno])
+        self.assertFalse(hc.obtener_recetas_pagina(0, 5).hay_mas())
+
+    def test_turnos_cancelados_no_se_muestran_y_se_compactan(self):
+        hc = HistoriaClinica(self.paciente_titular)
+        hc.agregar_turno(self.turno_pediatria)
+        hc.agregar_turno(self.turno_cardiologia)
+        str(hc) # Arma y guarda los fragmentos de los dos turnos
+        self.turno_pediatria.cancelar()
+
+        self.assertEqual(hc.obtener_turnos(), [self.turno_cardiologia])
+        self.assertEqual(list(hc.iterar_turnos()), [self.turno_cardiologia])
+        self.assertEqual(hc.obtener_turnos_pagina(0, 5).obtener_elementos(), [self.turno_cardiologia])
+        texto = str(hc)
+        self.assertNotIn("Pediatría", texto)
+        hc.compactar_turnos()
+        self.assertEqual(str(hc), texto)
+        self.assertEqual(hc.obtener_turnos(), [self.turno_cardiologia])
+
+    def test_texto_por_bloques_y_fragmentos_guardados(self):
+        hc = HistoriaClinica(self.paciente_titular)
+        hc.agregar_turno(self.turno_pediatria)
+        hc.agregar_receta(self.receta_uno)
+        with patch.object(Turno, "__str__", autospec=True, side_effect=Turno.__str__) as str_turno:
+            primero = str(hc)
+            self.assertEqual(str(hc), primero)
+            self.assertEqual(str_turno.call_count, 1) # El turno ya mostrado no se vuelve a formatear
+
+            hc.agregar_turno(self.turno_cardiologia)
+            completo = str(hc)
+            self.assertEqual(str_turno.call_count, 2) # Solo se formatea el turno nuevo
+        self.assertIn("Cardiología", completo)
+
+        bloques = list(hc.iterar_texto(entradas_por_bloque=1))
+        self.assertGreater(len(bloques), 3)
+        self.assertEqual("".join(bloques), completo)
+        with self.assertRaises(ValueError):
+            list(hc.iterar_texto(entradas_por_bloque=0))
+
     # --- Prueba de la Representación  ---
 
     def test_str_muestra_formato_correcto(self):
@@ -0,0 +1,133 @@
+import os
+import shutil
+import tempfile
+import unittest
+from datetime import timedelta
+from modelo.clinica import Clinica
+from modelo.paciente import Paciente
+from modelo.importacion import importar_archivo, leer_especialidades
+from modelo.persistencia import AlmacenamientoClinica
+
+
+class TestImportacion(unittest.TestCase):
+
+    def setUp(self):
+        self.clinica = Clinica()
+        self.clinica.agregar_paciente(Paciente("Ana García", "12345678", "01/01/1990"))
+        self.directorio = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.directorio, ignore_errors=True)
+
+    def _escribir(self, nombre, contenido):
+        ruta = os.path.join(self.directorio, nombre)
+        with open(ruta, "w", encoding="utf-8") as archivo:
+            archivo.write(contenido)
+        return ruta
+
+    def test_importar_pacientes_informa_errores_por_fila_y_guarda_los_validos(self):
+        filas = [
+            {"nombre": "Luis Díaz", "dni": "55555555", "fecha_nacimiento": "03/03/1985"},
+            {"nombre": "Sin DNI", "dni": "123", "fecha_nacimiento": "03/03/1985"},          # DNI inválido
+            {"nombre": "Ana Repetida", "dni": "12345678", "fecha_nacimiento": "01/01/1990"}, # Ya registrada
+            {"nombre": "Luis Otra Vez", "dni": "55555555", "fecha_nacimiento": "03/03/1985"}, # Repetido en el lote
+            {"nombre": "Sin Fecha", "dni": "66666666"},                                       # Falta columna
+            {"nombre": "Marta Sosa", "dni": "77777777", "fecha_nacimiento": "10/10/1970"},
+        ]
+        resultado = self.clinica.importar_lote("pacientes", filas, tamanio_lote=2)
+
+        self.assertEqual(resultado.obtener_importados(), 2)
+        self.assertEqual([numero for numero, _ in resultado.obtener_errores()], [2, 3, 4, 5])
+        self.assertTrue(self.clinica.validar_existencia_paciente("55555555"))
+        self.assertTrue(self.clinica.validar_existencia_paciente("77777777"))
+        self.assertEqual(self.clinica.obtener_historia_clinica_por_dni("77777777").obtener_turnos(), [])
+
+    def test_importar_medicos_desde_csv(self):
+        ruta = self._escribir("medicos.csv",
+                              "nombre,matricula,especialidades\n"
+                              "Dr. Juan Pérez,MP11111,\"Pediatría:lunes,miércoles;Cardiología:martes\"\n"
+                              "Dra. Sin Días,MP22222,Pediatría\n")
+        resultado = importar_archivo(self.clinica, "medicos", ruta)
+
+        self.assertEqual(resultado.obtener_importados(), 1)
+        self.assertEqual(len(resultado.obtener_errores()), 1)
+        medico = self.clinica.obtener_medico_por_matricula("MP11111")
+        self.assertEqual([e.obtener_tipo() for e in medico.obtener_especialidad()], ["Pediatría", "Cardiología"])
+
+    def test_importar_jsonl_con_linea_rota_sigue_adelante(self):
+        ruta = self._escribir("pacientes.jsonl",
+                              '{"nombre": "Luis Díaz", "dni": "55555555", "fecha_nacimiento": "03/03/1985"}\n'
+                              '{"nombre": "Roto", \n'
+                              '{"nombre": "Marta Sosa", "dni": "77777777", "fecha_nacimiento": "10/10/1970"}\n')
+        resultado = importar_archivo(self.clinica, "pacientes", ruta)
+        self.assertEqual(resultado.obtener_importados(), 2)
+        self.assertEqual(resultado.obtener_errores()[0][0], 2)
+
+    def test_importar_turnos_valida_agenda_y_dias(self):
+        self.clinica.importar_lote("medicos", [{"nombre": "Dr. Juan Pérez", "matricula": "MP11111",
+                                                "especialidades": "Pediatría:lunes,miércoles"}])
+        filas = [
+            {"dni": "12345678", "matricula": "MP11111", "especialidad": "Pediatría", "fecha_hora": "2025-06-16 10:00"},
+            {"dni": "12345678", "matricula": "MP11111", "especialidad": "Pediatría", "fecha_hora": "2025-06-16T10:00"}, # Mismo horario en el lote
+            {"dni": "12345678", "matricula": "MP11111", "especialidad": "Pediatría", "fecha_hora": "2025-06-17 10:00"}, # Martes: no atiende
+            {"dni": "12345678", "matricula": "MP11111", "especialidad": "Pediatría", "fecha_hora": "2025-06-18 10:00"},
+        ]
+        resultado = self.clinica.importar_lote("turnos", filas)
+        self.assertEqual(resultado.obtener_importados(), 2)
+        self.assertEqual([numero for numero, _ in resultado.obtener_errores()], [2, 3])
+        self.assertEqual(len(self.clinica.obtener_historia_clinica_por_dni("12345678").obtener_turnos()), 2)
+
+    def test_importar_turnos_con_duracion(self):
+        self.clinica.importar_lote("medicos", [{"nombre": "Dr. Juan Pérez", "matricula": "MP11111",
+                                                "especialidades": "Pediatría:lunes,miércoles"}])
+        filas = [
+            {"dni": "12345678", "matricula": "MP11111", "especialidad": "Pediatría", "fecha_hora": "2025-06-16 10:00",
+             "duracion_minutos": "60"},
+            {"dni": "12345678", "matricula": "MP11111", "especialidad": "Pediatría", "fecha_hora": "2025-06-16 10:30"}, # Pisa al de las 10 del lote
+            {"dni": "12345678", "matricula": "MP11111", "especialidad": "Pediatría", "fecha_hora": "2025-06-16 11:00",
+             "duracion_minutos": ""}, # Vacía: la de la especialidad
+            {"dni": "12345678", "matricula": "MP11111", "especialidad": "Pediatría", "fecha_hora": "2025-06-18 10:00",
+             "duracion_minutos": "media hora"},
+        ]
+        resultado = self.clinica.importar_lote("turnos", filas)
+        self.assertEqual([numero for numero, _ in resultado.obtener_errores()], [2, 4])
+        self.assertEqual([(t.obtener_fecha_hora().hour, t.obtener_duracion()) for t in self.clinica.obtener_turnos()],
+                         [(10, timedelta(hours=1)), (11, timedelta(minutes=30))])
+
+    def test_importar_turnos_de_paciente_inexistente_se_informa(self):
+        filas = [{"dni": "99999999", "matricula": "MP11111", "especialidad": "Pediatría", "fecha_hora": "2025-06-16 10:00"},
+                 {"dni": "12345678", "matricula": "MP11111", "especialidad": "Pediatría", "fecha_hora": "mañana"}]
+        resultado = self.clinica.importar_lote("turnos", filas)
+        self.assertEqual(resultado.obtener_importados(), 0)
+        self.assertEqual(len(resultado.obtener_errores()), 2)
+
+    def test_importacion_queda_en_el_diario(self):
+        almacenada = Clinica(AlmacenamientoClinica(self.directorio))
+        almacenada.importar_lote("pacientes", [{"nombre": "Luis Díaz", "dni": "55555555", "fecha_nacimiento": "03/03/1985"}])
+        almacenada.cerrar()
+        self.assertTrue(Clinica(AlmacenamientoClinica(self.directorio)).validar_existencia_paciente("55555555"))
+
+    def test_tipo_desconocido(self):
+        with self.assertRaises(ValueError):
+            self.clinica.importar_lote("recetas", [])
+
+    def test_leer_especialidades(self):
+        self.assertEqual(leer_especialidades("Pediatría:lunes, miércoles;Clínica:viernes:45"),
+                         [("Pediatría", ["lunes", "miércoles"], None), ("Clínica", ["viernes"], timedelta(minutes=45))])
+        self.assertEqual(leer_especialidades([{"tipo": "Clínica", "dias": ["viernes"]}]), [("Clínica", ["viernes"], None)])
+        self.assertEqual(leer_especialidades([{"tipo": "Clínica", "dias": ["viernes"], "duracion_minutos": 20}]),
+                         [("Clínica", ["viernes"], timedelta(minutes=20))])
+        with self.assertRaises(ValueError):
+            leer_especialidades("Clínica:viernes:media hora")
+
+    def test_importar_medicos_con_duracion_por_especialidad(self):
+        resultado = self.clinica.importar_lote("medicos", [{"nombre": "Dr. Juan Pérez", "matricula": "MP11111",
+                                                            "especialidades": "Pediatría:lunes:45;Clínica:martes"}])
+        self.assertEqual(resultado.obtener_importados(), 1)
+        medico = self.clinica.obtener_medico_por_matricula("MP11111")
+        self.assertEqual(medico.obtener_duracion_turno("Pediatría"), timedelta(minutes=45))
+        self.assertEqual(medico.obtener_duracion_turno("Clínica"), timedelta(minutes=30))
+
+
+if __name__ == '__main__':
+    unittest.main(argv=[''], exit=False)
@@ -0,0 +1,62 @@
+import unittest
+from datetime import datetime
+from modelo.paciente import Paciente
+from modelo.medico import Medico
+from modelo.especialidad import Especialidad
+from modelo.turno import Turno
+from modelo.indice_turnos import TurnosPorFecha, IndiceTurnos
+
+
+class TestIndiceTurnos(unittest.TestCase):
+
+    def setUp(self):
+        self.ana = Paciente("Ana García", "12345678", "01/01/1990")
+        self.luis = Paciente("Luis Díaz", "55555555", "03/03/1985")
+        self.medico = Medico("Dr. Juan Pérez", "MP11111", [Especialidad("Pediatría", ["lunes", "martes"]),
+                                                           Especialidad("Clínica", ["lunes"])])
+
+    def _turno(self, paciente, fecha, especialidad="Pediatría"):
+        return Turno(paciente, self.medico, fecha, especialidad)
+
+    def test_rango_ordenado_aunque_se_agregue_desordenado(self):
+        indice = TurnosPorFecha()
+        martes = self._turno(self.ana, datetime(2025, 6, 17, 9, 0))
+        lunes_11 = self._turno(self.ana, datetime(2025, 6, 16, 11, 0))
+        lunes_10 = self._turno(self.luis, datetime(2025, 6, 16, 10, 0))
+        for turno in (martes, lunes_11, lunes_10):
+            indice.agregar(turno.obtener_fecha_hora(), turno)
+
+        self.assertEqual(len(indice), 3)
+        self.assertEqual(list(indice.iterar_entre()), [lunes_10, lunes_11, martes])
+        self.assertEqual(list(indice.iterar_entre(datetime(2025, 6, 16, 10, 30), datetime(2025, 6, 17, 9, 0))), [lunes_11])
+        self.assertEqual(list(indice.iterar_entre(desde=datetime(2025, 6, 17))), [martes])
+        self.assertEqual(list(indice.iterar_entre(hasta=datetime(2025, 6, 16, 10, 0))), [])
+
+    def test_indices_por_dni_y_especialidad(self):
+        indice = IndiceTurnos()
+        pediatria = self._turno(self.ana, datetime(2025, 6, 16, 10, 0))
+        clinica = self._turno(self.luis, datetime(2025, 6, 16, 11, 0), " clínica ")
+        indice.agregar(pediatria)
+        indice.agregar(clinica)
+
+        self.assertEqual(list(indice.por_dni("12345678").iterar_entre()), [pediatria])
+        self.assertEqual(list(indice.por_especialidad("CLÍNICA").iterar_entre()), [clinica])
+        self.assertIsNone(indice.por_dni("99999999"))
+        self.assertEqual(len(indice.por_fecha()), 2)
+
+
+    def test_quitar_saca_el_turno_de_todos_los_indices(self):
+        indice = IndiceTurnos()
+        mismo_horario = [self._turno(self.ana, datetime(2025, 6, 16, 10, 0)), self._turno(self.luis, datetime(2025, 6, 16, 10, 0))]
+        otro_dia = self._turno(self.ana, datetime(2025, 6, 17, 9, 0))
+        for turno in mismo_horario + [otro_dia]:
+            indice.agregar(turno)
+
+        indice.quitar(mismo_horario[1]) # Otro turno a la misma hora: saca justo ese
+        indice.quitar(otro_dia)         # Era el único del día: el día desaparece
+        self.assertEqual(list(indice.por_fecha().iterar_entre()), [mismo_horario[0]])
+        self.assertEqual(len(indice.por_dni("55555555")), 0)
+        self.assertEqual(list(indice.por_especialidad("pediatría").iterar_entre(desde=datetime(2025, 6, 17))), [])
+
+if __name__ == '__main__':
+    unittest.main(argv=[''], exit=False)
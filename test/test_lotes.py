@@ -0,0 +1,41 @@
+import io
+import json
+import unittest
+from modelo.clinica import Clinica
+from servicio.lotes import ejecutar_lineas
+
+
+class TestLotes(unittest.TestCase):
+
+    def setUp(self):
+        self.clinica = Clinica()
+        self.lineas = [
+            "# Comentario: se ignora, igual que las líneas vacías",
+            "",
+            json.dumps({"op": "agregar_paciente", "id": 1, "nombre": "Ana García", "dni": "12345678", "fecha_nacimiento": "01/01/1990"}),
+            json.dumps({"op": "agregar_medico", "id": 2, "nombre": "Dr. Juan Pérez", "matricula": "MP11111", "especialidades": "Pediatría:lunes"}),
+            json.dumps({"op": "agendar_turno", "id": 3, "dni": "12345678", "matricula": "MP11111", "especialidad": "Pediatría",
+                        "fecha_hora": "2025-06-16 10:00"}),
+            "esto no es json",
+            json.dumps({"op": "emitir_receta", "id": 4, "dni": "12345678", "matricula": "MP11111", "medicamentos": ["Ibuprofeno"]}),
+        ]
+
+    def test_una_respuesta_por_pedido_en_orden(self):
+        salida = io.StringIO()
+        resultado = ejecutar_lineas(self.clinica, self.lineas, salida)
+        respuestas = [json.loads(linea) for linea in salida.getvalue().splitlines()]
+        self.assertEqual([r["id"] for r in respuestas], [1, 2, 3, None, 4])
+        self.assertEqual(respuestas[3]["error"], "JSONInvalido")
+        self.assertEqual((resultado.obtener_exitos(), resultado.obtener_errores()), (4, 1))
+        self.assertEqual(str(resultado), "Pedidos ejecutados: 5 (4 correctos, 1 con error).")
+        self.assertEqual(len(self.clinica.obtener_turnos()), 1)
+
+    def test_detener_en_error(self):
+        salida = io.StringIO()
+        resultado = ejecutar_lineas(self.clinica, self.lineas, salida, detener_en_error=True)
+        self.assertEqual((resultado.obtener_exitos(), resultado.obtener_errores()), (3, 1))
+        self.assertEqual(self.clinica.obtener_historia_clinica_por_dni("12345678").obtener_recetas(), [])
+
+
+if __name__ == '__main__':
+    unittest.main(argv=[''], exit=False)
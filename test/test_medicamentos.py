@@ -0,0 +1,68 @@
+import unittest
+from datetime import datetime
+from modelo.medicamentos import CatalogoMedicamentos, IndiceMedicamentos, clave_medicamento
+from modelo.receta import Receta
+from modelo.paciente import Paciente
+from modelo.medico import Medico
+from modelo.especialidad import Especialidad
+
+
+class TestCatalogoMedicamentos(unittest.TestCase):
+
+    def test_nombres_normalizados(self):
+        self.assertEqual(clave_medicamento("  Ácido   Fólico "), "acido folico")
+        catalogo = CatalogoMedicamentos()
+        codigo = catalogo.registrar("Ácido fólico")
+        self.assertEqual(catalogo.registrar("acido  FOLICO"), codigo)
+        self.assertEqual(catalogo.registrar("Ibuprofeno"), codigo + 1)
+        self.assertEqual(catalogo.nombre_canonico(" ácido fólico"), "Ácido fólico")
+        self.assertEqual(catalogo.nombre_canonico("Paracetamol  500"), "Paracetamol 500") # Todavía no está.
+        self.assertIn("IBUPROFENO", catalogo)
+        self.assertNotIn("Paracetamol", catalogo)
+        self.assertEqual(list(catalogo), ["Ácido fólico", "Ibuprofeno"])
+
+
+class TestIndiceMedicamentos(unittest.TestCase):
+
+    def setUp(self):
+        medico = Medico("Dr. Juan Pérez", "MP11111", [Especialidad("Clínica", ["lunes"])])
+        self.ana = Paciente("Ana García", "12345678", "01/01/1990")
+        self.carlos = Paciente("Carlos Pérez", "87654321", "02/02/1980")
+        self.indice = IndiceMedicamentos()
+        self.recetas = [Receta(paciente, medico, medicamentos, datetime(2025, mes, 10))
+                        for paciente, medicamentos, mes in [(self.ana, ["Ibuprofeno", "Omeprazol"], 1),
+                                                            (self.carlos, ["ibuprofeno", "Ibuprofeno"], 2),
+                                                            (self.ana, ["Paracetamol"], 3),
+                                                            (self.ana, ["Ibuprofeno"], 3)]]
+        for receta in self.recetas:
+            self.indice.agregar(receta)
+
+    def test_recetas_y_pacientes_por_medicamento(self):
+        self.assertEqual(self.indice.recetas_con("IBUPROFENO"), [self.recetas[0], self.recetas[1], self.recetas[3]])
+        self.assertEqual(self.indice.recetas_con("Ibuprofeno", datetime(2025, 2, 1), datetime(2025, 3, 1)), [self.recetas[1]])
+        self.assertEqual(self.indice.pacientes_con("Ibuprofeno"), [self.ana, self.carlos])
+        self.assertEqual(self.indice.recetas_con("Aspirina"), [])
+        self.assertEqual(self.indice.contar("Ibuprofeno", desde=datetime(2025, 2, 1)), 2)
+
+    def test_recetas_fuera_de_orden_quedan_ordenadas(self):
+        anterior = Receta(self.ana, self.recetas[0].obtener_medico(), ["Omeprazol"], datetime(2024, 12, 1))
+        self.indice.agregar(anterior)
+        self.assertEqual(self.indice.recetas_con("Omeprazol"), [anterior, self.recetas[0]])
+
+    def test_varios_medicamentos_nuevos_en_una_receta(self):
+        medico = self.recetas[0].obtener_medico()
+        for numero in range(4):
+            self.indice.agregar(Receta(self.ana, medico, [f"Droga {numero}"], datetime(2025, 4, 1)))
+        # Los códigos 7 y 8 salen del set en cualquier orden.
+        self.indice.agregar(Receta(self.ana, medico, ["Droga A", "Droga B"], datetime(2025, 4, 2)))
+        self.assertEqual(self.indice.contar("Droga B"), 1)
+
+    def test_mas_recetados(self):
+        self.assertEqual(self.indice.mas_recetados(2), [("Ibuprofeno", 3), ("Omeprazol", 1)])
+        self.assertEqual(self.indice.mas_recetados(5, desde=datetime(2025, 3, 1)), [("Ibuprofeno", 1), ("Paracetamol", 1)])
+        with self.assertRaises(ValueError):
+            self.indice.mas_recetados(0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -103,6 +103,23 @@ class TestMedico(unittest.TestCase):
         self.assertIsNone(med.obtener_especialidad_para_dia("domingo"))
         self.assertIsNone(med.obtener_especialidad_para_dia("")) # Un día vacío tampoco sirve.
 
+    def test_dos_especialidades_el_mismo_dia_se_devuelven_todas(self):
+        # Pediatría (lunes, miércoles) y Neurología (martes, viernes) comparten día con Cardiología (martes, jueves).
+        med = Medico("Dra. Doble Turno", "MP00006", [self.cardiologia, self.neurologia])
+        self.assertEqual(med.obtener_especialidades_para_dia("martes"), ["Cardiología", "Neurología"])
+        self.assertEqual(med.obtener_especialidad_para_dia("martes"), "Cardiología") # La primera, como antes
+        self.assertTrue(med.atiende_especialidad("Neurología", "Martes"))
+        self.assertTrue(med.atiende_especialidad("cardiología", "jueves"))
+        self.assertFalse(med.atiende_especialidad("Neurología", "jueves"))
+        self.assertFalse(med.atiende_especialidad("Pediatría", "martes"))
+
+    def test_agregar_especialidad_actualiza_los_dias(self):
+        med = Medico("Dr. Agregador", "MP00007", [self.pediatria])
+        self.assertEqual(med.obtener_especialidades_para_dia("viernes"), [])
+        med.agregar_especialidad(self.dermatologia)
+        self.assertEqual(med.obtener_especialidades_para_dia("viernes"), ["Dermatología"])
+        self.assertTrue(med.atiende_especialidad("Dermatología", "viernes"))
+
     # --- Prueba para el método '__str__' (cómo se ve el médico impreso) ---
 
     def test_str_formato_de_salida_es_el_esperado(self):
@@ -0,0 +1,100 @@
+import os
+import tempfile
+import threading
+import unittest
+from datetime import datetime
+from modelo.clinica import Clinica
+from modelo.paciente import Paciente
+from modelo.medico import Medico
+from modelo.especialidad import Especialidad
+from modelo.metricas import HistogramaLatencias, MetricasClinica, LIMITES_LATENCIA
+from modelo.exception import TurnoDuplicadoError, MedicoNoTrabajaEseDiaError
+
+
+class TestMetricas(unittest.TestCase):
+
+    def setUp(self):
+        self.clinica = Clinica(metricas=True)
+        self.clinica.agregar_paciente(Paciente("Ana García", "12345678", "01/01/1990"))
+        self.clinica.agregar_medico(Medico("Dr. Juan Pérez", "MP11111", [Especialidad("Pediatría", ["lunes"])]))
+
+    def test_cuenta_llamadas_y_errores_por_tipo(self):
+        lunes = datetime(2025, 6, 16, 10, 0)
+        self.clinica.agendar_turno("12345678", "MP11111", "Pediatría", lunes)
+        with self.assertRaises(TurnoDuplicadoError):
+            self.clinica.agendar_turno("12345678", "MP11111", "Pediatría", lunes)
+        with self.assertRaises(MedicoNoTrabajaEseDiaError):
+            self.clinica.agendar_turno("12345678", "MP11111", "Pediatría", datetime(2025, 6, 17, 10, 0))
+
+        resumen = self.clinica.obtener_metricas().obtener_resumen()
+        self.assertEqual(resumen["agendar_turno"]["llamadas"], 3)
+        self.assertEqual(resumen["agendar_turno"]["exitos"], 1)
+        self.assertEqual(resumen["agendar_turno"]["fallos"], {"TurnoDuplicadoError": 1, "MedicoNoTrabajaEseDiaError": 1})
+        self.assertEqual(resumen["agregar_paciente"]["llamadas"], 1)
+        self.assertEqual(len(self.clinica.obtener_turnos()), 1)
+
+    def test_sin_metricas_no_se_envuelve_nada(self):
+        clinica = Clinica()
+        self.assertIsNone(clinica.obtener_metricas())
+        self.assertEqual(clinica.agendar_turno.__func__, Clinica.agendar_turno)
+
+    def test_histograma_y_percentiles(self):
+        histograma = HistogramaLatencias()
+        for _ in range(90):
+            histograma.agregar(0.0015) # Cae en el cubo de 2 ms.
+        for _ in range(10):
+            histograma.agregar(0.3) # Cae en el cubo de 500 ms.
+        histograma.agregar(60.0) # Más que el último límite.
+        self.assertEqual(histograma.obtener_cantidad(), 101)
+        self.assertEqual(histograma.percentil(50), 0.002)
+        self.assertEqual(histograma.percentil(95), 0.5)
+        self.assertEqual(histograma.percentil(100), 60.0)
+        cubos = histograma.obtener_cubos()
+        self.assertEqual(len(cubos), len(LIMITES_LATENCIA) + 1)
+        self.assertEqual(cubos[-1], (float("inf"), 101))
+        self.assertEqual(HistogramaLatencias().percentil(99), 0.0)
+
+    def test_exportar_texto_y_archivo(self):
+        metricas = MetricasClinica()
+        metricas.registrar("agendar_turno", 0.001)
+        metricas.registrar("agendar_turno", 0.004, TurnoDuplicadoError("duplicado"))
+        texto = metricas.exportar_texto()
+        self.assertIn('clinica_operaciones_total{operacion="agendar_turno",resultado="ok"} 1', texto)
+        self.assertIn('clinica_operaciones_total{operacion="agendar_turno",resultado="error"} 1', texto)
+        self.assertIn('clinica_errores_total{operacion="agendar_turno",error="TurnoDuplicadoError"} 1', texto)
+        self.assertIn('clinica_latencia_segundos_bucket{operacion="agendar_turno",le="0.001"} 1', texto)
+        self.assertIn('clinica_latencia_segundos_bucket{operacion="agendar_turno",le="+Inf"} 2', texto)
+        self.assertIn('clinica_latencia_segundos_count{operacion="agendar_turno"} 2', texto)
+
+        with tempfile.TemporaryDirectory() as directorio:
+            ruta = os.path.join(directorio, "metricas.prom")
+            metricas.escribir_archivo(ruta)
+            with open(ruta, encoding="utf-8") as archivo:
+                self.assertEqual(archivo.read(), texto)
+            self.assertEqual(os.listdir(directorio), ["metricas.prom"])
+
+    def test_varios_hilos_cuentan_exacto(self):
+        metricas = MetricasClinica()
+        operacion = metricas.envolver("operacion", lambda: None)
+
+        def trabajar():
+            for _ in range(2000):
+                operacion()
+
+        hilos = [threading.Thread(target=trabajar) for _ in range(8)]
+        for hilo in hilos:
+            hilo.start()
+        for hilo in hilos:
+            hilo.join()
+        resumen = metricas.obtener_resumen()["operacion"]
+        self.assertEqual(resumen["llamadas"], 16000)
+        self.assertEqual(resumen["exitos"], 16000)
+        self.assertEqual(resumen["cubos"][-1][1], 16000)
+
+    def test_str_muestra_tabla(self):
+        self.assertEqual(str(MetricasClinica()), "Todavía no se registró ninguna operación.")
+        self.assertIn("agregar_paciente", str(self.clinica.obtener_metricas()))
+
+
+if __name__ == '__main__':
+    unittest.main()
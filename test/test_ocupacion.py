@@ -0,0 +1,88 @@
+import io
+import unittest
+from datetime import date, datetime, timedelta
+from modelo.clinica import Clinica
+from modelo.paciente import Paciente
+from modelo.medico import Medico
+from modelo.especialidad import Especialidad
+from modelo.ocupacion import calcular_ocupacion
+
+
+class TestOcupacion(unittest.TestCase):
+
+    def crear_clinica(self, columnar=False):
+        clinica = Clinica(columnar=columnar)
+        clinica.agregar_paciente(Paciente("Ana García", "12345678", "01/01/1990"))
+        # Pérez atiende Pediatría lunes y miércoles y Clínica los lunes; López solo Cardiología los martes.
+        clinica.agregar_medico(Medico("Dr. Juan Pérez", "MP11111",
+                                      [Especialidad("Pediatría", ["lunes", "miércoles"]), Especialidad("Clínica", ["lunes"])]))
+        clinica.agregar_medico(Medico("Dra. María López", "MP22222", [Especialidad("Cardiología", ["martes"])]))
+        for fecha_hora, matricula, especialidad in [(datetime(2025, 6, 2, 10), "MP11111", "Pediatría"),
+                                                    (datetime(2025, 6, 2, 11), "MP11111", "clínica"),
+                                                    (datetime(2025, 6, 4, 10), "MP11111", "Pediatría"),
+                                                    (datetime(2025, 6, 3, 10), "MP22222", "Cardiología"),
+                                                    (datetime(2025, 7, 1, 10), "MP22222", "Cardiología")]:
+            clinica.agendar_turno("12345678", matricula, especialidad, fecha_hora)
+        return clinica
+
+    def resumen(self, reporte, agrupacion):
+        return {f.obtener_clave(): (f.obtener_turnos(), f.obtener_capacidad()) for f in reporte.obtener_filas(agrupacion)}
+
+    def test_turnos_contra_capacidad(self):
+        # Junio de 2025: 5 lunes, 4 martes, 4 miércoles. 10 turnos por jornada.
+        for columnar in (False, True):
+            with self.subTest(columnar=columnar):
+                reporte = calcular_ocupacion(self.crear_clinica(columnar), date(2025, 6, 1), date(2025, 7, 1), turnos_por_dia=10)
+                self.assertEqual(self.resumen(reporte, "medico"), {"MP11111": (3, 90), "MP22222": (1, 40)})
+                self.assertEqual(self.resumen(reporte, "especialidad"),
+                                 {"cardiología": (1, 40), "clínica": (1, 50), "pediatría": (2, 90)})
+                dias = self.resumen(reporte, "dia")
+                self.assertEqual((dias["lunes"], dias["martes"], dias["miercoles"], dias["domingo"]),
+                                 ((2, 50), (1, 40), (1, 40), (0, 0)))
+                self.assertAlmostEqual(reporte.obtener_filas("medico")[0].obtener_ocupacion(), 3 / 90)
+
+    def test_sin_los_turnos_cancelados(self):
+        clinica = self.crear_clinica(columnar=True)
+        clinica.cancelar_turno(0)
+        reporte = calcular_ocupacion(clinica, date(2025, 6, 1), date(2025, 7, 1))
+        self.assertEqual(self.resumen(reporte, "medico")["MP11111"], (2, 180))
+
+    def test_capacidad_segun_duracion_de_los_turnos(self):
+        # Turnos de 60 minutos: entran 10 en la jornada. Con el lunes 2 de junio lleno, la ocupación es 100%.
+        clinica = Clinica()
+        clinica.agregar_paciente(Paciente("Ana García", "12345678", "01/01/1990"))
+        clinica.agregar_medico(Medico("Dr. Juan Pérez", "MP11111",
+                                      [Especialidad("Cirugía", ["lunes"], timedelta(minutes=60)), Especialidad("Clínica", ["lunes"])]))
+        for hora in range(8, 18):
+            clinica.agendar_turno("12345678", "MP11111", "Cirugía", datetime(2025, 6, 2, hora))
+        reporte = calcular_ocupacion(clinica, date(2025, 6, 2), date(2025, 6, 3))
+        self.assertIsNone(reporte.obtener_turnos_por_dia())
+        self.assertEqual(self.resumen(reporte, "especialidad"), {"cirugía": (10, 10), "clínica": (0, 20)})
+        self.assertEqual(reporte.obtener_filas("especialidad")[0].obtener_ocupacion(), 1.0)
+        # El médico y el día cuentan la jornada una vez, con los turnos más cortos (los de Clínica).
+        self.assertEqual(self.resumen(reporte, "medico"), {"MP11111": (10, 20)})
+        self.assertEqual(self.resumen(reporte, "dia")["lunes"], (10, 20))
+
+    def test_tabla_y_csv(self):
+        reporte = calcular_ocupacion(self.crear_clinica(), date(2025, 6, 1), date(2025, 7, 1), turnos_por_dia=10)
+        tabla = reporte.tabla("especialidad")
+        self.assertIn("Pediatría", tabla)
+        self.assertIn("2.2%", tabla) # 2 turnos de 90.
+        salida = io.StringIO()
+        reporte.escribir_csv(salida, "medico")
+        self.assertEqual(salida.getvalue().splitlines(), ["clave,nombre,turnos,capacidad,ocupacion",
+                                                          "MP11111,Dr. Juan Pérez,3,90,0.0333",
+                                                          "MP22222,Dra. María López,1,40,0.025"])
+
+    def test_datos_invalidos(self):
+        clinica = self.crear_clinica()
+        with self.assertRaises(ValueError):
+            calcular_ocupacion(clinica, date(2025, 7, 1), date(2025, 6, 1))
+        with self.assertRaises(TypeError):
+            calcular_ocupacion(clinica, "2025-06-01", date(2025, 7, 1))
+        with self.assertRaises(ValueError):
+            calcular_ocupacion(clinica, date(2025, 6, 1), date(2025, 7, 1)).obtener_filas("mes")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,42 @@
+import unittest
+from modelo.paginacion import paginar, iterar_lista
+
+
+class TestPaginacion(unittest.TestCase):
+
+    def test_recorrer_todas_las_paginas(self):
+        datos = list(range(7))
+        vistos = []
+        cursor = 0
+        while cursor is not None:
+            pagina = paginar(datos, cursor, 3)
+            vistos.extend(pagina)
+            cursor = pagina.obtener_siguiente_cursor()
+        self.assertEqual(vistos, datos)
+
+    def test_ultima_pagina_exacta_no_tiene_siguiente(self):
+        pagina = paginar([1, 2, 3, 4], 2, 2)
+        self.assertEqual(pagina.obtener_elementos(), [3, 4])
+        self.assertFalse(pagina.hay_mas())
+
+    def test_pagina_fuera_de_rango_vacia(self):
+        self.assertEqual(len(paginar([1, 2], 10, 5)), 0)
+
+    def test_parametros_invalidos(self):
+        with self.assertRaises(ValueError):
+            paginar([1], -1, 5)
+        with self.assertRaises(ValueError):
+            paginar([1], 0, 0)
+
+    def test_iterar_lista_ve_lo_que_se_agrega_mientras_recorre(self):
+        datos = [1, 2]
+        vistos = []
+        for valor in iterar_lista(datos):
+            vistos.append(valor)
+            if valor == 1:
+                datos.append(3)
+        self.assertEqual(vistos, [1, 2, 3])
+
+
+if __name__ == '__main__':
+    unittest.main(argv=[''], exit=False)
@@ -0,0 +1,97 @@
+import unittest
+from servicio.particiones import ClinicaParticionada, particion_de_matricula
+
+
+class TestClinicaParticionada(unittest.TestCase):
+
+    def setUp(self):
+        self.clinica = ClinicaParticionada(3)
+        self.matriculas = [f"MP{m}" for m in range(6)]
+        pedidos = [{"op": "agregar_paciente", "nombre": "Ana García", "dni": "12345678", "fecha_nacimiento": "01/01/1990"}]
+        pedidos += [{"op": "agregar_medico", "nombre": f"Dr. Médico {m}", "matricula": m, "especialidades": "Clínica:lunes"}
+                    for m in self.matriculas]
+        respuestas = self.clinica.ejecutar_varios(pedidos)
+        self.assertTrue(all(r["ok"] for r in respuestas))
+
+    def tearDown(self):
+        self.clinica.cerrar()
+
+    def agendar(self, matricula, fecha_hora="2025-06-16T10:00"):
+        return {"op": "agendar_turno", "dni": "12345678", "matricula": matricula, "especialidad": "Clínica", "fecha_hora": fecha_hora}
+
+    def test_particion_de_matricula_es_estable(self):
+        self.assertEqual(particion_de_matricula("MP1", 3), particion_de_matricula("MP1", 3))
+        self.assertTrue(all(0 <= particion_de_matricula(m, 3) < 3 for m in self.matriculas))
+
+    def test_turnos_en_la_particion_del_medico_con_ids_globales(self):
+        respuestas = self.clinica.ejecutar_varios([self.agendar(m) for m in self.matriculas])
+        ids = [r["resultado"]["id"] for r in respuestas]
+        self.assertEqual(len(set(ids)), len(ids))
+        for matricula, id_turno in zip(self.matriculas, ids):
+            self.assertEqual(id_turno % 3, particion_de_matricula(matricula, 3))
+
+        # El mismo horario del mismo médico choca en su partición.
+        repetido = self.clinica.ejecutar_operacion(self.agendar("MP0"))
+        self.assertEqual(repetido["error"], "TurnoDuplicadoError")
+
+        cancelado = self.clinica.ejecutar_operacion({"op": "cancelar_turno", "id_turno": ids[0]})
+        self.assertEqual(cancelado["resultado"]["id"], ids[0])
+        self.assertTrue(self.clinica.ejecutar_operacion(self.agendar("MP0"))["ok"])
+
+    def test_pacientes_y_medicos_en_todas_las_particiones(self):
+        repetido = self.clinica.ejecutar_operacion(
+            {"op": "agregar_paciente", "nombre": "Ana García", "dni": "12345678", "fecha_nacimiento": "01/01/1990"})
+        self.assertEqual(repetido["error"], "PacienteExistenteError")
+        medicos = self.clinica.ejecutar_operacion({"op": "listar_medicos"})["resultado"]["elementos"]
+        self.assertEqual([m["matricula"] for m in medicos], self.matriculas)
+
+    def test_historia_junta_todas_las_particiones(self):
+        pedidos = [self.agendar(m) for m in self.matriculas]
+        pedidos += [{"op": "emitir_receta", "dni": "12345678", "matricula": m, "medicamentos": ["Ibuprofeno"]} for m in ("MP1", "MP4")]
+        pedidos.append({"op": "ver_historia", "dni": "12345678"})
+        historia = self.clinica.ejecutar_varios(pedidos)[-1]["resultado"]
+        self.assertEqual(sorted(t["matricula"] for t in historia["turnos"]), self.matriculas)
+        self.assertEqual(sorted(r["matricula"] for r in historia["recetas"]), ["MP1", "MP4"])
+        self.assertEqual(self.clinica.ejecutar_operacion({"op": "ver_historia", "dni": "99999999"})["error"], "PacienteNoExisteError")
+
+    def test_medicamentos_de_todas_las_particiones(self):
+        pedidos = [{"op": "emitir_receta", "dni": "12345678", "matricula": m, "medicamentos": ["Ibuprofeno"]} for m in self.matriculas]
+        pedidos.append({"op": "emitir_receta", "dni": "12345678", "matricula": "MP0", "medicamentos": ["Omeprazol"]})
+        self.clinica.ejecutar_varios(pedidos)
+        recetas = self.clinica.ejecutar_operacion({"op": "recetas_por_medicamento", "medicamento": "ibuprofeno"})["resultado"]
+        self.assertEqual(sorted(r["matricula"] for r in recetas), self.matriculas)
+        mas_recetados = self.clinica.ejecutar_operacion({"op": "medicamentos_mas_recetados", "cantidad": 1})["resultado"]
+        self.assertEqual(mas_recetados, [{"medicamento": "Ibuprofeno", "recetas": 6}])
+
+    def test_listar_turnos_por_paginas_sin_perder_ninguno(self):
+        fechas = ["2025-06-16T10:00", "2025-06-23T10:00", "2025-06-30T10:00"]
+        ids = {r["resultado"]["id"] for r in self.clinica.ejecutar_varios([self.agendar(m, f) for m in self.matriculas for f in fechas])}
+        vistos, cursor = [], 0
+        while cursor is not None:
+            pagina = self.clinica.ejecutar_operacion({"op": "listar_turnos", "cursor": cursor, "limite": 4})["resultado"]
+            self.assertLessEqual(len(pagina["elementos"]), 4)
+            vistos.extend(t["id"] for t in pagina["elementos"])
+            cursor = pagina["siguiente_cursor"]
+        self.assertEqual(vistos, sorted(ids))
+        self.assertEqual(self.clinica.ejecutar_operacion({"op": "listar_turnos", "cursor": -1})["error"], "ValueError")
+
+    def test_pedidos_invalidos(self):
+        respuestas = self.clinica.ejecutar_varios(["no es un objeto", {"op": "volar"}, {"op": "agendar_turno", "dni": "12345678"}])
+        self.assertEqual([r["error"] for r in respuestas], ["PedidoInvalido", "OperacionDesconocida", "DatoFaltante"])
+
+    def test_un_pedido_que_falla_no_termina_la_particion(self):
+        medico = {"op": "agregar_medico", "nombre": "Dr. Viernes", "matricula": "MP9", "especialidades": "Clínica:viernes"}
+        self.assertTrue(self.clinica.ejecutar_operacion(medico)["ok"])
+        # Termina después de la última fecha posible: antes mataba el proceso de la partición.
+        fuera_de_rango = self.clinica.ejecutar_operacion(self.agendar("MP9", "9999-12-31T23:50"))
+        self.assertFalse(fuera_de_rango["ok"])
+        self.assertTrue(self.clinica.ejecutar_operacion(self.agendar("MP9", "2025-06-20T10:00"))["ok"])
+        self.assertEqual(len(self.clinica.ejecutar_operacion({"op": "listar_turnos"})["resultado"]["elementos"]), 1)
+
+    def test_cantidad_de_particiones_invalida(self):
+        with self.assertRaises(ValueError):
+            ClinicaParticionada(0)
+
+
+if __name__ == '__main__':
+    unittest.main()
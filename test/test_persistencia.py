@@ -0,0 +1,178 @@
+import os
+import shutil
+import tempfile
+import unittest
+from datetime import datetime, timedelta
+from modelo.clinica import Clinica
+from modelo.paciente import Paciente
+from modelo.medico import Medico
+from modelo.especialidad import Especialidad
+from modelo.persistencia import AlmacenamientoClinica
+from modelo.recurrencia import ReglaRecurrencia
+from modelo.exception import TurnoDuplicadoError
+
+
+class TestPersistencia(unittest.TestCase):
+
+    def setUp(self):
+        self.directorio = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.directorio, ignore_errors=True)
+
+    def _abrir_clinica(self, registros_por_instantanea=1000):
+        return Clinica(AlmacenamientoClinica(self.directorio, registros_por_instantanea))
+
+    def _cargar_datos(self, clinica):
+        clinica.agregar_paciente(Paciente("Ana García", "12345678", "01/01/1990"))
+        medico = Medico("Dr. Juan Pérez", "MP11111", [Especialidad("Pediatría", ["lunes", "miércoles"])])
+        clinica.agregar_medico(medico)
+        medico.agregar_especialidad(Especialidad("Clínica", ["viernes"])) # Se anota aunque no pase por Clinica
+        return clinica.emitir_receta("12345678", "MP11111", ["Ibuprofeno", "Paracetamol"])
+
+    def test_reinicio_recupera_los_datos_desde_el_diario(self):
+        clinica = self._abrir_clinica()
+        receta = self._cargar_datos(clinica)
+        clinica.cerrar()
+
+        recuperada = self._abrir_clinica()
+        self.assertTrue(recuperada.validar_existencia_paciente("12345678"))
+        medico = recuperada.obtener_medico_por_matricula("MP11111")
+        self.assertEqual([e.obtener_tipo() for e in medico.obtener_especialidad()], ["Pediatría", "Clínica"])
+        recetas = recuperada.obtener_historia_clinica_por_dni("12345678").obtener_recetas()
+        self.assertEqual(len(recetas), 1)
+        self.assertEqual(recetas[0].obtener_medicamentos(), ["Ibuprofeno", "Paracetamol"])
+        self.assertEqual(recetas[0].obtener_fecha(), receta.obtener_fecha()) # Conserva la fecha de emisión original
+        self.assertEqual(recuperada.buscar_recetas_por_medicamento("paracetamol"), recetas) # El índice se rearma
+        self.assertEqual([p.obtener_dni() for p in recuperada.buscar_pacientes_por_nombre("garc")], ["12345678"])
+
+    def test_turnos_se_recuperan_con_su_agenda(self):
+        clinica = self._abrir_clinica(registros_por_instantanea=5)
+        self._cargar_datos(clinica)
+        clinica.agendar_turno("12345678", "MP11111", "Pediatría", datetime(2025, 6, 16, 10, 0))  # Entra en la instantánea
+        clinica.agendar_turno("12345678", "MP11111", "Pediatría", datetime(2025, 6, 18, 10, 0))  # Queda en el diario
+        clinica.cerrar()
+
+        recuperada = self._abrir_clinica(registros_por_instantanea=5)
+        self.assertEqual(len(recuperada.obtener_turnos()), 2)
+        self.assertEqual(len(recuperada.obtener_historia_clinica_por_dni("12345678").obtener_turnos()), 2)
+        with self.assertRaises(TurnoDuplicadoError): # La agenda del médico también se reconstruye
+            recuperada.agendar_turno("12345678", "MP11111", "Pediatría", datetime(2025, 6, 18, 10, 0))
+
+    def test_serie_de_turnos_se_recupera_completa(self):
+        clinica = self._abrir_clinica()
+        self._cargar_datos(clinica)
+        clinica.agendar_serie("12345678", "MP11111", "Pediatría", ReglaRecurrencia(datetime(2025, 6, 16, 10, 0), cantidad=10))
+        clinica.cerrar()
+
+        recuperada = self._abrir_clinica()
+        self.assertEqual(len(recuperada.obtener_turnos()), 10)
+        with self.assertRaises(TurnoDuplicadoError):
+            recuperada.agendar_turno("12345678", "MP11111", "Pediatría", datetime(2025, 8, 18, 10, 0))
+
+    def test_cancelaciones_y_reprogramaciones_se_recuperan(self):
+        for registros_por_instantanea in (1000, 4): # Desde el diario y con instantáneas en el medio
+            clinica = self._abrir_clinica(registros_por_instantanea)
+            self._cargar_datos(clinica)
+            turnos = clinica.agendar_serie("12345678", "MP11111", "Pediatría", ReglaRecurrencia(datetime(2025, 6, 16, 10, 0), cantidad=4))
+            clinica.cancelar_turno(turnos[0].obtener_id())
+            nuevo = clinica.reprogramar_turno(turnos[1].obtener_id(), datetime(2025, 6, 25, 11, 0))
+            clinica.cerrar()
+
+            recuperada = self._abrir_clinica(registros_por_instantanea)
+            self.assertEqual(sorted(t.obtener_id() for t in recuperada.obtener_turnos()), [2, 3, 4])
+            self.assertEqual(recuperada.obtener_turno_por_id(nuevo.obtener_id()).obtener_fecha_hora(), datetime(2025, 6, 25, 11, 0))
+            self.assertFalse(recuperada.validar_turno_no_duplicado("MP11111", datetime(2025, 6, 16, 10, 0)))
+            self.assertEqual(recuperada.agendar_turno("12345678", "MP11111", "Pediatría", datetime(2025, 6, 16, 10, 0)).obtener_id(), 5)
+            recuperada.cerrar()
+            shutil.rmtree(self.directorio)
+
+    def test_duraciones_se_recuperan(self):
+        for columnar in (False, True):
+            for registros_por_instantanea in (1000, 4): # Desde el diario y con instantáneas en el medio
+                clinica = Clinica(AlmacenamientoClinica(self.directorio, registros_por_instantanea), columnar=columnar)
+                self._cargar_datos(clinica)
+                clinica.agregar_medico(Medico("Dra. Carla Ríos", "MP55555", [Especialidad("Kinesiología", ["martes"], timedelta(minutes=45))]))
+                clinica.obtener_medico_por_matricula("MP11111").agregar_especialidad(
+                    Especialidad("Traumatología", ["jueves"], timedelta(minutes=20)))
+                clinica.agendar_turno("12345678", "MP55555", "Kinesiología", datetime(2025, 6, 17, 10, 0))
+                clinica.agendar_turno("12345678", "MP11111", "Traumatología", datetime(2025, 6, 19, 10, 0))
+                largo = clinica.agendar_turno("12345678", "MP11111", "Pediatría", datetime(2025, 6, 16, 10, 0), timedelta(hours=1))
+                clinica.reprogramar_turno(largo.obtener_id(), datetime(2025, 6, 16, 10, 30))
+                clinica.agendar_serie("12345678", "MP11111", "Pediatría", ReglaRecurrencia(datetime(2025, 6, 18, 9, 0), cantidad=2),
+                                      timedelta(minutes=90))
+                clinica.cerrar()
+
+                recuperada = Clinica(AlmacenamientoClinica(self.directorio, registros_por_instantanea), columnar=columnar)
+                self.assertEqual(sorted((t.obtener_fecha_hora(), t.obtener_duracion()) for t in recuperada.obtener_turnos()),
+                                 [(datetime(2025, 6, 16, 10, 30), timedelta(hours=1)), (datetime(2025, 6, 17, 10, 0), timedelta(minutes=45)),
+                                  (datetime(2025, 6, 18, 9, 0), timedelta(minutes=90)), (datetime(2025, 6, 19, 10, 0), timedelta(minutes=20)),
+                                  (datetime(2025, 6, 25, 9, 0), timedelta(minutes=90))])
+                self.assertEqual(recuperada.obtener_medico_por_matricula("MP11111").obtener_duracion_turno("Traumatología"),
+                                 timedelta(minutes=20))
+                self.assertTrue(recuperada.validar_turno_no_duplicado("MP11111", datetime(2025, 6, 16, 11, 15)))
+                self.assertTrue(recuperada.validar_turno_no_duplicado("MP11111", datetime(2025, 6, 18, 10, 15)))
+                self.assertTrue(recuperada.validar_turno_no_duplicado("MP55555", datetime(2025, 6, 17, 10, 40)))
+                recuperada.cerrar()
+                shutil.rmtree(self.directorio)
+
+    def test_instantanea_automatica_vacia_el_diario_y_no_duplica_al_recuperar(self):
+        clinica = self._abrir_clinica(registros_por_instantanea=2)
+        self._cargar_datos(clinica) # 4 registros: se toman instantáneas en el camino
+        clinica.agregar_paciente(Paciente("Luis Díaz", "55555555", "03/03/1985")) # Queda en la cola del diario
+        clinica.cerrar()
+
+        self.assertTrue(os.path.exists(os.path.join(self.directorio, AlmacenamientoClinica.NOMBRE_INSTANTANEA)))
+        recuperada = self._abrir_clinica()
+        self.assertEqual(len(recuperada.obtener_pacientes()), 2)
+        self.assertEqual(len(recuperada.obtener_medicos()), 1)
+        self.assertEqual(len(recuperada.obtener_historia_clinica_por_dni("12345678").obtener_recetas()), 1)
+
+    def test_guardar_instantanea_manual_y_seguir_escribiendo(self):
+        clinica = self._abrir_clinica()
+        self._cargar_datos(clinica)
+        clinica.guardar_instantanea()
+        clinica.agregar_paciente(Paciente("Luis Díaz", "55555555", "03/03/1985"))
+        clinica.cerrar()
+
+        recuperada = self._abrir_clinica()
+        self.assertTrue(recuperada.validar_existencia_paciente("55555555"))
+        self.assertEqual(len(recuperada.obtener_pacientes()), 2)
+
+    def test_linea_cortada_al_final_del_diario_se_ignora(self):
+        clinica = self._abrir_clinica()
+        self._cargar_datos(clinica)
+        clinica.cerrar()
+        with open(os.path.join(self.directorio, AlmacenamientoClinica.NOMBRE_DIARIO), "a", encoding="utf-8") as diario:
+            diario.write('[99,"P","Corte')
+
+        recuperada = self._abrir_clinica()
+        self.assertEqual(len(recuperada.obtener_pacientes()), 1)
+
+        # Lo que se escriba después de recuperar no se pierde junto con la línea cortada.
+        recuperada.agregar_paciente(Paciente("Luis Díaz", "55555555", "03/03/1985"))
+        recuperada.cerrar()
+        self.assertEqual(len(self._abrir_clinica().obtener_pacientes()), 2)
+
+    def test_linea_completa_sin_salto_de_linea_se_descarta(self):
+        clinica = self._abrir_clinica()
+        self._cargar_datos(clinica)
+        clinica.cerrar()
+        with open(os.path.join(self.directorio, AlmacenamientoClinica.NOMBRE_DIARIO), "a", encoding="utf-8") as diario:
+            diario.write('[99,"P","Luis Díaz","55555555","03/03/1985"]') # JSON entero, pero sin el "\n"
+
+        recuperada = self._abrir_clinica()
+        self.assertFalse(recuperada.validar_existencia_paciente("55555555"))
+        recuperada.agregar_paciente(Paciente("Marta Sosa", "77777777", "10/10/1970"))
+        recuperada.cerrar()
+        recuperada = self._abrir_clinica()
+        self.assertTrue(recuperada.validar_existencia_paciente("77777777"))
+        self.assertEqual(len(recuperada.obtener_pacientes()), 2)
+
+    def test_guardar_instantanea_sin_almacenamiento_falla(self):
+        with self.assertRaises(ValueError):
+            Clinica().guardar_instantanea()
+
+
+if __name__ == '__main__':
+    unittest.main(argv=[''], exit=False)
@@ -105,5 +105,11 @@ class TestReceta(unittest.TestCase):
         self.assertEqual(str(receta_para_str), expected_output)
         print("Formato de impresión de receta OK. ¡Se ve bien!")
 
+    def test_medicamentos_internados_y_sin_dict(self):
+        una = Receta(self.paciente_valido, self.medico_valido, ["".join(["Ibupro", "feno"])])
+        otra = Receta(self.paciente_valido, self.medico_valido, [" Ibuprofeno "])
+        self.assertIs(una.obtener_medicamentos()[0], otra.obtener_medicamentos()[0])
+        self.assertFalse(hasattr(una, "__dict__"))
+
 if __name__ == '__main__':
     unittest.main(argv=[''], exit=False)
\ No newline at end of file
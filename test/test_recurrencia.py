@@ -0,0 +1,46 @@
+import unittest
+from datetime import datetime, timedelta
+from modelo.recurrencia import ReglaRecurrencia
+
+
+class TestReglaRecurrencia(unittest.TestCase):
+
+    def test_por_cantidad(self):
+        regla = ReglaRecurrencia(datetime(2025, 6, 16, 10, 0), cantidad=3)
+        self.assertEqual(regla.obtener_fechas(), [datetime(2025, 6, 16, 10, 0), datetime(2025, 6, 23, 10, 0),
+                                                  datetime(2025, 6, 30, 10, 0)])
+        self.assertEqual(len(regla), 3)
+
+    def test_hasta_una_fecha_y_lo_que_llegue_primero(self):
+        primera = datetime(2025, 6, 16, 10, 0)
+        self.assertEqual(len(ReglaRecurrencia(primera, hasta=datetime(2025, 7, 14, 10, 0))), 5) # Incluye la última
+        self.assertEqual(len(ReglaRecurrencia(primera, hasta=datetime(2025, 7, 14, 9, 59))), 4)
+        self.assertEqual(len(ReglaRecurrencia(primera, cantidad=2, hasta=datetime(2025, 7, 14))), 2)
+        self.assertEqual(ReglaRecurrencia(primera, timedelta(weeks=2), cantidad=2).obtener_fechas()[-1], datetime(2025, 6, 30, 10, 0))
+
+    def test_reglas_invalidas(self):
+        primera = datetime(2025, 6, 16, 10, 0)
+        with self.assertRaises(ValueError):
+            ReglaRecurrencia(primera) # Sin cantidad ni fecha final
+        with self.assertRaises(ValueError):
+            ReglaRecurrencia(primera, timedelta(0), cantidad=3)
+        with self.assertRaises(ValueError):
+            ReglaRecurrencia(primera, cantidad=0)
+        with self.assertRaises(ValueError):
+            ReglaRecurrencia(primera, hasta=datetime(2025, 6, 1))
+        with self.assertRaises(ValueError):
+            ReglaRecurrencia(primera, timedelta(days=1), hasta=datetime(2100, 1, 1)) # Demasiados turnos
+        with self.assertRaises(TypeError):
+            ReglaRecurrencia("2025-06-16", cantidad=3)
+
+    def test_la_ultima_fecha_tiene_que_existir(self):
+        with self.assertRaises(ValueError):
+            ReglaRecurrencia(datetime(9999, 12, 20, 10, 0), cantidad=3)
+        with self.assertRaises(ValueError):
+            ReglaRecurrencia(datetime(2025, 6, 16, 10, 0), timedelta(days=999999999), cantidad=2)
+        ultima = ReglaRecurrencia(datetime(9999, 12, 17, 10, 0), cantidad=3).obtener_fechas()[-1]
+        self.assertEqual(ultima, datetime(9999, 12, 31, 10, 0))
+
+
+if __name__ == '__main__':
+    unittest.main(argv=[''], exit=False)
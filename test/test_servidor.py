@@ -0,0 +1,191 @@
+import asyncio
+import contextlib
+import io
+import json
+import unittest
+from datetime import timedelta
+from unittest.mock import patch
+from modelo.clinica import Clinica
+from servicio.servidor import ServidorClinica
+from servicio.operaciones import OPERACIONES, ejecutar_operacion
+
+
+class TestOperaciones(unittest.TestCase):
+
+    def setUp(self):
+        self.clinica = Clinica()
+        self.salida = contextlib.redirect_stdout(io.StringIO())
+        self.salida.__enter__()
+
+    def tearDown(self):
+        self.salida.__exit__(None, None, None)
+
+    def test_flujo_completo(self):
+        pedidos = [
+            {"op": "agregar_paciente", "nombre": "Ana García", "dni": "12345678", "fecha_nacimiento": "01/01/1990"},
+            {"op": "agregar_medico", "nombre": "Dr. Juan Pérez", "matricula": "MP11111", "especialidades": "Pediatría:lunes"},
+            {"op": "agregar_especialidad", "matricula": "MP11111", "tipo": "Clínica", "dias": ["martes"]},
+            {"op": "agendar_turno", "dni": "12345678", "matricula": "MP11111", "especialidad": "Clínica", "fecha_hora": "2025-06-17 10:00"},
+            {"op": "emitir_receta", "dni": "12345678", "matricula": "MP11111", "medicamentos": ["Ibuprofeno"]},
+        ]
+        for pedido in pedidos:
+            self.assertTrue(ejecutar_operacion(self.clinica, pedido)["ok"], pedido)
+
+        historia = ejecutar_operacion(self.clinica, {"op": "ver_historia", "dni": "12345678"})["resultado"]
+        self.assertEqual(historia["turnos"][0]["fecha_hora"], "2025-06-17T10:00:00")
+        self.assertEqual(historia["recetas"][0]["medicamentos"], ["Ibuprofeno"])
+        self.assertEqual(ejecutar_operacion(self.clinica, {"op": "listar_medicos"})["resultado"]["siguiente_cursor"], None)
+        self.assertEqual(len(ejecutar_operacion(self.clinica, {"op": "listar_medicos"})["resultado"]["elementos"]), 1)
+
+    def test_agendar_serie_devuelve_los_conflictos(self):
+        ejecutar_operacion(self.clinica, {"op": "agregar_paciente", "nombre": "Ana García", "dni": "12345678", "fecha_nacimiento": "01/01/1990"})
+        ejecutar_operacion(self.clinica, {"op": "agregar_medico", "nombre": "Dr. Juan Pérez", "matricula": "MP11111", "especialidades": "Pediatría:lunes"})
+        serie = {"op": "agendar_serie", "dni": "12345678", "matricula": "MP11111", "especialidad": "Pediatría",
+                 "primera": "2025-06-16 10:00", "cantidad": 4}
+        self.assertEqual(len(ejecutar_operacion(self.clinica, serie)["resultado"]), 4)
+
+        fuera_de_rango = ejecutar_operacion(self.clinica, dict(serie, primera="9999-12-20 10:00"))
+        self.assertEqual(fuera_de_rango["error"], "ValueError")
+        self.assertEqual(ejecutar_operacion(self.clinica, dict(serie, intervalo_dias=10 ** 12))["error"], "ValueError")
+
+        respuesta = ejecutar_operacion(self.clinica, dict(serie, primera="2025-06-30 10:00", hasta="2025-07-28 10:00"))
+        self.assertEqual(respuesta["error"], "SerieTurnosConflictoError")
+        self.assertEqual([c["fecha_hora"] for c in respuesta["conflictos"]], ["2025-06-30T10:00:00", "2025-07-07T10:00:00"])
+
+    def test_cancelar_y_reprogramar_por_id(self):
+        ejecutar_operacion(self.clinica, {"op": "agregar_paciente", "nombre": "Ana García", "dni": "12345678", "fecha_nacimiento": "01/01/1990"})
+        ejecutar_operacion(self.clinica, {"op": "agregar_medico", "nombre": "Dr. Juan Pérez", "matricula": "MP11111", "especialidades": "Pediatría:lunes"})
+        turno = ejecutar_operacion(self.clinica, {"op": "agendar_turno", "dni": "12345678", "matricula": "MP11111",
+                                                  "especialidad": "Pediatría", "fecha_hora": "2025-06-16 10:00"})["resultado"]
+        nuevo = ejecutar_operacion(self.clinica, {"op": "reprogramar_turno", "id_turno": turno["id"], "fecha_hora": "2025-06-23 10:00"})["resultado"]
+        self.assertEqual(nuevo["fecha_hora"], "2025-06-23T10:00:00")
+        self.assertTrue(ejecutar_operacion(self.clinica, {"op": "cancelar_turno", "id_turno": nuevo["id"]})["ok"])
+        self.assertEqual(ejecutar_operacion(self.clinica, {"op": "cancelar_turno", "id_turno": nuevo["id"]})["error"], "TurnoNoExisteError")
+
+    def test_duraciones_de_turnos_y_especialidades(self):
+        ejecutar_operacion(self.clinica, {"op": "agregar_paciente", "nombre": "Ana García", "dni": "12345678", "fecha_nacimiento": "01/01/1990"})
+        ejecutar_operacion(self.clinica, {"op": "agregar_medico", "nombre": "Dr. Juan Pérez", "matricula": "MP11111", "especialidades": "Pediatría:lunes"})
+        medico = ejecutar_operacion(self.clinica, {"op": "agregar_especialidad", "matricula": "MP11111", "tipo": "Kinesiología",
+                                                   "dias": ["martes"], "duracion_minutos": 45})["resultado"]
+        self.assertEqual([e["duracion_minutos"] for e in medico["especialidades"]], [30, 45])
+        turno = {"op": "agendar_turno", "dni": "12345678", "matricula": "MP11111", "especialidad": "Pediatría", "fecha_hora": "2025-06-16 10:00"}
+        self.assertEqual(ejecutar_operacion(self.clinica, dict(turno, duracion_minutos=60))["resultado"]["duracion_minutos"], 60)
+        self.assertEqual(ejecutar_operacion(self.clinica, dict(turno, fecha_hora="2025-06-16 10:30"))["error"], "TurnoDuplicadoError")
+        kinesiologia = dict(turno, especialidad="Kinesiología", fecha_hora="2025-06-17 10:00")
+        self.assertEqual(ejecutar_operacion(self.clinica, kinesiologia)["resultado"]["duracion_minutos"], 45)
+        self.assertFalse(ejecutar_operacion(self.clinica, dict(turno, fecha_hora="2025-06-23 10:00", duracion_minutos=0))["ok"])
+
+        # Lo que devuelve listar_medicos sirve para volver a darlo de alta, con las mismas duraciones.
+        listado = ejecutar_operacion(self.clinica, {"op": "listar_medicos"})["resultado"]["elementos"][0]
+        otra = Clinica()
+        self.assertTrue(ejecutar_operacion(otra, dict(listado, op="agregar_medico"))["ok"])
+        copia = ejecutar_operacion(otra, {"op": "listar_medicos"})["resultado"]["elementos"][0]
+        self.assertEqual([e["duracion_minutos"] for e in copia["especialidades"]], [30, 45])
+        self.assertEqual(ejecutar_operacion(otra, {"op": "agregar_medico", "nombre": "Dra. Ana Ruiz", "matricula": "MP22222",
+                                                   "especialidades": "Kinesiología:martes:20"})["ok"], True)
+        self.assertEqual(otra.obtener_medico_por_matricula("MP22222").obtener_duracion_turno("Kinesiología"), timedelta(minutes=20))
+
+    def test_consultas_por_medicamento(self):
+        ejecutar_operacion(self.clinica, {"op": "agregar_paciente", "nombre": "Ana García", "dni": "12345678", "fecha_nacimiento": "01/01/1990"})
+        ejecutar_operacion(self.clinica, {"op": "agregar_medico", "nombre": "Dr. Juan Pérez", "matricula": "MP11111", "especialidades": "Pediatría:lunes"})
+        for medicamentos in (["Ibuprofeno"], ["Ibuprofeno", "Omeprazol"]):
+            ejecutar_operacion(self.clinica, {"op": "emitir_receta", "dni": "12345678", "matricula": "MP11111", "medicamentos": medicamentos})
+        recetas = ejecutar_operacion(self.clinica, {"op": "recetas_por_medicamento", "medicamento": "omeprazol"})["resultado"]
+        self.assertEqual([r["medicamentos"] for r in recetas], [["Ibuprofeno", "Omeprazol"]])
+        vacias = ejecutar_operacion(self.clinica, {"op": "recetas_por_medicamento", "medicamento": "Ibuprofeno", "hasta": "2000-01-01 00:00"})
+        self.assertEqual(vacias["resultado"], [])
+        mas_recetados = ejecutar_operacion(self.clinica, {"op": "medicamentos_mas_recetados", "cantidad": 1})["resultado"]
+        self.assertEqual(mas_recetados, [{"medicamento": "Ibuprofeno", "recetas": 2}])
+
+    def test_buscar_pacientes(self):
+        for nombre, dni in (("Ana García", "12345678"), ("Luis González", "23456789")):
+            ejecutar_operacion(self.clinica, {"op": "agregar_paciente", "nombre": nombre, "dni": dni, "fecha_nacimiento": "01/01/1990"})
+        por_prefijo = ejecutar_operacion(self.clinica, {"op": "buscar_pacientes", "nombre": "GARC"})["resultado"]
+        self.assertEqual([p["dni"] for p in por_prefijo], ["12345678"])
+        aproximada = ejecutar_operacion(self.clinica, {"op": "buscar_pacientes", "nombre": "gonzales", "aproximada": True})
+        self.assertEqual([p["nombre"] for p in aproximada["resultado"]], ["Luis González"])
+        self.assertEqual(ejecutar_operacion(self.clinica, {"op": "buscar_pacientes", "nombre": "  "})["error"], "ValueError")
+
+    def test_errores_vuelven_como_respuesta(self):
+        respuesta = ejecutar_operacion(self.clinica, {"op": "ver_historia", "id": 7, "dni": "99999999"})
+        self.assertEqual(respuesta, {"id": 7, "ok": False, "error": "PacienteNoExisteError",
+                                     "mensaje": "No se encontró historia clínica para el DNI 99999999."})
+        self.assertEqual(ejecutar_operacion(self.clinica, {"op": "volar"})["error"], "OperacionDesconocida")
+        self.assertEqual(ejecutar_operacion(self.clinica, {"op": "agregar_paciente"})["error"], "DatoFaltante")
+        self.assertEqual(ejecutar_operacion(self.clinica, ["no", "es", "un", "objeto"])["error"], "PedidoInvalido")
+
+    def test_errores_inesperados_vuelven_como_respuesta(self):
+        def fallar(clinica, pedido):
+            raise OverflowError("date value out of range")
+        with patch.dict(OPERACIONES, {"fallar": fallar}):
+            respuesta = ejecutar_operacion(self.clinica, {"op": "fallar", "id": 3})
+        self.assertEqual(respuesta, {"id": 3, "ok": False, "error": "OverflowError",
+                                     "mensaje": "Error inesperado: date value out of range"})
+
+
+class TestServidor(unittest.IsolatedAsyncioTestCase):
+
+    async def asyncSetUp(self):
+        self.salida = contextlib.redirect_stdout(io.StringIO())
+        self.salida.__enter__()
+        self.servidor = ServidorClinica(Clinica(), max_pendientes=4)
+        await self.servidor.iniciar_tcp("127.0.0.1", 0)
+
+    async def asyncTearDown(self):
+        await self.servidor.detener()
+        self.salida.__exit__(None, None, None)
+
+    async def test_pedidos_en_pipeline_se_responden_en_orden(self):
+        lector, escritor = await asyncio.open_connection("127.0.0.1", self.servidor.obtener_puerto())
+        pedidos = [{"op": "agregar_paciente", "id": i, "nombre": f"Paciente {i}", "dni": f"{10000000 + i}",
+                    "fecha_nacimiento": "01/01/1990"} for i in range(20)] # Más que max_pendientes
+        pedidos.append({"op": "agregar_paciente", "id": 20, "nombre": "Repetido", "dni": "10000000", "fecha_nacimiento": "01/01/1990"})
+        escritor.write(b"".join(json.dumps(p).encode() + b"\n" for p in pedidos) + b"esto no es json\n")
+        await escritor.drain()
+
+        respuestas = [json.loads(await lector.readline()) for _ in range(len(pedidos) + 1)]
+        self.assertEqual([r["id"] for r in respuestas[:21]], list(range(21)))
+        self.assertTrue(all(r["ok"] for r in respuestas[:20]))
+        self.assertEqual(respuestas[20]["error"], "PacienteExistenteError")
+        self.assertEqual(respuestas[21]["error"], "JSONInvalido")
+
+        escritor.close()
+        await escritor.wait_closed()
+
+    async def test_un_error_inesperado_no_corta_la_conexion(self):
+        def fallar(clinica, pedido):
+            raise OverflowError("date value out of range")
+        def sin_json(clinica, pedido):
+            return object()
+        lector, escritor = await asyncio.open_connection("127.0.0.1", self.servidor.obtener_puerto())
+        pedidos = [{"op": "fallar", "id": 0}, {"op": "sin_json", "id": 1},
+                   {"op": "agregar_paciente", "id": 2, "nombre": "Ana", "dni": "12345678", "fecha_nacimiento": "01/01/1990"}]
+        with patch.dict(OPERACIONES, {"fallar": fallar, "sin_json": sin_json}):
+            escritor.write(b"".join(json.dumps(p).encode() + b"\n" for p in pedidos))
+            await escritor.drain()
+            respuestas = [json.loads(await lector.readline()) for _ in pedidos]
+        self.assertEqual([r["error"] for r in respuestas[:2]], ["OverflowError", "TypeError"])
+        self.assertEqual(respuestas[2]["id"], 2)
+        self.assertTrue(respuestas[2]["ok"])
+
+        escritor.close()
+        await escritor.wait_closed()
+
+    async def test_linea_demasiado_larga_responde_y_cierra(self):
+        lector, escritor = await asyncio.open_connection("127.0.0.1", self.servidor.obtener_puerto())
+        pedido = {"op": "agregar_paciente", "id": 0, "nombre": "Ana", "dni": "12345678", "fecha_nacimiento": "01/01/1990"}
+        escritor.write(json.dumps(pedido).encode() + b"\n" + b"x" * (ServidorClinica.LARGO_MAXIMO_LINEA + 10) + b"\n")
+        await escritor.drain()
+        self.assertTrue(json.loads(await lector.readline())["ok"]) # Lo anterior se responde igual.
+        respuesta = json.loads(await lector.readline())
+        self.assertFalse(respuesta["ok"])
+        self.assertEqual(respuesta["error"], "LineaDemasiadoLarga")
+        self.assertTrue(respuesta["mensaje"].startswith("¡Error!"))
+        self.assertEqual(await lector.read(), b"") # Y después cierra la conexión.
+
+        escritor.close()
+        await escritor.wait_closed()
+
+
+if __name__ == '__main__':
+    unittest.main(argv=[''], exit=False)
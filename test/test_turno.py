@@ -1,5 +1,5 @@
 import unittest
-from datetime import datetime, date
+from datetime import datetime, date, timedelta
 from modelo.turno import Turno
 from modelo.paciente import Paciente 
 from modelo.medico import Medico
@@ -102,6 +102,18 @@ class TestTurno(unittest.TestCase):
         self.assertEqual(un_turno.obtener_fecha_hora(), self.fecha_hora_martes)
         self.assertEqual(un_turno.obtener_especialidad(), "Cardiología")
 
+    def test_duracion_del_turno(self):
+        kinesiologia = Especialidad("Kinesiología", ["martes"], timedelta(minutes=45))
+        medico = Medico("Dra. Carla Ríos", "MP55555", [self.pediatria, kinesiologia])
+        normal = Turno(self.paciente_ejemplo, medico, self.fecha_hora_lunes, "Pediatría")
+        largo = Turno(self.paciente_ejemplo, medico, self.fecha_hora_martes, "Kinesiología")
+        elegido = Turno(self.paciente_ejemplo, medico, self.fecha_hora_martes, "Kinesiología", timedelta(hours=1))
+        self.assertEqual(normal.obtener_duracion(), timedelta(minutes=30)) # La general
+        self.assertEqual(largo.obtener_duracion(), timedelta(minutes=45))  # La de la especialidad
+        self.assertEqual(elegido.obtener_fin(), datetime(2025, 6, 17, 12, 30))
+        with self.assertRaises(ValueError):
+            Turno(self.paciente_ejemplo, medico, self.fecha_hora_lunes, "Pediatría", timedelta(0))
+
     # --- Prueba de la Representación del Turno (__str__) ---
 
     def test_formato_del_turno(self):
@@ -118,5 +130,20 @@ class TestTurno(unittest.TestCase):
         )
         self.assertEqual(str(turno_para_imprimir), expected_output)
 
+    def test_turnos_sin_dict_y_con_especialidad_compartida(self):
+        # La especialidad llega como textos distintos (p. ej. leídos de un archivo) pero queda un solo objeto.
+        uno = Turno(self.paciente_ejemplo, self.medico_soto, self.fecha_hora_lunes, "".join(["Pedia", "tría"]))
+        otro = Turno(self.paciente_ejemplo, self.medico_soto, self.fecha_hora_martes, "".join(["Pediat", "ría"]))
+        self.assertIs(uno.obtener_especialidad_solicitada(), otro.obtener_especialidad_solicitada())
+        self.assertFalse(hasattr(uno, "__dict__"))
+
+    def test_vigente_segun_numero_de_baja(self):
+        turno = Turno(self.paciente_ejemplo, self.medico_soto, self.fecha_hora_lunes, "Pediatría")
+        self.assertTrue(turno.vigente_en(0))
+        turno.cancelar(3)
+        self.assertTrue(turno.esta_cancelado())
+        self.assertTrue(turno.vigente_en(3))   # Vista tomada con 3 bajas: todavía no estaba cancelado.
+        self.assertFalse(turno.vigente_en(4))
+
 if __name__ == '__main__':
     unittest.main(argv=[''], exit=False)
\ No newline at end of file
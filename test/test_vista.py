@@ -0,0 +1,73 @@
+import unittest
+from datetime import datetime, timedelta
+from modelo.clinica import Clinica
+from modelo.paciente import Paciente
+from modelo.medico import Medico
+from modelo.especialidad import Especialidad
+from modelo.exception import PacienteNoExisteError
+
+
+class TestVistaClinica(unittest.TestCase):
+
+    def crear_clinica(self, columnar=False):
+        clinica = Clinica(columnar=columnar)
+        clinica.agregar_paciente(Paciente("Ana García", "12345678", "01/01/1990"))
+        clinica.agregar_medico(Medico("Dr. Juan Pérez", "MP11111", [Especialidad("Pediatría", ["lunes"])]))
+        return clinica
+
+    def agendar(self, clinica, semana):
+        return clinica.agendar_turno("12345678", "MP11111", "Pediatría", datetime(2025, 6, 16, 10, 0) + timedelta(weeks=semana))
+
+    def test_la_vista_no_ve_lo_que_pasa_despues(self):
+        for columnar in (False, True):
+            with self.subTest(columnar=columnar):
+                clinica = self.crear_clinica(columnar)
+                primero = self.agendar(clinica, 0)
+                self.agendar(clinica, 1)
+                clinica.emitir_receta("12345678", "MP11111", ["Ibuprofeno"])
+
+                with clinica.obtener_vista() as vista:
+                    clinica.cancelar_turno(primero.obtener_id())
+                    self.agendar(clinica, 2)
+                    clinica.emitir_receta("12345678", "MP11111", ["Paracetamol"])
+                    clinica.agregar_paciente(Paciente("Carlos Pérez", "87654321", "02/02/1980"))
+
+                    self.assertEqual(vista.cantidad_turnos(), 2)
+                    self.assertEqual([t.obtener_id() for t in vista.iterar_turnos()], [0, 1])
+                    self.assertEqual([t.obtener_id() for t in vista.obtener_turnos_de("12345678")], [0, 1])
+                    self.assertEqual([r.obtener_medicamentos() for r in vista.iterar_recetas()], [["Ibuprofeno"]])
+                    self.assertEqual([p.obtener_dni() for p in vista.iterar_pacientes()], ["12345678"])
+                    self.assertEqual(vista.obtener_recetas_de("87654321"), [])
+
+                # La clínica sí ve todo.
+                self.assertEqual([t.obtener_id() for t in clinica.obtener_turnos()], [1, 2])
+                self.assertEqual(len(clinica.obtener_historia_clinica_por_dni("12345678").obtener_recetas()), 2)
+
+    def test_turnos_entre_fechas(self):
+        clinica = self.crear_clinica()
+        for semana in range(6):
+            self.agendar(clinica, semana)
+        vista = clinica.obtener_vista()
+        junio = list(vista.iterar_turnos(datetime(2025, 6, 1), datetime(2025, 7, 1)))
+        self.assertEqual([t.obtener_fecha_hora().day for t in junio], [16, 23, 30])
+        with self.assertRaises(PacienteNoExisteError):
+            vista.obtener_turnos_de("99999999")
+        vista.cerrar()
+
+    def test_no_se_compacta_con_vistas_abiertas(self):
+        clinica = self.crear_clinica()
+        turnos = [self.agendar(clinica, semana) for semana in range(4)]
+        vista = clinica.obtener_vista()
+        for turno in turnos[:2]:
+            clinica.cancelar_turno(turno.obtener_id())
+        with self.assertRaises(ValueError):
+            clinica.compactar_turnos()
+        self.assertEqual(len(vista.obtener_turnos_de("12345678")), 4)
+        vista.cerrar()
+        vista.cerrar() # Cerrarla dos veces no hace nada.
+        clinica.compactar_turnos()
+        self.assertEqual([t.obtener_id() for t in clinica.obtener_turnos()], [2, 3])
+
+
+if __name__ == '__main__':
+    unittest.main()